@@ -0,0 +1,81 @@
+"""Compare per-run overhead of the LangGraph runtime and the frankstate `DagEngine`.
+
+The benchmark builds a linear layout of trivial nodes so the measured time is
+dominated by the execution engine rather than by node work::
+
+    PYTHONPATH=src python benchmarks/engine_overhead.py --nodes 5 --runs 500
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Any
+
+from langgraph.graph import END, START, MessagesState
+
+from frankstate import WorkflowBuilder
+from frankstate.entity.edge import SimpleEdge
+from frankstate.entity.graph_layout import GraphLayout
+from frankstate.entity.node import SimpleNode
+from frankstate.entity.statehandler import StateEnhancer
+
+
+class BenchState(MessagesState):
+    counter: int
+
+
+class IncrementEnhancer(StateEnhancer):
+    async def enhance(self, state: Any) -> dict[str, int]:
+        return {"counter": state.get("counter", 0) + 1}
+
+
+def make_layout(size: int) -> type[GraphLayout]:
+    """Return a layout class chaining `size` increment nodes."""
+
+    class LinearBenchLayout(GraphLayout):
+        def build_runtime(self) -> dict[str, Any]:
+            return {}
+
+        def layout(self) -> None:
+            names = [f"node_{index}" for index in range(size)]
+            for name in names:
+                setattr(self, name.upper(), SimpleNode(enhancer=IncrementEnhancer(), name=name))
+            for index, (source, target) in enumerate(zip([START, *names], [*names, END], strict=True)):
+                setattr(self, f"EDGE_{index}", SimpleEdge(node_source=source, node_path=target))
+
+    return LinearBenchLayout
+
+
+async def measure(compiled: Any, runs: int) -> list[float]:
+    """Return per-run latencies in microseconds after a short warm-up."""
+    payload = {"messages": [], "counter": 0}
+    for _ in range(min(runs, 20)):
+        await compiled.ainvoke(payload)
+
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        await compiled.ainvoke(payload)
+        samples.append((time.perf_counter() - started) * 1e6)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=5, help="number of chained nodes")
+    parser.add_argument("--runs", type=int, default=500, help="measured runs per engine")
+    args = parser.parse_args()
+
+    layout = make_layout(args.nodes)
+    print(f"{args.nodes} chained nodes, {args.runs} runs per engine")
+    print(f"{'engine':<12}{'p50 (us)':>12}{'p95 (us)':>12}{'mean (us)':>12}")
+    for engine in ("langgraph", "dag"):
+        compiled = WorkflowBuilder(config=layout, state_schema=BenchState, engine=engine).compile()
+        samples = sorted(asyncio.run(measure(compiled, args.runs)))
+        p95 = samples[int(len(samples) * 0.95) - 1]
+        print(f"{engine:<12}{statistics.median(samples):>12.1f}{p95:>12.1f}{statistics.fmean(samples):>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
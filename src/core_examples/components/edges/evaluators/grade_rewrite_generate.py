@@ -1,8 +1,12 @@
+import logging
 from typing import Any, Literal, cast
 
 from langchain_core.messages import AnyMessage
 from pydantic import BaseModel
 
+from core_examples.components.runnables.structured_grade_document.structured_grade_document import (
+    GradeStreamCappedError,
+)
 from frankstate.entity.statehandler import StateEvaluator
 
 
@@ -19,18 +23,27 @@ class GradeRewriteGenerate(StateEvaluator):
             already retried enough times
         - `"rewrite"` when the question should be refined before another
             retrieval attempt
+
+    A grader whose stream was capped before the score was known counts as
+    inconclusive and routes to `"generate"`, like a degraded run.
     """
 
+    logger: logging.Logger = logging.getLogger(__name__)
+
     async def evaluate(self, state: list[AnyMessage] | dict[str, Any] | BaseModel) -> Literal["generate", "rewrite"]:
         state = cast(dict[str, Any], state)
         runnable = self.runnable
         if runnable is None:
             raise TypeError("GradeRewriteGenerate requires a runnable_builder at initialization time")
 
-        response = await runnable.ainvoke({
-            "context": state["context"],
-            "question": state["question"],
-        })
+        try:
+            response = await runnable.ainvoke({
+                "context": state["context"],
+                "question": state["question"],
+            })
+        except GradeStreamCappedError as exc:
+            self.logger.warning("%s; generating without a grade", exc)
+            return "generate"
 
         score = response.binary_score
 
@@ -0,0 +1,230 @@
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from langchain_core.messages import (
+    AIMessage,
+    BaseMessage,
+    HumanMessage,
+    SystemMessage,
+    ToolMessage,
+    get_buffer_string,
+)
+from langchain_core.messages.utils import count_tokens_approximately
+from langchain_core.runnables import Runnable
+
+SUMMARY_PREFIX = "Summary of the earlier conversation:"
+SUMMARY_INSTRUCTIONS = (
+    "You maintain the running summary of a conversation between a user and an assistant. "
+    "Extend the current summary with the new messages. Keep names, decisions, open questions "
+    "and facts returned by tools; drop greetings and repetitions. Answer with the summary only."
+)
+
+
+@dataclass
+class _Plan:
+    """View of a conversation computed before any summarization call."""
+
+    head: list[BaseMessage]
+    kept: list[BaseMessage]
+    summary: str | None
+    evicted: list[BaseMessage]
+    boundary: str | None
+
+
+class ConversationMemory:
+    """Bounded view of a message history, sent to a chat agent instead of the whole thread.
+
+    The graph state keeps every message; only what the agent sees is bounded:
+
+    1. Tool results already answered by a later AI message and longer than
+       `max_tool_result_chars` are replaced by a short placeholder. The
+       `ToolMessage` itself stays, so tool calls keep their results.
+    2. When the conversation exceeds `max_tokens`, the oldest turns are cut
+       until at most `keep_tokens` remain. Cuts only happen before a
+       `HumanMessage` and never separate a tool call from its result.
+    3. With a `summarizer` (a cheap chat model), cut turns are folded into a
+       rolling summary passed to the agent as a `SystemMessage`.
+
+    Cuts are remembered by the id of the last message they removed, so later
+    turns reuse the same cut and summary until the budget is exceeded again:
+    a long session pays one summarization call every few turns, and the
+    prompt prefix stays stable between cuts. Leading system messages are
+    always kept.
+
+    Attributes:
+        max_tokens: Token budget of the view, summary included.
+        keep_tokens: Tokens of recent turns kept when a cut happens, by
+            default half of `max_tokens`.
+        summarizer: Runnable turning a summarization request into a message
+            or a string, or `None` to drop cut turns without a summary.
+        max_tool_result_chars: Length above which a consumed tool result is
+            replaced, or `None` to keep tool results.
+        token_counter: Callable counting the tokens of a message list.
+    """
+
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        max_tokens: int = 4000,
+        keep_tokens: int | None = None,
+        summarizer: Runnable[Any, Any] | None = None,
+        max_tool_result_chars: int | None = 2000,
+        token_counter: Callable[[Sequence[BaseMessage]], int] = count_tokens_approximately,
+        max_cached_cuts: int = 1024,
+    ):
+        if max_tokens < 1:
+            raise ValueError("`max_tokens` must be at least 1")
+        self.max_tokens = max_tokens
+        self.keep_tokens = keep_tokens if keep_tokens is not None else max_tokens // 2
+        if not 0 < self.keep_tokens <= max_tokens:
+            raise ValueError("`keep_tokens` must be between 1 and `max_tokens`")
+        self.summarizer = summarizer
+        self.max_tool_result_chars = max_tool_result_chars
+        self.token_counter = token_counter
+        self.max_cached_cuts = max_cached_cuts
+        self._cuts: OrderedDict[str, str | None] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def prepare(self, messages: Sequence[BaseMessage]) -> list[BaseMessage]:
+        """Return the bounded view of `messages`, summarizing synchronously."""
+        plan = self._plan(messages)
+        if plan.evicted and self.summarizer is not None:
+            try:
+                response = self.summarizer.invoke(self._summary_request(plan))
+            except Exception:
+                self.logger.warning("Conversation summarization failed; dropping cut turns", exc_info=True)
+            else:
+                self._store(plan, response)
+        elif plan.evicted:
+            self._store(plan, None)
+        return self._view(plan)
+
+    async def aprepare(self, messages: Sequence[BaseMessage]) -> list[BaseMessage]:
+        """Return the bounded view of `messages`, summarizing asynchronously."""
+        plan = self._plan(messages)
+        if plan.evicted and self.summarizer is not None:
+            try:
+                response = await self.summarizer.ainvoke(self._summary_request(plan))
+            except Exception:
+                self.logger.warning("Conversation summarization failed; dropping cut turns", exc_info=True)
+            else:
+                self._store(plan, response)
+        elif plan.evicted:
+            self._store(plan, None)
+        return self._view(plan)
+
+    def compact_tool_results(self, messages: Sequence[BaseMessage]) -> list[BaseMessage]:
+        """Replace bulky tool results that a later AI message already used."""
+        limit = self.max_tool_result_chars
+        if limit is None:
+            return list(messages)
+
+        compacted = list(messages)
+        answered = False
+        for index in range(len(compacted) - 1, -1, -1):
+            message = compacted[index]
+            if isinstance(message, AIMessage):
+                answered = True
+            elif answered and isinstance(message, ToolMessage):
+                size = len(message.text)
+                if size > limit:
+                    compacted[index] = message.model_copy(
+                        update={"content": f"[{size} characters of tool output omitted after use]"}
+                    )
+        return compacted
+
+    def _plan(self, messages: Sequence[BaseMessage]) -> _Plan:
+        start = 0
+        while start < len(messages) and isinstance(messages[start], SystemMessage):
+            start += 1
+        head = list(messages[:start])
+        rest = self.compact_tool_results(messages[start:])
+
+        # Reuse the latest remembered cut while the view still fits.
+        previous, summary = -1, None
+        with self._lock:
+            for index in range(len(rest) - 1, -1, -1):
+                message_id = rest[index].id
+                if message_id is not None and message_id in self._cuts:
+                    previous, summary = index, self._cuts[message_id]
+                    self._cuts.move_to_end(message_id)
+                    break
+
+        counts = [self.token_counter([message]) for message in rest]
+        fixed = self.token_counter(head) + self._summary_tokens(summary)
+        if fixed + sum(counts[previous + 1:]) <= self.max_tokens:
+            return _Plan(head=head, kept=rest[previous + 1:], summary=summary, evicted=[], boundary=None)
+
+        cut = self._find_cut(rest, counts, previous + 1, self.keep_tokens - fixed)
+        if cut is None:
+            self.logger.warning("Conversation exceeds %s tokens but has no turn boundary to cut at", self.max_tokens)
+            return _Plan(head=head, kept=rest[previous + 1:], summary=summary, evicted=[], boundary=None)
+
+        return _Plan(
+            head=head,
+            kept=rest[cut:],
+            summary=summary,
+            evicted=rest[previous + 1:cut],
+            boundary=rest[cut - 1].id,
+        )
+
+    @staticmethod
+    def _find_cut(rest: list[BaseMessage], counts: list[int], first: int, budget: int) -> int | None:
+        """Return the earliest turn start after `first` whose suffix fits `budget`.
+
+        Falls back to the last valid turn start when no suffix fits.
+        """
+        pending_calls: set[str] = set()
+        cuts: list[int] = []
+        for index in range(first, len(rest)):
+            message = rest[index]
+            if isinstance(message, HumanMessage) and index > first and not pending_calls:
+                cuts.append(index)
+            if isinstance(message, AIMessage):
+                pending_calls.update(call["id"] for call in message.tool_calls if call.get("id"))
+            elif isinstance(message, ToolMessage):
+                pending_calls.discard(message.tool_call_id)
+
+        if not cuts:
+            return None
+        suffix = sum(counts[cuts[0]:])
+        for position, cut in enumerate(cuts):
+            if suffix <= budget:
+                return cut
+            following = cuts[position + 1] if position + 1 < len(cuts) else len(rest)
+            suffix -= sum(counts[cut:following])
+        return cuts[-1]
+
+    def _summary_request(self, plan: _Plan) -> list[BaseMessage]:
+        current = plan.summary or "(empty)"
+        return [
+            SystemMessage(content=SUMMARY_INSTRUCTIONS),
+            HumanMessage(
+                content=f"Current summary:\n{current}\n\nNew messages:\n{get_buffer_string(plan.evicted)}"
+            ),
+        ]
+
+    def _store(self, plan: _Plan, response: Any) -> None:
+        if response is not None:
+            plan.summary = response.text if isinstance(response, BaseMessage) else str(response)
+        if plan.boundary is None:
+            return
+        with self._lock:
+            self._cuts[plan.boundary] = plan.summary
+            self._cuts.move_to_end(plan.boundary)
+            while len(self._cuts) > self.max_cached_cuts:
+                self._cuts.popitem(last=False)
+
+    def _view(self, plan: _Plan) -> list[BaseMessage]:
+        summary = [SystemMessage(content=f"{SUMMARY_PREFIX}\n{plan.summary}")] if plan.summary else []
+        return [*plan.head, *summary, *plan.kept]
+
+    def _summary_tokens(self, summary: str | None) -> int:
+        if not summary:
+            return 0
+        return self.token_counter([SystemMessage(content=f"{SUMMARY_PREFIX}\n{summary}")])
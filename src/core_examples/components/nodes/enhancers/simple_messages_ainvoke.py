@@ -3,6 +3,7 @@ from typing import Any, cast
 from langchain_core.messages import AIMessage, AnyMessage
 from pydantic import BaseModel
 
+from core_examples.components.memory.conversation_memory import ConversationMemory
 from frankstate.entity.statehandler import StateEnhancer
 
 
@@ -15,8 +16,13 @@ class SimpleMessagesAsyncInvoke(StateEnhancer):
     Returns:
         - `messages`: a list containing the new AI response so LangGraph can
           append it to the running conversation state.
+
+    An optional `memory=ConversationMemory(...)` keyword bounds the history
+    sent to the runnable; the state itself keeps every message.
     """
 
+    memory: ConversationMemory | None = None
+
     async def enhance(self, state: list[AnyMessage] | dict[str, Any] | BaseModel) -> dict[str, Any]:
         state = cast(dict[str, Any], state)
         runnable = self.runnable
@@ -24,6 +30,8 @@ class SimpleMessagesAsyncInvoke(StateEnhancer):
             raise TypeError("SimpleMessagesAsyncInvoke requires a runnable_builder at initialization time")
 
         messages = cast(AIMessage, state["messages"])
+        if self.memory is not None:
+            messages = await self.memory.aprepare(messages)
         response = await runnable.ainvoke(messages)
         # We return a list, because this will get added to the existing list
         return {"messages": [response]}
@@ -3,6 +3,7 @@ from typing import Any, cast
 from langchain_core.messages import AIMessage, AnyMessage
 from pydantic import BaseModel
 
+from core_examples.components.memory.conversation_memory import ConversationMemory
 from frankstate.entity.statehandler import StateEnhancer
 
 
@@ -15,7 +16,12 @@ class SimpleMessagesInvoke(StateEnhancer):
     Returns:
         - `messages`: a list containing the new AI response so LangGraph can
           append it to the running conversation state.
+
+    An optional `memory=ConversationMemory(...)` keyword bounds the history
+    sent to the runnable; the state itself keeps every message.
     """
+
+    memory: ConversationMemory | None = None
     
     def enhance(self, state: list[AnyMessage] | dict[str, Any] | BaseModel) -> dict[str, Any]:
         state = cast(dict[str, Any], state)
@@ -24,6 +30,8 @@ class SimpleMessagesInvoke(StateEnhancer):
             raise TypeError("SimpleMessagesInvoke requires a runnable_builder at initialization time")
 
         messages = cast(AIMessage, state["messages"])
+        if self.memory is not None:
+            messages = self.memory.prepare(messages)
         response = runnable.invoke(messages)
         # We return a list, because this will get added to the existing list
         return {"messages": [response]}
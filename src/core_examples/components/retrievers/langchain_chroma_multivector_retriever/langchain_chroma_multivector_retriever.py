@@ -42,6 +42,8 @@ class LangchainChromaMultiVectorRetriever:
         else:
             self.vectordb = vectordb
             self.docstore = docstore
+        # Only a Chroma collection opened here is closed by `close()`.
+        self._owns_vectordb = vectordb is None
 
         self.id_key = id_key
         self.retriever = MultiVectorRetriever(
@@ -53,4 +55,15 @@ class LangchainChromaMultiVectorRetriever:
     def get_retriever(self) -> BaseRetriever:
         """Return the configured persistent local retriever."""
 
-        return self.retriever
\ No newline at end of file
+        return self.retriever
+
+    def count(self) -> int:
+        """Return the number of vectors in the Chroma collection, querying the client."""
+
+        return self.vectordb._collection.count()  # type: ignore[attr-defined]
+
+    def close(self) -> None:
+        """Close the Chroma client of the collection opened by this retriever."""
+
+        if self._owns_vectordb:
+            self.vectordb._client.close()  # type: ignore[attr-defined]
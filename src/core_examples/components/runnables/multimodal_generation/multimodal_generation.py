@@ -2,14 +2,14 @@ import logging
 from typing import Any, cast
 
 from langchain_core.language_models.chat_models import BaseChatModel
-from langchain_core.messages import HumanMessage
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.runnables import Runnable, RunnableLambda
 
-from core_examples.utils.common import (
-    load_and_clean_text_file,
-    resolve_package_resource,
+from core_examples.components.runnables.shared_context.shared_context import (
+    SHARED_CONTEXT_PACKAGE,
+    build_shared_context_prompt,
 )
+from core_examples.utils.prompt_registry import prompt_registry
 from frankstate.entity.runnable_builder import PromptMixin, RunnableBuilder
 
 
@@ -18,6 +18,7 @@ class MultimodalGeneration(PromptMixin, RunnableBuilder):
 
     def __init__(self, model: BaseChatModel):
         super().__init__(model=model)
+        prompt_registry.preload(__package__ or __name__, SHARED_CONTEXT_PACKAGE)
 
         self.logger.info("MultimodalGeneration initialized")
 
@@ -27,23 +28,10 @@ class MultimodalGeneration(PromptMixin, RunnableBuilder):
         if not question or not isinstance(docs_by_type, dict):
             raise ValueError("Missing required keys 'question' and 'context' in kwargs")
 
-        package = __package__ or __name__
-        instructions = load_and_clean_text_file(resolve_package_resource(package, 'prompt', 'instructions.md'))
+        # Shared context first, so the grader and the generator send the same prefix
+        instructions = prompt_registry.get(__package__ or __name__).render()
 
-        format_template = load_and_clean_text_file(resolve_package_resource(package, 'prompt', 'format_template.md'))
-
-        prompt_template = format_template.format(
-            instructions=instructions,
-            retrieved_context=docs_by_type["texts"],
-            question=question
-        )
-
-        prompt_content: list[str | dict[str, Any]] = [{"type": "text", "text": prompt_template}]
-        prompt_content.extend(docs_by_type["images"])
-
-        return ChatPromptTemplate.from_messages([
-            HumanMessage(content=prompt_content)
-        ])
+        return build_shared_context_prompt(docs_by_type, question, instructions)
 
     def _configure_runnable(self) -> Runnable:
         rag_chain = {
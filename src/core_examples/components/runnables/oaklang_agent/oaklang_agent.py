@@ -1,27 +1,40 @@
 import logging
+import threading
+from typing import Any, cast
 
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.prompts import (
     ChatPromptTemplate,
     MessagesPlaceholder,
 )
-from langchain_core.runnables import Runnable
+from langchain_core.runnables import Runnable, RunnableLambda
 from langchain_core.tools import BaseTool
 
-from core_examples.utils.common import (
-    load_and_clean_text_file,
-    resolve_package_resource,
-)
+from core_examples.components.tools.tool_selector import ToolSelector, extract_messages
+from core_examples.utils.prompt_registry import prompt_registry
 from frankstate.entity.runnable_builder import PromptMixin, RunnableBuilder
 
 from .history_template import history_template
 
 
 class OakLangAgent(PromptMixin, RunnableBuilder):
+    """Tool-calling Professor Oak agent.
+
+    With a `tool_selector`, each request binds only the tools the selector
+    picks for it instead of the whole catalog, saving the prompt tokens of
+    the other tool schemas. The prompt and model bound to each distinct tool
+    subset are built once and reused.
+    """
+
     logger: logging.Logger = logging.getLogger(__name__)
 
-    def __init__(self, model: BaseChatModel, tools: list[BaseTool]):
+    def __init__(self, model: BaseChatModel, tools: list[BaseTool], tool_selector: ToolSelector | None = None):
+        if tool_selector is not None and {tool.name for tool in tool_selector.tools} != {tool.name for tool in tools}:
+            raise ValueError("OakLangAgent tool_selector must select among the agent tools")
         self.tools = tools
+        self.tool_selector = tool_selector
+        self._chains: dict[tuple[str, ...], Runnable] = {}
+        self._chains_lock = threading.Lock()
         super().__init__(model=model)
 
         self.logger.info("OakLangAgent initialized")
@@ -40,22 +53,7 @@ class OakLangAgent(PromptMixin, RunnableBuilder):
         # )
 
         # Prepare the prompt
-        package = __package__ or __name__
-        context = load_and_clean_text_file(resolve_package_resource(package, 'prompt', 'context.md'))
-        instructions = load_and_clean_text_file(resolve_package_resource(package, 'prompt', 'instructions.md'))
-        input = load_and_clean_text_file(resolve_package_resource(package, 'prompt', 'input.md'))
-        output_format = load_and_clean_text_file(resolve_package_resource(package, 'prompt', 'output_format.md'))
-        restrictions = load_and_clean_text_file(resolve_package_resource(package, 'prompt', 'restrictions.md'))
-
-        format_template = load_and_clean_text_file(resolve_package_resource(package, 'prompt', 'format_template.md'))
-
-        system_prompt = format_template.format(
-            context=context,
-            instructions=instructions,
-            input=input,
-            output_format=output_format,
-            restrictions=restrictions
-        )
+        system_prompt = prompt_registry.get(__package__ or __name__).render()
 
         self.logger.info(system_prompt)
 
@@ -68,8 +66,30 @@ class OakLangAgent(PromptMixin, RunnableBuilder):
 
     def _configure_runnable(self) -> Runnable:
         prompt_template = self._build_prompt()
-        model_with_tools = self.model.bind_tools(self.tools or [])
-
-        chain = prompt_template | model_with_tools
-
-        return chain
\ No newline at end of file
+        if self.tool_selector is None:
+            model_with_tools = self.model.bind_tools(self.tools or [])
+            chain = prompt_template | model_with_tools
+            return chain
+
+        self._prompt_template = prompt_template
+        # A RunnableLambda returning a runnable invokes it with the same input and config.
+        return RunnableLambda(self._select_chain, afunc=self._aselect_chain)
+
+    def _select_chain(self, input: Any) -> Runnable:
+        selector = cast(ToolSelector, self.tool_selector)
+        return self._chain_for(selector.select(extract_messages(input)))
+
+    async def _aselect_chain(self, input: Any) -> Runnable:
+        selector = cast(ToolSelector, self.tool_selector)
+        return self._chain_for(await selector.aselect(extract_messages(input)))
+
+    def _chain_for(self, tools: list[BaseTool]) -> Runnable:
+        """Return the prompt and model bound to `tools`, building it on first use."""
+        key = tuple(tool.name for tool in tools)
+        with self._chains_lock:
+            chain = self._chains.get(key)
+            if chain is None:
+                chain = self._prompt_template | self.model.bind_tools(tools)
+                self._chains[key] = chain
+                self.logger.info("Bound OakLangAgent to tools %s", list(key))
+            return chain
\ No newline at end of file
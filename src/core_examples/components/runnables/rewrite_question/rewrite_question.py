@@ -6,10 +6,7 @@ from langchain_core.messages import HumanMessage
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.runnables import Runnable, RunnableLambda, RunnablePassthrough
 
-from core_examples.utils.common import (
-    load_and_clean_text_file,
-    resolve_package_resource,
-)
+from core_examples.utils.prompt_registry import prompt_registry
 from frankstate.entity.runnable_builder import PromptMixin, RunnableBuilder
 
 
@@ -18,6 +15,7 @@ class RewriteQuestion(PromptMixin, RunnableBuilder):
 
     def __init__(self, model: BaseChatModel):
         super().__init__(model=model)
+        prompt_registry.preload(__package__ or __name__)
 
         self.logger.info("RewriteQuestion initialized")
 
@@ -25,10 +23,7 @@ class RewriteQuestion(PromptMixin, RunnableBuilder):
         question = kwargs["question"]
 
         # Prepare the human_prompt
-        package = __package__ or __name__
-        format_template = load_and_clean_text_file(resolve_package_resource(package, 'prompt', 'format_template.md'))
-
-        prompt_template = format_template.format(
+        prompt_template = prompt_registry.get(__package__ or __name__).render(
             question=question
         )
 
@@ -0,0 +1,38 @@
+from typing import Any
+
+from langchain_core.messages import HumanMessage
+from langchain_core.prompts import ChatPromptTemplate
+
+from core_examples.utils.prompt_registry import prompt_registry
+
+# Prompt package of the shared context, preloaded by the builders using it.
+SHARED_CONTEXT_PACKAGE = __package__ or __name__
+
+
+def build_shared_context_prompt(docs_by_type: dict[str, Any], question: str, instructions: str) -> ChatPromptTemplate:
+    """Return a prompt that starts with the retrieved context shared by several chains.
+
+    The retrieved texts, the question and the images come first, rendered
+    identically for every chain that receives the same context, and the
+    role-specific `instructions` come last. The grader and the generator of
+    the adaptive RAG layouts thus send the same messages prefix for a
+    question, which Ollama reuses from its KV cache instead of prefilling it
+    again: its `json_schema` output is a decoding constraint, not prompt text.
+
+    On Azure OpenAI and OpenAI the grader's `json_schema` response format is
+    part of the cached prefix, so grader and generator requests do not share
+    one there; check `TokenUsage.cached_input_tokens` for the reuse a backend
+    actually reports.
+    """
+    shared_context = prompt_registry.get(SHARED_CONTEXT_PACKAGE).render(
+        retrieved_context=docs_by_type["texts"],
+        question=question,
+    )
+
+    prompt_content: list[str | dict[str, Any]] = [{"type": "text", "text": shared_context}]
+    prompt_content.extend(docs_by_type["images"])
+    prompt_content.append({"type": "text", "text": instructions})
+
+    return ChatPromptTemplate.from_messages([
+        HumanMessage(content=prompt_content)
+    ])
@@ -1,25 +1,75 @@
 import logging
+from contextlib import aclosing, closing
 from typing import Any, cast
 
 from langchain_core.language_models.chat_models import BaseChatModel
-from langchain_core.messages import HumanMessage
+from langchain_core.messages import BaseMessageChunk
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_core.runnables import Runnable, RunnableLambda
+from langchain_core.runnables import (
+    Runnable,
+    RunnableConfig,
+    RunnableLambda,
+    RunnableSequence,
+)
 from pydantic import BaseModel
 
-from core_examples.utils.common import (
-    load_and_clean_text_file,
-    resolve_package_resource,
+from core_examples.components.runnables.shared_context.shared_context import (
+    SHARED_CONTEXT_PACKAGE,
+    build_shared_context_prompt,
 )
+from core_examples.utils.prompt_registry import prompt_registry
+from core_examples.utils.streaming_json import JsonFieldScanner
 from frankstate.entity.runnable_builder import PromptMixin, RunnableBuilder
 
 
+class GradeStreamCappedError(RuntimeError):
+    """Raised when `max_stream_chunks` chunks were streamed before the early-exit field completed.
+
+    Attributes:
+        field: Early-exit field that was still incomplete.
+        chunks: Number of chunks streamed before the stream was closed.
+    """
+
+    def __init__(self, field: str, chunks: int):
+        super().__init__(f"Grading stream closed after {chunks} chunk(s) before '{field}' was complete")
+        self.field = field
+        self.chunks = chunks
+
+
 class StructuredGradeDocument(PromptMixin, RunnableBuilder):
+    """Grade the relevance of the retrieved context with a structured output.
+
+    With `early_exit_field`, the structured response is streamed and parsed
+    as it arrives: once that field is complete, the stream is closed, which
+    cancels the rest of the generation, and the result is built from that
+    field alone with `model_construct()`. When the stream ends without the
+    field, the whole response is parsed as usual.
+
+    `max_stream_chunks` caps the chunks streamed by such a call. Providers
+    usually stream about one token per chunk, but the cap counts chunks, not
+    tokens, and does not limit what the model generates server-side. Once
+    the cap is reached without the field, the stream is closed and
+    `GradeStreamCappedError` is raised instead of parsing a truncated answer.
+    """
+
     logger: logging.Logger = logging.getLogger(__name__)
 
-    def __init__(self, model: BaseChatModel, structured_output_schema: type[BaseModel]):
+    def __init__(
+        self,
+        model: BaseChatModel,
+        structured_output_schema: type[BaseModel],
+        early_exit_field: str | None = None,
+        max_stream_chunks: int | None = None,
+    ):
+        if max_stream_chunks is not None and max_stream_chunks < 1:
+            raise ValueError("`max_stream_chunks` must be at least 1")
+        if early_exit_field is not None and early_exit_field not in structured_output_schema.model_fields:
+            raise ValueError(f"'{early_exit_field}' is not a field of {structured_output_schema.__name__}")
         super().__init__(model=model)
         self.structured_output_schema = structured_output_schema
+        self.early_exit_field = early_exit_field
+        self.max_stream_chunks = max_stream_chunks
+        prompt_registry.preload(__package__ or __name__, SHARED_CONTEXT_PACKAGE)
 
         self.logger.info("StructuredGradeDocument initialized")
 
@@ -29,31 +79,80 @@ class StructuredGradeDocument(PromptMixin, RunnableBuilder):
         if not question or not isinstance(docs_by_type, dict):
             raise ValueError("Missing required keys 'question' and 'context' in kwargs")
 
-        # Prepare the human_prompt
-        package = __package__ or __name__
-        context = load_and_clean_text_file(resolve_package_resource(package, 'prompt', 'context.md'))
-        instructions = load_and_clean_text_file(resolve_package_resource(package, 'prompt', 'instructions.md'))
-
-        format_template = load_and_clean_text_file(resolve_package_resource(package, 'prompt', 'format_template.md'))
+        # Shared context first, so the grader and the generator send the same prefix
+        instructions = prompt_registry.get(__package__ or __name__).render()
 
-        prompt_template = format_template.format(
-            context=context,
-            retrieved_context=docs_by_type["texts"],
-            question=question,
-            instructions=instructions
-        )
-
-        prompt_content: list[str | dict[str, Any]] = [{"type": "text", "text": prompt_template}]
-        prompt_content.extend(docs_by_type["images"])
-
-        return ChatPromptTemplate.from_messages([
-            HumanMessage(content=prompt_content)
-        ])
+        return build_shared_context_prompt(docs_by_type, question, instructions)
 
     def _configure_runnable(self) -> Runnable:
-        structured_grade_document_chain = {
+        prompt_chain = {
             "context": RunnableLambda( lambda kwargs: cast(dict[str, Any], kwargs)["context"]),
             "question": RunnableLambda(lambda kwargs: cast(dict[str, Any], kwargs)["question"]),
-        } | RunnableLambda(lambda kwargs: self._build_prompt(**kwargs)) | self.model.with_structured_output(schema=self.structured_output_schema, method="json_schema")
+        } | RunnableLambda(lambda kwargs: self._build_prompt(**kwargs))
+        structured_output = self.model.with_structured_output(schema=self.structured_output_schema, method="json_schema")
+
+        if self.early_exit_field is None:
+            structured_grade_document_chain = prompt_chain | structured_output
+            return structured_grade_document_chain
+
+        # Chat models implement `json_schema` structured output as the model
+        # bound to the schema followed by an output parser; stream the former.
+        if not isinstance(structured_output, RunnableSequence) or len(structured_output.steps) != 2:
+            self.logger.warning("Structured output of %s cannot be streamed; grading without early exit", type(self.model).__name__)
+            return prompt_chain | structured_output
+
+        self._prompt_chain = prompt_chain
+        self._schema_model, self._output_parser = structured_output.steps
+        return RunnableLambda(self._grade, afunc=self._agrade)
+
+    def _grade(self, input: dict[str, Any], config: RunnableConfig) -> Any:
+        prompt = self._prompt_chain.invoke(input, config)
+        scanner = JsonFieldScanner(cast(str, self.early_exit_field))
+        chunks: list[BaseMessageChunk] = []
+        capped = False
+        with closing(self._schema_model.stream(prompt, config)) as stream:
+            for chunk in stream:
+                chunks.append(chunk)
+                if scanner.feed(chunk.text):
+                    break
+                if self._capped(chunks):
+                    capped = True
+                    break
+        return self._result(scanner, chunks, capped, config)
+
+    async def _agrade(self, input: dict[str, Any], config: RunnableConfig) -> Any:
+        prompt = await self._prompt_chain.ainvoke(input, config)
+        scanner = JsonFieldScanner(cast(str, self.early_exit_field))
+        chunks: list[BaseMessageChunk] = []
+        capped = False
+        async with aclosing(self._schema_model.astream(prompt, config)) as stream:
+            async for chunk in stream:
+                chunks.append(chunk)
+                if scanner.feed(chunk.text):
+                    break
+                if self._capped(chunks):
+                    capped = True
+                    break
+        return self._result(scanner, chunks, capped, config)
+
+    def _capped(self, chunks: list[BaseMessageChunk]) -> bool:
+        return self.max_stream_chunks is not None and len(chunks) >= self.max_stream_chunks
 
-        return structured_grade_document_chain
+    def _result(
+        self,
+        scanner: JsonFieldScanner,
+        chunks: list[BaseMessageChunk],
+        capped: bool,
+        config: RunnableConfig,
+    ) -> Any:
+        if scanner.done:
+            self.logger.debug("Grading stopped after %s streamed chunk(s)", len(chunks))
+            return self.structured_output_schema.model_construct(**{scanner.field: scanner.value})
+        if capped:
+            raise GradeStreamCappedError(scanner.field, len(chunks))
+        if not chunks:
+            raise ValueError("The grading model streamed an empty response")
+        message = chunks[0]
+        for chunk in chunks[1:]:
+            message = message + chunk
+        return self._output_parser.invoke(message, config)
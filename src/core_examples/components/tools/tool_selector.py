@@ -0,0 +1,143 @@
+import asyncio
+import logging
+import math
+import threading
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from langchain_core.embeddings import Embeddings
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langchain_core.tools import BaseTool
+
+
+def _cosine(left: Sequence[float], right: Sequence[float]) -> float:
+    dot = sum(a * b for a, b in zip(left, right, strict=False))
+    norm = math.sqrt(sum(a * a for a in left)) * math.sqrt(sum(b * b for b in right))
+    return dot / norm if norm else 0.0
+
+
+class ToolSelector:
+    """Pick the tools worth binding for one request by embedding similarity.
+
+    Each tool is embedded once from its name and description. A request is
+    matched on its latest human message, and the `top_k` most similar tools
+    are returned in catalog order, together with:
+
+    - the tools named in `always`,
+    - the tools already called since the latest human message, so the agent
+      can keep using them while it works through a turn.
+
+    Catalogs of at most `top_k` tools are returned whole without embedding
+    anything. If embedding fails, the whole catalog is returned and a warning
+    is logged, so selection never breaks a request.
+
+    Attributes:
+        tools: Tool catalog.
+        embeddings: Embeddings model used for descriptions and requests.
+        top_k: Number of tools selected by similarity.
+        always: Names of tools bound to every request.
+        min_score: Optional cosine similarity below which a tool is not
+            selected, even within the top `top_k`.
+    """
+
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        tools: Sequence[BaseTool],
+        embeddings: Embeddings,
+        top_k: int = 4,
+        always: Iterable[str] = (),
+        min_score: float | None = None,
+    ):
+        if top_k < 1:
+            raise ValueError("`top_k` must be at least 1")
+        self.tools = list(tools)
+        self.embeddings = embeddings
+        self.top_k = top_k
+        self.always = frozenset(always)
+        self.min_score = min_score
+
+        unknown = self.always - {tool.name for tool in self.tools}
+        if unknown:
+            raise ValueError(f"Tools {sorted(unknown)} in `always` are not in the catalog")
+
+        self._vectors: list[list[float]] | None = None
+        self._lock = threading.Lock()
+
+    def select(self, messages: Sequence[BaseMessage]) -> list[BaseTool]:
+        """Return the tools to bind for `messages`."""
+        if len(self.tools) <= self.top_k:
+            return list(self.tools)
+        try:
+            vectors = self._tool_vectors()
+            query = self._query(messages)
+            scores = self.embeddings.embed_query(query) if query else None
+        except Exception:
+            self.logger.warning("Tool selection failed; binding the whole catalog", exc_info=True)
+            return list(self.tools)
+        return self._rank(vectors, scores, messages)
+
+    async def aselect(self, messages: Sequence[BaseMessage]) -> list[BaseTool]:
+        """Return the tools to bind for `messages`, embedding asynchronously."""
+        if len(self.tools) <= self.top_k:
+            return list(self.tools)
+        try:
+            vectors = self._vectors
+            if vectors is None:
+                vectors = await asyncio.to_thread(self._tool_vectors)
+            query = self._query(messages)
+            scores = await self.embeddings.aembed_query(query) if query else None
+        except Exception:
+            self.logger.warning("Tool selection failed; binding the whole catalog", exc_info=True)
+            return list(self.tools)
+        return self._rank(vectors, scores, messages)
+
+    def _tool_vectors(self) -> list[list[float]]:
+        """Embed the tool descriptions once."""
+        with self._lock:
+            if self._vectors is None:
+                texts = [f"{tool.name}: {tool.description}" for tool in self.tools]
+                self._vectors = self.embeddings.embed_documents(texts)
+                self.logger.info("Embedded %s tool descriptions", len(texts))
+            return self._vectors
+
+    @staticmethod
+    def _query(messages: Sequence[BaseMessage]) -> str:
+        for message in reversed(messages):
+            if isinstance(message, HumanMessage):
+                return message.text
+        return ""
+
+    def _rank(
+        self,
+        vectors: list[list[float]],
+        query_vector: list[float] | None,
+        messages: Sequence[BaseMessage],
+    ) -> list[BaseTool]:
+        selected = set(self.always)
+        for message in reversed(messages):
+            if isinstance(message, HumanMessage):
+                break
+            if isinstance(message, AIMessage):
+                selected.update(call["name"] for call in message.tool_calls)
+
+        if query_vector is not None:
+            ranked = sorted(
+                ((_cosine(vector, query_vector), tool.name) for vector, tool in zip(vectors, self.tools, strict=True)),
+                reverse=True,
+            )
+            selected.update(
+                name
+                for score, name in ranked[: self.top_k]
+                if self.min_score is None or score >= self.min_score
+            )
+
+        return [tool for tool in self.tools if tool.name in selected]
+
+
+def extract_messages(input: Any) -> list[BaseMessage]:
+    """Return the messages of an agent input, given as a list or as `{"messages": [...]}`."""
+    if isinstance(input, dict):
+        return list(input.get("messages") or [])
+    return list(input) if isinstance(input, list) else []
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any
 
 from azure.core.credentials import AzureKeyCredential
@@ -49,9 +50,17 @@ class AISearchAdaptiveRAGConfigGraph(GraphLayout):
 
     Flow:
         START -> Retriever -> (Generation | Rewrite)
-        Rewrite -> Retriever
+        Rewrite -> Retriever, at most `MAX_REWRITES` times per run, then Generation
         Generation -> END
 
+    Under a `DegradationPolicy`, overloaded runs skip grading and rewriting
+    and go straight from Retriever to Generation.
+
+    The runtime is shared by every instance built under the same settings,
+    so graph variants of this layout reuse the same chains and retriever.
+    Starting the layout checks the search index is reachable, and releasing
+    the last instance closes the `SearchClient`.
+
     Use this layout when retrieval is delegated to Azure AI Search instead of a
     local vector store.
     """
@@ -63,6 +72,11 @@ class AISearchAdaptiveRAGConfigGraph(GraphLayout):
     RAW_RETRIEVER: AISearchMultiVectorRetriever
 
     INDEX_NAME = "demo-rag-multimodal-index"
+    MAX_REWRITES = 2
+    share_runtime = True
+
+    def runtime_key(self) -> str:
+        return get_settings().model_dump_json()
 
     def build_runtime(self) -> dict[str, Any]:
         settings = get_settings()
@@ -89,10 +103,19 @@ class AISearchAdaptiveRAGConfigGraph(GraphLayout):
             "GRADE_STRUCTURED_CHAIN": StructuredGradeDocument(
                 model=LLMServices.model,
                 structured_output_schema=GradeDocuments,
+                early_exit_field="binary_score",
+                max_stream_chunks=64,
             ),
             "REWRITE_CHAIN": RewriteQuestion(model=LLMServices.model),
         }
 
+    async def acheck_runtime(self, runtime: dict[str, Any]) -> None:
+        # Fails fast on a wrong endpoint, key or index instead of on the first question.
+        await asyncio.to_thread(runtime["RAW_RETRIEVER"].search_client.get_document_count)
+
+    def close_runtime(self, runtime: dict[str, Any]) -> None:
+        runtime["RAW_RETRIEVER"].search_client.close()
+
     def layout(self) -> None:
         ## NODES
         self.GENERATION_NODE = SimpleNode(
@@ -120,9 +143,14 @@ class AISearchAdaptiveRAGConfigGraph(GraphLayout):
                 "rewrite": self.REWRITE_NODE.name,
             },
             node_source=self.RETRIEVER_NODE.name,
+            degrade_to=self.GENERATION_NODE.name,
         )
         self._EDGE_3 = SimpleEdge(node_source=self.GENERATION_NODE.name, node_path=END)
+        # GradeRewriteGenerate allows one rewrite; the budget bounds the loop
+        # even if grading keeps answering "rewrite".
         self._EDGE_4 = SimpleEdge(
             node_source=self.REWRITE_NODE.name,
             node_path=self.RETRIEVER_NODE.name,
+            max_traversals=self.MAX_REWRITES,
+            exit_to=self.GENERATION_NODE.name,
         )
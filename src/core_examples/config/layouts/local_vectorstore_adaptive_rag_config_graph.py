@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any
 
 from langgraph.graph import END, START
@@ -49,9 +50,17 @@ class LocalVectorStoreAdaptiveRAGConfigGraph(GraphLayout):
 
     Flow:
         START -> Retriever -> (Generation | Rewrite)
-        Rewrite -> Retriever
+        Rewrite -> Retriever, at most `MAX_REWRITES` times per run, then Generation
         Generation -> END
 
+    Under a `DegradationPolicy`, overloaded runs skip grading and rewriting
+    and go straight from Retriever to Generation.
+
+    The runtime is shared by every instance built under the same settings,
+    so graph variants of this layout reuse the same chains and retriever.
+    Starting the layout checks the Chroma collection can be queried, and
+    releasing the last instance closes its Chroma client.
+
     This layout is the reference pattern for local multimodal retrieval loops.
     """
 
@@ -60,6 +69,13 @@ class LocalVectorStoreAdaptiveRAGConfigGraph(GraphLayout):
     GENERARION_CHAIN: MultimodalGeneration
     GRADE_STRUCTURED_CHAIN: StructuredGradeDocument
     REWRITE_CHAIN: RewriteQuestion
+    RAW_RETRIEVER: LangchainChromaMultiVectorRetriever
+
+    MAX_REWRITES = 2
+    share_runtime = True
+
+    def runtime_key(self) -> str:
+        return get_settings().model_dump_json()
 
     def build_runtime(self) -> dict[str, Any]:
         settings = get_settings()
@@ -69,22 +85,32 @@ class LocalVectorStoreAdaptiveRAGConfigGraph(GraphLayout):
 
         raw_retriever = LangchainChromaMultiVectorRetriever(
             embeddings=LLMServices.embeddings,
-        ).get_retriever()
+        )
 
         return {
             "CONFIG_NODES": load_node_registry(settings.config_nodes_file_path),
+            "RAW_RETRIEVER": raw_retriever,
             "RETRIEVER_CHAIN": MultimodalRetriever(
                 model=LLMServices.model,
-                retriever=raw_retriever,
+                retriever=raw_retriever.get_retriever(),
             ),
             "GENERARION_CHAIN": MultimodalGeneration(model=LLMServices.model),
             "GRADE_STRUCTURED_CHAIN": StructuredGradeDocument(
                 model=LLMServices.model,
                 structured_output_schema=GradeDocuments,
+                early_exit_field="binary_score",
+                max_stream_chunks=64,
             ),
             "REWRITE_CHAIN": RewriteQuestion(model=LLMServices.model),
         }
 
+    async def acheck_runtime(self, runtime: dict[str, Any]) -> None:
+        # Fails fast on an unreadable persist directory instead of on the first question.
+        await asyncio.to_thread(runtime["RAW_RETRIEVER"].count)
+
+    def close_runtime(self, runtime: dict[str, Any]) -> None:
+        runtime["RAW_RETRIEVER"].close()
+
     def layout(self) -> None:
         ## NODES
         self.GENERATION_NODE = SimpleNode(
@@ -112,9 +138,14 @@ class LocalVectorStoreAdaptiveRAGConfigGraph(GraphLayout):
                 "rewrite": self.REWRITE_NODE.name,
             },
             node_source=self.RETRIEVER_NODE.name,
+            degrade_to=self.GENERATION_NODE.name,
         )
         self._EDGE_3 = SimpleEdge(node_source=self.GENERATION_NODE.name, node_path=END)
+        # GradeRewriteGenerate allows one rewrite; the budget bounds the loop
+        # even if grading keeps answering "rewrite".
         self._EDGE_4 = SimpleEdge(
             node_source=self.REWRITE_NODE.name,
             node_path=self.RETRIEVER_NODE.name,
+            max_traversals=self.MAX_REWRITES,
+            exit_to=self.GENERATION_NODE.name,
         )
\ No newline at end of file
@@ -5,6 +5,7 @@ from langgraph.graph import END, START
 from langgraph.prebuilt import ToolNode
 
 from core_examples.components.edges.evaluators.route_human_node import RouteHumanNode
+from core_examples.components.memory.conversation_memory import ConversationMemory
 from core_examples.components.nodes.commands.human_review_sensitive_tool_call import (
     HumanReviewSensitiveToolCall,
 )
@@ -49,6 +50,7 @@ class OakHumanLoopConfigGraph(GraphLayout):
 
     CONFIG_NODES: dict[str, Any]
     OAKLANG_AGENT: OakLangAgent
+    MEMORY: ConversationMemory
     SENSITIVE_TOOLS: list[BaseTool]
 
     def build_runtime(self) -> dict[str, Any]:
@@ -65,13 +67,14 @@ class OakHumanLoopConfigGraph(GraphLayout):
                 model=LLMServices.model,
                 tools=[GetEvolutionTool(), RandomMovementsTool(), dominate_pokemon_tool],
             ),
+            "MEMORY": ConversationMemory(summarizer=LLMServices.turbo_model or LLMServices.model),
             "SENSITIVE_TOOLS": [dominate_pokemon_tool],
         }
 
     def layout(self) -> None:
         ## NODES
         self.OAKLANG_NODE = SimpleNode(
-            enhancer=SimpleMessagesAsyncInvoke(self.OAKLANG_AGENT),
+            enhancer=SimpleMessagesAsyncInvoke(self.OAKLANG_AGENT, memory=self.MEMORY),
             name=self.CONFIG_NODES["OAKLANG_NODE"]["name"],
             tags=[self.CONFIG_NODES["OAKLANG_NODE"]["description"]],
         )
@@ -6,6 +6,7 @@ from langgraph.prebuilt import ToolNode
 from core_examples.components.edges.evaluators.route_tool_condition import (
     RouteToolCondition,
 )
+from core_examples.components.memory.conversation_memory import ConversationMemory
 from core_examples.components.nodes.enhancers.simple_messages_ainvoke import (
     SimpleMessagesAsyncInvoke,
 )
@@ -31,7 +32,8 @@ class SimpleOakConfigGraph(GraphLayout):
 
     State expectations:
         - Uses `SharedState` or another messages-compatible schema.
-        - The agent node reads `messages` and appends a new assistant message.
+        - The agent node reads `messages`, bounded by `ConversationMemory`, and
+          appends a new assistant message.
 
     Flow:
         START -> OakLangAgent -> (OakTools | END)
@@ -43,6 +45,7 @@ class SimpleOakConfigGraph(GraphLayout):
 
     CONFIG_NODES: dict[str, Any]
     OAKLANG_AGENT: OakLangAgent
+    MEMORY: ConversationMemory
 
     def build_runtime(self) -> dict[str, Any]:
         settings = get_settings()
@@ -56,12 +59,13 @@ class SimpleOakConfigGraph(GraphLayout):
                 model=LLMServices.model,
                 tools=[GetEvolutionTool(), RandomMovementsTool()],
             ),
+            "MEMORY": ConversationMemory(summarizer=LLMServices.turbo_model or LLMServices.model),
         }
 
     def layout(self) -> None:
         ## NODES
         self.OAKLANG_NODE = SimpleNode(
-            enhancer=SimpleMessagesAsyncInvoke(self.OAKLANG_AGENT),
+            enhancer=SimpleMessagesAsyncInvoke(self.OAKLANG_AGENT, memory=self.MEMORY),
             name=self.CONFIG_NODES["OAKLANG_NODE"]["name"],
             tags=[self.CONFIG_NODES["OAKLANG_NODE"]["description"]],
         )
@@ -1,3 +1,4 @@
+import asyncio
 from importlib import resources
 from importlib.resources.abc import Traversable
 from pathlib import Path
@@ -9,6 +10,7 @@ from langgraph.types import Command
 
 from core_examples.config.settings import get_settings
 from core_examples.utils.config_loader import _read_text_resource
+from frankstate.runtime.stream_hub import StreamHub
 
 
 def resolve_package_resource(package: str, *relative_parts: str) -> Traversable:
@@ -93,14 +95,22 @@ async def print_process_astream(
     In Frankenst-AI notebooks this is typically a state dictionary keyed by
     graph field names, but LangGraph
     also allows resuming execution with a `Command` or passing `None`.
+    Updates go through a `StreamHub`, so only the last one is kept in memory.
     """
-    events = []
-    async for event in graph.astream(message_input, runnable_config, stream_mode="updates"):
-        events.append(event)
-        print(event)
-        print("\n")
+    hub = StreamHub(graph, stream_mode="updates")
+    printer = hub.subscribe("print")
+    last_event = None
 
-    if not events:
+    async def print_events() -> None:
+        nonlocal last_event
+        async for event in printer:
+            last_event = event.data
+            print(event.data)
+            print("\n")
+
+    await asyncio.gather(hub.run(message_input, runnable_config), print_events())
+
+    if hub.events == 0:
         raise ValueError("Graph stream produced no events.")
 
-    return events[-1]
\ No newline at end of file
+    return last_event
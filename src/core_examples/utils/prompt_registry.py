@@ -0,0 +1,196 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from importlib.resources.abc import Traversable
+from pathlib import Path
+from string import Formatter
+from typing import Any
+
+from core_examples.utils.common import (
+    load_and_clean_text_file,
+    resolve_package_resource,
+)
+
+PROMPT_DIRECTORY = "prompt"
+FORMAT_TEMPLATE = "format_template.md"
+
+
+def _escape(text: str) -> str:
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+def _root(field_name: str) -> str:
+    """Return the variable a field refers to, e.g. `docs` for `{docs[0]}`."""
+    return field_name.split(".", 1)[0].split("[", 1)[0]
+
+
+def compile_template(format_template: str, parts: dict[str, str]) -> str:
+    """Substitute `parts` into `format_template` and keep the other fields as placeholders.
+
+    The result is a `str.format()` template whose fields are only the
+    per-call variables. Braces inside `parts` are escaped, so the text of a
+    part is never interpreted as a placeholder, exactly as when the parts and
+    the variables are formatted together.
+    """
+    compiled: list[str] = []
+    for literal, field_name, format_spec, conversion in Formatter().parse(format_template):
+        compiled.append(_escape(literal))
+        if field_name is None:
+            continue
+        if field_name in parts:
+            value = parts[field_name]
+            if conversion == "r":
+                value = repr(value)
+            compiled.append(_escape(format(value, format_spec or "")))
+            continue
+        suffix = f"!{conversion}" if conversion else ""
+        suffix += f":{format_spec}" if format_spec else ""
+        compiled.append(f"{{{field_name}{suffix}}}")
+    return "".join(compiled)
+
+
+@dataclass(frozen=True)
+class PromptPackage:
+    """Prompt files of one runnable package, loaded and compiled once.
+
+    Attributes:
+        package: Package whose `prompt/` directory was loaded.
+        parts: Cleaned text of every markdown file but the format template,
+            keyed by file stem.
+        template: Format template with the parts already substituted; only
+            per-call variables remain.
+        variables: Names of the per-call variables of `template`.
+        mtimes: Modification time of each file, when it lives on disk.
+    """
+
+    package: str
+    parts: dict[str, str]
+    template: str
+    variables: frozenset[str]
+    mtimes: dict[str, float] = field(default_factory=dict)
+
+    def render(self, **values: Any) -> str:
+        """Return the prompt text with the per-call `values` substituted.
+
+        Raises:
+            ValueError: If a variable of the template has no value.
+        """
+        missing = self.variables - values.keys()
+        if missing:
+            raise ValueError(f"Prompt of '{self.package}' is missing variables {sorted(missing)}")
+        return self.template.format(**values)
+
+
+class PromptRegistry:
+    """Cache of the compiled `PromptPackage`s used by the example builders.
+
+    Builders used to read and format their markdown prompt files on every
+    invocation. The registry reads each package's `prompt/` directory once
+    and compiles its format template, so building a prompt only substitutes
+    the per-call variables:
+
+        prompt_registry.preload(__package__)
+        text = prompt_registry.get(__package__).render(question=question)
+
+    With `reload=True`, the modification times of the files are checked at
+    most every `check_interval` seconds and a package whose files changed is
+    reloaded, which is handy while editing prompts. Packages installed as
+    zip archives have no modification times and are never reloaded.
+    """
+
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    def __init__(self, reload: bool = False, check_interval: float = 1.0):
+        self.reload = reload
+        self.check_interval = check_interval
+        self._packages: dict[str, PromptPackage] = {}
+        self._checked: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def preload(self, *packages: str) -> None:
+        """Load and compile `packages` ahead of their first use."""
+        for package in packages:
+            self.get(package)
+
+    def get(self, package: str) -> PromptPackage:
+        """Return the compiled prompt of `package`, loading it on first use.
+
+        Raises:
+            FileNotFoundError: If the package has no `prompt/format_template.md`.
+        """
+        prompt = self._packages.get(package)
+        if prompt is not None and not self._is_stale(prompt):
+            return prompt
+
+        with self._lock:
+            current = self._packages.get(package)
+            if current is prompt or current is None:
+                current = self._load(package)
+                self._packages[package] = current
+                self._checked[package] = time.monotonic()
+            return current
+
+    def clear(self) -> None:
+        """Forget every compiled package."""
+        with self._lock:
+            self._packages.clear()
+            self._checked.clear()
+
+    def _is_stale(self, prompt: PromptPackage) -> bool:
+        if not self.reload or not prompt.mtimes:
+            return False
+        now = time.monotonic()
+        if now - self._checked.get(prompt.package, 0.0) < self.check_interval:
+            return False
+        self._checked[prompt.package] = now
+        return self._read_mtimes(self._files(prompt.package)) != prompt.mtimes
+
+    def _load(self, package: str) -> PromptPackage:
+        files = self._files(package)
+        if FORMAT_TEMPLATE not in files:
+            raise FileNotFoundError(f"Not found the file <{PROMPT_DIRECTORY}/{FORMAT_TEMPLATE}> in package '{package}'.")
+
+        parts = {
+            name.removesuffix(".md"): load_and_clean_text_file(resource)
+            for name, resource in files.items()
+            if name != FORMAT_TEMPLATE
+        }
+        template = compile_template(load_and_clean_text_file(files[FORMAT_TEMPLATE]), parts)
+        variables = frozenset(
+            _root(field_name)
+            for _, field_name, _, _ in Formatter().parse(template)
+            if field_name
+        )
+        self.logger.info("Compiled prompt of %s from %s file(s)", package, len(files))
+        return PromptPackage(
+            package=package,
+            parts=parts,
+            template=template,
+            variables=variables,
+            mtimes=self._read_mtimes(files),
+        )
+
+    @staticmethod
+    def _files(package: str) -> dict[str, Traversable]:
+        directory = resolve_package_resource(package, PROMPT_DIRECTORY)
+        if not directory.is_dir():
+            return {}
+        return {
+            resource.name: resource
+            for resource in sorted(directory.iterdir(), key=lambda item: item.name)
+            if resource.is_file() and resource.name.endswith(".md")
+        }
+
+    @staticmethod
+    def _read_mtimes(files: dict[str, Traversable]) -> dict[str, float]:
+        mtimes: dict[str, float] = {}
+        for name, resource in files.items():
+            if not isinstance(resource, Path):
+                return {}
+            mtimes[name] = resource.stat().st_mtime
+        return mtimes
+
+
+# Registry shared by the example runnable builders.
+prompt_registry = PromptRegistry()
@@ -0,0 +1,109 @@
+import json
+from typing import Any
+
+_DELIMITERS = ",}] \t\r\n"
+
+
+class JsonFieldScanner:
+    """Find a top-level scalar field of a JSON object while it is still streaming.
+
+    Feed the text chunks of a model response as they arrive; `feed()` returns
+    `True` as soon as the value of `field` is complete, so the caller can stop
+    reading the rest of the object:
+
+        scanner = JsonFieldScanner("binary_score")
+        async for chunk in stream:
+            if scanner.feed(chunk.text):
+                break
+        scanner.value  # "yes"
+
+    Only the top-level object is inspected, so the same key nested in another
+    value or quoted inside a string is ignored. Text before the opening brace,
+    such as a Markdown code fence, is skipped. A field whose value is an
+    object or an array is never reported complete.
+    """
+
+    def __init__(self, field: str):
+        self.field = field
+        self.done = False
+        self.value: Any = None
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._expect_key = False
+        self._after_colon = False
+        self._key: str | None = None
+        self._raw: list[str] | None = None
+        self._capture: str | None = None
+
+    def feed(self, text: str) -> bool:
+        """Scan `text` and return whether the field value is complete."""
+        for char in text:
+            if self.done:
+                break
+            self._step(char)
+        return self.done
+
+    def _step(self, char: str) -> None:
+        if self._in_string:
+            if self._raw is not None:
+                self._raw.append(char)
+            if self._escape:
+                self._escape = False
+            elif char == "\\":
+                self._escape = True
+            elif char == '"':
+                self._in_string = False
+                self._close_string()
+            return
+
+        if self._capture == "literal" and self._raw is not None:
+            if char not in _DELIMITERS:
+                self._raw.append(char)
+                return
+            self._finish("".join(self._raw))
+            return
+
+        if char == '"':
+            self._in_string = True
+            capture = self._starts_value()
+            self._capture = "string" if capture else None
+            self._raw = ['"'] if capture or (self._depth == 1 and self._expect_key) else None
+        elif char in "{[":
+            self._starts_value()
+            self._depth += 1
+            self._expect_key = char == "{" and self._depth == 1
+        elif char in "}]":
+            self._depth -= 1
+        elif self._depth == 1 and char == ":":
+            self._after_colon = True
+        elif self._depth == 1 and char == ",":
+            self._expect_key = True
+        elif not char.isspace() and self._starts_value():
+            self._capture = "literal"
+            self._raw = [char]
+
+    def _starts_value(self) -> bool:
+        """Return whether a value starting here belongs to `field`."""
+        if self._depth != 1 or not self._after_colon:
+            return False
+        self._after_colon = False
+        return self._key == self.field
+
+    def _close_string(self) -> None:
+        raw = "".join(self._raw or ())
+        self._raw = None
+        if self._capture == "string":
+            self._finish(raw)
+        elif self._depth == 1 and self._expect_key:
+            self._key = json.loads(raw)
+            self._expect_key = False
+
+    def _finish(self, raw: str) -> None:
+        try:
+            self.value = json.loads(raw)
+        except json.JSONDecodeError:
+            self._capture = None
+            self._raw = None
+            return
+        self.done = True
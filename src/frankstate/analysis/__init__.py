@@ -0,0 +1,9 @@
+"""Offline analysis tools for configured layouts.
+
+They read the topology collected by the managers, or runs recorded earlier,
+without compiling or running the graph. Import concrete tools from their modules instead of this package:
+
+- ``frankstate.analysis.critical_path``
+- ``frankstate.analysis.simulator``
+- ``frankstate.analysis.stats``
+"""
@@ -0,0 +1,303 @@
+import argparse
+import json
+import logging
+import sys
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Sequence
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from frankstate.analysis.stats import PERCENTILES, percentile
+
+
+@dataclass(frozen=True)
+class NodeContribution:
+    """Latency contribution of one node across the analysed runs.
+
+    Attributes:
+        node: Node name, as declared in the layout.
+        executions: Times the node ran.
+        critical_executions: Times the node was the slowest task of its
+            superstep, i.e. on the critical path.
+        critical_time: Total seconds the node spent on the critical path.
+        share: `critical_time` over the total latency of the analysed runs.
+        mean_duration: Mean seconds per execution.
+        p95_duration: 95th percentile seconds per execution.
+        mean_barrier_wait: Mean seconds per execution spent finished but
+            waiting for slower tasks of the same superstep.
+    """
+
+    node: str
+    executions: int
+    critical_executions: int
+    critical_time: float
+    share: float
+    mean_duration: float
+    p95_duration: float
+    mean_barrier_wait: float
+
+
+@dataclass(frozen=True)
+class RunPath:
+    """Critical path of one recorded run.
+
+    Attributes:
+        run_id: Recorded run id.
+        latency: End-to-end seconds of the run.
+        path: Slowest node of each superstep, in order.
+        working: Seconds spent in the nodes of `path`.
+        waiting: Remaining seconds, spent between supersteps in the runtime
+            (scheduling, routing writes, checkpointing).
+    """
+
+    run_id: str
+    latency: float
+    path: tuple[str, ...]
+    working: float
+    waiting: float
+
+
+@dataclass(frozen=True)
+class CriticalPathReport:
+    """Result of `CriticalPathAnalyzer.report()`.
+
+    Attributes:
+        layout: Layout the runs were filtered by, if any.
+        runs: Number of analysed runs.
+        failed_runs: Analysed runs that ended with an error.
+        latency: End-to-end latency percentiles in seconds, keyed by percentile.
+        mean_latency: Mean end-to-end latency in seconds.
+        mean_working: Mean seconds per run spent in critical-path nodes.
+        mean_waiting: Mean seconds per run spent outside critical-path nodes.
+        contributors: Nodes sorted by `critical_time`, largest first.
+        paths: Occurrences of each distinct critical path, most common first.
+        decisions: Route counts per conditional edge source node.
+        durations: Recorded seconds per execution of each node, usable as
+            `Empirical` latency models in `LayoutSimulator`.
+    """
+
+    layout: str | None
+    runs: int
+    failed_runs: int
+    latency: dict[float, float]
+    mean_latency: float
+    mean_working: float
+    mean_waiting: float
+    contributors: tuple[NodeContribution, ...]
+    paths: tuple[tuple[tuple[str, ...], int], ...]
+    decisions: dict[str, dict[str, int]]
+    durations: dict[str, tuple[float, ...]] = field(repr=False)
+
+    def summary(self, top: int = 10) -> str:
+        """Return a human readable explanation of the analysis."""
+        scope = f" of {self.layout}" if self.layout else ""
+        lines = [f"{self.runs} recorded run(s){scope} analysed."]
+        if self.failed_runs:
+            lines.append(f"  {self.failed_runs} run(s) ended with an error.")
+        if not self.runs:
+            return "\n".join(lines)
+
+        percentiles = ", ".join(f"p{p:g}={value * 1000:.1f}ms" for p, value in self.latency.items())
+        lines.append(f"  latency: mean={self.mean_latency * 1000:.1f}ms, {percentiles}")
+        working_share = self.mean_working / self.mean_latency if self.mean_latency else 0.0
+        lines.append(
+            f"  per run: working={self.mean_working * 1000:.1f}ms ({working_share:.0%}), "
+            f"waiting={self.mean_waiting * 1000:.1f}ms ({1 - working_share:.0%})"
+        )
+        lines.append("  top latency contributors:")
+        for item in self.contributors[:top]:
+            lines.append(
+                f"    {item.node}: {item.share:.0%} of latency, {item.critical_executions}/{item.executions} "
+                f"critical, mean={item.mean_duration * 1000:.1f}ms, p95={item.p95_duration * 1000:.1f}ms, "
+                f"barrier wait={item.mean_barrier_wait * 1000:.1f}ms"
+            )
+        lines.append("  most common critical paths:")
+        for path, count in self.paths[:3]:
+            lines.append(f"    {count}x {' -> '.join(path)}")
+        for node, routes in self.decisions.items():
+            counts = ", ".join(f"{route}={count}" for route, count in routes.items())
+            lines.append(f"  routes after {node}: {counts}")
+        return "\n".join(lines)
+
+
+class CriticalPathAnalyzer:
+    """Critical-path analysis of runs recorded by `RunRecorder`.
+
+    LangGraph runs a layout in supersteps separated by barriers: a superstep
+    lasts as long as its slowest node, so the critical path of a run is the
+    slowest node of each superstep. Time outside those nodes is spent waiting
+    on the runtime between supersteps.
+
+        analyzer = CriticalPathAnalyzer.from_jsonl("runs.jsonl")
+        print(analyzer.report(layout="AdaptiveRAGLayout").summary())
+    """
+
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    def __init__(self, records: Iterable[dict[str, Any]]):
+        self.runs: dict[str, dict[str, Any]] = {}
+        self._records: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
+        for record in records:
+            run_id = record.get("run_id")
+            if run_id is None:
+                continue
+            if record.get("type") == "run":
+                self.runs[run_id] = record
+            else:
+                self._records[run_id].append(record)
+
+    @classmethod
+    def from_jsonl(cls, *paths: str | Path) -> "CriticalPathAnalyzer":
+        """Load the records of one or more JSONL files written by `RunRecorder`.
+
+        Raises:
+            ValueError: If a line is not valid JSON.
+        """
+        records: list[dict[str, Any]] = []
+        for path in paths:
+            with Path(path).open(encoding="utf-8") as file:
+                for number, line in enumerate(file, start=1):
+                    if not line.strip():
+                        continue
+                    try:
+                        records.append(json.loads(line))
+                    except json.JSONDecodeError as exc:
+                        raise ValueError(f"{path}:{number} is not a valid JSON record") from exc
+        return cls(records)
+
+    @property
+    def layouts(self) -> list[str]:
+        """Return the layouts present in the recorded runs."""
+        return sorted({run["layout"] for run in self.runs.values() if run.get("layout")})
+
+    def report(self, layout: str | None = None) -> CriticalPathReport:
+        """Analyse the recorded runs, optionally only those of `layout`."""
+        runs = [run for run in self.runs.values() if layout is None or run.get("layout") == layout]
+        paths = [self._run_path(run) for run in runs]
+
+        durations: defaultdict[str, list[float]] = defaultdict(list)
+        barrier_waits: defaultdict[str, float] = defaultdict(float)
+        critical_counts: Counter[str] = Counter()
+        critical_time: defaultdict[str, float] = defaultdict(float)
+        decisions: defaultdict[str, Counter[str]] = defaultdict(Counter)
+        for run in runs:
+            records = self._records.get(run["run_id"], [])
+            steps = {record["step"]: record for record in records if record.get("type") == "step"}
+            for record in records:
+                if record.get("type") == "node":
+                    duration = record["end"] - record["start"]
+                    durations[record["node"]].append(duration)
+                    step = steps.get(record["step"])
+                    if step is not None:
+                        barrier_waits[record["node"]] += step["end"] - record["end"]
+                elif record.get("type") == "route":
+                    decisions[record["node"]][json.dumps(record["decision"]).strip('"')] += 1
+            for step in steps.values():
+                slowest = self._slowest(records, step["step"])
+                if slowest is not None:
+                    critical_counts[slowest["node"]] += 1
+                    critical_time[slowest["node"]] += slowest["end"] - slowest["start"]
+
+        latencies = sorted(path.latency for path in paths)
+        total_latency = sum(latencies)
+        contributors = [
+            NodeContribution(
+                node=node,
+                executions=len(values),
+                critical_executions=critical_counts[node],
+                critical_time=critical_time[node],
+                share=critical_time[node] / total_latency if total_latency else 0.0,
+                mean_duration=sum(values) / len(values),
+                p95_duration=percentile(sorted(values), 95.0),
+                mean_barrier_wait=barrier_waits[node] / len(values),
+            )
+            for node, values in durations.items()
+        ]
+        contributors.sort(key=lambda item: item.critical_time, reverse=True)
+
+        count = len(paths)
+        return CriticalPathReport(
+            layout=layout,
+            runs=count,
+            failed_runs=sum(run.get("status") != "ok" for run in runs),
+            latency={p: percentile(latencies, p) for p in PERCENTILES} if latencies else {},
+            mean_latency=total_latency / count if count else 0.0,
+            mean_working=sum(path.working for path in paths) / count if count else 0.0,
+            mean_waiting=sum(path.waiting for path in paths) / count if count else 0.0,
+            contributors=tuple(contributors),
+            paths=tuple(Counter(path.path for path in paths).most_common()),
+            decisions={node: dict(routes.most_common()) for node, routes in decisions.items()},
+            durations={node: tuple(values) for node, values in durations.items()},
+        )
+
+    def run_path(self, run_id: str) -> RunPath:
+        """Return the critical path of one recorded run.
+
+        Raises:
+            ValueError: If the run was not recorded.
+        """
+        run = self.runs.get(run_id)
+        if run is None:
+            raise ValueError(f"Run '{run_id}' was not recorded")
+        return self._run_path(run)
+
+    def _run_path(self, run: dict[str, Any]) -> RunPath:
+        records = self._records.get(run["run_id"], [])
+        steps = sorted({record["step"] for record in records if record.get("type") == "node" and record.get("step") is not None})
+        path: list[str] = []
+        working = 0.0
+        for step in steps:
+            slowest = self._slowest(records, step)
+            if slowest is not None:
+                path.append(slowest["node"])
+                working += slowest["end"] - slowest["start"]
+        latency = float(run.get("duration") or 0.0)
+        return RunPath(
+            run_id=run["run_id"],
+            latency=latency,
+            path=tuple(path),
+            working=working,
+            waiting=max(latency - working, 0.0),
+        )
+
+    @staticmethod
+    def _slowest(records: Sequence[dict[str, Any]], step: int) -> dict[str, Any] | None:
+        """Return the node record of `step` that finished last."""
+        nodes = [record for record in records if record.get("type") == "node" and record.get("step") == step]
+        return max(nodes, key=lambda record: record["end"], default=None)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Command line entry point: `python -m frankstate.analysis.critical_path runs.jsonl`."""
+    parser = argparse.ArgumentParser(
+        prog="python -m frankstate.analysis.critical_path",
+        description="Critical path, waiting versus working time and top latency contributors of recorded runs.",
+    )
+    parser.add_argument("paths", nargs="+", type=Path, help="JSONL files written by RunRecorder")
+    parser.add_argument("--layout", help="only analyse runs of this layout")
+    parser.add_argument("--top", type=int, default=10, help="number of contributors to show (default: 10)")
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args(argv)
+
+    try:
+        analyzer = CriticalPathAnalyzer.from_jsonl(*args.paths)
+    except (OSError, ValueError) as exc:
+        parser.error(str(exc))
+
+    report = analyzer.report(layout=args.layout)
+    if args.json:
+        payload = asdict(report)
+        payload["latency"] = {f"p{p:g}": value for p, value in report.latency.items()}
+        payload["paths"] = [{"path": list(path), "runs": count} for path, count in report.paths]
+        del payload["durations"]
+        print(json.dumps(payload, indent=2))
+    else:
+        print(report.summary(top=args.top))
+        if args.layout is None and len(analyzer.layouts) > 1:
+            print(f"  note: runs of several layouts were mixed ({', '.join(analyzer.layouts)}); use --layout")
+    return 0 if report.runs else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,451 @@
+import logging
+import math
+import random
+from collections.abc import Hashable, Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Protocol
+
+from langgraph.graph import END, START
+
+from frankstate.analysis.stats import PERCENTILES, percentile
+from frankstate.entity.edge import ConditionalEdge, SimpleEdge
+from frankstate.entity.graph_layout import GraphLayout
+from frankstate.entity.node import CommandNode
+from frankstate.managers.edge_manager import EdgeManager
+from frankstate.managers.node_manager import NodeManager
+
+
+class LatencyModel(Protocol):
+    """Distribution of one duration in seconds."""
+
+    def sample(self, rng: random.Random) -> float: ...
+
+
+@dataclass(frozen=True)
+class Fixed:
+    """Constant duration."""
+
+    seconds: float
+
+    def sample(self, rng: random.Random) -> float:
+        return self.seconds
+
+
+@dataclass(frozen=True)
+class Uniform:
+    """Duration drawn uniformly between `low` and `high` seconds."""
+
+    low: float
+    high: float
+
+    def sample(self, rng: random.Random) -> float:
+        return rng.uniform(self.low, self.high)
+
+
+@dataclass(frozen=True)
+class LogNormal:
+    """Right-skewed duration described by its median and 95th percentile.
+
+    This is the usual shape of LLM and network latencies: most calls are
+    close to the median with a long tail of slow ones.
+    """
+
+    median: float
+    p95: float
+
+    def __post_init__(self) -> None:
+        if not 0 < self.median <= self.p95:
+            raise ValueError("`LogNormal` requires 0 < median <= p95")
+
+    def sample(self, rng: random.Random) -> float:
+        sigma = math.log(self.p95 / self.median) / 1.6448536269514722
+        return rng.lognormvariate(math.log(self.median), sigma)
+
+
+@dataclass(frozen=True)
+class Empirical:
+    """Duration resampled from measured values, e.g. production traces."""
+
+    samples: tuple[float, ...]
+
+    def __init__(self, samples: Iterable[float]):
+        values = tuple(samples)
+        if not values:
+            raise ValueError("`Empirical` requires at least one measured sample")
+        object.__setattr__(self, "samples", values)
+
+    def sample(self, rng: random.Random) -> float:
+        return rng.choice(self.samples)
+
+
+@dataclass(frozen=True)
+class NodeProfile:
+    """Cost model of one node: its latency and the LLM calls it makes per execution."""
+
+    latency: LatencyModel
+    llm_calls: int = 0
+
+
+@dataclass(frozen=True)
+class RouteProfile:
+    """Cost model of the routing done after a node.
+
+    `probabilities` maps the route keys of the node's `ConditionalEdge.map_dict`
+    (or the destination keys of a `CommandNode`) to their probability.
+    `latency` and `llm_calls` describe the evaluator itself, e.g. an LLM grader.
+    """
+
+    probabilities: Mapping[Hashable, float]
+    latency: LatencyModel | None = None
+    llm_calls: int = 0
+
+
+@dataclass(frozen=True)
+class SimulationReport:
+    """Result of `LayoutSimulator.run()`.
+
+    Attributes:
+        runs: Number of simulated runs.
+        failed_runs: Runs stopped by the recursion limit; they are excluded
+            from latency and LLM call statistics.
+        latency: End-to-end latency percentiles in seconds, keyed by percentile.
+        mean_latency: Mean end-to-end latency in seconds.
+        mean_llm_calls: Expected LLM calls per run.
+        llm_calls: LLM calls per run percentiles, keyed by percentile.
+        node_visits: Mean executions per run of each node.
+        concurrent_runs: Runs in flight used for the throughput estimate.
+        llm_capacity: Backend capacity in LLM calls per second, if given.
+        throughput: Sustainable runs per second.
+        bottleneck: `"concurrency"` or `"backend"`, whichever caps `throughput`.
+    """
+
+    runs: int
+    failed_runs: int
+    latency: dict[float, float]
+    mean_latency: float
+    mean_llm_calls: float
+    llm_calls: dict[float, float]
+    node_visits: dict[str, float]
+    concurrent_runs: int
+    llm_capacity: float | None
+    throughput: float
+    bottleneck: str
+
+    def summary(self) -> str:
+        """Return a human readable explanation of the simulation."""
+        completed = self.runs - self.failed_runs
+        lines = [f"{completed}/{self.runs} simulated run(s) completed."]
+        if self.failed_runs:
+            lines.append(f"  {self.failed_runs} run(s) hit the recursion limit.")
+        if not completed:
+            return "\n".join(lines)
+
+        percentiles = ", ".join(f"p{p:g}={value * 1000:.1f}ms" for p, value in self.latency.items())
+        lines.append(f"  latency: mean={self.mean_latency * 1000:.1f}ms, {percentiles}")
+        lines.append(
+            f"  LLM calls per run: mean={self.mean_llm_calls:.2f}, p95={self.llm_calls.get(95.0, 0.0):g}"
+        )
+        lines.append(
+            f"  throughput: {self.throughput:.2f} run(s)/s with {self.concurrent_runs} concurrent run(s), "
+            f"bound by {self.bottleneck}"
+        )
+        for name, visits in self.node_visits.items():
+            lines.append(f"  {name}: {visits:.2f} visit(s) per run")
+        return "\n".join(lines)
+
+
+@dataclass
+class _Run:
+    latency: float = 0.0
+    llm_calls: int = 0
+    visits: dict[str, int] = field(default_factory=dict)
+    traversals: dict[int, int] = field(default_factory=dict)
+
+
+class LayoutSimulator:
+    """Monte Carlo latency and cost model of a layout, for capacity planning.
+
+    The simulator walks the topology collected by `NodeManager` and
+    `EdgeManager` the way LangGraph executes it: nodes triggered together run
+    in the same superstep, a superstep lasts as long as its slowest task, and
+    conditional routing picks one route per traversal according to the
+    supplied `RouteProfile`. Loop budgets are honoured and runs are stopped at
+    `recursion_limit` supersteps, like `GraphRecursionError`.
+
+    `max_concurrency` mirrors LangGraph's config key of the same name and
+    limits how many tasks of one superstep run at once. Throughput is the
+    lower of two bounds: `concurrent_runs / mean_latency` (Little's law) and,
+    when `llm_capacity` is given, `llm_capacity / mean_llm_calls`.
+
+    Node state is not modelled, so routes are independent draws; encode
+    correlations such as "retries usually succeed" in the probabilities or
+    through loop budgets.
+    """
+
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        node_manager: NodeManager,
+        edge_manager: EdgeManager,
+        nodes: Mapping[str, NodeProfile],
+        routes: Mapping[str, RouteProfile] | None = None,
+        default_node: NodeProfile | None = None,
+        max_concurrency: int | None = None,
+        recursion_limit: int = 25,
+    ):
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("`max_concurrency` must be at least 1")
+        if recursion_limit < 1:
+            raise ValueError("`recursion_limit` must be at least 1")
+
+        self.node_manager = node_manager
+        self.edge_manager = edge_manager
+        self.nodes = dict(nodes)
+        self.routes = dict(routes or {})
+        self.default_node = default_node
+        self.max_concurrency = max_concurrency
+        self.recursion_limit = recursion_limit
+        self._validate()
+        self._profiles: dict[str, NodeProfile] = {
+            name: self.nodes.get(name) or self.default_node  # type: ignore[misc]
+            for name in self.node_manager.nodes
+        }
+
+    @classmethod
+    def from_layout(
+        cls,
+        layout: type[GraphLayout] | GraphLayout,
+        nodes: Mapping[str, NodeProfile],
+        routes: Mapping[str, RouteProfile] | None = None,
+        default_node: NodeProfile | None = None,
+        max_concurrency: int | None = None,
+        recursion_limit: int = 25,
+    ) -> "LayoutSimulator":
+        """Build a simulator from a layout class or instance without compiling it.
+
+        Declaring the nodes and edges builds the layout runtime, so
+        `build_runtime()` runs and may connect to the backends it opens (LLM
+        services, vector stores, search clients); node names often come from
+        it. A layout class is instantiated and its runtime released once the
+        topology is collected; an instance keeps its runtime. Build the
+        managers by hand and pass them to the constructor to simulate without
+        backends.
+        """
+        owned = isinstance(layout, type)
+        instance = layout() if isinstance(layout, type) else layout
+        try:
+            node_manager = NodeManager()
+            node_manager.add_nodes(instance.get_nodes())
+            edge_manager = EdgeManager()
+            edge_manager.add_edges(instance.get_edges())
+        finally:
+            if owned:
+                instance.release_runtime()
+        return cls(
+            node_manager,
+            edge_manager,
+            nodes,
+            routes=routes,
+            default_node=default_node,
+            max_concurrency=max_concurrency,
+            recursion_limit=recursion_limit,
+        )
+
+    def _validate(self) -> None:
+        """Reject profiles that do not match the topology."""
+        registered = self.node_manager.nodes
+        unknown = sorted(set(self.nodes) - set(registered))
+        if unknown:
+            raise ValueError(f"Node profiles reference unknown nodes: {unknown}")
+        if self.default_node is None:
+            missing = sorted(set(registered) - set(self.nodes))
+            if missing:
+                raise ValueError(f"Missing node profiles (or a `default_node`) for: {missing}")
+
+        for source, profile in self.routes.items():
+            keys = self._route_keys(source)
+            if keys is None:
+                raise ValueError(f"Route profile for '{source}' does not match any conditional routing")
+            unknown_keys = [key for key in profile.probabilities if key not in keys]
+            if unknown_keys:
+                raise ValueError(f"Route profile for '{source}' references unknown routes: {unknown_keys}")
+            if any(probability < 0 for probability in profile.probabilities.values()):
+                raise ValueError(f"Route probabilities for '{source}' must not be negative")
+            if not math.isclose(sum(profile.probabilities.values()), 1.0, abs_tol=1e-6):
+                raise ValueError(f"Route probabilities for '{source}' must sum to 1")
+
+        for edge in self.edge_manager.get_edges():
+            if isinstance(edge, ConditionalEdge) and edge.node_source not in self.routes:
+                self.logger.warning(
+                    "No route profile for '%s'; assuming its %s route(s) are equally likely",
+                    edge.node_source,
+                    len(edge.map_dict),
+                )
+
+    def _route_keys(self, source: str) -> set[Hashable] | None:
+        """Return the route keys available after `source`, if it routes conditionally."""
+        keys: set[Hashable] = set()
+        found = False
+        for edge in self.edge_manager.get_outgoing_edges(source):
+            if isinstance(edge, ConditionalEdge):
+                keys.update(edge.map_dict)
+                found = True
+        node = self.node_manager.nodes.get(source)
+        if isinstance(node, CommandNode):
+            keys.update(node.commander.destinations)
+            found = True
+        return keys if found else None
+
+    def run(
+        self,
+        runs: int = 10_000,
+        concurrent_runs: int = 1,
+        llm_capacity: float | None = None,
+        seed: int | None = None,
+    ) -> SimulationReport:
+        """Simulate `runs` independent graph runs and summarize them.
+
+        Args:
+            runs: Number of Monte Carlo samples.
+            concurrent_runs: Runs the service keeps in flight.
+            llm_capacity: LLM calls per second the backend sustains.
+            seed: Seed for reproducible results.
+        """
+        if runs < 1:
+            raise ValueError("`runs` must be at least 1")
+        if concurrent_runs < 1:
+            raise ValueError("`concurrent_runs` must be at least 1")
+        if llm_capacity is not None and llm_capacity <= 0:
+            raise ValueError("`llm_capacity` must be positive")
+
+        rng = random.Random(seed)
+        completed: list[_Run] = []
+        for _ in range(runs):
+            result = self._simulate_run(rng)
+            if result is not None:
+                completed.append(result)
+
+        failed_runs = runs - len(completed)
+        if failed_runs:
+            self.logger.warning("%s of %s simulated run(s) hit the recursion limit", failed_runs, runs)
+        if not completed:
+            return SimulationReport(
+                runs=runs,
+                failed_runs=failed_runs,
+                latency={},
+                mean_latency=math.inf,
+                mean_llm_calls=0.0,
+                llm_calls={},
+                node_visits={},
+                concurrent_runs=concurrent_runs,
+                llm_capacity=llm_capacity,
+                throughput=0.0,
+                bottleneck="recursion limit",
+            )
+
+        latencies = sorted(result.latency for result in completed)
+        calls = sorted(float(result.llm_calls) for result in completed)
+        mean_latency = sum(latencies) / len(latencies)
+        mean_llm_calls = sum(calls) / len(calls)
+
+        throughput = concurrent_runs / mean_latency if mean_latency > 0 else math.inf
+        bottleneck = "concurrency"
+        if llm_capacity is not None and mean_llm_calls > 0 and llm_capacity / mean_llm_calls < throughput:
+            throughput = llm_capacity / mean_llm_calls
+            bottleneck = "backend"
+
+        return SimulationReport(
+            runs=runs,
+            failed_runs=failed_runs,
+            latency={p: percentile(latencies, p) for p in PERCENTILES},
+            mean_latency=mean_latency,
+            mean_llm_calls=mean_llm_calls,
+            llm_calls={p: percentile(calls, p) for p in PERCENTILES},
+            node_visits={
+                name: sum(result.visits.get(name, 0) for result in completed) / len(completed)
+                for name in self.node_manager.nodes
+            },
+            concurrent_runs=concurrent_runs,
+            llm_capacity=llm_capacity,
+            throughput=throughput,
+            bottleneck=bottleneck,
+        )
+
+    def _simulate_run(self, rng: random.Random) -> _Run | None:
+        """Simulate one run superstep by superstep; return `None` past the recursion limit."""
+        run = _Run()
+        active = self._successors(START, run, rng, durations=[])
+
+        for _ in range(self.recursion_limit):
+            if not active:
+                return run
+
+            durations: list[float] = []
+            triggered: list[str] = []
+            for name in active:
+                run.visits[name] = run.visits.get(name, 0) + 1
+                profile = self._profiles[name]
+                durations.append(profile.latency.sample(rng))
+                run.llm_calls += profile.llm_calls
+                for target in self._successors(name, run, rng, durations):
+                    if target not in triggered:
+                        triggered.append(target)
+
+            run.latency += self._superstep_latency(durations)
+            active = triggered
+
+        return run if not active else None
+
+    def _successors(self, name: str, run: _Run, rng: random.Random, durations: list[float]) -> list[str]:
+        """Return the nodes triggered after `name`, adding router costs to its task duration."""
+        targets: list[str] = []
+        for edge in self.edge_manager.get_outgoing_edges(name):
+            if edge.has_budget:
+                traversals = run.traversals.get(id(edge), 0) + 1
+                run.traversals[id(edge)] = traversals
+                if edge.max_traversals is not None and edge.exit_to is not None and traversals > edge.max_traversals:
+                    targets.append(edge.exit_to)
+                    continue
+
+            if isinstance(edge, SimpleEdge):
+                targets.append(edge.node_path)
+            else:
+                targets.append(edge.map_dict[self._pick_route(name, list(edge.map_dict), run, rng, durations)])
+
+        node = self.node_manager.nodes.get(name)
+        if isinstance(node, CommandNode) and node.commander.destinations:
+            destinations = node.commander.destinations
+            targets.append(destinations[self._pick_route(name, list(destinations), run, rng, durations)])
+
+        return [target for target in targets if target != END]
+
+    def _pick_route[Key: Hashable](
+        self,
+        source: str,
+        keys: list[Key],
+        run: _Run,
+        rng: random.Random,
+        durations: list[float],
+    ) -> Key:
+        """Draw one route key, charging the evaluator's cost to the source task."""
+        profile = self.routes.get(source)
+        if profile is None:
+            return rng.choice(keys)
+
+        if profile.latency is not None and durations:
+            durations[-1] += profile.latency.sample(rng)
+        run.llm_calls += profile.llm_calls
+        weights = [profile.probabilities.get(key, 0.0) for key in keys]
+        return rng.choices(keys, weights=weights)[0]
+
+    def _superstep_latency(self, durations: list[float]) -> float:
+        """Return the wall time of one superstep under `max_concurrency`."""
+        if self.max_concurrency is None or len(durations) <= self.max_concurrency:
+            return max(durations, default=0.0)
+
+        slots = [0.0] * self.max_concurrency
+        for duration in durations:
+            index = slots.index(min(slots))
+            slots[index] += duration
+        return max(slots)
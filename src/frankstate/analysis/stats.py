@@ -0,0 +1,11 @@
+import math
+from collections.abc import Sequence
+
+# Latency percentiles reported by the analysis tools.
+PERCENTILES = (50.0, 90.0, 95.0, 99.0)
+
+
+def percentile(sorted_values: Sequence[float], p: float) -> float:
+    """Return the nearest-rank `p`th percentile of pre-sorted, non-empty values."""
+    rank = max(math.ceil(p / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
@@ -5,32 +5,89 @@ from frankstate.entity.statehandler import StateEvaluator
 
 
 class BaseEdge:
-    """Base edge definition storing the source node name."""
+    """Base edge definition storing the source node name.
+
+    `max_traversals` and `exit_to` optionally declare a loop budget: the edge
+    may be traversed at most `max_traversals` times per graph run, after which
+    the run continues at `exit_to` (a node name or `END`) instead. The budget
+    is enforced by `frankstate` at runtime, so the state schema does not have
+    to carry iteration counters.
+
+    `degrade_to` optionally marks what the edge leads to as optional: while a
+    `DegradationPolicy` reports the process as overloaded, runs continue at
+    `degrade_to` (a node name or `END`) instead, skipping the optional nodes.
+    """
+
+    def __init__(
+        self,
+        node_source: str | Literal["START", "END"],
+        max_traversals: int | None = None,
+        exit_to: str | Literal["START", "END"] | None = None,
+        degrade_to: str | Literal["START", "END"] | None = None,
+    ):
+        if (max_traversals is None) != (exit_to is None):
+            raise ValueError("`max_traversals` and `exit_to` must be declared together")
+        if max_traversals is not None and (not isinstance(max_traversals, int) or max_traversals < 0):
+            raise ValueError(f"`max_traversals` must be a non-negative int, got {max_traversals!r}")
 
-    def __init__(self, node_source: str | Literal["START", "END"]):
         self.node_source = node_source
+        self.max_traversals = max_traversals
+        self.exit_to = exit_to
+        self.degrade_to = degrade_to
+
+    @property
+    def has_budget(self) -> bool:
+        """Return whether the edge declares a loop budget."""
+        return self.max_traversals is not None
+
+    @property
+    def is_degradable(self) -> bool:
+        """Return whether the edge declares a degraded route."""
+        return self.degrade_to is not None
+
+    @property
+    def is_routed(self) -> bool:
+        """Return whether the edge needs a router at runtime, even if it is a `SimpleEdge`."""
+        return self.has_budget or self.is_degradable
+
 
 class SimpleEdge(BaseEdge):
-    """Static edge definition used with StateGraph.add_edge."""
+    """Static edge definition used with StateGraph.add_edge.
+
+    A budgeted or degradable `SimpleEdge` is registered as a conditional edge
+    that routes to `node_path` until the budget is spent and to `exit_to`
+    afterwards, or to `degrade_to` under load.
+    """
 
     def __init__(
-        self, 
+        self,
         node_source: str | Literal["START", "END"],
         node_path: str | Literal["START", "END"],
+        max_traversals: int | None = None,
+        exit_to: str | Literal["START", "END"] | None = None,
+        degrade_to: str | Literal["START", "END"] | None = None,
     ):
-        super().__init__(node_source)
+        super().__init__(node_source, max_traversals=max_traversals, exit_to=exit_to, degrade_to=degrade_to)
         self.node_path = node_path
 
 
 class ConditionalEdge(BaseEdge):
-    """Conditional edge definition used with StateGraph.add_conditional_edges."""
+    """Conditional edge definition used with StateGraph.add_conditional_edges.
+
+    With a loop budget, the evaluator is skipped once the budget is spent and
+    the run continues at `exit_to`. A degraded route also skips the
+    evaluator, so LLM graders can be left out under load.
+    """
 
     def __init__(
         self,
         node_source: str | Literal["START", "END"],
         map_dict: dict[Hashable, str | Literal["START", "END"]],
         evaluator: StateEvaluator,
+        max_traversals: int | None = None,
+        exit_to: str | Literal["START", "END"] | None = None,
+        degrade_to: str | Literal["START", "END"] | None = None,
     ):
-        super().__init__(node_source)
+        super().__init__(node_source, max_traversals=max_traversals, exit_to=exit_to, degrade_to=degrade_to)
         self.map_dict = map_dict
-        self.evaluator = evaluator
\ No newline at end of file
+        self.evaluator = evaluator
@@ -1,12 +1,14 @@
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, get_type_hints
+from collections.abc import Hashable
+from typing import Any, ClassVar, get_origin, get_type_hints
 
 from langgraph.prebuilt import ToolNode
 
 from frankstate.entity.edge import ConditionalEdge, SimpleEdge
 from frankstate.entity.node import CommandNode, SimpleNode
 from frankstate.entity.runnable_builder import RunnableBuilder
+from frankstate.runtime.shared_runtime import RuntimeRegistry, shared_runtimes
 
 
 class GraphLayout(ABC):
@@ -18,13 +20,31 @@ class GraphLayout(ABC):
 
     Validation and serialization into LangGraph remain delegated to the
     existing managers.
+
+    Layouts setting `share_runtime = True` build their runtime once per
+    `runtime_key()` and share it with every other instance of the class
+    through `runtime_registry`, until each instance calls
+    `release_runtime()`. Nodes and edges are still declared per instance.
+
+    Pooled resources opened by the runtime are managed through lifecycle
+    hooks: `astart_runtime()` opens them and `acheck_runtime()` checks them
+    once per runtime on `astart()`, and `close_runtime()` /
+    `aclose_runtime()` close them when the runtime is released. Layouts are
+    also sync and async context managers:
+
+        async with MyLayout() as layout:
+            ...
     """
 
     logger: logging.Logger = logging.getLogger(__name__)
+    share_runtime: ClassVar[bool] = False
+    runtime_registry: ClassVar[RuntimeRegistry | None] = None
 
     def __init__(self):
         self.runtime: dict[str, Any] | None = None
         self._runtime_built: bool = False
+        self._runtime_lease: Hashable | None = None
+        self._runtime_started: bool = False
         self._layout_built: bool = False
 
         self.logger.info(f"{self.__class__.__name__} initialized")
@@ -37,34 +57,182 @@ class GraphLayout(ABC):
     def layout(self) -> None:
         """Declare runnable builders, nodes and edges on the layout instance."""
 
+    def runtime_key(self) -> Hashable:
+        """Return what, besides the layout class, a shared runtime depends on.
+
+        Override it with a snapshot of the settings `build_runtime()` reads,
+        so instances built under different settings do not share a runtime.
+        """
+        return ()
+
+    async def astart_runtime(self, runtime: dict[str, Any]) -> None:
+        """Open the pooled resources of a new runtime, such as client sessions.
+
+        Called by `astart()` once per runtime, however many instances share
+        it. The default does nothing.
+        """
+        return None
+
+    async def acheck_runtime(self, runtime: dict[str, Any]) -> None:
+        """Raise if a resource of the runtime is unusable.
+
+        Called by `astart()` right after `astart_runtime()` and by `acheck()`,
+        for instance from a readiness probe. The default does nothing.
+        """
+        return None
+
+    def close_runtime(self, runtime: dict[str, Any]) -> None:
+        """Release resources held by a runtime nobody uses anymore.
+
+        Called by `release_runtime()`, once the last instance sharing the
+        runtime released it. The default does nothing.
+        """
+        return None
+
+    async def aclose_runtime(self, runtime: dict[str, Any]) -> None:
+        """Asynchronous counterpart of `close_runtime()`, called by `aclose()`.
+
+        The default calls `close_runtime()`.
+        """
+        self.close_runtime(runtime)
+
+    async def astart(self) -> None:
+        """Build the runtime if needed, then start and health-check it once.
+
+        Raises:
+            RuntimeError: If the runtime was released.
+        """
+        self._build_runtime()
+        runtime = self._require_runtime()
+        if self._runtime_started:
+            return
+
+        if self._runtime_lease is None:
+            await self._start_runtime(runtime)
+        else:
+            await self._get_runtime_registry().astart(self.__class__, self._runtime_lease, self._start_runtime)
+        self._runtime_started = True
+
+    async def acheck(self) -> None:
+        """Health-check the runtime with `acheck_runtime()`.
+
+        Raises:
+            RuntimeError: If the runtime was released.
+        """
+        self._build_runtime()
+        await self.acheck_runtime(self._require_runtime())
+
+    def release_runtime(self) -> None:
+        """Give up this instance's runtime; calling it again does nothing.
+
+        A shared runtime is closed when the last instance holding it releases
+        it, a private one immediately. The instance is not rebuilt afterwards:
+        its nodes, and graphs already compiled from them, keep the objects
+        they reference.
+        """
+        runtime, lease = self._give_up_runtime()
+        if runtime is None:
+            return
+        if lease is None:
+            self.close_runtime(runtime)
+        else:
+            self._get_runtime_registry().release(self.__class__, lease)
+
+    async def aclose(self) -> None:
+        """Asynchronous `release_runtime()`, closing with `aclose_runtime()`."""
+        runtime, lease = self._give_up_runtime()
+        if runtime is None:
+            return
+        if lease is None:
+            await self.aclose_runtime(runtime)
+        else:
+            await self._get_runtime_registry().arelease(self.__class__, lease)
+
+    def __enter__(self) -> "GraphLayout":
+        self._build_runtime()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.release_runtime()
+
+    async def __aenter__(self) -> "GraphLayout":
+        await self.astart()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def _start_runtime(self, runtime: dict[str, Any]) -> None:
+        await self.astart_runtime(runtime)
+        await self.acheck_runtime(runtime)
+
+    def _require_runtime(self) -> dict[str, Any]:
+        if self.runtime is None:
+            raise RuntimeError(f"{self.__class__.__name__} runtime was released")
+        return self.runtime
+
+    def _give_up_runtime(self) -> tuple[dict[str, Any] | None, Hashable | None]:
+        """Detach the runtime and its lease from the instance and return them."""
+        runtime, self.runtime = self.runtime, None
+        lease, self._runtime_lease = self._runtime_lease, None
+        self._runtime_started = False
+        return runtime, lease
+
+    def _get_runtime_registry(self) -> RuntimeRegistry:
+        """Return the registry holding the shared runtimes of this layout."""
+        return self.runtime_registry if self.runtime_registry is not None else shared_runtimes
+
     def _get_declared_runtime_keys(self) -> set[str]:
-        """Return annotated attribute names declared by the concrete layout."""
+        """Return annotated attribute names declared by the concrete layout, `ClassVar`s excluded."""
         hints = get_type_hints(self.__class__)
         declared_annotations = self.__class__.__dict__.get("__annotations__", {})
-        return {key for key in hints.keys() if key in declared_annotations}
+        return {
+            key
+            for key, hint in hints.items()
+            if key in declared_annotations and get_origin(hint) is not ClassVar
+        }
 
-    def _build_runtime(self) -> None:
-        """Build and project runtime attributes once per layout instance."""
-        if not self._runtime_built:
-            runtime = self.build_runtime()
-            if not isinstance(runtime, dict):
-                raise TypeError(
-                    f"{self.__class__.__name__}.build_runtime() must return dict[str, Any], got {type(runtime)}"
-                )
+    def _create_runtime(self) -> dict[str, Any]:
+        """Call `build_runtime()` and check its keys against the class annotations."""
+        runtime = self.build_runtime()
+        if not isinstance(runtime, dict):
+            raise TypeError(
+                f"{self.__class__.__name__}.build_runtime() must return dict[str, Any], got {type(runtime)}"
+            )
 
-            declared_keys = self._get_declared_runtime_keys()
-            runtime_keys = set(runtime.keys())
-            missing_annotations = sorted(runtime_keys - declared_keys)
-            if missing_annotations:
-                raise ValueError(
-                    f"{self.__class__.__name__}.build_runtime() returned keys without class annotations: {missing_annotations}"
-                )
+        declared_keys = self._get_declared_runtime_keys()
+        runtime_keys = set(runtime.keys())
+        missing_annotations = sorted(runtime_keys - declared_keys)
+        if missing_annotations:
+            raise ValueError(
+                f"{self.__class__.__name__}.build_runtime() returned keys without class annotations: {missing_annotations}"
+            )
+
+        missing_runtime_keys = sorted(declared_keys - runtime_keys)
+        if missing_runtime_keys:
+            raise ValueError(
+                f"{self.__class__.__name__}.build_runtime() must populate all annotated runtime keys: {missing_runtime_keys}"
+            )
 
-            missing_runtime_keys = sorted(declared_keys - runtime_keys)
-            if missing_runtime_keys:
-                raise ValueError(
-                    f"{self.__class__.__name__}.build_runtime() must populate all annotated runtime keys: {missing_runtime_keys}"
+        return runtime
+
+    def _build_runtime(self) -> None:
+        """Build, or acquire when shared, and project runtime attributes once per layout instance."""
+        if not self._runtime_built:
+            if self.share_runtime:
+                lease = self.runtime_key()
+                runtime = dict(
+                    self._get_runtime_registry().acquire(
+                        self.__class__,
+                        lease,
+                        self._create_runtime,
+                        dispose=self.close_runtime,
+                        adispose=self.aclose_runtime,
+                    )
                 )
+                self._runtime_lease = lease
+            else:
+                runtime = self._create_runtime()
 
             self.runtime = runtime
             for key, value in runtime.items():
@@ -1,7 +1,12 @@
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from frankstate.entity.statehandler import StateCommander, StateEnhancer
 
+if TYPE_CHECKING:
+    from frankstate.runtime.offload import ProcessPoolOffload
+    from frankstate.runtime.remote import RemoteOffload
+    from frankstate.runtime.retry import NodeRetry
+
 
 class BaseNode:
     """Base named node definition consumed by GraphLayout and NodeManager.
@@ -15,18 +20,43 @@ class BaseNode:
     `kwargs` stores future-facing keyword arguments that should be forwarded to
     `StateGraph.add_node()` without forcing `frankstate` to predefine every
     native option in its own constructor surface.
+
+    `reads` and `writes` optionally declare the state keys a node consumes and
+    produces. They are not enforced at runtime; compile-time passes such as the
+    `ParallelScheduler` rely on them to decide which nodes may share a superstep.
+    Leaving them as `None` means "unknown" and keeps the node sequential.
+
+    `retry` declares a `NodeRetry` policy, applied as the node's LangGraph
+    `retry_policy`. Policies sharing a `RetryBudget` stop retrying together
+    when the backend they call keeps failing.
     """
 
-    def __init__(self, name: str, tags: list[str] | None = None, kwargs: dict[str, Any] | None = None):
+    def __init__(
+        self,
+        name: str,
+        tags: list[str] | None = None,
+        kwargs: dict[str, Any] | None = None,
+        reads: list[str] | None = None,
+        writes: list[str] | None = None,
+        retry: "NodeRetry | None" = None,
+    ):
         self.name = name
         self.tags = tags
         self.kwargs = dict(kwargs) if kwargs else None
+        self.reads = list(reads) if reads is not None else None
+        self.writes = list(writes) if writes is not None else None
+        self.retry = retry
 
 class SimpleNode(BaseNode):
     """Node wrapper for a StateEnhancer callable.
 
     Optional `kwargs` are passed through to `StateGraph.add_node()` by the
     workflow builder after `frankstate` merges its own `tags` convention.
+
+    `offload` runs a CPU-bound enhancer in a `ProcessPoolOffload` pool instead
+    of the interpreter executing the graph, or a heavy one on remote
+    `NodeWorker`s through a `RemoteOffload`; only the declared `reads` keys
+    are sent to the worker when they are known.
     """
 
     def __init__(
@@ -35,9 +65,14 @@ class SimpleNode(BaseNode):
         name: str,
         tags: list[str] | None = None,
         kwargs: dict[str, Any] | None = None,
+        reads: list[str] | None = None,
+        writes: list[str] | None = None,
+        offload: "ProcessPoolOffload | RemoteOffload | None" = None,
+        retry: "NodeRetry | None" = None,
     ):
-        super().__init__(name, tags=tags, kwargs=kwargs)
+        super().__init__(name, tags=tags, kwargs=kwargs, reads=reads, writes=writes, retry=retry)
         self.enhancer = enhancer
+        self.offload = offload
 
 class CommandNode(BaseNode):
     """Node wrapper for a StateCommander callable returning Command.
@@ -53,6 +88,9 @@ class CommandNode(BaseNode):
         name: str,
         tags: list[str] | None = None,
         kwargs: dict[str, Any] | None = None,
+        reads: list[str] | None = None,
+        writes: list[str] | None = None,
+        retry: "NodeRetry | None" = None,
     ):
         try:
             _ = commander.destinations
@@ -62,7 +100,7 @@ class CommandNode(BaseNode):
                 "or a constructor-populated '_destinations' attribute where values are the "
                 "registered names of destination nodes. See StateCommander docstring for the convention."
             ) from exc
-        super().__init__(name, tags=tags, kwargs=kwargs)
+        super().__init__(name, tags=tags, kwargs=kwargs, reads=reads, writes=writes, retry=retry)
         self.commander = commander
 
     @property
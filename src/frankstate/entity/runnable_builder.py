@@ -1,5 +1,7 @@
 from abc import ABC, abstractmethod
-from collections.abc import Awaitable
+from collections.abc import Awaitable, Callable, Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Any
 
 from langchain_core.language_models.chat_models import BaseChatModel
@@ -8,6 +10,29 @@ from langchain_core.retrievers import BaseRetriever
 from langchain_core.runnables import Runnable
 from langchain_core.vectorstores import VectorStore
 
+from frankstate.runtime.batching import MicroBatchRunnable
+
+# Metadata key naming the builder that produced a run, read by instrumentation.
+BUILDER_METADATA_KEY = "frankstate_runnable_builder"
+
+# Set while layouts observed by execution hooks declare their nodes and edges.
+_instrumenting: ContextVar[bool] = ContextVar("frankstate_instrument_builders", default=False)
+
+
+@contextmanager
+def instrument_builders() -> Iterator[None]:
+    """Make `RunnableBuilder.get()` return runnables named after their builder.
+
+    Execution hooks recognise builder runs by the run name and metadata bound
+    this way. `WorkflowBuilder` enters it while declaring a layout compiled
+    with hooks; elsewhere builders return their configured runnable as is.
+    """
+    token = _instrumenting.set(True)
+    try:
+        yield
+    finally:
+        _instrumenting.reset(token)
+
 
 class RunnableBuilder(ABC):
     """Base lifecycle contract for assembling LangChain LCEL runnable.
@@ -33,6 +58,7 @@ class RunnableBuilder(ABC):
     def __init__(self, *, model: BaseChatModel) -> None:
         self.model = model
         self._runnable: Runnable | None = None
+        self._named_runnable: tuple[Runnable, Runnable] | None = None
 
     @abstractmethod
     def _configure_runnable(self) -> Runnable:
@@ -49,10 +75,24 @@ class RunnableBuilder(ABC):
             self._runnable = self._configure_runnable()
         return self._runnable
 
+    def _name_runnable(self, runnable: Runnable) -> Runnable:
+        """Name runs of `runnable` after the builder, so traces and hooks can attribute them.
+
+        The binding is created once per configured runnable and only inside
+        `instrument_builders()`.
+        """
+        if not isinstance(runnable, Runnable):
+            return runnable
+        if self._named_runnable is None or self._named_runnable[0] is not runnable:
+            name = type(self).__name__
+            self._named_runnable = (runnable, runnable.with_config(run_name=name, metadata={BUILDER_METADATA_KEY: name}))
+        return self._named_runnable[1]
+
     @property
     def runnable(self) -> Runnable:
         """The lazily initialized, cached runnable instance."""
-        return self._require_runnable()
+        runnable = self._require_runnable()
+        return self._name_runnable(runnable) if _instrumenting.get() else runnable
 
     def invoke(self, input: Any) -> Any:
         """Invoke the runnable synchronously."""
@@ -166,3 +206,54 @@ class PromptMixin(ABC):
         """
         raise NotImplementedError
 
+
+class BatchingMixin:
+    """Cooperative mixin that micro-batches concurrent `ainvoke()` calls.
+
+    The configured runnable is wrapped in a `MicroBatchRunnable`, so calls
+    from concurrent graph runs reaching the same node within
+    `batch_max_latency` seconds are sent as one `abatch()` (or `batch_fn`)
+    call of at most `batch_max_size` inputs. Place it before
+    `RunnableBuilder` in the bases:
+
+        class BatchedRetriever(BatchingMixin, RetrieverMixin, RunnableBuilder):
+            def __init__(self, model: BaseChatModel, retriever: BaseRetriever) -> None:
+                super().__init__(model=model, retriever=retriever, batch_max_size=32)
+
+            def _configure_runnable(self) -> Runnable:
+                return self.retriever
+
+    Args:
+        batch_max_size: Maximum inputs per dispatched batch.
+        batch_max_latency: Seconds the first call of a window waits for
+            others before the batch is dispatched.
+    """
+
+    def __init__(
+        self,
+        *,
+        batch_max_size: int = 16,
+        batch_max_latency: float = 0.005,
+        **kwargs: Any,
+    ):
+        super().__init__(**kwargs)
+        self.batch_max_size = batch_max_size
+        self.batch_max_latency = batch_max_latency
+
+    def _batch_fn(self) -> Callable[[list[Any]], Awaitable[Sequence[Any]]] | None:
+        """Return a true batch API to use instead of `abatch()`, if any."""
+        return None
+
+    def _require_runnable(self) -> Runnable:
+        runnable = super()._require_runnable()  # type: ignore[misc]
+        if isinstance(runnable, MicroBatchRunnable):
+            return runnable
+
+        batched = MicroBatchRunnable(
+            runnable,
+            max_batch_size=self.batch_max_size,
+            max_latency=self.batch_max_latency,
+            batch_fn=self._batch_fn(),
+        )
+        self._runnable = batched
+        return batched
@@ -0,0 +1,14 @@
+"""Opt-in instrumentation for compiled layouts.
+
+Instruments are `ExecutionHook`s passed to `WorkflowBuilder(hooks=[...])`.
+Import concrete hooks from their modules instead of this package:
+
+- ``frankstate.instrumentation.hooks``
+- ``frankstate.instrumentation.loop_lag``
+- ``frankstate.instrumentation.memory``
+- ``frankstate.instrumentation.otel``
+- ``frankstate.instrumentation.profiler``
+- ``frankstate.instrumentation.recorder``
+- ``frankstate.instrumentation.usage``
+- ``frankstate.instrumentation.writer``
+"""
@@ -0,0 +1,375 @@
+import logging
+import threading
+import time
+from collections.abc import Callable, Hashable, Iterable, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Literal
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+from frankstate.entity.edge import ConditionalEdge
+from frankstate.entity.node import CommandNode, SimpleNode
+from frankstate.entity.runnable_builder import BUILDER_METADATA_KEY
+from frankstate.managers.edge_manager import EdgeManager
+from frankstate.managers.node_manager import NodeManager
+from frankstate.optimizers.chain_fusion import FusedChainEnhancer
+
+EventKind = Literal["graph", "node", "router", "builder", "tool", "model", "retriever", "runnable"]
+
+
+@dataclass
+class ExecutionEvent:
+    """One traced unit of work inside a graph run.
+
+    Attributes:
+        run_id: Callback run id of this unit.
+        parent_run_id: Run id of the enclosing unit, if traced.
+        root_run_id: Run id of the graph run this unit belongs to.
+        kind: `"graph"` for the run itself, `"node"` for a node task,
+            `"router"` for a conditional edge evaluation, `"builder"` for the
+            runnable of a `RunnableBuilder`, `"tool"`, `"model"` and
+            `"retriever"` for LangChain components and `"runnable"` for any
+            other nested runnable.
+        name: Run name, e.g. the node, builder, tool or model name.
+        node: Node the unit runs in (for routers, the edge source node).
+        step: LangGraph superstep, when known.
+        inputs: Inputs received by the unit, as passed to the callbacks.
+        metadata: Callback metadata of the run.
+        tags: Callback tags of the run.
+        started_at: `time.perf_counter()` at start.
+        ended_at: `time.perf_counter()` at end, once finished.
+        thread_id: Thread the unit started in.
+    """
+
+    run_id: UUID
+    parent_run_id: UUID | None
+    root_run_id: UUID
+    kind: EventKind
+    name: str
+    node: str | None
+    step: int | None
+    inputs: Any
+    metadata: dict[str, Any]
+    tags: list[str]
+    started_at: float
+    ended_at: float | None = None
+    thread_id: int = field(default_factory=threading.get_ident)
+
+    @property
+    def duration(self) -> float | None:
+        """Return the elapsed seconds once the unit has finished."""
+        return None if self.ended_at is None else self.ended_at - self.started_at
+
+
+class ExecutionHook:
+    """Base class for instruments observing compiled layout runs.
+
+    Override the callbacks you need; all of them are no-ops by default. They
+    run inline in the thread executing the traced unit, so they must be fast
+    and thread-safe. Exceptions raised by hooks are logged and never fail
+    the run.
+
+    `bind()` is called by `WorkflowBuilder` with the final topology (after
+    optimization passes), before the graph is assembled and run.
+    """
+
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    def __init__(self) -> None:
+        self.layout_name: str | None = None
+        self.node_manager: NodeManager | None = None
+        self.edge_manager: EdgeManager | None = None
+
+    def bind(self, layout_name: str, node_manager: NodeManager, edge_manager: EdgeManager) -> None:
+        """Receive the layout name and the managers of the compiled graph."""
+        self.layout_name = layout_name
+        self.node_manager = node_manager
+        self.edge_manager = edge_manager
+
+    def component_names(self) -> dict[int, tuple[EventKind, str]]:
+        """Map `id()` of every bound enhancer, commander and evaluator to its node.
+
+        Evaluators map to the source node of their edge with kind `"router"`;
+        enhancers of a fused chain keep their original node names.
+        """
+        components: dict[int, tuple[EventKind, str]] = {}
+        if self.node_manager is not None:
+            for node in self.node_manager.get_nodes():
+                if isinstance(node, SimpleNode):
+                    components[id(node.enhancer)] = ("node", node.name)
+                    if isinstance(node.enhancer, FusedChainEnhancer):
+                        components.update((id(inner.enhancer), ("node", inner.name)) for inner in node.enhancer.nodes)
+                elif isinstance(node, CommandNode):
+                    components[id(node.commander)] = ("node", node.name)
+        if self.edge_manager is not None:
+            for edge in self.edge_manager.get_edges():
+                if isinstance(edge, ConditionalEdge):
+                    components[id(edge.evaluator)] = ("router", edge.node_source)
+        return components
+
+    def wrap_router(
+        self,
+        node_source: str,
+        router: Callable[[Any], Any],
+        path_map: dict[Hashable, Any],
+    ) -> tuple[Callable[[Any], Any], dict[Hashable, Any]]:
+        """Return the router and path map of the conditional edge leaving `node_source`.
+
+        Called by `WorkflowBuilder` while assembling the graph, after `bind()`.
+        Hooks that steer runs, such as token budgets, override it to add routes;
+        the router must keep the sync or async nature of the one it wraps. The
+        default returns both unchanged.
+        """
+        return router, path_map
+
+    def on_start(self, event: ExecutionEvent) -> None:
+        """Called when a graph run, node, router, tool, model or runnable starts."""
+
+    def on_end(self, event: ExecutionEvent, output: Any) -> None:
+        """Called when the unit finishes; `event.ended_at` is set."""
+
+    def on_error(self, event: ExecutionEvent, error: BaseException) -> None:
+        """Called when the unit raises; `event.ended_at` is set."""
+
+
+class ExecutionHookHandler(BaseCallbackHandler):
+    """Callback handler translating LangChain callbacks into `ExecutionHook` events.
+
+    `WorkflowBuilder` attaches one handler per compiled graph. A chain run
+    whose parent is unknown to the handler is the graph run and its children
+    carrying `langgraph_node` metadata are node tasks. Conditional edge
+    routers run inside the node task as a later step of its sequence, and
+    `RunnableBuilder` runnables are recognised by the metadata they bind.
+    """
+
+    run_inline = True
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    def __init__(self, hooks: Sequence[ExecutionHook]):
+        self.hooks = tuple(hooks)
+        self.events: dict[UUID, ExecutionEvent] = {}
+        self._lock = threading.Lock()
+
+    def _start(
+        self,
+        kind: EventKind | None,
+        name: str,
+        inputs: Any,
+        run_id: UUID,
+        parent_run_id: UUID | None,
+        metadata: dict[str, Any] | None,
+        tags: list[str] | None,
+    ) -> None:
+        metadata = dict(metadata or {})
+        with self._lock:
+            parent = self.events.get(parent_run_id) if parent_run_id is not None else None
+
+        graph_node = metadata.get("langgraph_node")
+        if parent is None:
+            kind, node, root_run_id = "graph", None, run_id
+        else:
+            root_run_id = parent.root_run_id
+            node = parent.node
+            if kind is None and parent.kind == "graph" and graph_node is not None:
+                kind, node = "node", graph_node
+            elif kind is None and metadata.get(BUILDER_METADATA_KEY) not in (None, parent.metadata.get(BUILDER_METADATA_KEY)):
+                # Builder metadata is inherited, so only its outermost run is the builder.
+                kind = "builder"
+            elif kind is None and parent.kind == "node" and self._is_router_step(tags):
+                kind = "router"
+            kind = kind or "runnable"
+
+        step = metadata.get("langgraph_step")
+        event = ExecutionEvent(
+            run_id=run_id,
+            parent_run_id=parent_run_id,
+            root_run_id=root_run_id,
+            kind=kind,
+            name=name,
+            node=node,
+            step=step if isinstance(step, int) else (parent.step if parent is not None else None),
+            inputs=inputs,
+            metadata=metadata,
+            tags=list(tags or []),
+            started_at=time.perf_counter(),
+        )
+        with self._lock:
+            self.events[run_id] = event
+        self._dispatch("on_start", event)
+
+    @staticmethod
+    def _is_router_step(tags: list[str] | None) -> bool:
+        """Return whether a node child is a router.
+
+        A node task is a sequence of the node callable, its channel writes and
+        its routers. Runs started by the callable inherit its `seq:step:1` tag;
+        routers are tagged with a later step.
+        """
+        steps = [tag for tag in tags or () if tag.startswith("seq:step:")]
+        return bool(steps) and "seq:step:1" not in steps
+
+    def _finish(self, run_id: UUID, method: str, payload: Any) -> None:
+        with self._lock:
+            event = self.events.pop(run_id, None)
+        if event is None:
+            return
+        event.ended_at = time.perf_counter()
+        self._dispatch(method, event, payload)
+
+    def _dispatch(self, method: str, *args: Any) -> None:
+        for hook in self.hooks:
+            try:
+                getattr(hook, method)(*args)
+            except Exception:
+                self.logger.exception("Execution hook %s.%s failed", type(hook).__name__, method)
+
+    @staticmethod
+    def _name(serialized: dict[str, Any] | None, kwargs: dict[str, Any], default: str) -> str:
+        name = kwargs.get("name")
+        if name:
+            return str(name)
+        if serialized:
+            return str(serialized.get("name") or (serialized.get("id") or [default])[-1])
+        return default
+
+    def on_chain_start(
+        self,
+        serialized: dict[str, Any] | None,
+        inputs: Any,
+        *,
+        run_id: UUID,
+        parent_run_id: UUID | None = None,
+        tags: list[str] | None = None,
+        metadata: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        self._start(None, self._name(serialized, kwargs, "chain"), inputs, run_id, parent_run_id, metadata, tags)
+
+    def on_chain_end(self, outputs: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._finish(run_id, "on_end", outputs)
+
+    def on_chain_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._finish(run_id, "on_error", error)
+
+    def on_tool_start(
+        self,
+        serialized: dict[str, Any] | None,
+        input_str: str,
+        *,
+        run_id: UUID,
+        parent_run_id: UUID | None = None,
+        tags: list[str] | None = None,
+        metadata: dict[str, Any] | None = None,
+        inputs: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        self._start(
+            "tool",
+            self._name(serialized, kwargs, "tool"),
+            inputs if inputs is not None else input_str,
+            run_id,
+            parent_run_id,
+            metadata,
+            tags,
+        )
+
+    def on_tool_end(self, output: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._finish(run_id, "on_end", output)
+
+    def on_tool_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._finish(run_id, "on_error", error)
+
+    def on_chat_model_start(
+        self,
+        serialized: dict[str, Any] | None,
+        messages: list[list[Any]],
+        *,
+        run_id: UUID,
+        parent_run_id: UUID | None = None,
+        tags: list[str] | None = None,
+        metadata: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        self._start("model", self._name(serialized, kwargs, "chat_model"), messages, run_id, parent_run_id, metadata, tags)
+
+    def on_llm_start(
+        self,
+        serialized: dict[str, Any] | None,
+        prompts: list[str],
+        *,
+        run_id: UUID,
+        parent_run_id: UUID | None = None,
+        tags: list[str] | None = None,
+        metadata: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        self._start("model", self._name(serialized, kwargs, "llm"), prompts, run_id, parent_run_id, metadata, tags)
+
+    def on_llm_end(self, response: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._finish(run_id, "on_end", response)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._finish(run_id, "on_error", error)
+
+    def on_retriever_start(
+        self,
+        serialized: dict[str, Any] | None,
+        query: str,
+        *,
+        run_id: UUID,
+        parent_run_id: UUID | None = None,
+        tags: list[str] | None = None,
+        metadata: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        self._start("retriever", self._name(serialized, kwargs, "retriever"), query, run_id, parent_run_id, metadata, tags)
+
+    def on_retriever_end(self, documents: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._finish(run_id, "on_end", documents)
+
+    def on_retriever_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._finish(run_id, "on_error", error)
+
+
+def token_usage(response: Any) -> dict[str, int]:
+    """Return the token usage reported by a model response, summed over generations.
+
+    Reads `usage_metadata` from the generated messages and falls back to the
+    provider's `llm_output["token_usage"]`. Returns `input_tokens`,
+    `output_tokens`, `total_tokens` and `cached_input_tokens`, the input
+    tokens served from the provider's prompt cache, or an empty dict when
+    nothing is reported.
+    """
+    usage = {"input_tokens": 0, "output_tokens": 0, "total_tokens": 0, "cached_input_tokens": 0}
+    found = False
+    for generations in getattr(response, "generations", None) or ():
+        for generation in generations:
+            metadata = getattr(getattr(generation, "message", None), "usage_metadata", None)
+            if metadata:
+                found = True
+                for key in ("input_tokens", "output_tokens", "total_tokens"):
+                    usage[key] += int(metadata.get(key) or 0)
+                details = metadata.get("input_token_details") or {}
+                usage["cached_input_tokens"] += int(details.get("cache_read") or 0)
+    if not found:
+        reported = (getattr(response, "llm_output", None) or {}).get("token_usage") or {}
+        if reported:
+            found = True
+            usage["input_tokens"] = int(reported.get("prompt_tokens") or reported.get("input_tokens") or 0)
+            usage["output_tokens"] = int(reported.get("completion_tokens") or reported.get("output_tokens") or 0)
+            usage["total_tokens"] = int(reported.get("total_tokens") or 0)
+            details = reported.get("prompt_tokens_details") or {}
+            usage["cached_input_tokens"] = int(details.get("cached_tokens") or 0)
+    if found and not usage["total_tokens"]:
+        usage["total_tokens"] = usage["input_tokens"] + usage["output_tokens"]
+    return usage if found else {}
+
+
+def validate_hooks(hooks: Iterable[Any] | None) -> tuple[ExecutionHook, ...]:
+    """Return `hooks` as a tuple, rejecting objects that are not `ExecutionHook`s."""
+    validated = tuple(hooks or ())
+    for hook in validated:
+        if not isinstance(hook, ExecutionHook):
+            raise TypeError(f"Each hook must be an ExecutionHook, got {type(hook)}")
+    return validated
@@ -0,0 +1,379 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import Counter, defaultdict, deque
+from dataclasses import asdict, dataclass, field
+from types import FrameType
+from typing import Any
+from uuid import UUID
+
+from langchain_core.runnables import Runnable
+from langchain_core.tools import BaseTool
+
+from frankstate.analysis.stats import percentile
+from frankstate.entity.statehandler import StateCommander, StateEnhancer, StateEvaluator
+from frankstate.instrumentation.hooks import EventKind, ExecutionEvent, ExecutionHook
+from frankstate.managers.edge_manager import EdgeManager
+from frankstate.managers.node_manager import NodeManager
+
+# Runnables defined in these packages are plumbing; attribution looks past them.
+_INTERNAL_MODULES = ("asyncio.", "langchain_core.", "langgraph.", "frankstate.instrumentation.")
+
+
+@dataclass(frozen=True)
+class LoopStall:
+    """One heartbeat that waited longer than the monitor threshold.
+
+    Attributes:
+        lag: Seconds between scheduling the heartbeat and the loop running it.
+        kind: Kind of the blamed component (`"node"`, `"router"`, `"tool"`
+            or `"runnable"`), or `None` when nothing could be attributed.
+        component: Name of the blamed tool or runnable, or of the node for
+            enhancers, commanders and evaluators.
+        node: Node the blocking code belongs to, when known.
+        call_site: Innermost Python frame of the blocking call,
+            formatted as `path:line in function`.
+        stack: Innermost-first frames sampled while the loop was blocked.
+        active_nodes: Nodes that had started and not finished on the loop.
+        run_ids: Graph runs active on the loop.
+        inferred: `True` when the blame comes from the only active node rather
+            than from the sampled stack.
+        timestamp: Wall-clock time the stall was detected.
+    """
+
+    lag: float
+    kind: EventKind | None
+    component: str | None
+    node: str | None
+    call_site: str | None
+    stack: tuple[str, ...]
+    active_nodes: tuple[str, ...]
+    run_ids: tuple[str, ...]
+    inferred: bool = False
+    timestamp: float = field(default_factory=time.time)
+
+    @property
+    def label(self) -> str:
+        """Return a `kind:component` key used to aggregate stalls."""
+        return f"{self.kind}:{self.component}" if self.kind else "unattributed"
+
+
+@dataclass(frozen=True)
+class LoopLagMetrics:
+    """Aggregated event-loop lag observed by a `LoopLagMonitor`.
+
+    Attributes:
+        samples: Heartbeats measured while graph runs were active.
+        stalls: Heartbeats above the threshold.
+        max_lag: Largest lag observed, in seconds.
+        p50_lag: Median lag over the recent samples (nearest rank).
+        p99_lag: 99th percentile lag over the recent samples (nearest rank).
+        stalls_by_component: Stall count per `LoopStall.label`.
+        blocked_seconds_by_component: Total lag per `LoopStall.label`.
+    """
+
+    samples: int
+    stalls: int
+    max_lag: float
+    p50_lag: float
+    p99_lag: float
+    stalls_by_component: dict[str, int]
+    blocked_seconds_by_component: dict[str, float]
+
+
+class _LoopWatch:
+    """Active runs, sampler thread and in-flight heartbeat for one event loop.
+
+    `pending` holds the perf-counter time the outstanding heartbeat was
+    scheduled and, once it is late, the stall attribution. Whoever takes it
+    first, the sampler or a run ending on the loop, records the measurement.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, thread_id: int, stop: threading.Event):
+        self.loop = loop
+        self.thread_id = thread_id
+        self.stop = stop
+        self.runs: set[UUID] = set()
+        self.nodes: dict[UUID, str] = {}
+        self.thread: threading.Thread | None = None
+        self.pending: tuple[float, dict[str, Any] | None] | None = None
+
+
+class LoopLagMonitor(ExecutionHook):
+    """Detect event-loop stalls during graph runs and blame the blocking code.
+
+    A watchdog thread schedules a heartbeat on every event loop running an
+    instrumented graph, every `interval` seconds while runs are active. When
+    a heartbeat waits longer than `threshold`, the loop thread's stack is
+    sampled and the stall is attributed to the innermost tool, runnable,
+    enhancer, commander or evaluator on it, mapped back to its node:
+
+        monitor = LoopLagMonitor(threshold=0.05)
+        graph = WorkflowBuilder(config=MyLayout, state_schema=State, hooks=[monitor]).compile()
+        ...
+        monitor.metrics().blocked_seconds_by_component
+
+    Each stall is kept in `stalls` and logged as a warning whose record
+    carries the `LoopStall` fields under `extra["loop_stall"]`. A stall still
+    being measured when a node or run ends is recorded by that end event, so
+    `stalls` is complete as soon as `ainvoke()` returns. Synchronous runs have
+    no event loop and are ignored.
+
+    `close()` stops the watchdog threads; the monitor starts new ones on the
+    next run, so it can stay attached to a long-lived graph.
+    """
+
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        threshold: float = 0.1,
+        interval: float = 0.05,
+        max_stalls: int = 1000,
+        max_samples: int = 10_000,
+        stack_depth: int = 12,
+    ):
+        super().__init__()
+        if threshold <= 0 or interval <= 0:
+            raise ValueError("`threshold` and `interval` must be positive")
+
+        self.threshold = threshold
+        self.interval = interval
+        self.stack_depth = stack_depth
+        self.stalls: deque[LoopStall] = deque(maxlen=max_stalls)
+        self._lags: deque[float] = deque(maxlen=max_samples)
+        self._samples = 0
+        self._stall_count = 0
+        self._max_lag = 0.0
+        self._stalls_by_component: Counter[str] = Counter()
+        self._blocked_by_component: defaultdict[str, float] = defaultdict(float)
+        self._components: dict[int, tuple[EventKind, str]] = {}
+        self._watches: dict[int, _LoopWatch] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def bind(self, layout_name: str, node_manager: NodeManager, edge_manager: EdgeManager) -> None:
+        super().bind(layout_name, node_manager, edge_manager)
+        with self._lock:
+            self._components.update(self.component_names())
+
+    def on_start(self, event: ExecutionEvent) -> None:
+        if event.kind not in ("graph", "node"):
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+
+        with self._lock:
+            watch = self._watches.get(id(loop))
+            if watch is None or watch.loop is not loop:
+                watch = self._watches[id(loop)] = _LoopWatch(loop, threading.get_ident(), self._stop)
+            if event.kind == "graph":
+                watch.runs.add(event.run_id)
+            elif event.node is not None:
+                watch.nodes[event.run_id] = event.node
+            if watch.thread is None:
+                watch.thread = threading.Thread(
+                    target=self._watch, args=(watch,), name="frankstate-loop-lag", daemon=True
+                )
+                watch.thread.start()
+
+    def on_end(self, event: ExecutionEvent, output: Any) -> None:
+        if event.kind not in ("graph", "node"):
+            return
+        self._flush(event)
+        with self._lock:
+            for watch in self._watches.values():
+                watch.runs.discard(event.run_id)
+                watch.nodes.pop(event.run_id, None)
+
+    def on_error(self, event: ExecutionEvent, error: BaseException) -> None:
+        self.on_end(event, None)
+
+    def _flush(self, event: ExecutionEvent) -> None:
+        """Record the late heartbeat of the loop `event` ends on, if any.
+
+        End events run inline on the loop thread, right after the blocking
+        code returned, so the lag measured here is the one the heartbeat would
+        report once the loop gets to it.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        with self._lock:
+            watch = self._watches.get(id(loop))
+            if watch is None or watch.loop is not loop or watch.pending is None:
+                return
+            scheduled, stall = watch.pending
+            lag = time.perf_counter() - scheduled
+            if lag < self.threshold:
+                return
+            watch.pending = None
+            if stall is None:
+                # The sampler has not looked at the stack yet, and the blocking
+                # frames are gone; blame the node that just finished.
+                node = event.node if event.kind == "node" else None
+                stall = {
+                    "kind": "node" if node else None,
+                    "component": node,
+                    "node": node,
+                    "call_site": None,
+                    "stack": (),
+                    "active_nodes": tuple(sorted(set(watch.nodes.values()))),
+                    "run_ids": tuple(str(run_id) for run_id in watch.runs),
+                    "inferred": node is not None,
+                }
+        self._record(lag, stall)
+
+    def _watch(self, watch: _LoopWatch) -> None:
+        """Measure heartbeat lag on `watch.loop` until it closes or the watch is stopped."""
+        while not watch.stop.is_set() and not watch.loop.is_closed():
+            with self._lock:
+                active = bool(watch.runs)
+            if not active:
+                watch.stop.wait(self.interval)
+                continue
+
+            beat = threading.Event()
+            scheduled = time.perf_counter()
+            with self._lock:
+                watch.pending = (scheduled, None)
+            try:
+                watch.loop.call_soon_threadsafe(beat.set)
+            except RuntimeError:
+                with self._lock:
+                    watch.pending = None
+                break
+
+            if not beat.wait(self.threshold):
+                stall = self._attribute(watch)
+                with self._lock:
+                    if watch.pending is not None:
+                        watch.pending = (scheduled, stall)
+                while not beat.wait(self.interval):
+                    if watch.loop.is_closed() or watch.stop.is_set():
+                        break
+            lag = time.perf_counter() - scheduled
+            with self._lock:
+                # An end event on the loop may have recorded this heartbeat already.
+                pending, watch.pending = watch.pending, None
+            if pending is not None:
+                self._record(lag, pending[1])
+            watch.stop.wait(self.interval)
+
+        with self._lock:
+            if self._watches.get(id(watch.loop)) is watch:
+                del self._watches[id(watch.loop)]
+
+    def _attribute(self, watch: _LoopWatch) -> dict[str, Any]:
+        """Sample the loop thread's stack and find the component blocking it."""
+        frame = sys._current_frames().get(watch.thread_id)
+        with self._lock:
+            active_nodes = tuple(sorted(set(watch.nodes.values())))
+            run_ids = tuple(str(run_id) for run_id in watch.runs)
+
+        stack = self._format_stack(frame)
+        blame = self._blame(frame)
+        inferred = False
+        if blame is None and len(active_nodes) == 1:
+            blame, inferred = ("node", active_nodes[0], active_nodes[0]), True
+        kind, component, node = blame or (None, None, None)
+        return {
+            "kind": kind,
+            "component": component,
+            "node": node,
+            "call_site": stack[0] if stack else None,
+            "stack": stack,
+            "active_nodes": active_nodes,
+            "run_ids": run_ids,
+            "inferred": inferred,
+        }
+
+    def _format_stack(self, frame: FrameType | None) -> tuple[str, ...]:
+        if frame is None:
+            return ()
+        summary = traceback.extract_stack(frame, limit=self.stack_depth)
+        return tuple(f"{entry.filename}:{entry.lineno} in {entry.name}" for entry in reversed(summary))
+
+    def _blame(self, frame: FrameType | None) -> tuple[EventKind, str, str | None] | None:
+        """Return `(kind, component, node)` for the innermost known component on the stack."""
+        inner: tuple[EventKind, str] | None = None
+        while frame is not None:
+            owner = frame.f_locals.get("self")
+            if owner is not None:
+                known = self._components.get(id(owner))
+                if known is not None:
+                    kind, node = known
+                    if inner is not None:
+                        return inner[0], inner[1], node
+                    return kind, node, node
+                if isinstance(owner, (StateEnhancer, StateCommander, StateEvaluator)):
+                    # Unbound handler, e.g. one created inside another enhancer.
+                    return ("router" if isinstance(owner, StateEvaluator) else "node"), type(owner).__name__, None
+                if inner is None and isinstance(owner, BaseTool):
+                    inner = ("tool", owner.name)
+                elif inner is None and isinstance(owner, Runnable) and not self._is_internal(frame):
+                    inner = ("runnable", owner.get_name())
+            frame = frame.f_back
+        return (inner[0], inner[1], None) if inner is not None else None
+
+    @staticmethod
+    def _is_internal(frame: FrameType) -> bool:
+        return str(frame.f_globals.get("__name__", "")).startswith(_INTERNAL_MODULES)
+
+    def _record(self, lag: float, stall_fields: dict[str, Any] | None) -> None:
+        with self._lock:
+            self._samples += 1
+            self._lags.append(lag)
+            self._max_lag = max(self._max_lag, lag)
+        if stall_fields is None:
+            return
+
+        stall = LoopStall(lag=lag, **stall_fields)
+        with self._lock:
+            self._stall_count += 1
+            self.stalls.append(stall)
+            self._stalls_by_component[stall.label] += 1
+            self._blocked_by_component[stall.label] += lag
+
+        self.logger.warning(
+            "Event loop blocked for %.0f ms by %s at %s",
+            lag * 1000,
+            stall.label,
+            stall.call_site,
+            extra={"loop_stall": asdict(stall)},
+        )
+
+    def metrics(self) -> LoopLagMetrics:
+        """Return a snapshot of the lag observed so far."""
+        with self._lock:
+            lags = sorted(self._lags)
+            return LoopLagMetrics(
+                samples=self._samples,
+                stalls=self._stall_count,
+                max_lag=self._max_lag,
+                p50_lag=percentile(lags, 50.0) if lags else 0.0,
+                p99_lag=percentile(lags, 99.0) if lags else 0.0,
+                stalls_by_component=dict(self._stalls_by_component),
+                blocked_seconds_by_component=dict(self._blocked_by_component),
+            )
+
+    def close(self) -> None:
+        """Stop the watchdog threads, recording the heartbeat they may be measuring.
+
+        Metrics are kept, and the next run on an event loop starts a new
+        watchdog.
+        """
+        with self._lock:
+            stop, self._stop = self._stop, threading.Event()
+            watches = list(self._watches.values())
+            self._watches.clear()
+        stop.set()
+        for watch in watches:
+            if watch.thread is not None:
+                watch.thread.join(timeout=self.threshold + self.interval)
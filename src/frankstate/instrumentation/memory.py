@@ -0,0 +1,244 @@
+import logging
+import threading
+import time
+import tracemalloc
+from collections import defaultdict, deque
+from dataclasses import asdict, dataclass, field
+from typing import Any
+from uuid import UUID
+
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from langgraph.types import Command
+
+from frankstate.instrumentation.hooks import ExecutionEvent, ExecutionHook
+
+
+@dataclass(frozen=True)
+class NodeMemory:
+    """Memory accounting of one node execution.
+
+    Attributes:
+        run_id: Root run id of the graph run.
+        node: Node name, as declared in the layout.
+        step: LangGraph superstep of the execution.
+        input_bytes: Serialized size of the state the node received.
+        output_bytes: Serialized size of the update the node returned.
+        input_bytes_by_key: `input_bytes` per state key.
+        output_bytes_by_key: `output_bytes` per state key.
+        allocated: Net bytes traced by `tracemalloc` between the start and
+            the end of the node, or `None` without `trace_allocations`. It
+            includes allocations of anything running concurrently.
+        flags: `"output"` when the update is larger than `max_output_bytes`,
+            `"state"` when the state would grow past `max_state_bytes`.
+        timestamp: Wall-clock time the node finished.
+    """
+
+    run_id: str
+    node: str
+    step: int | None
+    input_bytes: int
+    output_bytes: int
+    input_bytes_by_key: dict[str, int]
+    output_bytes_by_key: dict[str, int]
+    allocated: int | None
+    flags: tuple[str, ...] = ()
+    timestamp: float = field(default_factory=time.time)
+
+    @property
+    def largest_key(self) -> str | None:
+        """Return the state key carrying most of the update."""
+        return max(self.output_bytes_by_key, key=self.output_bytes_by_key.__getitem__, default=None)
+
+
+@dataclass(frozen=True)
+class NodeMemoryStats:
+    """Memory accounting of one node aggregated over its executions.
+
+    Attributes:
+        node: Node name, as declared in the layout.
+        executions: Times the node ran.
+        flagged: Executions carrying at least one flag.
+        total_output_bytes: Serialized bytes returned over all executions.
+        max_output_bytes: Largest serialized update.
+        max_input_bytes: Largest serialized state received.
+        output_bytes_by_key: Serialized bytes returned per state key.
+        allocated: Net traced bytes over all executions, or `None` without
+            `trace_allocations`.
+    """
+
+    node: str
+    executions: int
+    flagged: int
+    total_output_bytes: int
+    max_output_bytes: int
+    max_input_bytes: int
+    output_bytes_by_key: dict[str, int]
+    allocated: int | None
+
+
+@dataclass
+class _NodeTotals:
+    executions: int = 0
+    flagged: int = 0
+    total_output_bytes: int = 0
+    max_output_bytes: int = 0
+    max_input_bytes: int = 0
+    output_bytes_by_key: defaultdict[str, int] = field(default_factory=lambda: defaultdict(int))
+    allocated: int | None = None
+
+
+class MemoryTracker(ExecutionHook):
+    """Account the serialized state size and allocations of every node.
+
+    Each node's input state and returned update are serialized with the
+    checkpointer serializer, key by key, so a node appending tool messages to
+    `messages` or base64 images to `context` shows up as the owner of that
+    growth. Executions whose update is larger than `max_output_bytes`, or
+    whose update would take the state past `max_state_bytes`, are flagged and
+    logged as warnings carrying the `NodeMemory` fields under
+    `extra["node_memory"]`:
+
+        tracker = MemoryTracker(max_output_bytes=256_000, trace_allocations=True)
+        graph = WorkflowBuilder(config=MyLayout, state_schema=State, hooks=[tracker]).compile()
+        ...
+        tracker.stats()
+
+    With `trace_allocations=True`, `tracemalloc` is started if needed and the
+    net traced memory across each node is recorded; call `close()` to stop it
+    again. Serializing every state has a cost, so keep the tracker for
+    diagnosis rather than for every production run.
+    """
+
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        max_output_bytes: int | None = 256_000,
+        max_state_bytes: int | None = 2_000_000,
+        trace_allocations: bool = False,
+        max_records: int = 1000,
+    ):
+        super().__init__()
+        self.max_output_bytes = max_output_bytes
+        self.max_state_bytes = max_state_bytes
+        self.trace_allocations = trace_allocations
+        self.records: deque[NodeMemory] = deque(maxlen=max_records)
+        self._serializer = JsonPlusSerializer()
+        self._started: dict[UUID, tuple[dict[str, int], int | None]] = {}
+        self._totals: dict[str, _NodeTotals] = {}
+        self._started_tracing = False
+        self._lock = threading.Lock()
+
+    def on_start(self, event: ExecutionEvent) -> None:
+        if event.kind != "node":
+            return
+        if self.trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        allocated = tracemalloc.get_traced_memory()[0] if self.trace_allocations else None
+        sizes = self._sizes(event.inputs)
+        with self._lock:
+            self._started[event.run_id] = (sizes, allocated)
+
+    def on_end(self, event: ExecutionEvent, output: Any) -> None:
+        if event.kind != "node":
+            return
+        with self._lock:
+            started = self._started.pop(event.run_id, None)
+        if started is None or event.node is None:
+            return
+
+        input_sizes, allocated_before = started
+        allocated = None
+        if allocated_before is not None and tracemalloc.is_tracing():
+            allocated = tracemalloc.get_traced_memory()[0] - allocated_before
+        if isinstance(output, Command):
+            output = output.update
+        output_sizes = self._sizes(output)
+        input_bytes, output_bytes = sum(input_sizes.values()), sum(output_sizes.values())
+
+        flags: list[str] = []
+        if self.max_output_bytes is not None and output_bytes > self.max_output_bytes:
+            flags.append("output")
+        if self.max_state_bytes is not None and input_bytes + output_bytes > self.max_state_bytes:
+            flags.append("state")
+        record = NodeMemory(
+            run_id=str(event.root_run_id),
+            node=event.node,
+            step=event.step,
+            input_bytes=input_bytes,
+            output_bytes=output_bytes,
+            input_bytes_by_key=input_sizes,
+            output_bytes_by_key=output_sizes,
+            allocated=allocated,
+            flags=tuple(flags),
+        )
+        self._record(record)
+
+    def on_error(self, event: ExecutionEvent, error: BaseException) -> None:
+        with self._lock:
+            self._started.pop(event.run_id, None)
+
+    def _sizes(self, value: Any) -> dict[str, int]:
+        """Return the serialized size of each key of a state or update."""
+        if isinstance(value, (list, tuple)) and all(isinstance(item, tuple) and len(item) == 2 for item in value):
+            value = dict(value)
+        if not isinstance(value, dict):
+            return {}
+
+        sizes: dict[str, int] = {}
+        for key, item in value.items():
+            try:
+                sizes[str(key)] = len(self._serializer.dumps_typed(item)[1])
+            except Exception:
+                self.logger.debug("State key %r is not serializable; left out of the accounting", key)
+        return sizes
+
+    def _record(self, record: NodeMemory) -> None:
+        with self._lock:
+            self.records.append(record)
+            totals = self._totals.setdefault(record.node, _NodeTotals())
+            totals.executions += 1
+            totals.flagged += bool(record.flags)
+            totals.total_output_bytes += record.output_bytes
+            totals.max_output_bytes = max(totals.max_output_bytes, record.output_bytes)
+            totals.max_input_bytes = max(totals.max_input_bytes, record.input_bytes)
+            for key, size in record.output_bytes_by_key.items():
+                totals.output_bytes_by_key[key] += size
+            if record.allocated is not None:
+                totals.allocated = (totals.allocated or 0) + record.allocated
+
+        if record.flags:
+            self.logger.warning(
+                "Node '%s' returned %s bytes (%s: %s bytes) on a %s-byte state",
+                record.node,
+                record.output_bytes,
+                record.largest_key,
+                record.output_bytes_by_key.get(record.largest_key or "", 0),
+                record.input_bytes,
+                extra={"node_memory": asdict(record)},
+            )
+
+    def stats(self) -> list[NodeMemoryStats]:
+        """Return per-node accounting, the nodes returning the most bytes first."""
+        with self._lock:
+            stats = [
+                NodeMemoryStats(
+                    node=node,
+                    executions=totals.executions,
+                    flagged=totals.flagged,
+                    total_output_bytes=totals.total_output_bytes,
+                    max_output_bytes=totals.max_output_bytes,
+                    max_input_bytes=totals.max_input_bytes,
+                    output_bytes_by_key=dict(totals.output_bytes_by_key),
+                    allocated=totals.allocated,
+                )
+                for node, totals in self._totals.items()
+            ]
+        return sorted(stats, key=lambda item: item.total_output_bytes, reverse=True)
+
+    def close(self) -> None:
+        """Stop `tracemalloc` if this tracker started it."""
+        if self._started_tracing and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        self._started_tracing = False
@@ -0,0 +1,243 @@
+import logging
+import sys
+import threading
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+from uuid import UUID
+
+from frankstate.instrumentation.hooks import (
+    ExecutionEvent,
+    ExecutionHook,
+    token_usage,
+)
+from frankstate.managers.edge_manager import EdgeManager
+from frankstate.managers.node_manager import NodeManager
+
+if TYPE_CHECKING:
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SpanExporter
+    from opentelemetry.trace import Span
+
+# Event kinds that open a span; the others only report into their parent span.
+SPAN_KINDS = ("graph", "node", "router", "builder")
+
+USAGE_ATTRIBUTES = {
+    "input_tokens": "gen_ai.usage.input_tokens",
+    "output_tokens": "gen_ai.usage.output_tokens",
+    "total_tokens": "frankstate.usage.total_tokens",
+    "cached_input_tokens": "frankstate.usage.cached_input_tokens",
+}
+
+
+def create_tracer_provider(
+    exporter: Literal["console", "file", "otlp"] | "SpanExporter" = "console",
+    path: str | Path | None = None,
+    service_name: str = "frankstate",
+    endpoint: str | None = None,
+) -> "TracerProvider":
+    """Build an OpenTelemetry SDK `TracerProvider` with one exporter.
+
+    Args:
+        exporter: `"console"` prints spans to stdout, `"file"` appends one
+            JSON span per line to `path` and closes it on `provider.shutdown()`, `"otlp"` sends spans to an OTLP gRPC
+            collector (`endpoint`, or the standard `OTEL_EXPORTER_OTLP_*`
+            variables) and any `SpanExporter` instance is used as is.
+        path: Target file for `exporter="file"`.
+        service_name: `service.name` resource attribute.
+        endpoint: Collector endpoint for `exporter="otlp"`.
+
+    Raises:
+        ImportError: If `opentelemetry-sdk`, or the OTLP exporter package for
+            `exporter="otlp"`, is not installed.
+        ValueError: If `exporter="file"` is used without `path` or the exporter
+            name is unknown.
+    """
+    try:
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import (
+            BatchSpanProcessor,
+            ConsoleSpanExporter,
+            SimpleSpanProcessor,
+        )
+    except ImportError as exc:
+        raise ImportError("create_tracer_provider() requires `opentelemetry-sdk`.") from exc
+
+    provider = TracerProvider(resource=Resource.create({"service.name": service_name}))
+    if exporter == "console":
+        provider.add_span_processor(SimpleSpanProcessor(ConsoleSpanExporter(out=sys.stdout)))
+    elif exporter == "file":
+        if path is None:
+            raise ValueError("`path` is required with exporter='file'")
+
+        class FileSpanExporter(ConsoleSpanExporter):
+            """Console exporter writing to a file it closes on provider shutdown."""
+
+            def shutdown(self) -> None:
+                super().shutdown()
+                self.out.close()
+
+        stream = Path(path).open("a", encoding="utf-8")
+        file_exporter = FileSpanExporter(out=stream, formatter=lambda span: span.to_json(indent=None) + "\n")
+        provider.add_span_processor(SimpleSpanProcessor(file_exporter))
+    elif exporter == "otlp":
+        try:
+            from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import (
+                OTLPSpanExporter,
+            )
+        except ImportError as exc:
+            raise ImportError("exporter='otlp' requires `opentelemetry-exporter-otlp-proto-grpc`.") from exc
+        provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter(endpoint=endpoint)))
+    elif isinstance(exporter, str):
+        raise ValueError(f"Unknown exporter {exporter!r}; use 'console', 'file', 'otlp' or a SpanExporter")
+    else:
+        provider.add_span_processor(BatchSpanProcessor(exporter))
+    return provider
+
+
+class OpenTelemetryHook(ExecutionHook):
+    """Emit OpenTelemetry spans for graph runs, nodes, edge evaluations and builders.
+
+    One span is opened per graph run (`run <layout>`), per node execution
+    (`node <name>`), per conditional edge evaluation (`edge <source>`) and per
+    `RunnableBuilder` runnable invocation (`runnable <builder>`). Spans nest
+    under the run span, which itself joins the caller's current trace, and
+    carry:
+
+    - `frankstate.layout`, `frankstate.run_id` and `frankstate.node`.
+    - `frankstate.node.tags`: tags declared on the node in the layout.
+    - `frankstate.step` and `frankstate.iteration`, the execution count of
+      the node or edge within the run.
+    - `frankstate.edge.decision` on edge spans.
+    - `gen_ai.usage.input_tokens`, `gen_ai.usage.output_tokens`,
+      `frankstate.usage.total_tokens` and
+      `frankstate.usage.cached_input_tokens`, summed over the model calls
+      made inside the span.
+
+    Spans go to `tracer_provider`, or to the globally configured provider.
+    See `create_tracer_provider()` for console, file and OTLP exporters.
+
+    Raises:
+        ImportError: If `opentelemetry-api` is not installed.
+    """
+
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    def __init__(self, tracer_provider: Any | None = None, tracer_name: str = "frankstate"):
+        super().__init__()
+        try:
+            from opentelemetry import trace
+        except ImportError as exc:
+            raise ImportError("OpenTelemetryHook requires `opentelemetry-api`.") from exc
+
+        self._trace = trace
+        self.tracer = trace.get_tracer(tracer_name, tracer_provider=tracer_provider)
+        self._node_tags: dict[str, list[str]] = {}
+        self._spans: dict[UUID, Span] = {}
+        self._owners: dict[UUID, UUID] = {}
+        self._parents: dict[UUID, UUID | None] = {}
+        self._usage: defaultdict[UUID, Counter[str]] = defaultdict(Counter)
+        self._iterations: defaultdict[UUID, Counter[tuple[str, str]]] = defaultdict(Counter)
+        self._lock = threading.Lock()
+
+    def bind(self, layout_name: str, node_manager: NodeManager, edge_manager: EdgeManager) -> None:
+        super().bind(layout_name, node_manager, edge_manager)
+        for node in node_manager.get_nodes():
+            tags = getattr(node, "tags", None)
+            if tags:
+                self._node_tags[node.name] = list(tags)
+
+    def on_start(self, event: ExecutionEvent) -> None:
+        with self._lock:
+            parent = self._owners.get(event.parent_run_id) if event.parent_run_id is not None else None
+            if event.kind not in SPAN_KINDS:
+                if parent is not None:
+                    self._owners[event.run_id] = parent
+                return
+            parent_span = self._spans.get(parent) if parent is not None else None
+            iteration = 0
+            if event.kind in ("node", "router") and event.node is not None:
+                self._iterations[event.root_run_id][(event.kind, event.node)] += 1
+                iteration = self._iterations[event.root_run_id][(event.kind, event.node)]
+
+        context = self._trace.set_span_in_context(parent_span) if parent_span is not None else None
+        span = self.tracer.start_span(self._span_name(event), context=context, attributes=self._attributes(event, iteration))
+        with self._lock:
+            self._spans[event.run_id] = span
+            self._owners[event.run_id] = event.run_id
+            self._parents[event.run_id] = parent
+
+    def on_end(self, event: ExecutionEvent, output: Any) -> None:
+        if event.kind == "model":
+            usage = token_usage(output)
+            if usage:
+                self._add_usage(event.parent_run_id, usage)
+        if event.kind == "router":
+            self._finish(event, {"frankstate.edge.decision": str(output)})
+        else:
+            self._finish(event, {})
+
+    def on_error(self, event: ExecutionEvent, error: BaseException) -> None:
+        span = self._finish(event, {}, end=False)
+        if span is not None:
+            from opentelemetry.trace import Status, StatusCode
+
+            span.record_exception(error)
+            span.set_status(Status(StatusCode.ERROR, str(error)))
+            span.end()
+
+    def _span_name(self, event: ExecutionEvent) -> str:
+        if event.kind == "graph":
+            return f"run {self.layout_name or event.name}"
+        if event.kind == "router":
+            return f"edge {event.node}"
+        if event.kind == "builder":
+            return f"runnable {event.name}"
+        return f"node {event.node}"
+
+    def _attributes(self, event: ExecutionEvent, iteration: int) -> dict[str, Any]:
+        attributes: dict[str, Any] = {
+            "frankstate.layout": self.layout_name or "",
+            "frankstate.run_id": str(event.root_run_id),
+        }
+        if event.node is not None:
+            attributes["frankstate.node"] = event.node
+            if event.node in self._node_tags:
+                attributes["frankstate.node.tags"] = self._node_tags[event.node]
+        if event.step is not None:
+            attributes["frankstate.step"] = event.step
+        if iteration:
+            attributes["frankstate.iteration"] = iteration
+        if event.kind == "router":
+            attributes["frankstate.edge.source"] = event.node or ""
+        if event.kind == "builder":
+            attributes["frankstate.runnable_builder"] = event.name
+        return attributes
+
+    def _add_usage(self, run_id: UUID | None, usage: dict[str, int]) -> None:
+        """Add model usage to every span enclosing the model call."""
+        with self._lock:
+            owner = self._owners.get(run_id) if run_id is not None else None
+            while owner is not None:
+                self._usage[owner].update(usage)
+                owner = self._parents.get(owner)
+
+    def _finish(self, event: ExecutionEvent, attributes: dict[str, Any], end: bool = True) -> "Span | None":
+        with self._lock:
+            self._owners.pop(event.run_id, None)
+            span = self._spans.pop(event.run_id, None)
+            self._parents.pop(event.run_id, None)
+            usage = self._usage.pop(event.run_id, None)
+            if event.kind == "graph":
+                self._iterations.pop(event.run_id, None)
+        if span is None:
+            return None
+
+        for key, value in (usage or {}).items():
+            attributes[USAGE_ATTRIBUTES[key]] = value
+        if attributes:
+            span.set_attributes(attributes)
+        if end:
+            span.end()
+        return span
@@ -0,0 +1,330 @@
+import asyncio
+import logging
+import sys
+import threading
+import time
+from collections import Counter, defaultdict, deque
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import CodeType, FrameType
+from typing import Any
+from uuid import UUID
+
+from frankstate.instrumentation.hooks import ExecutionEvent, ExecutionHook
+from frankstate.instrumentation.writer import BackgroundWriter
+
+# Frames of these modules are the scheduler, not the profiled code.
+_RUNTIME_MODULES = ("asyncio", "threading", "concurrent.futures", "langgraph", "langchain_core", "frankstate.instrumentation")
+
+# Pseudo frames for samples taken while a node or run was not on the CPU.
+AWAITING = "[awaiting]"
+GRAPH = "[graph]"
+
+
+@dataclass(frozen=True)
+class FunctionStat:
+    """Samples of one function within one node.
+
+    Attributes:
+        function: `qualname (path:line)` of the function.
+        self_samples: Samples where the function was the innermost frame.
+        total_samples: Samples where the function was anywhere on the stack.
+    """
+
+    function: str
+    self_samples: int
+    total_samples: int
+
+
+@dataclass(frozen=True)
+class RunProfile:
+    """Sampled profile of one graph run.
+
+    Attributes:
+        run_id: Root run id of the profiled run.
+        layout: Layout the run belongs to.
+        interval: Seconds between samples.
+        samples: Samples taken while the run was active.
+        samples_by_node: Samples per node, including `[graph]` for the
+            runtime between nodes.
+        awaiting_by_node: Samples where the node was waiting on I/O or
+            another task rather than running.
+        top_by_node: Functions with the most samples per node, by
+            `self_samples` then `total_samples`.
+        path: Collapsed-stack file written for the run, if any.
+        stacks: Sample count per root-first stack, the first frame being the node.
+    """
+
+    run_id: UUID
+    layout: str | None
+    interval: float
+    samples: int
+    samples_by_node: dict[str, int]
+    awaiting_by_node: dict[str, int]
+    top_by_node: dict[str, tuple[FunctionStat, ...]]
+    path: Path | None
+    stacks: dict[tuple[str, ...], int] = field(repr=False)
+
+    def summary(self) -> str:
+        """Return the per-node top functions as text."""
+        lines = [
+            f"Profile of {self.layout or 'graph'} run {self.run_id}: "
+            f"{self.samples} samples every {self.interval * 1000:g}ms"
+        ]
+        for node, samples in sorted(self.samples_by_node.items(), key=lambda item: item[1], reverse=True):
+            share = samples / self.samples if self.samples else 0.0
+            awaiting = self.awaiting_by_node.get(node, 0)
+            lines.append(f"  {node}: {samples} samples ({share:.0%}), {awaiting} awaiting")
+            for stat in self.top_by_node.get(node, ()):
+                lines.append(f"    {stat.total_samples:>6} total {stat.self_samples:>6} self  {stat.function}")
+        return "\n".join(lines)
+
+
+@dataclass
+class _ProfiledRun:
+    """Sampling state of one profiled graph run."""
+
+    thread_id: int
+    loop: asyncio.AbstractEventLoop | None
+    nodes: dict[UUID, tuple[str, int, bool]] = field(default_factory=dict)
+    stacks: Counter[tuple[str, ...]] = field(default_factory=Counter)
+
+
+# `(root run id, label)` of the profiled unit executing in the current context.
+# Set inline by node callbacks, it follows the node into the tasks LangGraph
+# spawns for it, which lets the sampler tell apart runs sharing one loop.
+_profiled_unit: ContextVar[tuple[UUID, str] | None] = ContextVar("frankstate_profiled_unit", default=None)
+
+
+class RunProfiler(ExecutionHook):
+    """Sample the call stacks of single runs that ask to be profiled.
+
+    Only runs invoked with `metadata={"profile": True}` (or another
+    `config_key`) in their `RunnableConfig` are profiled, so one slow request
+    can be inspected on a loaded server without profiling the others:
+
+        profiler = RunProfiler(output_dir="profiles")
+        graph = WorkflowBuilder(config=MyLayout, state_schema=State, hooks=[profiler]).compile()
+        await graph.ainvoke(inputs, config={"metadata": {"profile": True}})
+
+    The switch lives in `metadata` because, unlike `configurable`, it reaches
+    the callbacks of the run.
+
+    A sampler thread reads the stack of the threads running the run every
+    `interval` seconds. On an event loop shared with other runs, a sample
+    only counts when the loop is executing one of the run's tasks; while it
+    is not, its active nodes are reported as `[awaiting]`. Each finished run
+    writes `<layout>-<run_id>.folded` (collapsed stacks, one
+    `node;frame;...;frame count` line per stack, readable by speedscope or
+    flamegraph.pl) and a `.txt` top-`top` summary per node to `output_dir`,
+    and is kept in `profiles`. With `output_dir=None` nothing is written.
+
+    Files are written by a background thread, not on the profiled event loop;
+    `flush()` waits for the profiles finished so far and `close()`, also
+    called at interpreter exit, stops the writer.
+    """
+
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        output_dir: str | Path | None = ".",
+        interval: float = 0.005,
+        top: int = 15,
+        config_key: str = "profile",
+        stack_depth: int = 64,
+        max_profiles: int = 100,
+    ):
+        super().__init__()
+        if interval <= 0:
+            raise ValueError("`interval` must be positive")
+
+        self.output_dir = Path(output_dir) if output_dir is not None else None
+        self.interval = interval
+        self.top = top
+        self.config_key = config_key
+        self.stack_depth = stack_depth
+        self.profiles: deque[RunProfile] = deque(maxlen=max_profiles)
+        self._runs: dict[UUID, _ProfiledRun] = {}
+        self._labels: dict[CodeType, str] = {}
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self._writer = BackgroundWriter("frankstate-profile-writer")
+
+    def on_start(self, event: ExecutionEvent) -> None:
+        try:
+            loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        with self._lock:
+            if event.kind == "graph":
+                if not event.metadata.get(self.config_key):
+                    return
+                self._runs[event.run_id] = _ProfiledRun(thread_id=threading.get_ident(), loop=loop)
+                label = GRAPH
+            elif event.kind == "node" and event.node is not None and event.root_run_id in self._runs:
+                self._runs[event.root_run_id].nodes[event.run_id] = (event.node, threading.get_ident(), loop is not None)
+                label = event.node
+            else:
+                return
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._sample, name="frankstate-profiler", daemon=True)
+                self._thread.start()
+        _profiled_unit.set((event.root_run_id, label))
+
+    def on_end(self, event: ExecutionEvent, output: Any) -> None:
+        if event.kind == "node":
+            with self._lock:
+                run = self._runs.get(event.root_run_id)
+                if run is None or run.nodes.pop(event.run_id, None) is None:
+                    return
+            # Work left in this context after the node belongs to the runtime.
+            if _profiled_unit.get() == (event.root_run_id, event.node):
+                _profiled_unit.set((event.root_run_id, GRAPH))
+        elif event.kind == "graph":
+            with self._lock:
+                finished = self._runs.pop(event.run_id, None)
+            if finished is None:
+                return
+            if _profiled_unit.get() == (event.run_id, GRAPH):
+                _profiled_unit.set(None)
+            self._finish(event, finished.stacks)
+
+    def on_error(self, event: ExecutionEvent, error: BaseException) -> None:
+        self.on_end(event, None)
+
+    def _sample(self) -> None:
+        """Sample every profiled run until none is left."""
+        while True:
+            with self._lock:
+                if not self._runs:
+                    self._thread = None
+                    return
+                runs = {run_id: (run.thread_id, run.loop, list(run.nodes.values())) for run_id, run in self._runs.items()}
+            samples = self._take(runs, sys._current_frames())
+            with self._lock:
+                for run_id, stack in samples:
+                    if run_id in self._runs:
+                        self._runs[run_id].stacks[stack] += 1
+            time.sleep(self.interval)
+
+    def _take(
+        self,
+        runs: dict[UUID, tuple[int, asyncio.AbstractEventLoop | None, list[tuple[str, int, bool]]]],
+        frames: dict[int, FrameType],
+    ) -> list[tuple[UUID, tuple[str, ...]]]:
+        """Return the `(run, node-first stack)` samples of one tick."""
+        running: dict[UUID, tuple[str, FrameType | None]] = {}
+        loops = {id(loop): (loop, thread_id) for thread_id, loop, _ in runs.values() if loop is not None}
+        for loop, thread_id in loops.values():
+            task = asyncio.current_task(loop)
+            unit = task.get_context().get(_profiled_unit) if task is not None else None
+            if unit is not None and unit[0] in runs:
+                running[unit[0]] = (unit[1], frames.get(thread_id))
+        for run_id, (thread_id, loop, nodes) in runs.items():
+            # Synchronous nodes own the thread they run in.
+            for node, node_thread, is_async in nodes:
+                if not is_async and node_thread in frames:
+                    running[run_id] = (node, frames[node_thread])
+            if loop is None and run_id not in running and thread_id in frames:
+                running[run_id] = (GRAPH, frames[thread_id])
+
+        samples: list[tuple[UUID, tuple[str, ...]]] = []
+        for run_id, (_, _, nodes) in runs.items():
+            if run_id in running:
+                label, frame = running[run_id]
+                samples.append((run_id, (label, *self._stack(frame))))
+            else:
+                samples.extend((run_id, (node, AWAITING)) for node, _, _ in nodes)
+        return samples
+
+    def _stack(self, frame: FrameType | None) -> tuple[str, ...]:
+        """Return the root-first user frames run by LangGraph, runtime frames left out."""
+        frames: list[tuple[str, FrameType]] = []
+        while frame is not None:
+            frames.append((str(frame.f_globals.get("__name__", "")), frame))
+            frame = frame.f_back
+        # Frames outside the outermost LangGraph frame belong to the caller of the graph.
+        outermost = max(
+            (index for index, (module, _) in enumerate(frames) if module.startswith("langgraph")),
+            default=len(frames),
+        )
+        stack = [self._label(frame) for module, frame in frames[:outermost] if not module.startswith(_RUNTIME_MODULES)]
+        return tuple(reversed(stack[: self.stack_depth]))
+
+    def _label(self, frame: FrameType) -> str:
+        code = frame.f_code
+        label = self._labels.get(code)
+        if label is None:
+            label = self._labels[code] = f"{code.co_qualname} ({code.co_filename}:{code.co_firstlineno})"
+        return label
+
+    def _finish(self, event: ExecutionEvent, stacks: Counter[tuple[str, ...]]) -> None:
+        samples_by_node: Counter[str] = Counter()
+        awaiting_by_node: Counter[str] = Counter()
+        self_samples: defaultdict[str, Counter[str]] = defaultdict(Counter)
+        total_samples: defaultdict[str, Counter[str]] = defaultdict(Counter)
+        for (node, *frames), count in stacks.items():
+            samples_by_node[node] += count
+            if frames == [AWAITING]:
+                awaiting_by_node[node] += count
+                continue
+            if frames:
+                self_samples[node][frames[-1]] += count
+            for function in set(frames):
+                total_samples[node][function] += count
+
+        profile = RunProfile(
+            run_id=event.run_id,
+            layout=self.layout_name,
+            interval=self.interval,
+            samples=sum(samples_by_node.values()),
+            samples_by_node=dict(samples_by_node),
+            awaiting_by_node=dict(awaiting_by_node),
+            top_by_node={
+                node: tuple(
+                    sorted(
+                        (FunctionStat(function, self_samples[node][function], total) for function, total in functions.items()),
+                        key=lambda stat: (stat.self_samples, stat.total_samples),
+                        reverse=True,
+                    )[: self.top]
+                )
+                for node, functions in total_samples.items()
+            },
+            path=self._path(event.run_id),
+            stacks=dict(stacks),
+        )
+        if profile.path is not None:
+            path = profile.path
+            self._writer.submit(lambda: self._write(path, profile, stacks))
+        self.profiles.append(profile)
+        self.logger.info(
+            "Profiled %s run %s: %s samples, writing to %s",
+            self.layout_name,
+            event.run_id,
+            profile.samples,
+            profile.path,
+        )
+
+    def _path(self, run_id: UUID) -> Path | None:
+        if self.output_dir is None:
+            return None
+        return self.output_dir / f"{self.layout_name or 'graph'}-{run_id}.folded"
+
+    def _write(self, path: Path, profile: RunProfile, stacks: Counter[tuple[str, ...]]) -> None:
+        """Write the collapsed stacks and the summary of `profile`, on the writer thread."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as file:
+            for stack, count in stacks.most_common():
+                file.write(f"{';'.join(frame.replace(';', ':') for frame in stack)} {count}\n")
+        path.with_suffix(".txt").write_text(profile.summary() + "\n", encoding="utf-8")
+
+    def flush(self) -> None:
+        """Block until the profiles of the runs finished so far are written."""
+        self._writer.flush()
+
+    def close(self) -> None:
+        """Write the pending profiles and stop the writer thread."""
+        self._writer.close()
@@ -0,0 +1,144 @@
+import json
+import logging
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, TextIO
+from uuid import UUID
+
+from frankstate.instrumentation.hooks import ExecutionEvent, ExecutionHook
+from frankstate.instrumentation.writer import BackgroundWriter
+
+
+def _decision(output: Any) -> Any:
+    """Return a JSON-friendly form of a router result."""
+    if isinstance(output, str | bool | int | float) or output is None:
+        return output
+    if isinstance(output, list | tuple):
+        return [_decision(item) for item in output]
+    return getattr(output, "node", None) or repr(output)
+
+
+class RunRecorder(ExecutionHook):
+    """Record node timings, supersteps and branch decisions of each run as JSONL.
+
+    Every finished run appends one block of lines to `path`:
+
+    - `{"type": "run", ...}` with the layout name, wall-clock `timestamp`,
+      `duration` and `status`.
+    - `{"type": "node", ...}` per node task with its `step`, `start`, `end`,
+      `status` and `triggers`.
+    - `{"type": "route", ...}` per conditional edge evaluation with the
+      source `node`, `step` and `decision`.
+    - `{"type": "step", ...}` per superstep with its `start`, `end` and nodes.
+
+    `start` and `end` are seconds since the run started. Lines of one run are
+    written together, so several processes or graphs may share a file. Analyse
+    the corpus with `python -m frankstate.analysis.critical_path`.
+
+    Hooks run inline on the event loop, so the lines are handed to a writer
+    thread instead of being written there. `flush()` waits until the runs
+    finished so far are on disk; `close()`, also called at interpreter exit,
+    drains and stops the writer.
+    """
+
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    def __init__(self, path: str | Path | TextIO):
+        super().__init__()
+        if isinstance(path, str | Path):
+            self.path: Path | None = Path(path)
+            self._stream: TextIO | None = None
+        else:
+            self.path = None
+            self._stream = path
+        self._records: defaultdict[UUID, list[dict[str, Any]]] = defaultdict(list)
+        self._starts: dict[UUID, float] = {}
+        self._lock = threading.Lock()
+        self._writer = BackgroundWriter("frankstate-run-recorder")
+
+    def on_start(self, event: ExecutionEvent) -> None:
+        if event.kind == "graph":
+            with self._lock:
+                self._starts[event.run_id] = event.started_at
+
+    def on_end(self, event: ExecutionEvent, output: Any) -> None:
+        self._record(event, "ok", output)
+
+    def on_error(self, event: ExecutionEvent, error: BaseException) -> None:
+        self._record(event, "error", None)
+
+    def _record(self, event: ExecutionEvent, status: str, output: Any) -> None:
+        if event.kind == "graph":
+            self._flush(event, status)
+            return
+        if event.kind not in ("node", "router"):
+            return
+
+        with self._lock:
+            origin = self._starts.get(event.root_run_id)
+        if origin is None:
+            return
+
+        record: dict[str, Any] = {
+            "type": "node" if event.kind == "node" else "route",
+            "run_id": str(event.root_run_id),
+            "node": event.node,
+            "step": event.step,
+            "start": event.started_at - origin,
+            "end": (event.ended_at or event.started_at) - origin,
+        }
+        if event.kind == "node":
+            record["status"] = status
+            record["triggers"] = list(event.metadata.get("langgraph_triggers") or ())
+        else:
+            record["decision"] = _decision(output) if status == "ok" else None
+        with self._lock:
+            self._records[event.root_run_id].append(record)
+
+    def _flush(self, event: ExecutionEvent, status: str) -> None:
+        """Write the records of a finished run, adding its run and step records."""
+        with self._lock:
+            records = self._records.pop(event.run_id, [])
+            self._starts.pop(event.run_id, None)
+
+        steps: dict[int, dict[str, Any]] = {}
+        for record in records:
+            if record["type"] != "node" or record["step"] is None:
+                continue
+            step = steps.setdefault(
+                record["step"],
+                {"type": "step", "run_id": str(event.run_id), "step": record["step"], "start": record["start"], "end": record["end"], "nodes": []},
+            )
+            step["start"] = min(step["start"], record["start"])
+            step["end"] = max(step["end"], record["end"])
+            step["nodes"].append(record["node"])
+
+        run = {
+            "type": "run",
+            "run_id": str(event.run_id),
+            "layout": self.layout_name,
+            "timestamp": time.time() - (event.duration or 0.0),
+            "duration": event.duration,
+            "status": status,
+        }
+        lines = [run, *sorted(records, key=lambda record: record["start"]), *(steps[key] for key in sorted(steps))]
+        payload = "".join(json.dumps(line, default=str) + "\n" for line in lines)
+        self._writer.submit(lambda: self._write(payload))
+
+    def _write(self, payload: str) -> None:
+        if self._stream is not None:
+            self._stream.write(payload)
+            self._stream.flush()
+        elif self.path is not None:
+            with self.path.open("a", encoding="utf-8") as file:
+                file.write(payload)
+
+    def flush(self) -> None:
+        """Block until the runs finished so far are written."""
+        self._writer.flush()
+
+    def close(self) -> None:
+        """Write the pending runs and stop the writer thread; the next run starts a new one."""
+        self._writer.close()
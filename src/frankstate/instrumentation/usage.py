@@ -0,0 +1,284 @@
+import inspect
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, field
+from typing import Any, Literal
+from uuid import UUID
+
+from langgraph.graph import END
+
+from frankstate.instrumentation.hooks import ExecutionEvent, ExecutionHook, token_usage
+from frankstate.runtime.run_scope import current_run_scope
+
+# Route keys added to the path map of every conditional edge when a token
+# budget declares a fallback node: the first leads to the fallback, the
+# second ends the run at any later decision.
+TOKEN_BUDGET_ROUTE = "__token_budget_exit__"
+TOKEN_BUDGET_END_ROUTE = "__token_budget_end__"
+
+UsageMetric = Literal["input_tokens", "output_tokens", "total_tokens"]
+
+
+@dataclass(frozen=True)
+class TokenUsage:
+    """Token counts reported by one or more model responses.
+
+    `cached_input_tokens` counts the input tokens the provider served from its
+    prompt cache; it stays 0 for providers that do not report it.
+    """
+
+    input_tokens: int = 0
+    output_tokens: int = 0
+    total_tokens: int = 0
+    cached_input_tokens: int = 0
+
+    @property
+    def cache_hit_ratio(self) -> float:
+        """Return the share of input tokens read from the provider's prompt cache."""
+        return self.cached_input_tokens / self.input_tokens if self.input_tokens else 0.0
+
+    def __add__(self, other: "TokenUsage") -> "TokenUsage":
+        return TokenUsage(
+            input_tokens=self.input_tokens + other.input_tokens,
+            output_tokens=self.output_tokens + other.output_tokens,
+            total_tokens=self.total_tokens + other.total_tokens,
+            cached_input_tokens=self.cached_input_tokens + other.cached_input_tokens,
+        )
+
+
+@dataclass
+class RunUsage:
+    """Token usage of one graph run.
+
+    Attributes:
+        run_id: Root run id of the graph run.
+        layout: Layout the run belongs to.
+        total: Usage of every model call of the run.
+        by_node: Usage of the model calls made by each node's enhancer or commander.
+        by_edge: Usage of the model calls made by the evaluator of the
+            conditional edge leaving each node, such as an LLM grader.
+        by_builder: Usage of the model calls made through each `RunnableBuilder`.
+        model_calls: Number of model responses.
+        budget_exceeded: Whether the run went over its `TokenBudget`.
+    """
+
+    run_id: UUID
+    layout: str | None
+    total: TokenUsage = field(default_factory=TokenUsage)
+    by_node: dict[str, TokenUsage] = field(default_factory=dict)
+    by_edge: dict[str, TokenUsage] = field(default_factory=dict)
+    by_builder: dict[str, TokenUsage] = field(default_factory=dict)
+    model_calls: int = 0
+    budget_exceeded: bool = False
+
+
+class TokenBudgetExceeded(RuntimeError):
+    """Raised at the next routing decision of a run over its token budget without fallback."""
+
+    def __init__(self, usage: RunUsage, budget: "TokenBudget"):
+        super().__init__(
+            f"Run {usage.run_id} used {getattr(usage.total, budget.metric)} {budget.metric}, "
+            f"over its budget of {budget.max_tokens}"
+        )
+        self.usage = usage
+        self.budget = budget
+
+
+@dataclass(frozen=True)
+class TokenBudget:
+    """Per-run token budget enforced at conditional edges.
+
+    Once a run's usage goes over `max_tokens` of `metric`, its next routing
+    decision continues at `fallback` (a node name or `END`) instead of asking
+    the evaluator, and any later decision ends the run. With `fallback=None`
+    the next routing decision raises `TokenBudgetExceeded`. `on_exceeded` is
+    called once per run with its `RunUsage` when the budget is first exceeded.
+    """
+
+    max_tokens: int
+    fallback: str | None = END
+    metric: UsageMetric = "total_tokens"
+    on_exceeded: Callable[[RunUsage], object] | None = None
+
+    def __post_init__(self) -> None:
+        if self.max_tokens < 1:
+            raise ValueError("`max_tokens` must be at least 1")
+        if self.metric not in ("input_tokens", "output_tokens", "total_tokens"):
+            raise ValueError(f"Unknown token metric {self.metric!r}")
+
+
+@dataclass(frozen=True)
+class _Attribution:
+    component: Literal["node", "edge"] | None
+    node: str | None
+    builder: str | None = None
+
+
+class TokenUsageTracker(ExecutionHook):
+    """Aggregate model token usage per node, edge, runnable builder and run.
+
+    Usage is read from the `usage_metadata` of every model response produced
+    inside a run, whichever builder or runnable made the call:
+
+        tracker = TokenUsageTracker(budget=TokenBudget(20_000, fallback="generate"))
+        graph = WorkflowBuilder(config=MyLayout, state_schema=State, hooks=[tracker]).compile()
+        ...
+        tracker.last_run.by_node
+
+    Finished runs are passed to `on_run_end` and kept in `runs`, the last
+    `max_runs` of them keyed by run id; `usage(run_id)` also returns the usage
+    of runs in flight. Fallback routes of `budget` are added to every
+    conditional edge of the layout.
+    """
+
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        budget: TokenBudget | None = None,
+        on_run_end: Callable[[RunUsage], object] | None = None,
+        max_runs: int = 1000,
+    ):
+        super().__init__()
+        self.budget = budget
+        self.on_run_end = on_run_end
+        self.max_runs = max_runs
+        self.runs: OrderedDict[UUID, RunUsage] = OrderedDict()
+        self._active: dict[UUID, RunUsage] = {}
+        self._attributions: dict[UUID, _Attribution] = {}
+        self._fallback_taken: set[UUID] = set()
+        self._lock = threading.Lock()
+
+    @property
+    def last_run(self) -> RunUsage | None:
+        """Return the usage of the most recently finished run."""
+        with self._lock:
+            return next(reversed(self.runs.values()), None)
+
+    def usage(self, run_id: UUID) -> RunUsage | None:
+        """Return the usage of a run in flight or among the last finished runs."""
+        with self._lock:
+            return self._active.get(run_id) or self.runs.get(run_id)
+
+    def on_start(self, event: ExecutionEvent) -> None:
+        with self._lock:
+            if event.kind == "graph":
+                self._active[event.run_id] = RunUsage(run_id=event.run_id, layout=self.layout_name)
+                self._attributions[event.run_id] = _Attribution(None, None)
+                return
+
+            parent = self._attributions.get(event.parent_run_id) if event.parent_run_id else None
+            if parent is None:
+                return
+            if event.kind == "node":
+                attribution = _Attribution("node", event.node)
+            elif event.kind == "router":
+                attribution = _Attribution("edge", event.node)
+            elif event.kind == "builder":
+                attribution = _Attribution(parent.component, parent.node, event.name)
+            else:
+                attribution = parent
+            self._attributions[event.run_id] = attribution
+
+    def on_end(self, event: ExecutionEvent, output: Any) -> None:
+        if event.kind == "model":
+            usage = token_usage(output)
+            if usage:
+                self._add(event, TokenUsage(**usage))
+        self._finish(event)
+
+    def on_error(self, event: ExecutionEvent, error: BaseException) -> None:
+        self._finish(event)
+
+    def _add(self, event: ExecutionEvent, usage: TokenUsage) -> None:
+        exceeded: RunUsage | None = None
+        with self._lock:
+            run = self._active.get(event.root_run_id)
+            attribution = self._attributions.get(event.run_id)
+            if run is None or attribution is None:
+                return
+            run.total += usage
+            run.model_calls += 1
+            if attribution.component is not None and attribution.node is not None:
+                breakdown = run.by_node if attribution.component == "node" else run.by_edge
+                breakdown[attribution.node] = breakdown.get(attribution.node, TokenUsage()) + usage
+            if attribution.builder is not None:
+                run.by_builder[attribution.builder] = run.by_builder.get(attribution.builder, TokenUsage()) + usage
+            if (
+                self.budget is not None
+                and not run.budget_exceeded
+                and getattr(run.total, self.budget.metric) > self.budget.max_tokens
+            ):
+                run.budget_exceeded = True
+                exceeded = run
+
+        if exceeded is not None and self.budget is not None:
+            self.logger.warning(
+                "Run %s exceeded its budget of %s %s",
+                exceeded.run_id,
+                self.budget.max_tokens,
+                self.budget.metric,
+            )
+            if self.budget.on_exceeded is not None:
+                self.budget.on_exceeded(exceeded)
+
+    def _finish(self, event: ExecutionEvent) -> None:
+        with self._lock:
+            self._attributions.pop(event.run_id, None)
+            if event.kind != "graph":
+                return
+            run = self._active.pop(event.run_id, None)
+            self._fallback_taken.discard(event.run_id)
+            if run is None:
+                return
+            self.runs[event.run_id] = run
+            while len(self.runs) > self.max_runs:
+                self.runs.popitem(last=False)
+        if self.on_run_end is not None:
+            self.on_run_end(run)
+
+    def wrap_router(
+        self,
+        node_source: str,
+        router: Callable[[Any], Any],
+        path_map: dict[Hashable, Any],
+    ) -> tuple[Callable[[Any], Any], dict[Hashable, Any]]:
+        if self.budget is None:
+            return router, path_map
+
+        if self.budget.fallback is not None:
+            path_map = {**path_map, TOKEN_BUDGET_ROUTE: self.budget.fallback, TOKEN_BUDGET_END_ROUTE: END}
+
+        if inspect.iscoroutinefunction(router):
+
+            async def guard_async(state: Any) -> Any:
+                route = self._budget_route(node_source)
+                return route if route is not None else await router(state)
+
+            return guard_async, path_map
+
+        def guard_sync(state: Any) -> Any:
+            route = self._budget_route(node_source)
+            return route if route is not None else router(state)
+
+        return guard_sync, path_map
+
+    def _budget_route(self, node_source: str) -> str | None:
+        """Return the route forced by the budget for the current run, if any."""
+        scope = current_run_scope()
+        if scope is None or scope.run_id is None or self.budget is None:
+            return None
+        with self._lock:
+            run = self._active.get(scope.run_id)
+            if run is None or not run.budget_exceeded:
+                return None
+            if self.budget.fallback is None:
+                raise TokenBudgetExceeded(run, self.budget)
+            if scope.run_id in self._fallback_taken:
+                return TOKEN_BUDGET_END_ROUTE
+            self._fallback_taken.add(scope.run_id)
+
+        self.logger.info("Token budget spent; leaving '%s' for '%s'", node_source, self.budget.fallback)
+        return TOKEN_BUDGET_ROUTE
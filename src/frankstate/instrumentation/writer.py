@@ -0,0 +1,77 @@
+import atexit
+import logging
+import queue
+import threading
+import weakref
+from collections.abc import Callable
+
+# Writers with a running thread, drained at interpreter exit.
+_writers: "weakref.WeakSet[BackgroundWriter]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_writers() -> None:
+    for writer in list(_writers):
+        writer.close()
+
+
+class BackgroundWriter:
+    """Run the file writes of a hook on a thread of their own, in submission order.
+
+    Hooks run inline on the event loop of the instrumented graph, so
+    instruments that persist what they measure hand the writes to this
+    writer instead of blocking the loop:
+
+        self._writer = BackgroundWriter("frankstate-run-recorder")
+        self._writer.submit(lambda: path.write_text(payload))
+
+    The thread starts on the first write. `flush()` waits until the writes
+    submitted so far are done; `close()`, also called at interpreter exit,
+    drains and stops the thread, and a later write starts a new one.
+    A failing write is logged and does not stop the others.
+    """
+
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    def __init__(self, name: str):
+        self.name = name
+        self._queue: queue.Queue[Callable[[], object] | None] = queue.Queue()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def submit(self, write: Callable[[], object]) -> None:
+        """Queue `write` to run on the writer thread."""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, args=(self._queue,), name=self.name, daemon=True)
+                self._thread.start()
+                _writers.add(self)
+            self._queue.put(write)
+
+    def _run(self, pending: "queue.Queue[Callable[[], object] | None]") -> None:
+        """Run queued writes until the `None` sentinel queued by `close()`."""
+        while True:
+            write = pending.get()
+            try:
+                if write is None:
+                    return
+                write()
+            except Exception:
+                self.logger.exception("Background write of %s failed", self.name)
+            finally:
+                pending.task_done()
+
+    def flush(self) -> None:
+        """Block until the writes submitted so far are done."""
+        with self._lock:
+            pending = self._queue
+        pending.join()
+
+    def close(self) -> None:
+        """Run the pending writes and stop the writer thread."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+            pending, self._queue = self._queue, queue.Queue()
+        if thread is not None:
+            pending.put(None)
+            thread.join()
@@ -3,6 +3,16 @@ from collections.abc import Hashable, Iterable
 from typing import Any, Literal
 
 from frankstate.entity.edge import ConditionalEdge, SimpleEdge
+from frankstate.runtime.loop_budget import build_budgeted_router
+
+
+def _route_to(target: str) -> Any:
+    """Return a router that always follows `target`, for `SimpleEdge`s routed at runtime."""
+
+    def route_static(state: Any) -> str:
+        return target
+
+    return route_static
 
 
 class EdgeManager:
@@ -14,6 +24,11 @@ class EdgeManager:
 
     Edge registration intentionally mirrors the declared layout order and does
     not silently deduplicate repeated entries.
+
+    Edges declaring a loop budget (`max_traversals` / `exit_to`) are exposed as
+    conditional edges whose router enforces the budget, including budgeted
+    `SimpleEdge`s. Degradable `SimpleEdge`s are exposed as conditional edges
+    too, so a `DegradationPolicy` can redirect them.
     """
 
     logger: logging.Logger = logging.getLogger(__name__)
@@ -56,13 +71,110 @@ class EdgeManager:
         else:
             raise TypeError(f"Each edge must be a SimpleEdge or ConditionalEdge, expected {type(filter_type)}")
 
+    def get_outgoing_edges(self, node_name: str) -> tuple[SimpleEdge | ConditionalEdge, ...]:
+        """
+        Return edges whose `node_source` is `node_name`, preserving declaration order.
+        """
+        return tuple(edge for edge in self.edges if edge.node_source == node_name)
+
+    def get_incoming_edges(self, node_name: str) -> tuple[SimpleEdge | ConditionalEdge, ...]:
+        """
+        Return static edges targeting `node_name`, conditional edges that may route to it
+        and budgeted or degradable edges exiting to it.
+        """
+        return tuple(
+            edge
+            for edge in self.edges
+            if (isinstance(edge, SimpleEdge) and edge.node_path == node_name)
+            or (isinstance(edge, ConditionalEdge) and node_name in edge.map_dict.values())
+            or edge.exit_to == node_name
+            or edge.degrade_to == node_name
+        )
+
+    def get_budgeted_edges(self) -> tuple[SimpleEdge | ConditionalEdge, ...]:
+        """
+        Return edges declaring a loop budget, preserving declaration order.
+        """
+        return tuple(edge for edge in self.edges if edge.has_budget)
+
+    def get_degradable_edges(self) -> tuple[SimpleEdge | ConditionalEdge, ...]:
+        """
+        Return edges declaring a degraded route, preserving declaration order.
+        """
+        return tuple(edge for edge in self.edges if edge.is_degradable)
+
+    def find_unbounded_cycles(self) -> list[tuple[str, ...]]:
+        """
+        Return the node groups forming cycles that no budgeted edge can leave.
+
+        Each group is a strongly connected component of the edge topology
+        (static targets, conditional routes, budget exits and degraded routes).
+        A component is bounded when at least one edge inside it declares a loop
+        budget. `Command` routing is not visible to the edge manager and is
+        ignored.
+        """
+        graph: dict[str, set[str]] = {}
+        for edge in self.edges:
+            targets = {edge.node_path} if isinstance(edge, SimpleEdge) else set(edge.map_dict.values())
+            targets.update(target for target in (edge.exit_to, edge.degrade_to) if target is not None)
+            graph.setdefault(edge.node_source, set()).update(targets)
+
+        unbounded = []
+        for component in self._strongly_connected_components(graph):
+            members = set(component)
+            is_cycle = len(component) > 1 or component[0] in graph.get(component[0], set())
+            is_bounded = any(
+                edge.has_budget and edge.node_source in members for edge in self.edges
+            )
+            if is_cycle and not is_bounded:
+                unbounded.append(component)
+        return unbounded
+
+    @staticmethod
+    def _strongly_connected_components(graph: dict[str, set[str]]) -> list[tuple[str, ...]]:
+        """Return Tarjan's strongly connected components in discovery order."""
+        index: dict[str, int] = {}
+        lowlink: dict[str, int] = {}
+        stack: list[str] = []
+        on_stack: set[str] = set()
+        components: list[tuple[str, ...]] = []
+
+        def visit(name: str) -> None:
+            index[name] = lowlink[name] = len(index)
+            stack.append(name)
+            on_stack.add(name)
+            for target in sorted(graph.get(name, ())):
+                if target not in index:
+                    visit(target)
+                    lowlink[name] = min(lowlink[name], lowlink[target])
+                elif target in on_stack:
+                    lowlink[name] = min(lowlink[name], index[target])
+
+            if lowlink[name] == index[name]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == name:
+                        break
+                components.append(tuple(sorted(component)))
+
+        for name in sorted(graph):
+            if name not in index:
+                visit(name)
+        return components
+
     def configs_edges(self) -> tuple[tuple[str, str], ...]:
         """
         Return ordered tuples of `(node_source, node_path)` for `StateGraph.add_edge()`.
+
+        Budgeted and degradable `SimpleEdge`s are excluded; they are routed by
+        `configs_conditional_edges()`.
         """
         return tuple(
             (edge.node_source, edge.node_path)
-            for edge in self.edges if isinstance(edge, SimpleEdge)
+            for edge in self.edges if isinstance(edge, SimpleEdge) and not edge.is_routed
         )
     
     def configs_conditional_edges(
@@ -71,9 +183,17 @@ class EdgeManager:
         """
         Return ordered tuples for `StateGraph.add_conditional_edges()`.
 
-        The evaluator callable may be synchronous or asynchronous.
+        The evaluator callable may be synchronous or asynchronous. Budgeted
+        edges are returned with a router that enforces their loop budget, and
+        degradable `SimpleEdge`s with a router to their `node_path`.
         """
-        return tuple(
-            (edge.node_source, edge.evaluator.evaluate, edge.map_dict)
-            for edge in self.edges if isinstance(edge, ConditionalEdge)
-        )
+        configs: list[tuple[str, Any, dict[Hashable, str | Literal["START", "END"]]]] = []
+        for edge in self.edges:
+            if edge.has_budget:
+                router, path_map = build_budgeted_router(edge)
+                configs.append((edge.node_source, router, path_map))
+            elif isinstance(edge, ConditionalEdge):
+                configs.append((edge.node_source, edge.evaluator.evaluate, edge.map_dict))
+            elif edge.is_degradable:
+                configs.append((edge.node_source, _route_to(edge.node_path), {edge.node_path: edge.node_path}))
+        return tuple(configs)
@@ -35,15 +35,20 @@ class NodeManager:
         return list(nodes)
 
     def _get_node_value(self, node: SimpleNode | CommandNode | ToolNode) -> Any:
-        """Resolve a node wrapper to the callable or ToolNode added to the graph."""
+        """Resolve a node wrapper to the callable or ToolNode added to the graph.
+
+        Callables of nodes with a `retry` policy are wrapped with
+        `NodeRetry.wrap()`, which charges the policy's budget.
+        """
         if isinstance(node, ToolNode):
             return node
         elif isinstance(node, SimpleNode):
-            return node.enhancer.enhance
+            value = node.offload.wrap(node) if node.offload is not None else node.enhancer.enhance
         elif isinstance(node, CommandNode):
-            return node.commander.command
+            value = node.commander.command
         else:
             raise TypeError(f"Unexpected node type: {type(node)}")
+        return node.retry.wrap(value, node.name) if node.retry is not None else value
 
     def _get_node_tags(self, node: SimpleNode | CommandNode | ToolNode) -> list[str] | None:
         """Return node tags for wrappers or native ToolNode instances.
@@ -64,6 +69,9 @@ class NodeManager:
 
         For `CommandNode`, `destinations` is sourced from the commander and wins
         over passthrough kwargs to avoid drifting from the runtime routing contract.
+
+        A node `retry` policy becomes `retry_policy`; declaring one in `kwargs`
+        as well is rejected rather than silently overridden.
         """
         kwargs = dict(node.kwargs) if isinstance(node, BaseNode) and node.kwargs else {}
         metadata = kwargs.pop("metadata", None)
@@ -90,6 +98,11 @@ class NodeManager:
                 )
             kwargs["destinations"] = node_destinations
 
+        if isinstance(node, BaseNode) and node.retry is not None:
+            if "retry_policy" in kwargs:
+                raise ValueError(f"Node '{node.name}' defines a retry policy both in `retry` and kwargs")
+            kwargs["retry_policy"] = node.retry.to_retry_policy(node.name)
+
         return kwargs
 
     def add_nodes(
@@ -129,7 +142,8 @@ class NodeManager:
         without requiring a new `frankstate` config class for every upstream change.
 
         The returned callable may be synchronous or asynchronous. LangGraph
-        accepts both forms for node execution.
+        accepts both forms for node execution. Offloaded `SimpleNode`s resolve
+        to the async callable submitting them to their process pool.
         """
         return tuple(
             (
@@ -0,0 +1,8 @@
+"""Optional compile-time passes applied by `WorkflowBuilder`.
+
+Passes rewrite the topology collected by the managers before it is registered
+in LangGraph. Import concrete passes from their modules instead of this package:
+
+- ``frankstate.optimizers.parallel_scheduler``
+- ``frankstate.optimizers.chain_fusion``
+"""
@@ -0,0 +1,339 @@
+import asyncio
+import inspect
+import logging
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from langchain_core.messages import AnyMessage
+from langgraph.channels import BinaryOperatorAggregate
+from langgraph.channels.base import BaseChannel
+from langgraph.config import get_stream_writer
+from langgraph.prebuilt import ToolNode
+from langgraph.types import Command
+from pydantic import BaseModel
+
+from frankstate.entity.edge import ConditionalEdge, SimpleEdge
+from frankstate.entity.node import CommandNode, SimpleNode
+from frankstate.entity.statehandler import StateEnhancer
+from frankstate.managers.edge_manager import EdgeManager
+from frankstate.managers.node_manager import NodeManager
+from frankstate.optimizers.chains import find_linear_chains, get_command_targets
+
+FUSED_NAME_SEPARATOR = "+"
+
+
+class FusedChainEnhancer(StateEnhancer):
+    """Run the enhancers of a fused chain in order inside one node.
+
+    Each inner enhancer observes the state produced by its predecessors: the
+    updates are folded into a local copy of the node input using the graph
+    channels, so reducer keys such as `messages` accumulate exactly as they
+    would across supersteps.
+
+    The node returns one `Command` per inner update for reducer keys and a
+    final `Command` carrying the last value of every plain key. LangGraph then
+    applies the writes in order within a single superstep. Plain keys are only
+    written once because `LastValue` channels reject several writes per step.
+
+    When `preserve_node_events` is `True`, every inner update is also emitted
+    as a custom stream event `{inner_node_name: update}`, visible with
+    `stream_mode="custom"`.
+    """
+
+    def __init__(
+        self,
+        nodes: Iterable[SimpleNode],
+        channels: Mapping[str, BaseChannel],
+        preserve_node_events: bool = False,
+    ):
+        super().__init__()
+        self.nodes: tuple[SimpleNode, ...] = tuple(nodes)
+        self.channels = channels
+        self.preserve_node_events = preserve_node_events
+
+    def enhance(self, state: list[AnyMessage] | dict[str, Any] | BaseModel) -> Any:
+        local = self._local_state(state)
+        updates: list[dict[str, Any]] = []
+        for node in self.nodes:
+            update = node.enhancer.enhance(dict(local))
+            self._apply(local, updates, node, update)
+        return self._to_commands(local, updates)
+
+    @staticmethod
+    def _local_state(state: list[AnyMessage] | dict[str, Any] | BaseModel) -> dict[str, Any]:
+        if not isinstance(state, dict):
+            raise TypeError(f"Fused chains require a TypedDict state, got {type(state).__name__}")
+        return dict(state)
+
+    def _apply(
+        self,
+        local: dict[str, Any],
+        updates: list[dict[str, Any]],
+        node: SimpleNode,
+        update: Any,
+    ) -> None:
+        """Fold one inner update into the local state and keep it for the writes."""
+        if update is None:
+            return
+        if not isinstance(update, dict):
+            raise TypeError(
+                f"Node '{node.name}' returned {type(update).__name__}; fused chains only support dict updates"
+            )
+
+        for key, value in update.items():
+            channel = self.channels.get(key)
+            if isinstance(channel, BinaryOperatorAggregate):
+                current = channel.from_checkpoint(local[key]) if key in local else channel.copy()
+                current.update([value])
+                local[key] = current.get()
+            else:
+                local[key] = value
+
+        if self.preserve_node_events:
+            get_stream_writer()({node.name: update})
+        updates.append(update)
+
+    def _to_commands(self, local: dict[str, Any], updates: list[dict[str, Any]]) -> list[Command] | None:
+        """Translate inner updates into ordered writes for the fused node."""
+        commands: list[Command] = []
+        last_values: dict[str, Any] = {}
+
+        for update in updates:
+            aggregated = {
+                key: value
+                for key, value in update.items()
+                if isinstance(self.channels.get(key), BinaryOperatorAggregate)
+            }
+            if aggregated:
+                commands.append(Command(update=aggregated))
+            last_values.update({key: local[key] for key in update if key not in aggregated})
+
+        if last_values:
+            commands.append(Command(update=last_values))
+        return commands or None
+
+
+class AsyncFusedChainEnhancer(FusedChainEnhancer):
+    """Asynchronous variant used when at least one inner enhancer is a coroutine.
+
+    Synchronous inner enhancers run in a worker thread, as LangGraph does for
+    synchronous nodes, so they do not block the event loop.
+    """
+
+    async def enhance(self, state: list[AnyMessage] | dict[str, Any] | BaseModel) -> Any:
+        local = self._local_state(state)
+        updates: list[dict[str, Any]] = []
+        for node in self.nodes:
+            if inspect.iscoroutinefunction(node.enhancer.enhance):
+                update = await node.enhancer.enhance(dict(local))
+            else:
+                update = await asyncio.to_thread(node.enhancer.enhance, dict(local))
+            self._apply(local, updates, node, update)
+        return self._to_commands(local, updates)
+
+
+@dataclass(frozen=True)
+class FusedChain:
+    """One fused node and the layout nodes it replaces, in execution order."""
+
+    name: str
+    nodes: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class ChainFusionReport:
+    """Result of `ChainFusion.plan()`.
+
+    Attributes:
+        chains: Chains replaced by a single fused node.
+        nodes: Node definitions to register instead of the layout nodes.
+        edges: Edge definitions to register instead of the layout edges.
+    """
+
+    chains: tuple[FusedChain, ...]
+    nodes: tuple[SimpleNode | CommandNode | ToolNode, ...]
+    edges: tuple[SimpleEdge | ConditionalEdge, ...]
+
+    @property
+    def fused_nodes(self) -> tuple[str, ...]:
+        """Return the layout node names absorbed by a fused node."""
+        return tuple(name for chain in self.chains for name in chain.nodes)
+
+    def summary(self) -> str:
+        """Return a human readable explanation of the fusion."""
+        if not self.chains:
+            return "No fusible chains of SimpleNodes were found; nothing to fuse."
+
+        lines = [f"{len(self.chains)} chain(s) fused."]
+        lines.extend(f"  {chain.name}: {' -> '.join(chain.nodes)}" for chain in self.chains)
+        return "\n".join(lines)
+
+
+class ChainFusion:
+    """Fuse linear chains of `SimpleNode`s into one node per chain.
+
+    Every link of a chain is a `SimpleEdge` that is the only way out of its
+    source and the only way into its target, so running the chain inside one
+    superstep keeps the same final state while saving the scheduling,
+    channel-update and checkpoint overhead of the intermediate steps.
+
+    A node is never fused when:
+
+    - it is listed in `exclude`, e.g. because it calls `interrupt()` and a
+      resume must not replay its predecessors
+    - it is a `Command` destination, so `goto` targets keep resolving
+    - it forwards `add_node()` kwargs other than `metadata`, or declares a
+      `retry` policy (retry or cache policies would otherwise apply to the
+      whole chain)
+    - it is offloaded to a process pool or to remote workers
+
+    Conditional edges leaving the chain tail and edges entering the chain head
+    are rewired to the fused node, named after its members joined by `+`.
+    """
+
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        node_manager: NodeManager,
+        edge_manager: EdgeManager,
+        channels: Mapping[str, BaseChannel],
+        preserve_node_events: bool = False,
+        exclude: Iterable[str] | None = None,
+    ):
+        self.node_manager = node_manager
+        self.edge_manager = edge_manager
+        self.channels = channels
+        self.preserve_node_events = preserve_node_events
+        self.exclude = frozenset(exclude or ())
+
+    def plan(self) -> ChainFusionReport:
+        """Compute the fused nodes and the rewired node and edge definitions."""
+        command_targets = get_command_targets(self.node_manager)
+        chains = find_linear_chains(
+            self.node_manager,
+            self.edge_manager,
+            accept=lambda node: self._is_fusible(node, command_targets),
+        )
+
+        nodes: list[SimpleNode | CommandNode | ToolNode] = list(self.node_manager.get_nodes())
+        edges: list[SimpleEdge | ConditionalEdge] = list(self.edge_manager.get_edges())
+        fused: list[FusedChain] = []
+
+        for chain in chains:
+            fused_node = self._fuse(chain)
+            nodes = self._replace_nodes(nodes, chain, fused_node)
+            edges = self._rewire_edges(edges, chain, fused_node.name)
+            fused.append(FusedChain(name=fused_node.name, nodes=chain))
+
+        self.logger.info("ChainFusion fused %s chain(s)", len(fused))
+        return ChainFusionReport(chains=tuple(fused), nodes=tuple(nodes), edges=tuple(edges))
+
+    def _is_fusible(self, node: SimpleNode, command_targets: set[str]) -> bool:
+        if node.name in self.exclude or node.name in command_targets:
+            return False
+        if node.offload is not None or node.retry is not None:
+            return False
+        return not node.kwargs or set(node.kwargs) <= {"metadata"}
+
+    def _fuse(self, chain: tuple[str, ...]) -> SimpleNode:
+        """Build the `SimpleNode` that replaces `chain`."""
+        members = [self.node_manager.nodes[name] for name in chain]
+        inner_nodes = [member for member in members if isinstance(member, SimpleNode)]
+        name = FUSED_NAME_SEPARATOR.join(chain)
+        if name in self.node_manager.nodes:
+            raise ValueError(f"Fused node name '{name}' collides with a registered node")
+
+        is_async = any(inspect.iscoroutinefunction(node.enhancer.enhance) for node in inner_nodes)
+        enhancer_cls = AsyncFusedChainEnhancer if is_async else FusedChainEnhancer
+        enhancer = enhancer_cls(
+            inner_nodes,
+            channels=self.channels,
+            preserve_node_events=self.preserve_node_events,
+        )
+
+        tags: list[str] = []
+        metadata: dict[str, Any] = {}
+        for node in inner_nodes:
+            tags.extend(tag for tag in node.tags or [] if tag not in tags)
+            metadata.update((node.kwargs or {}).get("metadata") or {})
+        metadata["fused_nodes"] = list(chain)
+
+        reads, writes = self._merge_declarations(inner_nodes)
+        return SimpleNode(
+            enhancer=enhancer,
+            name=name,
+            tags=tags or None,
+            kwargs={"metadata": metadata},
+            reads=reads,
+            writes=writes,
+        )
+
+    @staticmethod
+    def _merge_declarations(nodes: list[SimpleNode]) -> tuple[list[str] | None, list[str] | None]:
+        """Return the external reads and all writes of a chain, or `None` if unknown."""
+        if any(node.reads is None or node.writes is None for node in nodes):
+            return None, None
+
+        reads: list[str] = []
+        writes: list[str] = []
+        for node in nodes:
+            reads.extend(key for key in node.reads or [] if key not in writes and key not in reads)
+            writes.extend(key for key in node.writes or [] if key not in writes)
+        return reads, writes
+
+    @staticmethod
+    def _replace_nodes(
+        nodes: list[SimpleNode | CommandNode | ToolNode],
+        chain: tuple[str, ...],
+        fused_node: SimpleNode,
+    ) -> list[SimpleNode | CommandNode | ToolNode]:
+        """Put the fused node where the chain head was declared and drop the members."""
+        return [
+            fused_node if node.name == chain[0] else node
+            for node in nodes
+            if node.name == chain[0] or node.name not in chain
+        ]
+
+    @staticmethod
+    def _rewire_edges(
+        edges: list[SimpleEdge | ConditionalEdge],
+        chain: tuple[str, ...],
+        fused_name: str,
+    ) -> list[SimpleEdge | ConditionalEdge]:
+        """Drop the chain links and point the head inputs and tail outputs at the fused node.
+
+        Loop budgets and degraded routes are carried over, including `exit_to`
+        and `degrade_to` targets naming the head.
+        """
+        head, tail = chain[0], chain[-1]
+        links = set(zip(chain, chain[1:], strict=False))
+
+        def rename(name: Any, old: str) -> Any:
+            return fused_name if name == old else name
+
+        rewired: list[SimpleEdge | ConditionalEdge] = []
+        for edge in edges:
+            if isinstance(edge, SimpleEdge):
+                if (edge.node_source, edge.node_path) in links:
+                    continue
+                if edge.node_source == tail or head in (edge.node_path, edge.exit_to, edge.degrade_to):
+                    edge = SimpleEdge(
+                        node_source=rename(edge.node_source, tail),
+                        node_path=rename(edge.node_path, head),
+                        max_traversals=edge.max_traversals,
+                        exit_to=rename(edge.exit_to, head),
+                        degrade_to=rename(edge.degrade_to, head),
+                    )
+            elif edge.node_source == tail or head in (*edge.map_dict.values(), edge.exit_to, edge.degrade_to):
+                edge = ConditionalEdge(
+                    node_source=rename(edge.node_source, tail),
+                    map_dict={key: rename(path, head) for key, path in edge.map_dict.items()},
+                    evaluator=edge.evaluator,
+                    max_traversals=edge.max_traversals,
+                    exit_to=rename(edge.exit_to, head),
+                    degrade_to=rename(edge.degrade_to, head),
+                )
+            rewired.append(edge)
+        return rewired
@@ -0,0 +1,75 @@
+from collections.abc import Callable
+
+from frankstate.entity.edge import SimpleEdge
+from frankstate.entity.node import CommandNode, SimpleNode
+from frankstate.managers.edge_manager import EdgeManager
+from frankstate.managers.node_manager import NodeManager
+
+
+def get_command_targets(node_manager: NodeManager) -> set[str]:
+    """Return every node name reachable through a `CommandNode` destination."""
+    return {
+        destination
+        for node in node_manager.get_nodes()
+        if isinstance(node, CommandNode)
+        for destination in node.destinations
+    }
+
+
+def get_static_successor(edge_manager: EdgeManager, node_name: str) -> str | None:
+    """Return the only static successor of a node, if it has exactly one unrouted way out."""
+    outgoing = edge_manager.get_outgoing_edges(node_name)
+    if len(outgoing) == 1 and isinstance(outgoing[0], SimpleEdge) and not outgoing[0].is_routed:
+        return outgoing[0].node_path
+    return None
+
+
+def find_linear_chains(
+    node_manager: NodeManager,
+    edge_manager: EdgeManager,
+    accept: Callable[[SimpleNode], bool] | None = None,
+) -> list[tuple[str, ...]]:
+    """Return maximal linear chains of at least two `SimpleNode`s.
+
+    A link `source -> target` belongs to a chain when both nodes are accepted
+    `SimpleNode`s, the `SimpleEdge` between them is the only way out of
+    `source` and the only way into `target`, and `target` is not a `Command`
+    destination. Chains are returned in layout declaration order.
+    """
+    simple_nodes = {
+        node.name: node
+        for node in node_manager.get_nodes()
+        if isinstance(node, SimpleNode) and (accept is None or accept(node))
+    }
+    command_targets = get_command_targets(node_manager)
+
+    def is_link(source: str, target: str) -> bool:
+        if source not in simple_nodes or target not in simple_nodes or target in command_targets:
+            return False
+        if get_static_successor(edge_manager, source) != target:
+            return False
+        return len(edge_manager.get_incoming_edges(target)) == 1
+
+    def has_chain_predecessor(name: str) -> bool:
+        incoming = edge_manager.get_incoming_edges(name)
+        return (
+            len(incoming) == 1
+            and isinstance(incoming[0], SimpleEdge)
+            and is_link(incoming[0].node_source, name)
+        )
+
+    chains: list[tuple[str, ...]] = []
+    for name in simple_nodes:
+        if has_chain_predecessor(name):
+            continue
+
+        chain = [name]
+        successor = get_static_successor(edge_manager, name)
+        while successor is not None and successor not in chain and is_link(chain[-1], successor):
+            chain.append(successor)
+            successor = get_static_successor(edge_manager, successor)
+
+        if len(chain) > 1:
+            chains.append(tuple(chain))
+
+    return chains
@@ -0,0 +1,238 @@
+import logging
+from dataclasses import dataclass
+
+from frankstate.entity.edge import ConditionalEdge, SimpleEdge
+from frankstate.entity.node import SimpleNode
+from frankstate.managers.edge_manager import EdgeManager
+from frankstate.managers.node_manager import NodeManager
+from frankstate.optimizers.chains import (
+    find_linear_chains,
+    get_command_targets,
+    get_static_successor,
+)
+
+# `StateGraph.add_edge()` accepts a single source or a list of sources. The
+# tuple form is used here so the plan stays hashable and is converted back to a
+# list by `WorkflowBuilder` when it registers waiting edges.
+EdgeConfig = tuple[str | tuple[str, ...], str]
+
+
+@dataclass(frozen=True)
+class NodeScheduleDecision:
+    """Scheduling outcome for one `SimpleNode` found in a linear chain."""
+
+    node: str
+    stage: tuple[str, ...]
+    reason: str
+
+    @property
+    def parallelized(self) -> bool:
+        return len(self.stage) > 1
+
+
+@dataclass(frozen=True)
+class ParallelizationReport:
+    """Result of `ParallelScheduler.plan()`.
+
+    Attributes:
+        stages: Groups of nodes that now run in the same superstep.
+        decisions: One entry per chained `SimpleNode` explaining its stage.
+        edges: Static edge configuration that replaces
+            `EdgeManager.configs_edges()` when the plan is applied.
+    """
+
+    stages: tuple[tuple[str, ...], ...]
+    decisions: tuple[NodeScheduleDecision, ...]
+    edges: tuple[EdgeConfig, ...]
+
+    @property
+    def parallelized_nodes(self) -> tuple[str, ...]:
+        """Return node names scheduled alongside at least one other node."""
+        return tuple(node for stage in self.stages for node in stage)
+
+    def summary(self) -> str:
+        """Return a human readable explanation of the plan."""
+        if not self.decisions:
+            return "No linear chains of SimpleNodes were found; nothing to parallelize."
+
+        lines = [f"{len(self.stages)} parallel stage(s) scheduled."]
+        for decision in self.decisions:
+            marker = "||" if decision.parallelized else "->"
+            lines.append(f"  {marker} {decision.node}: {decision.reason}")
+        return "\n".join(lines)
+
+
+class ParallelScheduler:
+    """Schedule independent chained nodes in the same LangGraph superstep.
+
+    The scheduler only looks at linear chains: `SimpleNode`s connected one to
+    one by `SimpleEdge`s, where each link is the only way out of its source and
+    the only way into its target. Inside a chain, a node joins the stage of its
+    predecessors when all of them declare `reads`/`writes` and:
+
+    - it does not read a key written by the current stage (read-after-write)
+    - it does not write a key written by the current stage (write-after-write)
+
+    Write-after-read is safe because every node in a superstep observes the
+    same state snapshot. The stage is then fanned out from the chain
+    predecessor and joined with a LangGraph waiting edge before its successor.
+
+    Nodes reached through conditional routing or `Command`, nodes that route
+    through conditional edges and nodes without declarations always keep their
+    sequential position.
+    """
+
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    def __init__(self, node_manager: NodeManager, edge_manager: EdgeManager):
+        self.node_manager = node_manager
+        self.edge_manager = edge_manager
+
+    def plan(self) -> ParallelizationReport:
+        """Compute stages for every chain and the rewired static edge list."""
+        edges: list[EdgeConfig] = list(self.edge_manager.configs_edges())
+        stages: list[tuple[str, ...]] = []
+        decisions: list[NodeScheduleDecision] = []
+
+        for chain in self._find_chains():
+            chain_stages, chain_decisions = self._plan_chain(chain)
+            decisions.extend(chain_decisions)
+            if any(len(stage) > 1 for stage in chain_stages):
+                edges = self._rewire_chain(edges, chain, chain_stages)
+                stages.extend(stage for stage in chain_stages if len(stage) > 1)
+
+        report = ParallelizationReport(
+            stages=tuple(stages),
+            decisions=tuple(decisions),
+            edges=tuple(edges),
+        )
+        self.logger.info("ParallelScheduler planned %s parallel stage(s)", len(stages))
+        return report
+
+    def _simple_nodes(self) -> dict[str, SimpleNode]:
+        return {
+            node.name: node
+            for node in self.node_manager.get_nodes()
+            if isinstance(node, SimpleNode)
+        }
+
+    def _static_successor(self, node_name: str) -> str | None:
+        return get_static_successor(self.edge_manager, node_name)
+
+    def _find_chains(self) -> list[tuple[str, ...]]:
+        return find_linear_chains(self.node_manager, self.edge_manager)
+
+    def _head_trigger_reason(self, head: str) -> str | None:
+        """Explain why the chain head's triggers cannot be duplicated, if so."""
+        if head in get_command_targets(self.node_manager):
+            return f"'{head}' is a Command destination, so its trigger cannot be fanned out"
+
+        incoming = self.edge_manager.get_incoming_edges(head)
+        if not incoming:
+            return f"'{head}' has no incoming edge to fan out from"
+        if any(isinstance(edge, ConditionalEdge) or edge.is_routed for edge in incoming):
+            return f"'{head}' is reached through a conditional edge, so its trigger cannot be fanned out"
+        return None
+
+    def _plan_chain(
+        self,
+        chain: tuple[str, ...],
+    ) -> tuple[list[tuple[str, ...]], list[NodeScheduleDecision]]:
+        simple_nodes = self._simple_nodes()
+        head_reason = self._head_trigger_reason(chain[0])
+
+        stages: list[list[str]] = [[chain[0]]]
+        reasons: dict[str, str] = {chain[0]: "starts the chain"}
+
+        for position, name in enumerate(chain[1:], start=1):
+            is_tail = position == len(chain) - 1
+            conflict = self._find_conflict(
+                stage=stages[-1],
+                candidate=name,
+                simple_nodes=simple_nodes,
+                head_reason=head_reason if len(stages) == 1 else None,
+                is_tail=is_tail,
+            )
+            if conflict is None:
+                reasons[name] = f"runs alongside {', '.join(repr(n) for n in stages[-1])}: no read/write conflict"
+                stages[-1].append(name)
+            else:
+                reasons[name] = conflict
+                stages.append([name])
+
+        frozen_stages = [tuple(stage) for stage in stages]
+        stage_by_node = {name: stage for stage in frozen_stages for name in stage}
+        decisions = [
+            NodeScheduleDecision(node=name, stage=stage_by_node[name], reason=reasons[name])
+            for name in chain
+        ]
+        return frozen_stages, decisions
+
+    def _find_conflict(
+        self,
+        stage: list[str],
+        candidate: str,
+        simple_nodes: dict[str, SimpleNode],
+        head_reason: str | None,
+        is_tail: bool,
+    ) -> str | None:
+        """Return why `candidate` must wait for `stage`, or `None` when it may join it."""
+        node = simple_nodes[candidate]
+        if node.reads is None or node.writes is None:
+            return "does not declare reads/writes"
+
+        for member in stage:
+            member_node = simple_nodes[member]
+            if member_node.reads is None or member_node.writes is None:
+                return f"waits for '{member}', which does not declare reads/writes"
+
+        if head_reason is not None:
+            return head_reason
+
+        if is_tail and self._static_successor(candidate) is None:
+            return "routes through conditional edges, so it must observe the state of its predecessors"
+
+        for member in stage:
+            member_writes = set(simple_nodes[member].writes or [])
+            raw = sorted(set(node.reads) & member_writes)
+            if raw:
+                return f"reads {raw} written by '{member}'"
+            waw = sorted(set(node.writes) & member_writes)
+            if waw:
+                return f"writes {waw} also written by '{member}'"
+
+        return None
+
+    def _rewire_chain(
+        self,
+        edges: list[EdgeConfig],
+        chain: tuple[str, ...],
+        stages: list[tuple[str, ...]],
+    ) -> list[EdgeConfig]:
+        """Replace the sequential edges of a chain with fan-out and waiting edges."""
+        head, tail = chain[0], chain[-1]
+        links = set(zip(chain, chain[1:], strict=False))
+        tail_successor = self._static_successor(tail)
+        head_sources = [
+            edge.node_source
+            for edge in self.edge_manager.get_incoming_edges(head)
+            if isinstance(edge, SimpleEdge)
+        ]
+
+        added: list[EdgeConfig] = []
+        first_stage, last_stage = stages[0], stages[-1]
+
+        for source in head_sources:
+            added.extend((source, name) for name in first_stage[1:])
+
+        for current, following in zip(stages, stages[1:], strict=False):
+            source_key: str | tuple[str, ...] = current[0] if len(current) == 1 else current
+            added.extend((source_key, name) for name in following)
+
+        removed: set[EdgeConfig] = set(links)
+        if len(last_stage) > 1 and tail_successor is not None:
+            removed.add((tail, tail_successor))
+            added.append((last_stage, tail_successor))
+
+        self.logger.debug("Rewired chain %s into stages %s", chain, stages)
+        return [edge for edge in edges if edge not in removed] + added
@@ -0,0 +1,18 @@
+"""Optional execution runtimes and helpers for configured layouts.
+
+They change how a layout executes without changing its declaration. Import
+concrete runtimes from their modules instead of this package:
+
+- ``frankstate.runtime.batching``
+- ``frankstate.runtime.compiled_graph``
+- ``frankstate.runtime.dag_engine``
+- ``frankstate.runtime.degradation``
+- ``frankstate.runtime.loop_budget``
+- ``frankstate.runtime.loop_runner``
+- ``frankstate.runtime.offload``
+- ``frankstate.runtime.remote``
+- ``frankstate.runtime.retry``
+- ``frankstate.runtime.run_scope``
+- ``frankstate.runtime.shared_runtime``
+- ``frankstate.runtime.stream_hub``
+"""
@@ -0,0 +1,188 @@
+import asyncio
+import logging
+import weakref
+from collections.abc import Awaitable, Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from langchain_core.runnables import Runnable, RunnableConfig, ensure_config
+
+type BatchFn[Item, Result] = Callable[[list[Item]], Awaitable[Sequence[Result | BaseException]]]
+
+
+@dataclass
+class _LoopState[Item, Result]:
+    """Pending calls and timer owned by one event loop."""
+
+    pending: list[tuple[Item, asyncio.Future[Result]]] = field(default_factory=list)
+    timer: asyncio.TimerHandle | None = None
+    tasks: set[asyncio.Task[None]] = field(default_factory=set)
+
+
+class MicroBatcher[Item, Result]:
+    """Collect concurrent calls over a small window and dispatch them as one batch.
+
+    `submit()` parks the caller on a future. A batch is dispatched when
+    `max_batch_size` calls are pending or `max_latency` seconds after the first
+    pending call, whichever comes first. `batch_fn` receives the items in
+    arrival order and must return one result per item; a returned exception
+    instance fails only its own caller, while a raised exception fails the
+    whole batch.
+
+    State is kept per event loop, so one batcher can be shared by graphs
+    running under different loops (e.g. repeated `asyncio.run()` calls).
+    """
+
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        batch_fn: BatchFn[Item, Result],
+        max_batch_size: int = 16,
+        max_latency: float = 0.005,
+    ):
+        if max_batch_size < 1:
+            raise ValueError("`max_batch_size` must be at least 1")
+        if max_latency < 0:
+            raise ValueError("`max_latency` must be zero or positive")
+
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+        self.batches_dispatched = 0
+        self.items_dispatched = 0
+        self._states: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopState[Item, Result]] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    async def submit(self, item: Item) -> Result:
+        """Queue `item` for the next batch and wait for its result."""
+        loop = asyncio.get_running_loop()
+        state = self._states.setdefault(loop, _LoopState())
+        future: asyncio.Future[Result] = loop.create_future()
+        state.pending.append((item, future))
+
+        if len(state.pending) >= self.max_batch_size:
+            self._flush(loop, state)
+        elif state.timer is None:
+            state.timer = loop.call_later(self.max_latency, self._flush, loop, state)
+
+        return await future
+
+    def _flush(self, loop: asyncio.AbstractEventLoop, state: _LoopState[Item, Result]) -> None:
+        """Dispatch up to `max_batch_size` pending calls and re-arm the timer if needed."""
+        if state.timer is not None:
+            state.timer.cancel()
+            state.timer = None
+
+        batch = state.pending[: self.max_batch_size]
+        state.pending = state.pending[self.max_batch_size :]
+        if state.pending:
+            state.timer = loop.call_later(self.max_latency, self._flush, loop, state)
+        if not batch:
+            return
+
+        task = loop.create_task(self._dispatch(batch))
+        state.tasks.add(task)
+        task.add_done_callback(state.tasks.discard)
+
+    async def _dispatch(self, batch: list[tuple[Item, asyncio.Future[Result]]]) -> None:
+        # Callers cancelled while waiting for the window are not sent.
+        batch = [(item, future) for item, future in batch if not future.done()]
+        if not batch:
+            return
+
+        self.batches_dispatched += 1
+        self.items_dispatched += len(batch)
+        self.logger.debug("Dispatching micro-batch of %s item(s)", len(batch))
+
+        try:
+            results = list(await self.batch_fn([item for item, _ in batch]))
+            if len(results) != len(batch):
+                raise ValueError(f"Batch function returned {len(results)} result(s) for {len(batch)} item(s)")
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        except BaseException:
+            # Cancelled dispatch (e.g. loop shutdown): never leave callers parked.
+            for _, future in batch:
+                future.cancel()
+            raise
+
+        for (_, future), result in zip(batch, results, strict=True):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+class MicroBatchRunnable(Runnable[Any, Any]):
+    """Runnable wrapper that batches concurrent `ainvoke()` calls across runs.
+
+    Each `ainvoke()` captures the caller's config (callbacks, tags, metadata)
+    before joining the window, so tracing stays attached to the right graph
+    run. Batches are executed with `runnable.abatch(inputs, configs,
+    return_exceptions=True)` unless a `batch_fn` is supplied for a true batch
+    API such as `Embeddings.aembed_documents`:
+
+        MicroBatchRunnable(embeddings_chain, batch_fn=embeddings.aembed_documents)
+
+    Synchronous `invoke()` and explicit `batch()`/`abatch()` calls are
+    delegated unchanged.
+    """
+
+    def __init__(
+        self,
+        runnable: Runnable[Any, Any],
+        max_batch_size: int = 16,
+        max_latency: float = 0.005,
+        batch_fn: Callable[[list[Any]], Awaitable[Sequence[Any]]] | None = None,
+    ):
+        self.runnable = runnable
+        self.batch_fn = batch_fn
+        self.batcher: MicroBatcher[tuple[Any, RunnableConfig], Any] = MicroBatcher(
+            self._run_batch,
+            max_batch_size=max_batch_size,
+            max_latency=max_latency,
+        )
+
+    def get_name(self, suffix: str | None = None, *, name: str | None = None) -> str:
+        return self.runnable.get_name(suffix, name=name)
+
+    def invoke(self, input: Any, config: RunnableConfig | None = None, **kwargs: Any) -> Any:
+        return self.runnable.invoke(input, config, **kwargs)
+
+    async def ainvoke(self, input: Any, config: RunnableConfig | None = None, **kwargs: Any) -> Any:
+        if kwargs:
+            return await self.runnable.ainvoke(input, config, **kwargs)
+        return await self.batcher.submit((input, ensure_config(config)))
+
+    def batch(
+        self,
+        inputs: list[Any],
+        config: RunnableConfig | list[RunnableConfig] | None = None,
+        *,
+        return_exceptions: bool = False,
+        **kwargs: Any | None,
+    ) -> list[Any]:
+        return self.runnable.batch(inputs, config, return_exceptions=return_exceptions, **kwargs)
+
+    async def abatch(
+        self,
+        inputs: list[Any],
+        config: RunnableConfig | list[RunnableConfig] | None = None,
+        *,
+        return_exceptions: bool = False,
+        **kwargs: Any | None,
+    ) -> list[Any]:
+        return await self.runnable.abatch(inputs, config, return_exceptions=return_exceptions, **kwargs)
+
+    async def _run_batch(self, items: list[tuple[Any, RunnableConfig]]) -> Sequence[Any]:
+        inputs = [input for input, _ in items]
+        if self.batch_fn is not None:
+            return await self.batch_fn(inputs)
+        return await self.runnable.abatch(inputs, [config for _, config in items], return_exceptions=True)
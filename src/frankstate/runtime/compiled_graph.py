@@ -0,0 +1,53 @@
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+
+from langchain_core.callbacks import BaseCallbackHandler, BaseCallbackManager
+from langchain_core.runnables import RunnableConfig
+from langchain_core.runnables.config import var_child_runnable_config
+from langgraph.graph.state import CompiledStateGraph
+
+
+class CompiledLayoutGraph(CompiledStateGraph):
+    """`CompiledStateGraph` returned by `WorkflowBuilder.compile()`.
+
+    LangGraph replaces the callbacks bound with `with_config()` by the
+    callbacks passed to each call. `frankstate` binds runtime handlers, such
+    as the loop budget run scope, that must observe every run, so this graph
+    adds its bound handlers to the caller's callbacks instead. Everything
+    else behaves exactly like the wrapped `CompiledStateGraph`.
+    """
+
+    @classmethod
+    def from_compiled(cls, graph: CompiledStateGraph) -> "CompiledLayoutGraph":
+        """Rebuild `graph` as a `CompiledLayoutGraph`, the same way `Pregel.copy()` does."""
+        return cls(**{key: value for key, value in graph.__dict__.items() if key != "__orig_class__"})
+
+    def _bind_callbacks(self, config: RunnableConfig | None) -> RunnableConfig | None:
+        """Return `config` with the graph's bound handlers added to the call's callbacks."""
+        bound = (self.config or {}).get("callbacks")
+        if not isinstance(bound, list) or not bound:
+            return config
+
+        callbacks = (config or {}).get("callbacks")
+        if callbacks is None:
+            # Without explicit callbacks LangGraph inherits the parent run's
+            # callbacks, which the bound ones would otherwise replace.
+            parent = var_child_runnable_config.get()
+            callbacks = parent.get("callbacks") if parent else None
+        if callbacks is None:
+            return config
+
+        merged: list[BaseCallbackHandler] | BaseCallbackManager
+        if isinstance(callbacks, BaseCallbackManager):
+            merged = callbacks.copy()
+            for handler in bound:
+                merged.add_handler(handler, inherit=True)
+        else:
+            merged = [*callbacks, *(handler for handler in bound if handler not in callbacks)]
+        return {**(config or {}), "callbacks": merged}
+
+    def stream(self, input: Any, config: RunnableConfig | None = None, **kwargs: Any) -> Iterator[Any]:
+        return super().stream(input, self._bind_callbacks(config), **kwargs)
+
+    def astream(self, input: Any, config: RunnableConfig | None = None, **kwargs: Any) -> AsyncIterator[Any]:
+        return super().astream(input, self._bind_callbacks(config), **kwargs)
@@ -0,0 +1,440 @@
+import asyncio
+import inspect
+import logging
+from collections.abc import (
+    AsyncIterator,
+    Callable,
+    Generator,
+    Iterator,
+    Mapping,
+    Sequence,
+)
+from dataclasses import dataclass
+from typing import Any
+
+from langchain_core.runnables import RunnableConfig
+from langchain_core.runnables.config import var_child_runnable_config
+from langgraph.channels.base import BaseChannel
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.graph import END, START, StateGraph
+from langgraph.graph.state import CompiledStateGraph
+from langgraph.types import Command
+from typing_extensions import is_typeddict
+
+from frankstate.entity.node import SimpleNode
+from frankstate.managers.edge_manager import EdgeManager
+from frankstate.managers.node_manager import NodeManager
+from frankstate.optimizers.parallel_scheduler import EdgeConfig
+from frankstate.runtime.run_scope import RunScope, reset_run_scope, set_run_scope
+
+STREAM_MODES = ("values", "updates")
+
+
+@dataclass(frozen=True)
+class _Call:
+    """One node or router invocation requested by the run loop."""
+
+    fn: Callable[..., Any]
+    state: dict[str, Any]
+    config: RunnableConfig
+    scope: RunScope
+
+
+@dataclass(frozen=True)
+class _StepEvent:
+    """Stream payloads produced after the input or a superstep is applied."""
+
+    values: dict[str, Any]
+    updates: dict[str, Any] | None
+
+
+class DagEngine:
+    """Run an acyclic layout in process without the Pregel runtime.
+
+    The engine keeps LangGraph's superstep semantics for the subset of layouts
+    it accepts: all nodes triggered by the previous step run against the same
+    state snapshot, their writes are folded into fresh copies of the
+    `StateGraph` channels (so reducers such as `add_messages` behave the
+    same), and routers observe the state including their own node's writes.
+    Static, waiting and conditional edges are supported.
+
+    It is selected with `WorkflowBuilder(engine="dag")` and exposes the
+    execution surface used by the examples and services: `invoke`, `ainvoke`,
+    `stream` and `astream` with the `"values"` and `"updates"` stream modes.
+    `get_graph()` delegates to the compiled LangGraph graph, which stays
+    available as `graph`.
+
+    Layouts that need Pregel features are rejected by
+    `find_unsupported_feature()` and the builder falls back to LangGraph:
+    cycles, `CommandNode`, `ToolNode`, checkpointers (and therefore
+    `interrupt()`), non-`TypedDict` state schemas and `add_node()` kwargs
+    other than `metadata`.
+    """
+
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        workflow: StateGraph,
+        graph: CompiledStateGraph,
+        node_manager: NodeManager,
+        edge_manager: EdgeManager,
+        static_edges: Sequence[EdgeConfig],
+    ):
+        self.graph = graph
+        self.channels: dict[str, BaseChannel] = dict(workflow.channels)
+        self.state_keys = tuple(workflow.schemas[workflow.state_schema])
+        self.input_keys = tuple(workflow.schemas[workflow.input_schema])
+        self.output_keys = tuple(workflow.schemas[workflow.output_schema])
+
+        self.nodes: dict[str, Callable[..., Any]] = {
+            name: fn for (name, fn), _ in node_manager.configs_nodes()
+        }
+        self.successors: dict[str, list[str]] = {}
+        self.waiting_edges: list[tuple[tuple[str, ...], str]] = []
+        for source, target in static_edges:
+            if isinstance(source, tuple):
+                self.waiting_edges.append((source, target))
+            else:
+                self.successors.setdefault(source, []).append(target)
+
+        self.routers: dict[str, list[tuple[Callable[..., Any], Mapping[Any, str]]]] = {}
+        for source, router, path_map in edge_manager.configs_conditional_edges():
+            self.routers.setdefault(source, []).append((router, path_map))
+
+        self.logger.info("DagEngine initialized with %s node(s)", len(self.nodes))
+
+    @staticmethod
+    def find_unsupported_feature(
+        node_manager: NodeManager,
+        edge_manager: EdgeManager,
+        static_edges: Sequence[EdgeConfig],
+        state_schema: type[Any],
+        checkpointer: BaseCheckpointSaver | None = None,
+    ) -> str | None:
+        """Return why a layout needs LangGraph, or `None` when the engine can run it."""
+        if checkpointer is not None:
+            return "a checkpointer is attached"
+        if not is_typeddict(state_schema):
+            return "the state schema is not a TypedDict"
+
+        for node in node_manager.get_nodes():
+            if not isinstance(node, SimpleNode):
+                return f"'{node.name}' is a {type(node).__name__}"
+            if node.kwargs and set(node.kwargs) - {"metadata"}:
+                return f"'{node.name}' forwards add_node() kwargs {sorted(set(node.kwargs) - {'metadata'})}"
+            if node.retry is not None:
+                return f"'{node.name}' declares a retry policy"
+
+        graph: dict[str, set[str]] = {}
+        for source, target in static_edges:
+            for name in source if isinstance(source, tuple) else (source,):
+                graph.setdefault(name, set()).add(target)
+        for source, _, path_map in edge_manager.configs_conditional_edges():
+            graph.setdefault(source, set()).update(path_map.values())
+
+        cycle_node = DagEngine._find_cycle(graph)
+        if cycle_node is not None:
+            return f"the layout contains a cycle through '{cycle_node}'"
+        return None
+
+    @staticmethod
+    def _find_cycle(graph: dict[str, set[str]]) -> str | None:
+        """Return a node on a cycle of `graph`, if any."""
+        visiting: set[str] = set()
+        done: set[str] = set()
+
+        def visit(name: str) -> str | None:
+            if name in done:
+                return None
+            if name in visiting:
+                return name
+            visiting.add(name)
+            for target in sorted(graph.get(name, ())):
+                found = visit(target)
+                if found is not None:
+                    return found
+            visiting.discard(name)
+            done.add(name)
+            return None
+
+        for name in sorted(graph):
+            found = visit(name)
+            if found is not None:
+                return found
+        return None
+
+    def get_graph(self, *args: Any, **kwargs: Any) -> Any:
+        """Return the drawable graph of the equivalent compiled LangGraph graph."""
+        return self.graph.get_graph(*args, **kwargs)
+
+    def invoke(self, input: dict[str, Any], config: RunnableConfig | None = None) -> dict[str, Any]:
+        """Run the layout synchronously and return the output state."""
+        values: dict[str, Any] = {}
+        for event in self._drive(input, config):
+            values = event.values
+        return values
+
+    async def ainvoke(self, input: dict[str, Any], config: RunnableConfig | None = None) -> dict[str, Any]:
+        """Run the layout asynchronously and return the output state."""
+        values: dict[str, Any] = {}
+        async for event in self._adrive(input, config):
+            values = event.values
+        return values
+
+    def stream(
+        self,
+        input: dict[str, Any],
+        config: RunnableConfig | None = None,
+        stream_mode: str | Sequence[str] = "values",
+    ) -> Iterator[Any]:
+        """Yield LangGraph-shaped chunks for the requested stream mode(s)."""
+        modes = self._validate_stream_mode(stream_mode)
+        for event in self._drive(input, config):
+            yield from self._to_chunks(event, stream_mode, modes)
+
+    async def astream(
+        self,
+        input: dict[str, Any],
+        config: RunnableConfig | None = None,
+        stream_mode: str | Sequence[str] = "values",
+    ) -> AsyncIterator[Any]:
+        """Asynchronously yield LangGraph-shaped chunks for the requested stream mode(s)."""
+        modes = self._validate_stream_mode(stream_mode)
+        async for event in self._adrive(input, config):
+            for chunk in self._to_chunks(event, stream_mode, modes):
+                yield chunk
+
+    @staticmethod
+    def _validate_stream_mode(stream_mode: str | Sequence[str]) -> tuple[str, ...]:
+        modes = (stream_mode,) if isinstance(stream_mode, str) else tuple(stream_mode)
+        unsupported = [mode for mode in modes if mode not in STREAM_MODES]
+        if unsupported:
+            raise ValueError(f"DagEngine supports stream modes {STREAM_MODES}, got {unsupported}")
+        return modes
+
+    @staticmethod
+    def _to_chunks(
+        event: _StepEvent,
+        stream_mode: str | Sequence[str],
+        modes: tuple[str, ...],
+    ) -> Iterator[Any]:
+        # LangGraph emits the updates of a step before the values it produces.
+        for mode in sorted(modes, key=("updates", "values").index):
+            if mode == "values":
+                chunks = [event.values]
+            elif event.updates is not None:
+                chunks = [{name: update} for name, update in event.updates.items()]
+            else:
+                chunks = []
+            for chunk in chunks:
+                yield chunk if isinstance(stream_mode, str) else (mode, chunk)
+
+    def _drive(self, input: dict[str, Any], config: RunnableConfig | None) -> Iterator[_StepEvent]:
+        """Execute the run loop, calling nodes and routers in the current thread."""
+        run = self._run(input, config)
+        results: list[Any] | None = None
+        while True:
+            try:
+                item = run.send(results)
+            except StopIteration:
+                return
+            if isinstance(item, _StepEvent):
+                results = None
+                yield item
+            else:
+                results = [self._call(call) for call in item]
+
+    async def _adrive(self, input: dict[str, Any], config: RunnableConfig | None) -> AsyncIterator[_StepEvent]:
+        """Execute the run loop, awaiting each batch of calls concurrently."""
+        run = self._run(input, config)
+        results: list[Any] | None = None
+        while True:
+            try:
+                item = run.send(results)
+            except StopIteration:
+                return
+            if isinstance(item, _StepEvent):
+                results = None
+                yield item
+            elif len(item) == 1:
+                results = [await self._acall(item[0])]
+            else:
+                results = list(await asyncio.gather(*(self._acall(call) for call in item)))
+
+    @staticmethod
+    def _call(call: _Call) -> Any:
+        token = var_child_runnable_config.set(call.config)
+        scope_token = set_run_scope(call.scope)
+        try:
+            result = call.fn(call.state)
+        finally:
+            reset_run_scope(scope_token)
+            var_child_runnable_config.reset(token)
+        if inspect.isawaitable(result):
+            if inspect.iscoroutine(result):
+                result.close()
+            raise TypeError(
+                f"'{call.config['metadata']['langgraph_node']}' is asynchronous; use ainvoke() or astream()"
+            )
+        return result
+
+    @staticmethod
+    async def _acall(call: _Call) -> Any:
+        token = var_child_runnable_config.set(call.config)
+        scope_token = set_run_scope(call.scope)
+        try:
+            if inspect.iscoroutinefunction(call.fn):
+                return await call.fn(call.state)
+            result = await asyncio.to_thread(call.fn, call.state)
+            return await result if inspect.isawaitable(result) else result
+        finally:
+            reset_run_scope(scope_token)
+            var_child_runnable_config.reset(token)
+
+    def _run(
+        self,
+        input: dict[str, Any],
+        config: RunnableConfig | None,
+    ) -> Generator[list[_Call] | _StepEvent, list[Any] | None, None]:
+        """Sans-IO run loop: yields call batches and step events, receives call results."""
+        if not isinstance(input, dict):
+            raise TypeError(f"DagEngine expects a dict input, got {type(input).__name__}")
+
+        channels = {key: channel.copy() for key, channel in self.channels.items()}
+        scope = RunScope()
+        input_update = {key: value for key, value in input.items() if key in self.input_keys}
+        self._apply(channels, [input_update])
+        yield _StepEvent(values=self._read(channels, self.output_keys), updates=None)
+
+        barriers: dict[int, set[str]] = {}
+        frontier = yield from self._route(
+            [START], channels, None, {START: [input_update]}, barriers, config, scope, 0
+        )
+
+        step = 1
+        while frontier:
+            state = self._read(channels, self.state_keys)
+            results = yield [
+                _Call(self.nodes[name], dict(state), self._node_config(config, name, step), scope)
+                for name in frontier
+            ]
+            writes = {
+                name: self._normalize(name, result)
+                for name, result in zip(frontier, results or [], strict=True)
+            }
+            snapshot = (
+                {key: channel.copy() for key, channel in channels.items()}
+                if len(frontier) > 1 and any(name in self.routers for name in frontier)
+                else None
+            )
+            self._apply(channels, [update for name in frontier for update in writes[name]])
+            yield _StepEvent(
+                values=self._read(channels, self.output_keys),
+                updates={name: self._to_update_payload(updates) for name, updates in writes.items()},
+            )
+
+            frontier = yield from self._route(
+                frontier, channels, snapshot, writes, barriers, config, scope, step
+            )
+            step += 1
+
+    def _route(
+        self,
+        executed: list[str],
+        channels: dict[str, BaseChannel],
+        snapshot: dict[str, BaseChannel] | None,
+        writes: dict[str, list[dict[str, Any]]],
+        barriers: dict[int, set[str]],
+        config: RunnableConfig | None,
+        scope: RunScope,
+        step: int,
+    ) -> Generator[list[_Call], list[Any] | None, list[str]]:
+        """Return the nodes triggered by the nodes executed in the last step."""
+        triggered: dict[str, None] = {}
+        for name in executed:
+            triggered.update(dict.fromkeys(self.successors.get(name, ())))
+            for index, (sources, _) in enumerate(self.waiting_edges):
+                if name in sources:
+                    barriers.setdefault(index, set()).add(name)
+
+            routers = self.routers.get(name)
+            if not routers:
+                continue
+
+            if snapshot is None:
+                state = self._read(channels, self.state_keys)
+            else:
+                own = {key: channel.copy() for key, channel in snapshot.items()}
+                self._apply(own, writes[name])
+                state = self._read(own, self.state_keys)
+
+            keys = yield [
+                _Call(router, dict(state), self._node_config(config, name, step), scope)
+                for router, _ in routers
+            ]
+            for key, (_, path_map) in zip(keys or [], routers, strict=True):
+                for route in key if isinstance(key, list | tuple) else (key,):
+                    if route not in path_map:
+                        raise ValueError(f"Router of '{name}' returned unknown route {route!r}")
+                    triggered[path_map[route]] = None
+
+        for index, (sources, target) in enumerate(self.waiting_edges):
+            if barriers.get(index) == set(sources):
+                triggered[target] = None
+                barriers.pop(index)
+
+        triggered.pop(END, None)
+        return list(triggered)
+
+    @staticmethod
+    def _node_config(config: RunnableConfig | None, name: str, step: int) -> RunnableConfig:
+        base: RunnableConfig = config or {}
+        return {
+            **base,
+            "metadata": {
+                **(base.get("metadata") or {}),
+                "langgraph_step": step,
+                "langgraph_node": name,
+            },
+        }
+
+    @staticmethod
+    def _normalize(name: str, result: Any) -> list[dict[str, Any]]:
+        """Return the ordered update dicts produced by a node."""
+        if result is None:
+            return []
+        if isinstance(result, dict):
+            return [result]
+        if isinstance(result, list | tuple) and all(isinstance(item, Command) for item in result):
+            updates = []
+            for command in result:
+                if command.goto:
+                    raise TypeError(f"Node '{name}' returned a Command with goto; DagEngine only applies updates")
+                if isinstance(command.update, dict):
+                    updates.append(command.update)
+            return updates
+        raise TypeError(f"Node '{name}' returned {type(result).__name__}; expected a dict update")
+
+    def _to_update_payload(self, updates: list[dict[str, Any]]) -> Any:
+        filtered = [
+            {key: value for key, value in update.items() if key in self.channels}
+            for update in updates
+        ]
+        if not filtered:
+            return None
+        return filtered[0] if len(filtered) == 1 else filtered
+
+    def _apply(self, channels: dict[str, BaseChannel], updates: list[dict[str, Any]]) -> None:
+        """Fold updates into the channels, one `update()` call per written key."""
+        pending: dict[str, list[Any]] = {}
+        for update in updates:
+            for key, value in update.items():
+                if key in channels:
+                    pending.setdefault(key, []).append(value)
+        for key, values in pending.items():
+            channels[key].update(values)
+
+    @staticmethod
+    def _read(channels: dict[str, BaseChannel], keys: Sequence[str]) -> dict[str, Any]:
+        return {key: channels[key].get() for key in keys if key in channels and channels[key].is_available()}
@@ -0,0 +1,276 @@
+import inspect
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Hashable
+from dataclasses import asdict, dataclass, field
+from typing import Any, Literal
+from uuid import UUID
+
+from frankstate.entity.edge import ConditionalEdge, SimpleEdge
+from frankstate.instrumentation.hooks import ExecutionEvent, ExecutionHook
+from frankstate.runtime.run_scope import current_run_scope
+
+# Route key added to the path map of degradable edges; keeps `degrade_to`
+# visible in rendered graphs.
+DEGRADED_ROUTE = "__degraded__"
+
+
+@dataclass(frozen=True)
+class LoadSignals:
+    """Load observed by a `DegradationPolicy`.
+
+    Attributes:
+        in_flight: Graph runs started and not finished.
+        queue_wait: Mean queue wait in seconds reported over the window, if any.
+        backend_latency: Mean model call duration in seconds over the window, if any.
+    """
+
+    in_flight: int
+    queue_wait: float | None
+    backend_latency: float | None
+
+
+@dataclass(frozen=True)
+class DegradationEvent:
+    """A change of degradation mode, or one run taking a degraded route.
+
+    Attributes:
+        kind: `"enter"` and `"exit"` when the mode changes, `"route"` when a
+            run follows the degraded route of an edge.
+        reasons: Signals above their threshold when entering the mode.
+        signals: Load observed when the event happened.
+        run_id: Run taking the degraded route, for `"route"` events.
+        edge: Source node of the degraded edge, for `"route"` events.
+        target: `degrade_to` of the degraded edge, for `"route"` events.
+        timestamp: Wall-clock time of the event.
+    """
+
+    kind: Literal["enter", "exit", "route"]
+    reasons: tuple[str, ...]
+    signals: LoadSignals
+    run_id: str | None = None
+    edge: str | None = None
+    target: str | None = None
+    timestamp: float = field(default_factory=time.time)
+
+
+class DegradationPolicy(ExecutionHook):
+    """Switch runs to the degraded routes of a layout while the process is overloaded.
+
+    Edges declaring `degrade_to` mark what they lead to as optional, such as
+    the grade/rewrite loop of an adaptive RAG layout. The policy watches three
+    load signals and enters degradation mode as soon as one crosses its
+    threshold:
+
+    - `max_in_flight`: graph runs in progress across the graphs sharing the
+      policy.
+    - `max_queue_wait`: mean seconds requests waited before running, as
+      reported by the serving layer through `record_queue_wait()`.
+    - `max_backend_latency`: mean seconds of the model calls made by the runs,
+      or reported through `record_backend_latency()`.
+
+    Means are taken over the samples of the last `window` seconds. The mode
+    is left once every signal is below `recovery` times its threshold and the
+    mode has lasted `min_duration` seconds, so it does not flap on every run.
+    While degraded, degradable edges route to `degrade_to` without calling
+    their evaluator; a run that took a degraded route keeps degrading until it
+    ends. Pass the policy as a hook:
+
+        policy = DegradationPolicy(max_in_flight=32, max_backend_latency=6.0)
+        graph = WorkflowBuilder(config=MyLayout, state_schema=State, hooks=[policy]).compile()
+
+    Mode changes and degraded routes are kept in `events`, logged with the
+    `DegradationEvent` fields under `extra["degradation"]` and passed to
+    `on_event`.
+    """
+
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        max_in_flight: int | None = None,
+        max_queue_wait: float | None = None,
+        max_backend_latency: float | None = None,
+        window: float = 30.0,
+        recovery: float = 0.8,
+        min_duration: float = 5.0,
+        on_event: Callable[[DegradationEvent], object] | None = None,
+        max_events: int = 1000,
+    ):
+        super().__init__()
+        if max_in_flight is None and max_queue_wait is None and max_backend_latency is None:
+            raise ValueError("Declare at least one of `max_in_flight`, `max_queue_wait` or `max_backend_latency`")
+        if not 0 < recovery <= 1:
+            raise ValueError(f"`recovery` must be in (0, 1], got {recovery!r}")
+        if window <= 0:
+            raise ValueError("`window` must be positive")
+
+        self.thresholds: dict[str, float] = {
+            name: float(value)
+            for name, value in (
+                ("in_flight", max_in_flight),
+                ("queue_wait", max_queue_wait),
+                ("backend_latency", max_backend_latency),
+            )
+            if value is not None
+        }
+        self.window = window
+        self.recovery = recovery
+        self.min_duration = min_duration
+        self.on_event = on_event
+        self.events: deque[DegradationEvent] = deque(maxlen=max_events)
+        self._in_flight: set[UUID] = set()
+        self._queue_waits: deque[tuple[float, float]] = deque()
+        self._latencies: deque[tuple[float, float]] = deque()
+        self._degraded_runs: set[UUID] = set()
+        self._entered_at: float | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def degraded(self) -> bool:
+        """Return whether the policy is in degradation mode."""
+        return self._entered_at is not None
+
+    def signals(self) -> LoadSignals:
+        """Return the load currently observed."""
+        with self._lock:
+            return self._signals(time.monotonic())
+
+    def record_queue_wait(self, seconds: float) -> None:
+        """Report how long a request waited before its run started."""
+        self._observe(self._queue_waits, seconds)
+
+    def record_backend_latency(self, seconds: float) -> None:
+        """Report the duration of a backend call made outside the instrumented runs."""
+        self._observe(self._latencies, seconds)
+
+    def on_start(self, event: ExecutionEvent) -> None:
+        if event.kind == "graph":
+            with self._lock:
+                self._in_flight.add(event.run_id)
+            self._update()
+
+    def on_end(self, event: ExecutionEvent, output: Any) -> None:
+        if event.kind == "model" and event.duration is not None:
+            self._observe(self._latencies, event.duration)
+        elif event.kind == "graph":
+            with self._lock:
+                self._in_flight.discard(event.run_id)
+                self._degraded_runs.discard(event.run_id)
+            self._update()
+
+    def on_error(self, event: ExecutionEvent, error: BaseException) -> None:
+        self.on_end(event, None)
+
+    def wrap_router(
+        self,
+        node_source: str,
+        router: Callable[[Any], Any],
+        path_map: dict[Hashable, Any],
+    ) -> tuple[Callable[[Any], Any], dict[Hashable, Any]]:
+        edge = self._degradable_edge(node_source, path_map)
+        if edge is None or edge.degrade_to is None:
+            return router, path_map
+
+        target = edge.degrade_to
+        path_map = {**path_map, DEGRADED_ROUTE: target}
+        if inspect.iscoroutinefunction(router):
+
+            async def degrade_async(state: Any) -> Any:
+                return DEGRADED_ROUTE if self._should_degrade(node_source, target) else await router(state)
+
+            return degrade_async, path_map
+
+        def degrade_sync(state: Any) -> Any:
+            return DEGRADED_ROUTE if self._should_degrade(node_source, target) else router(state)
+
+        return degrade_sync, path_map
+
+    def _degradable_edge(
+        self,
+        node_source: str,
+        path_map: dict[Hashable, Any],
+    ) -> SimpleEdge | ConditionalEdge | None:
+        """Return the degradable edge leaving `node_source` that the router belongs to."""
+        if self.edge_manager is None:
+            return None
+        targets = set(path_map.values())
+        for edge in self.edge_manager.get_outgoing_edges(node_source):
+            routes = {edge.node_path} if isinstance(edge, SimpleEdge) else set(edge.map_dict.values())
+            if edge.is_degradable and routes <= targets:
+                return edge
+        return None
+
+    def _should_degrade(self, node_source: str, target: str) -> bool:
+        scope = current_run_scope()
+        run_id = scope.run_id if scope is not None else None
+        with self._lock:
+            if run_id not in self._degraded_runs and self._entered_at is None:
+                return False
+            if run_id is not None:
+                self._degraded_runs.add(run_id)
+            event = DegradationEvent(
+                kind="route",
+                reasons=(),
+                signals=self._signals(time.monotonic()),
+                run_id=str(run_id) if run_id is not None else None,
+                edge=node_source,
+                target=target,
+            )
+        self._emit(event, logging.INFO, "Degraded route taken from '%s' to '%s'", node_source, target)
+        return True
+
+    def _observe(self, samples: deque[tuple[float, float]], seconds: float) -> None:
+        with self._lock:
+            samples.append((time.monotonic(), seconds))
+        self._update()
+
+    def _signals(self, now: float) -> LoadSignals:
+        """Return the signals over the window; call with the lock held."""
+        for samples in (self._queue_waits, self._latencies):
+            while samples and samples[0][0] < now - self.window:
+                samples.popleft()
+        return LoadSignals(
+            in_flight=len(self._in_flight),
+            queue_wait=sum(value for _, value in self._queue_waits) / len(self._queue_waits) if self._queue_waits else None,
+            backend_latency=sum(value for _, value in self._latencies) / len(self._latencies) if self._latencies else None,
+        )
+
+    def _update(self) -> None:
+        """Enter or leave degradation mode according to the current signals."""
+        now = time.monotonic()
+        with self._lock:
+            signals = self._signals(now)
+            values = asdict(signals)
+            exceeded = tuple(
+                name for name, threshold in self.thresholds.items() if values[name] is not None and values[name] > threshold
+            )
+            if self._entered_at is None and exceeded:
+                self._entered_at = now
+                event = DegradationEvent(kind="enter", reasons=exceeded, signals=signals)
+            elif (
+                self._entered_at is not None
+                and now - self._entered_at >= self.min_duration
+                and all(
+                    values[name] is None or values[name] <= threshold * self.recovery
+                    for name, threshold in self.thresholds.items()
+                )
+            ):
+                self._entered_at = None
+                event = DegradationEvent(kind="exit", reasons=(), signals=signals)
+            else:
+                return
+
+        if event.kind == "enter":
+            self._emit(event, logging.WARNING, "Entering degradation mode: %s", ", ".join(event.reasons))
+        else:
+            self._emit(event, logging.INFO, "Leaving degradation mode")
+
+    def _emit(self, event: DegradationEvent, level: int, message: str, *args: Any) -> None:
+        with self._lock:
+            self.events.append(event)
+        self.logger.log(level, message, *args, extra={"degradation": asdict(event)})
+        if self.on_event is not None:
+            self.on_event(event)
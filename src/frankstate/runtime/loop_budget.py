@@ -0,0 +1,77 @@
+import inspect
+import logging
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from frankstate.entity.edge import ConditionalEdge, SimpleEdge
+from frankstate.runtime.run_scope import current_run_scope
+
+# Route key added to the path map of budgeted edges. It cannot collide with
+# evaluator keys in practice and keeps `exit_to` visible in rendered graphs.
+BUDGET_EXIT_ROUTE = "__budget_exit__"
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+def _budget_spent(edge: SimpleEdge | ConditionalEdge, key: object) -> bool:
+    """Count one traversal of `edge` in the current run and report whether its budget is spent."""
+    scope = current_run_scope()
+    if scope is None:
+        raise RuntimeError(
+            f"Loop budget on the edge from '{edge.node_source}' needs a run scope; "
+            "compile the graph with WorkflowBuilder.compile()"
+        )
+
+    traversals = scope.increment(key)
+    if edge.max_traversals is not None and traversals > edge.max_traversals:
+        logger.warning(
+            "Loop budget of %s traversal(s) spent on the edge from '%s'; continuing at '%s'",
+            edge.max_traversals,
+            edge.node_source,
+            edge.exit_to,
+        )
+        return True
+    return False
+
+
+def build_budgeted_router(
+    edge: SimpleEdge | ConditionalEdge,
+) -> tuple[Callable[[Any], Any], dict[Hashable, str]]:
+    """Return a router and path map enforcing the loop budget declared on `edge`.
+
+    Budgeted `SimpleEdge`s route to `node_path` until the budget is spent.
+    Budgeted `ConditionalEdge`s delegate to their evaluator, which is no longer
+    called once the budget is spent. The router keeps the evaluator's sync or
+    async nature so LangGraph executes it the same way.
+    """
+    if edge.exit_to is None:
+        raise ValueError(f"The edge from '{edge.node_source}' does not declare a loop budget")
+
+    key = object()
+    path_map: dict[Hashable, str]
+
+    if isinstance(edge, SimpleEdge):
+        target = edge.node_path
+        path_map = {target: target, BUDGET_EXIT_ROUTE: edge.exit_to}
+
+        def route_simple(state: Any) -> str:
+            return BUDGET_EXIT_ROUTE if _budget_spent(edge, key) else target
+
+        return route_simple, path_map
+
+    evaluate = edge.evaluator.evaluate
+    path_map = {**edge.map_dict, BUDGET_EXIT_ROUTE: edge.exit_to}
+
+    if inspect.iscoroutinefunction(evaluate):
+
+        async def route_async(state: Any) -> Any:
+            if _budget_spent(edge, key):
+                return BUDGET_EXIT_ROUTE
+            return await evaluate(state)
+
+        return route_async, path_map
+
+    def route_sync(state: Any) -> Any:
+        return BUDGET_EXIT_ROUTE if _budget_spent(edge, key) else evaluate(state)
+
+    return route_sync, path_map
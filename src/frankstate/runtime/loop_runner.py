@@ -0,0 +1,204 @@
+import asyncio
+import atexit
+import concurrent.futures
+import importlib
+import logging
+import queue
+import threading
+from collections.abc import Coroutine, Iterator
+from typing import Any
+
+from langchain_core.runnables import Runnable, RunnableConfig
+
+from frankstate.runtime.dag_engine import DagEngine
+
+_STREAM_END = object()
+
+
+class BackgroundLoopRunner:
+    """Run async graphs from synchronous code on one long-lived event loop.
+
+    `asyncio.run()` creates and closes an event loop per call, which discards
+    loop-bound resources such as the async HTTP connection pools of chat
+    models and search clients. The runner owns a single loop in a daemon
+    thread, so those pools stay warm across calls from Azure Function
+    handlers, Streamlit callbacks or any other synchronous entry point:
+
+        runner = BackgroundLoopRunner()
+        result = runner.run(graph, {"messages": [...]})
+
+    Calls are thread-safe and run concurrently on the shared loop. A call
+    that times out or is interrupted cancels its task on the loop before the
+    exception reaches the caller. The caller's context variables are copied
+    into the task, so tracing context propagates as with a direct `await`.
+
+    `use_uvloop=None` uses `uvloop` when it is installed, `True` requires it
+    and `False` always uses the default asyncio loop.
+    """
+
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    def __init__(self, use_uvloop: bool | None = None, name: str = "frankstate-loop"):
+        self.use_uvloop = use_uvloop
+        self.name = name
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Return the background loop, starting it on first use."""
+        with self._lock:
+            if self._loop is None:
+                self._loop, self._thread = self._start()
+            return self._loop
+
+    @property
+    def running(self) -> bool:
+        """Return whether the background loop has been started and not closed."""
+        return self._loop is not None
+
+    def _new_loop(self) -> asyncio.AbstractEventLoop:
+        if self.use_uvloop is False:
+            return asyncio.new_event_loop()
+
+        try:
+            uvloop = importlib.import_module("uvloop")
+        except ImportError as exc:
+            if self.use_uvloop:
+                raise ImportError("BackgroundLoopRunner(use_uvloop=True) requires `uvloop` to be installed.") from exc
+            return asyncio.new_event_loop()
+
+        loop: asyncio.AbstractEventLoop = uvloop.new_event_loop()
+        return loop
+
+    def _start(self) -> tuple[asyncio.AbstractEventLoop, threading.Thread]:
+        loop = self._new_loop()
+        thread = threading.Thread(target=self._serve, args=(loop,), name=self.name, daemon=True)
+        thread.start()
+        self.logger.info("Background event loop %s started (%s)", self.name, type(loop).__name__)
+        return loop, thread
+
+    @staticmethod
+    def _serve(loop: asyncio.AbstractEventLoop) -> None:
+        asyncio.set_event_loop(loop)
+        loop.run_forever()
+
+    def submit[T](self, coro: Coroutine[Any, Any, T]) -> concurrent.futures.Future[T]:
+        """Schedule `coro` on the background loop and return a thread-safe future.
+
+        Cancelling the returned future cancels the task on the loop.
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run_coroutine[T](self, coro: Coroutine[Any, Any, T], timeout: float | None = None) -> T:
+        """Run `coro` on the background loop and block until it finishes.
+
+        Raises:
+            RuntimeError: If called from the runner's own loop thread, where
+                blocking would deadlock.
+            TimeoutError: If `timeout` seconds elapse first; the task is
+                cancelled.
+        """
+        if self._thread is not None and threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("BackgroundLoopRunner cannot block inside its own event loop; await instead")
+
+        future = self.submit(coro)
+        try:
+            return future.result(timeout)
+        except BaseException:
+            # Timeouts and KeyboardInterrupt must not leave the run going on
+            # in the background.
+            future.cancel()
+            raise
+
+    def run(
+        self,
+        graph: Runnable[Any, Any] | DagEngine,
+        input: Any,
+        config: RunnableConfig | None = None,
+        timeout: float | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Invoke `graph.ainvoke(input, config, **kwargs)` on the background loop."""
+        return self.run_coroutine(graph.ainvoke(input, config, **kwargs), timeout=timeout)
+
+    def stream(
+        self,
+        graph: Runnable[Any, Any] | DagEngine,
+        input: Any,
+        config: RunnableConfig | None = None,
+        **kwargs: Any,
+    ) -> Iterator[Any]:
+        """Iterate over `graph.astream(input, config, **kwargs)` from synchronous code.
+
+        The stream runs as one task on the background loop. Closing the
+        iterator early cancels it.
+        """
+        chunks: queue.SimpleQueue[Any] = queue.SimpleQueue()
+
+        async def pump() -> None:
+            try:
+                async for chunk in graph.astream(input, config, **kwargs):
+                    chunks.put(chunk)
+            finally:
+                chunks.put(_STREAM_END)
+
+        future = self.submit(pump())
+        try:
+            while (chunk := chunks.get()) is not _STREAM_END:
+                yield chunk
+            future.result()
+        finally:
+            future.cancel()
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        """Cancel pending tasks, stop the loop and join its thread.
+
+        Loop-bound clients created while the runner was alive cannot be used
+        afterwards. A closed runner starts a new loop on next use.
+        """
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or thread is None:
+            return
+
+        async def shutdown() -> None:
+            tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await loop.shutdown_asyncgens()
+
+        try:
+            asyncio.run_coroutine_threadsafe(shutdown(), loop).result(timeout)
+        except concurrent.futures.TimeoutError:
+            self.logger.warning("Background event loop %s did not shut down within %ss", self.name, timeout)
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout)
+            if not thread.is_alive():
+                loop.close()
+        self.logger.info("Background event loop %s closed", self.name)
+
+    def __enter__(self) -> "BackgroundLoopRunner":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+_default_runner: BackgroundLoopRunner | None = None
+_default_runner_lock = threading.Lock()
+
+
+def get_default_runner() -> BackgroundLoopRunner:
+    """Return the process-wide runner, closed automatically at interpreter exit."""
+    global _default_runner
+    with _default_runner_lock:
+        if _default_runner is None:
+            _default_runner = BackgroundLoopRunner()
+            atexit.register(_default_runner.close)
+        return _default_runner
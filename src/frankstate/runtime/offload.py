@@ -0,0 +1,220 @@
+import asyncio
+import atexit
+import hashlib
+import inspect
+import logging
+import multiprocessing
+import os
+import pickle
+import threading
+import weakref
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.context import BaseContext
+from typing import TYPE_CHECKING, Any
+
+from pydantic import BaseModel
+
+if TYPE_CHECKING:
+    from frankstate.entity.node import SimpleNode
+    from frankstate.entity.statehandler import StateEnhancer
+
+# Enhancers installed in the current worker process by `_init_worker`.
+_worker_enhancers: dict[str, "StateEnhancer"] = {}
+
+# Offloads whose pool may be running, stopped at interpreter exit.
+_offloads: "weakref.WeakSet[ProcessPoolOffload]" = weakref.WeakSet()
+
+
+def _init_worker(
+    enhancers: dict[str, bytes],
+    initializer: Callable[..., object] | None,
+    initargs: tuple[Any, ...],
+) -> None:
+    """Install the offloaded enhancers once per worker and run the user initializer."""
+    _worker_enhancers.update({key: pickle.loads(payload) for key, payload in enhancers.items()})
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def _run_enhancer(key: str, state: Any) -> Any:
+    """Run one offloaded enhancer inside a worker process."""
+    result = _worker_enhancers[key].enhance(state)
+    if inspect.isawaitable(result):
+        awaitable = result
+
+        async def _await() -> Any:
+            return await awaitable
+
+        result = asyncio.run(_await())
+    return result
+
+
+def _forget_enhancer(offload_ref: "weakref.ref[ProcessPoolOffload]", key: str) -> None:
+    """Drop one user of `key` once an offloaded callable is garbage collected."""
+    offload = offload_ref()
+    if offload is not None:
+        offload._forget(key)
+
+
+@atexit.register
+def _shutdown_offloads() -> None:
+    for offload in list(_offloads):
+        offload.shutdown(wait=False)
+
+
+def default_max_workers() -> int:
+    """Return the usable core count minus one, leaving a core for the event loop."""
+    try:
+        cores = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cores = os.cpu_count() or 1
+    return max(cores - 1, 1)
+
+
+class ProcessPoolOffload:
+    """Run CPU-bound `SimpleNode` enhancers in a managed process pool.
+
+    Pass one instance to every node that should leave the interpreter running
+    the graph:
+
+        offload = ProcessPoolOffload(initializer=load_models)
+        SimpleNode(enhancer=ParseDocs(), name="parse_docs", reads=["documents"], offload=offload)
+
+    Each enhancer is pickled once and installed in every worker when the pool
+    starts, so heavy attributes are loaded once per worker, as is whatever
+    `initializer(*initargs)` sets up. Per call, only the state projection and
+    the returned update cross the process boundary: the node's `reads` keys
+    when declared, the whole state otherwise, or the result of `project`.
+
+    Enhancers are keyed by class and pickled content, so nodes rebuilt by new
+    `WorkflowBuilder`s reuse the installed copy. An enhancer is forgotten once
+    its node and the graphs compiled from it are garbage collected.
+
+    The pool starts lazily on the first call and is restarted only when a new
+    enhancer is registered after that. `WorkflowBuilder.close()` stops the
+    pools of its nodes, as does interpreter exit; a later call restarts them.
+    Offloaded nodes resolve to async callables, so graphs using them run
+    through the async API (`ainvoke`, `astream`).
+    The default `mp_context` is `spawn`, which is safe with the threads used
+    by the event loop; enhancers must therefore be importable by module path.
+    """
+
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        initializer: Callable[..., object] | None = None,
+        initargs: tuple[Any, ...] = (),
+        mp_context: BaseContext | None = None,
+        project: Callable[[Any], Any] | None = None,
+    ):
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("`max_workers` must be at least 1")
+
+        self.max_workers = max_workers or default_max_workers()
+        self.initializer = initializer
+        self.initargs = tuple(initargs)
+        self.mp_context = mp_context or multiprocessing.get_context("spawn")
+        self.project = project
+        self._enhancers: dict[str, bytes] = {}
+        self._users: dict[str, int] = {}
+        self._wrappers: weakref.WeakKeyDictionary[SimpleNode, Callable[[Any], Any]] = weakref.WeakKeyDictionary()
+        self._pool: ProcessPoolExecutor | None = None
+        self._pool_keys: frozenset[str] = frozenset()
+        self._lock = threading.Lock()
+
+    def wrap(self, node: "SimpleNode") -> Callable[[Any], Any]:
+        """Register `node` and return the async callable that runs it in the pool.
+
+        Raises:
+            TypeError: If the node's enhancer cannot be pickled.
+        """
+        with self._lock:
+            wrapper = self._wrappers.get(node)
+            if wrapper is not None:
+                return wrapper
+
+            try:
+                payload = pickle.dumps(node.enhancer)
+            except Exception as exc:
+                raise TypeError(
+                    f"Node '{node.name}' cannot be offloaded: {type(node.enhancer).__name__} is not picklable ({exc})"
+                ) from exc
+
+            key = f"{type(node.enhancer).__qualname__}#{hashlib.sha256(payload).hexdigest()[:16]}"
+            self._enhancers.setdefault(key, payload)
+            self._users[key] = self._users.get(key, 0) + 1
+            reads = tuple(node.reads) if node.reads is not None else None
+
+            async def offloaded(state: Any) -> Any:
+                projection = self._project(state, reads)
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(self._get_pool(key), _run_enhancer, key, projection)
+
+            offloaded.__name__ = node.name
+            self._wrappers[node] = offloaded
+            # Compiled graphs hold the callable, not the node: keep the key while either lives.
+            weakref.finalize(offloaded, _forget_enhancer, weakref.ref(self), key)
+
+        self.logger.info("Node %s offloaded to a process pool of %s worker(s)", node.name, self.max_workers)
+        return offloaded
+
+    def _forget(self, key: str) -> None:
+        """Drop one user of `key`, removing its payload and pool when unused."""
+        pool = None
+        with self._lock:
+            self._users[key] -= 1
+            if self._users[key] > 0:
+                return
+            del self._users[key]
+            del self._enhancers[key]
+            if not self._enhancers:
+                pool, self._pool = self._pool, None
+                self._pool_keys = frozenset()
+        if pool is not None:
+            pool.shutdown(wait=False)
+
+    def _project(self, state: Any, reads: tuple[str, ...] | None) -> Any:
+        """Return the picklable part of `state` sent to the worker."""
+        if self.project is not None:
+            return self.project(state)
+        if reads is not None:
+            values = state.model_dump() if isinstance(state, BaseModel) else state
+            return {key: values[key] for key in reads if key in values}
+        return state
+
+    def _get_pool(self, key: str) -> ProcessPoolExecutor:
+        """Return a pool whose workers know `key`, starting or restarting it if needed."""
+        with self._lock:
+            if self._pool is not None and key in self._pool_keys:
+                return self._pool
+
+            if self._pool is not None:
+                self.logger.info("Restarting process pool to install newly offloaded nodes")
+                self._pool.shutdown(wait=False)
+
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=self.mp_context,
+                initializer=_init_worker,
+                initargs=(dict(self._enhancers), self.initializer, self.initargs),
+            )
+            self._pool_keys = frozenset(self._enhancers)
+            _offloads.add(self)
+            return self._pool
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes; the pool restarts on the next call."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+            self._pool_keys = frozenset()
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+    def __enter__(self) -> "ProcessPoolOffload":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.shutdown()
@@ -0,0 +1,631 @@
+import argparse
+import asyncio
+import hashlib
+import hmac
+import importlib
+import inspect
+import ipaddress
+import itertools
+import logging
+import os
+import secrets
+import struct
+import sys
+import threading
+import time
+import weakref
+from collections.abc import Callable, Mapping, Sequence
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from langgraph.checkpoint.serde.event_hooks import (
+    SerdeEvent,
+    register_serde_event_listener,
+)
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from pydantic import BaseModel
+
+from frankstate.entity.node import SimpleNode
+
+if TYPE_CHECKING:
+    from frankstate.entity.graph_layout import GraphLayout
+    from frankstate.entity.statehandler import StateEnhancer
+
+# Frame header: length of the serializer type tag, then of the payload.
+_HEADER = struct.Struct(">HI")
+# Greeting sent by a worker on every connection: protocol magic, then the
+# length of the authentication challenge that follows (0 without a secret).
+_GREETING = struct.Struct(">4sB")
+_MAGIC = b"FSW1"
+_CHALLENGE_BYTES = 32
+# Serializer type tags accepted in frames; "json" and "pickle" never are.
+_ACCEPTED_TAGS = frozenset({"msgpack", "null", "bytes", "bytearray"})
+# Environment variable read by the command line worker for its shared secret.
+SECRET_ENV = "FRANKSTATE_WORKER_SECRET"
+# Transport failures worth retrying on another worker; `TimeoutError` is an
+# `OSError` but is never retried.
+_RETRYABLE = (OSError, asyncio.IncompleteReadError)
+
+
+class RemoteNodeError(RuntimeError):
+    """Raised when a remote node failed in its worker, or no worker could run it.
+
+    Attributes:
+        node: Name of the remote node.
+        error_type: Exception class raised in the worker, if the node ran.
+    """
+
+    def __init__(self, message: str, node: str, error_type: str | None = None):
+        super().__init__(message)
+        self.node = node
+        self.error_type = error_type
+
+
+@dataclass(frozen=True)
+class WorkerAddress:
+    """Parsed address of a `NodeWorker`: `"host:port"` or `"unix:/path/to.sock"`."""
+
+    host: str | None = None
+    port: int | None = None
+    path: str | None = None
+
+    @classmethod
+    def parse(cls, address: str) -> "WorkerAddress":
+        if address.startswith("unix:"):
+            if not address[5:]:
+                raise ValueError(f"Worker address {address!r} has no socket path")
+            return cls(path=address[5:])
+        host, separator, port = address.rpartition(":")
+        if not separator or not host or not port.isdigit():
+            raise ValueError(f"Worker address must be 'host:port' or 'unix:/path', got {address!r}")
+        return cls(host=host.strip("[]"), port=int(port))
+
+    def __str__(self) -> str:
+        if self.path is not None:
+            return f"unix:{self.path}"
+        host = f"[{self.host}]" if self.host and ":" in self.host else self.host
+        return f"{host}:{self.port}"
+
+
+class FrameRejectedError(ValueError):
+    """Raised when a frame carries a type outside the codec's allowlist."""
+
+
+# Types blocked while the current frame is decoded; `None` outside decoding.
+_blocked_types: ContextVar[list[str] | None] = ContextVar("frankstate_remote_blocked_types", default=None)
+
+
+def _record_blocked_type(event: SerdeEvent) -> None:
+    blocked = _blocked_types.get()
+    if blocked is not None and event["kind"].endswith("_blocked"):
+        blocked.append(f"{event['module']}.{event['name']}")
+
+
+register_serde_event_listener(_record_blocked_type)
+
+
+def _digest(secret: bytes, challenge: bytes) -> bytes:
+    return hmac.new(secret, challenge, hashlib.sha256).digest()
+
+
+def _encode_secret(secret: str | bytes | None) -> bytes | None:
+    if secret is None:
+        return None
+    encoded = secret.encode() if isinstance(secret, str) else bytes(secret)
+    if not encoded:
+        raise ValueError("`secret` must not be empty")
+    return encoded
+
+
+class _FrameCodec:
+    """Length-prefixed frames carrying values serialized like checkpoints.
+
+    Decoding is strict: msgpack extension types are only rebuilt when they
+    are in LangGraph's safe list (messages, documents, datetimes...) or in
+    `allowed_types`, and a frame carrying any other type is rejected instead
+    of being imported and called.
+    """
+
+    def __init__(self, max_frame_bytes: int, allowed_types: Sequence[type | tuple[str, ...]] = ()):
+        self.max_frame_bytes = max_frame_bytes
+        self._serializer = JsonPlusSerializer(allowed_msgpack_modules=tuple(allowed_types) or None)
+
+    async def write(self, writer: asyncio.StreamWriter, value: Any) -> None:
+        type_tag, payload = self._serializer.dumps_typed(value)
+        tag = type_tag.encode()
+        writer.write(_HEADER.pack(len(tag), len(payload)) + tag + payload)
+        await writer.drain()
+
+    async def read(self, reader: asyncio.StreamReader) -> Any:
+        tag_size, payload_size = _HEADER.unpack(await reader.readexactly(_HEADER.size))
+        if payload_size > self.max_frame_bytes:
+            raise ConnectionError(f"Frame of {payload_size} bytes exceeds `max_frame_bytes`")
+        tag = (await reader.readexactly(tag_size)).decode()
+        payload = await reader.readexactly(payload_size)
+        if tag not in _ACCEPTED_TAGS:
+            raise FrameRejectedError(f"Frame serialized as {tag!r} is not accepted")
+        return self.decode(tag, payload)
+
+    def decode(self, tag: str, payload: bytes) -> Any:
+        blocked: list[str] = []
+        token = _blocked_types.set(blocked)
+        try:
+            value = self._serializer.loads_typed((tag, payload))
+        finally:
+            _blocked_types.reset(token)
+        if blocked:
+            raise FrameRejectedError(f"Frame carries types outside the allowlist: {sorted(set(blocked))}")
+        return value
+
+
+async def _open(
+    address: WorkerAddress, secret: bytes | None
+) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    if address.path is not None:
+        reader, writer = await asyncio.open_unix_connection(address.path)
+    else:
+        reader, writer = await asyncio.open_connection(address.host, address.port)
+    try:
+        magic, size = _GREETING.unpack(await reader.readexactly(_GREETING.size))
+        if magic != _MAGIC:
+            raise RemoteNodeError(f"{address} is not a NodeWorker", node="*")
+        if size and secret is None:
+            raise RemoteNodeError(f"Worker {address} requires a shared secret", node="*")
+        if not size and secret is not None:
+            raise RemoteNodeError(f"Worker {address} does not authenticate callers", node="*")
+        if size:
+            writer.write(_digest(secret or b"", await reader.readexactly(size)))
+            await writer.drain()
+    except BaseException:
+        writer.transport.abort()
+        raise
+    return reader, writer
+
+
+def _is_loopback(host: str | None) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host or "").is_loopback
+    except ValueError:
+        return False
+
+
+async def _close(writer: asyncio.StreamWriter) -> None:
+    writer.close()
+    try:
+        await writer.wait_closed()
+    except OSError:
+        pass
+
+
+def project_state(state: Any, reads: Sequence[str] | None) -> Any:
+    """Return the `reads` keys of `state`, or the whole state when they are unknown."""
+    if reads is None:
+        return state
+    values = state.model_dump() if isinstance(state, BaseModel) else state
+    return {key: values[key] for key in reads if key in values}
+
+
+class NodeWorker:
+    """Serve `SimpleNode` enhancers to the `RemoteOffload`s of other processes or hosts.
+
+    A worker is usually started from the layout that marks the nodes remote,
+    so both sides agree on node names and the heavy runtime lives only where
+    the nodes run:
+
+        python -m frankstate.runtime.remote my_app.layouts:RagLayout --address unix:/run/rag.sock
+
+    or from code with `NodeWorker.from_layout(RagLayout, address="unix:/tmp/rag.sock")`
+    and `await worker.serve_forever()`.
+
+    Each request carries the node name and its state projection, and gets the
+    node update back, both serialized with LangGraph's checkpoint serializer
+    in frames of at most `max_frame_bytes`. Decoding is strict: only
+    LangGraph's safe types and `allowed_types` are rebuilt, and requests
+    carrying other types are answered with an error without running. Async enhancers
+    run on the worker's event loop and sync ones in threads, at most
+    `max_concurrency` at a time when set. Enhancer exceptions are sent back
+    and raised as `RemoteNodeError` by the caller.
+
+    With a `secret`, every connection starts with an HMAC-SHA256
+    challenge-response and callers without the same secret are disconnected.
+    A worker listening on a non-loopback TCP address requires one. The
+    secret authenticates callers but does not encrypt traffic; use a private
+    network or a TLS tunnel between hosts.
+    """
+
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        enhancers: Mapping[str, "StateEnhancer"],
+        address: str = "127.0.0.1:0",
+        max_concurrency: int | None = None,
+        max_frame_bytes: int = 64 * 1024 * 1024,
+        secret: str | bytes | None = None,
+        allowed_types: Sequence[type | tuple[str, ...]] = (),
+    ):
+        if not enhancers:
+            raise ValueError("NodeWorker needs at least one enhancer to serve")
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("`max_concurrency` must be at least 1")
+
+        self.enhancers = dict(enhancers)
+        self.max_concurrency = max_concurrency
+        self._address = WorkerAddress.parse(address)
+        self._secret = _encode_secret(secret)
+        if self._secret is None and self._address.path is None and not _is_loopback(self._address.host):
+            raise ValueError(
+                f"NodeWorker on non-loopback address {address!r} requires a `secret`; "
+                "bind 127.0.0.1 or a unix socket otherwise"
+            )
+        self._codec = _FrameCodec(max_frame_bytes, allowed_types)
+        self._server: asyncio.Server | None = None
+        self._slots: asyncio.Semaphore | None = None
+
+    @classmethod
+    def from_layout(cls, layout: type["GraphLayout"], **kwargs: Any) -> "NodeWorker":
+        """Build a worker serving the nodes of `layout` declared with a `RemoteOffload`.
+
+        Raises:
+            ValueError: If the layout declares no remote node.
+        """
+        nodes = layout().get_nodes()
+        enhancers = {
+            node.name: node.enhancer
+            for node in nodes
+            if isinstance(node, SimpleNode) and isinstance(node.offload, RemoteOffload)
+        }
+        if not enhancers:
+            raise ValueError(f"{layout.__name__} declares no node offloaded with RemoteOffload")
+        return cls(enhancers, **kwargs)
+
+    @property
+    def address(self) -> str:
+        """Return the address to give to `RemoteOffload`, with the bound port once started."""
+        if self._server is not None and self._address.path is None:
+            host, port = self._server.sockets[0].getsockname()[:2]
+            return str(WorkerAddress(host=self._address.host, port=port))
+        return str(self._address)
+
+    async def astart(self) -> str:
+        """Start listening and return the worker address."""
+        if self._server is None:
+            self._slots = asyncio.Semaphore(self.max_concurrency) if self.max_concurrency else None
+            if self._address.path is not None:
+                self._server = await asyncio.start_unix_server(self._serve, path=self._address.path)
+            else:
+                self._server = await asyncio.start_server(self._serve, self._address.host, self._address.port)
+            self.logger.info("NodeWorker serving %s on %s", sorted(self.enhancers), self.address)
+        return self.address
+
+    async def serve_forever(self) -> None:
+        await self.astart()
+        assert self._server is not None
+        await self._server.serve_forever()
+
+    async def aclose(self) -> None:
+        """Stop accepting connections and wait for the open ones to close."""
+        server, self._server = self._server, None
+        if server is not None:
+            server.close()
+            await server.wait_closed()
+
+    async def __aenter__(self) -> "NodeWorker":
+        await self.astart()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    def run(self) -> None:
+        """Serve until interrupted, for worker entry points."""
+        try:
+            asyncio.run(self.serve_forever())
+        except KeyboardInterrupt:
+            self.logger.info("NodeWorker on %s stopped", self.address)
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            if not await self._authenticate(reader, writer):
+                return
+            while True:
+                try:
+                    request = await self._codec.read(reader)
+                except FrameRejectedError as exc:
+                    self.logger.warning("NodeWorker rejected a request: %s", exc)
+                    await self._codec.write(writer, {"ok": False, "error_type": type(exc).__name__, "error": str(exc)})
+                    continue
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    return
+                await self._codec.write(writer, await self._handle(request))
+        finally:
+            await _close(writer)
+
+    async def _authenticate(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> bool:
+        challenge = secrets.token_bytes(_CHALLENGE_BYTES) if self._secret is not None else b""
+        writer.write(_GREETING.pack(_MAGIC, len(challenge)) + challenge)
+        await writer.drain()
+        if self._secret is None:
+            return True
+        try:
+            response = await reader.readexactly(hashlib.sha256().digest_size)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            return False
+        if hmac.compare_digest(response, _digest(self._secret, challenge)):
+            return True
+        self.logger.warning("NodeWorker rejected a caller with a wrong secret")
+        return False
+
+    async def _handle(self, request: Any) -> dict[str, Any]:
+        if not isinstance(request, dict) or request.get("op") not in ("call", "ping"):
+            return {"ok": False, "error_type": "ValueError", "error": f"Malformed request {request!r}"}
+        if request["op"] == "ping":
+            return {"ok": True, "nodes": sorted(self.enhancers)}
+
+        node = request.get("node")
+        enhancer = self.enhancers.get(node) if isinstance(node, str) else None
+        if enhancer is None:
+            return {"ok": False, "error_type": "KeyError", "error": f"Worker does not serve node {node!r}"}
+        try:
+            if self._slots is None:
+                update = await self._enhance(enhancer, request.get("state"))
+            else:
+                async with self._slots:
+                    update = await self._enhance(enhancer, request.get("state"))
+        except Exception as exc:
+            self.logger.exception("Remote node '%s' failed", node)
+            return {"ok": False, "error_type": type(exc).__name__, "error": str(exc)}
+        return {"ok": True, "update": update}
+
+    @staticmethod
+    async def _enhance(enhancer: "StateEnhancer", state: Any) -> Any:
+        if inspect.iscoroutinefunction(enhancer.enhance):
+            return await enhancer.enhance(state)
+        result = await asyncio.to_thread(enhancer.enhance, state)
+        return await result if inspect.isawaitable(result) else result
+
+
+@dataclass
+class _Worker:
+    address: WorkerAddress
+    in_flight: int = 0
+    failures: int = 0
+    unavailable_until: float = 0.0
+
+
+class RemoteOffload:
+    """Run `SimpleNode` enhancers on `NodeWorker`s instead of the graph process.
+
+    Mark the heavy nodes of a layout with the same instance:
+
+        remote = RemoteOffload(["gpu-1:8765", "gpu-2:8765"], retries=2)
+        SimpleNode(enhancer=GenerateAnswer(chain), name="generate", reads=["question", "context"], offload=remote)
+
+    Each call sends the node's `reads` keys (the whole state when unknown, or
+    the result of `project`) to the worker with the fewest calls in flight,
+    rotating among equally loaded ones, and returns the worker's update.
+    Connections are kept open per worker and event loop and reused.
+
+    A worker that cannot be reached, or drops the connection, is skipped for
+    `cooldown` seconds and the call is retried on another one up to `retries`
+    times, waiting `backoff` seconds doubled on each retry. A retried call
+    may already have run on the worker that failed, so remote nodes must be
+    safe to run twice. Errors raised by the enhancer itself are not retried:
+    they surface as `RemoteNodeError`, as does running out of retries.
+    `timeout` bounds each call and is not retried either.
+
+    `secret` must match the workers' secret, and `allowed_types` lists the
+    extra types the updates may carry, as on `NodeWorker`.
+
+    Remote nodes resolve to async callables, so graphs using them run through
+    the async API (`ainvoke`, `astream`).
+    """
+
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        workers: Sequence[str],
+        retries: int = 2,
+        backoff: float = 0.1,
+        cooldown: float = 5.0,
+        timeout: float | None = None,
+        max_idle_connections: int = 8,
+        max_frame_bytes: int = 64 * 1024 * 1024,
+        project: Callable[[Any], Any] | None = None,
+        secret: str | bytes | None = None,
+        allowed_types: Sequence[type | tuple[str, ...]] = (),
+    ):
+        if isinstance(workers, str) or not workers:
+            raise ValueError("`workers` must be a non-empty sequence of worker addresses")
+        if retries < 0:
+            raise ValueError("`retries` must not be negative")
+
+        self.workers = [_Worker(WorkerAddress.parse(address)) for address in workers]
+        self.retries = retries
+        self.backoff = backoff
+        self.cooldown = cooldown
+        self.timeout = timeout
+        self.max_idle_connections = max_idle_connections
+        self.project = project
+        self._secret = _encode_secret(secret)
+        self._codec = _FrameCodec(max_frame_bytes, allowed_types)
+        self._rotation = itertools.count()
+        self._idle: dict[
+            tuple[int, WorkerAddress], list[tuple[asyncio.StreamReader, asyncio.StreamWriter]]
+        ] = {}
+        self._wrappers: weakref.WeakKeyDictionary[SimpleNode, Callable[[Any], Any]] = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def wrap(self, node: SimpleNode) -> Callable[[Any], Any]:
+        """Return the async callable running `node` on the workers."""
+        with self._lock:
+            wrapper = self._wrappers.get(node)
+            if wrapper is not None:
+                return wrapper
+
+            name = node.name
+            reads = tuple(node.reads) if node.reads is not None else None
+
+            async def remote(state: Any) -> Any:
+                projection = self.project(state) if self.project is not None else project_state(state, reads)
+                return await self.call(name, projection)
+
+            remote.__name__ = name
+            self._wrappers[node] = remote
+
+        self.logger.info("Node %s runs on %s remote worker(s)", name, len(self.workers))
+        return remote
+
+    async def call(self, node: str, state: Any) -> Any:
+        """Run `node` on a worker with an already projected `state` and return its update.
+
+        Raises:
+            RemoteNodeError: If the enhancer failed in the worker or no worker
+                could be reached within `retries`.
+        """
+        request = {"op": "call", "node": node, "state": state}
+        response = await self._request(request, node)
+        if not response.get("ok"):
+            raise RemoteNodeError(
+                f"Remote node '{node}' failed: {response.get('error_type')}: {response.get('error')}",
+                node=node,
+                error_type=response.get("error_type"),
+            )
+        return response.get("update")
+
+    async def acheck(self) -> None:
+        """Ping every worker and check it serves every node wrapped so far.
+
+        Raises:
+            RemoteNodeError: If a worker is unreachable or misses a node.
+        """
+        expected = {node.name for node in list(self._wrappers.keys())}
+        for worker in self.workers:
+            try:
+                response = await self._send(worker, {"op": "ping"})
+            except _RETRYABLE as exc:
+                raise RemoteNodeError(f"Worker {worker.address} is unreachable: {exc}", node="*") from exc
+            missing = expected - set(response.get("nodes", ()))
+            if missing:
+                raise RemoteNodeError(f"Worker {worker.address} does not serve {sorted(missing)}", node="*")
+
+    async def aclose(self) -> None:
+        """Close the idle connections opened from the running event loop, and forget the others."""
+        loop_id = id(asyncio.get_running_loop())
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for (owner, _), connections in idle.items():
+            for _, writer in connections:
+                if owner == loop_id:
+                    await _close(writer)
+                else:
+                    writer.transport.abort()
+
+    async def _request(self, request: dict[str, Any], node: str) -> dict[str, Any]:
+        attempts = self.retries + 1
+        for attempt in range(attempts):
+            worker = self._pick()
+            try:
+                return await self._send(worker, request)
+            except _RETRYABLE as exc:
+                if isinstance(exc, TimeoutError):
+                    raise
+                worker.failures += 1
+                worker.unavailable_until = time.monotonic() + self.cooldown
+                self.logger.warning(
+                    "Worker %s failed running node '%s' (attempt %s/%s): %s",
+                    worker.address,
+                    node,
+                    attempt + 1,
+                    attempts,
+                    exc,
+                )
+                if attempt + 1 == attempts:
+                    raise RemoteNodeError(
+                        f"Remote node '{node}' failed on {attempts} attempt(s): {exc}",
+                        node=node,
+                    ) from exc
+                await asyncio.sleep(self.backoff * 2**attempt)
+        raise AssertionError("unreachable")
+
+    def _pick(self) -> _Worker:
+        """Return the available worker with the fewest calls in flight."""
+        now = time.monotonic()
+        with self._lock:
+            offset = next(self._rotation)
+            rotated = self.workers[offset % len(self.workers):] + self.workers[: offset % len(self.workers)]
+            available = [worker for worker in rotated if worker.unavailable_until <= now]
+            if not available:
+                return min(rotated, key=lambda worker: worker.unavailable_until)
+            return min(available, key=lambda worker: worker.in_flight)
+
+    async def _send(self, worker: _Worker, request: dict[str, Any]) -> dict[str, Any]:
+        reader, writer = await self._connect(worker.address)
+        worker.in_flight += 1
+        try:
+            await self._codec.write(writer, request)
+            response = await asyncio.wait_for(self._codec.read(reader), self.timeout)
+        except BaseException:
+            writer.transport.abort()
+            raise
+        finally:
+            worker.in_flight -= 1
+        worker.failures = 0
+        self._release(worker.address, reader, writer)
+        return response
+
+    async def _connect(self, address: WorkerAddress) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        key = (id(asyncio.get_running_loop()), address)
+        with self._lock:
+            connections = self._idle.get(key, [])
+            while connections:
+                reader, writer = connections.pop()
+                if not writer.is_closing() and not reader.at_eof():
+                    return reader, writer
+        return await _open(address, self._secret)
+
+    def _release(self, address: WorkerAddress, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        key = (id(asyncio.get_running_loop()), address)
+        with self._lock:
+            connections = self._idle.setdefault(key, [])
+            if len(connections) < self.max_idle_connections:
+                connections.append((reader, writer))
+                return
+        writer.close()
+
+
+def _load_layout(reference: str) -> type["GraphLayout"]:
+    module_name, _, attribute = reference.partition(":")
+    if not attribute:
+        raise ValueError(f"Layout must be given as 'module:Class', got {reference!r}")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Command line entry point: `python -m frankstate.runtime.remote module:Layout`."""
+    parser = argparse.ArgumentParser(
+        prog="python -m frankstate.runtime.remote",
+        description="Serve the remote nodes of a GraphLayout to RemoteOffload callers.",
+        epilog=f"The shared secret of the worker is read from ${SECRET_ENV}.",
+    )
+    parser.add_argument("layout", help="Layout class as 'module:Class'.")
+    parser.add_argument("--address", default="127.0.0.1:8765", help="'host:port' or 'unix:/path/to.sock'.")
+    parser.add_argument("--max-concurrency", type=int, default=None, help="Node calls run at the same time.")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    NodeWorker.from_layout(
+        _load_layout(args.layout),
+        address=args.address,
+        max_concurrency=args.max_concurrency,
+        secret=os.environ.get(SECRET_ENV) or None,
+    ).run()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
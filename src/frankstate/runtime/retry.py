@@ -0,0 +1,198 @@
+import functools
+import inspect
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from langgraph.runtime import get_runtime
+from langgraph.types import RetryPolicy, default_retry_on
+
+# Set on a failure whose retry the budget refused, so `retry_on` lets it surface.
+_DENIED_ATTR = "__frankstate_retry_denied__"
+
+
+def _current_attempt() -> int | None:
+    """Return the 1-based attempt of the running node, when LangGraph exposes it."""
+    try:
+        info = get_runtime().execution_info
+    except RuntimeError:
+        return None
+    return info.node_attempt if info is not None else None
+
+
+class RetryBudget:
+    """Token bucket shared by the retry policies calling the same backend.
+
+    Every retry takes one token; tokens refill at `rate` per second up to
+    `capacity`. When the bucket is empty, failures are no longer retried and
+    surface immediately, so a degraded backend sees at most `capacity` extra
+    calls plus `rate` per second however many runs and nodes are failing:
+
+        openai_budget = RetryBudget("openai", rate=2.0, capacity=20)
+        SimpleNode(enhancer=Generate(chain), name="generate", retry=NodeRetry(budget=openai_budget))
+
+    Attributes:
+        name: Backend name, used in logs.
+        rate: Tokens added per second.
+        capacity: Maximum tokens, also the initial amount.
+        granted: Retries allowed so far.
+        denied: Retries refused because the bucket was empty.
+    """
+
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    def __init__(self, name: str, rate: float, capacity: float):
+        if rate < 0:
+            raise ValueError("`rate` must not be negative")
+        if capacity < 1:
+            raise ValueError("`capacity` must be at least 1")
+
+        self.name = name
+        self.rate = rate
+        self.capacity = capacity
+        self.granted = 0
+        self.denied = 0
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        """Return the tokens currently available."""
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Take `tokens` if available and return whether the retry may proceed."""
+        with self._lock:
+            self._refill()
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                self.granted += 1
+                return True
+            self.denied += 1
+            denied = self.denied
+
+        if denied == 1 or denied % 100 == 0:
+            self.logger.warning("Retry budget '%s' exhausted; %s retries denied so far", self.name, denied)
+        return False
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+
+@dataclass(frozen=True)
+class NodeRetry:
+    """Retry policy of a `SimpleNode` or `CommandNode`.
+
+    It is handed to LangGraph as the node's `RetryPolicy`, so retries run
+    inside the Pregel task with LangGraph's exponential backoff: `max_attempts`
+    tries in total, waiting `initial_interval * backoff_factor ** n` seconds
+    capped at `max_interval`, plus up to one second of random jitter when
+    `jitter` is set.
+
+    The budget is charged by the node callable itself, wrapped with `wrap()`,
+    because only the node knows its attempt number: a failure takes a token
+    only when another attempt will actually run, so final failures and
+    `max_attempts=1` policies never drain the shared bucket.
+
+    Attributes:
+        retry_on: Exception classes worth retrying. `None` keeps LangGraph's
+            default, which retries network and 5xx errors but not programming
+            errors.
+        max_attempts: Attempts including the first one.
+        initial_interval: Seconds before the first retry.
+        backoff_factor: Multiplier applied to the interval after each retry.
+        max_interval: Upper bound of the interval in seconds.
+        jitter: Whether to add random jitter to each interval.
+        budget: Shared `RetryBudget` drawn on by every retry. Without tokens
+            left the failure is raised instead of retried.
+    """
+
+    retry_on: tuple[type[Exception], ...] | None = None
+    max_attempts: int = 3
+    initial_interval: float = 0.5
+    backoff_factor: float = 2.0
+    max_interval: float = 30.0
+    jitter: bool = True
+    budget: RetryBudget | None = field(default=None, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise ValueError("`max_attempts` must be at least 1")
+        if self.initial_interval < 0 or self.max_interval < 0:
+            raise ValueError("Retry intervals must not be negative")
+        if self.backoff_factor < 1:
+            raise ValueError("`backoff_factor` must be at least 1")
+        if self.retry_on is not None:
+            object.__setattr__(self, "retry_on", tuple(self.retry_on))
+
+    def to_retry_policy(self, node: str) -> RetryPolicy:
+        """Return the LangGraph `RetryPolicy` of `node`."""
+        return RetryPolicy(
+            initial_interval=self.initial_interval,
+            backoff_factor=self.backoff_factor,
+            max_interval=self.max_interval,
+            max_attempts=self.max_attempts,
+            jitter=self.jitter,
+            retry_on=self._build_retry_on(node),
+        )
+
+    def wrap(self, func: Callable[..., Any], node: str) -> Callable[..., Any]:
+        """Return `func` charging the budget for each failure that will be retried.
+
+        Without a budget, `func` is returned unchanged.
+        """
+        if self.budget is None:
+            return func
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def acharged(*args: Any, **kwargs: Any) -> Any:
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as exc:
+                    self._charge(exc, node)
+                    raise
+
+            return acharged
+
+        @functools.wraps(func)
+        def charged(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return func(*args, **kwargs)
+            except Exception as exc:
+                self._charge(exc, node)
+                raise
+
+        return charged
+
+    def _matches(self, exc: Exception) -> bool:
+        return isinstance(exc, self.retry_on) if self.retry_on is not None else default_retry_on(exc)
+
+    def _charge(self, exc: Exception, node: str) -> None:
+        budget = self.budget
+        if budget is None or not self._matches(exc):
+            return
+        attempt = _current_attempt()
+        if attempt is not None and attempt >= self.max_attempts:
+            return
+        if not budget.try_acquire():
+            RetryBudget.logger.info(
+                "Not retrying node '%s' after %s: retry budget '%s' is empty", node, type(exc).__name__, budget.name
+            )
+            setattr(exc, _DENIED_ATTR, True)
+
+    def _build_retry_on(self, node: str) -> Callable[[Exception], bool]:
+        def should_retry(exc: Exception) -> bool:
+            return self._matches(exc) and not getattr(exc, _DENIED_ATTR, False)
+
+        return should_retry
+
@@ -0,0 +1,94 @@
+import threading
+from collections.abc import Hashable
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+_current_run_scope: ContextVar["RunScope | None"] = ContextVar("frankstate_run_scope", default=None)
+
+
+@dataclass
+class RunScope:
+    """Mutable per-run storage shared by every node and router of one graph run.
+
+    LangGraph does not expose a per-run object to node or router callables.
+    `RunScopeHandler` creates one scope per root run and makes it available
+    through `current_run_scope()`, so runtime features can keep per-run
+    bookkeeping without adding keys to the state schema.
+    """
+
+    run_id: UUID | None = None
+    counters: dict[Hashable, int] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def increment(self, key: Hashable) -> int:
+        """Increase the counter for `key` and return its new value."""
+        with self._lock:
+            value = self.counters.get(key, 0) + 1
+            self.counters[key] = value
+            return value
+
+
+def current_run_scope() -> RunScope | None:
+    """Return the scope of the graph run executing the caller, if any."""
+    return _current_run_scope.get()
+
+
+def set_run_scope(scope: RunScope | None) -> Any:
+    """Bind `scope` to the current context and return the reset token."""
+    return _current_run_scope.set(scope)
+
+
+def reset_run_scope(token: Any) -> None:
+    """Restore the scope bound before the matching `set_run_scope()` call."""
+    _current_run_scope.reset(token)
+
+
+class RunScopeHandler(BaseCallbackHandler):
+    """Callback handler that binds a `RunScope` to every run of a compiled graph.
+
+    Every chain started under a known run inherits its parent's scope; a chain
+    whose parent is unknown (the graph root, or the graph used as a subgraph)
+    starts a new one. The scope is re-bound on each chain start, which runs
+    inline in the context that later executes the node or router, so stale
+    bindings left in a caller's context are never observed.
+
+    `WorkflowBuilder` attaches it with `compiled.with_config(callbacks=[...])`
+    only when a layout needs per-run state.
+    """
+
+    run_inline = True
+
+    def __init__(self) -> None:
+        self.scopes: dict[UUID, RunScope] = {}
+
+    def on_chain_start(
+        self,
+        serialized: dict[str, Any] | None,
+        inputs: Any,
+        *,
+        run_id: UUID,
+        parent_run_id: UUID | None = None,
+        **kwargs: Any,
+    ) -> None:
+        scope = self.scopes.get(parent_run_id) if parent_run_id is not None else None
+        if scope is None:
+            scope = RunScope(run_id=run_id)
+        self.scopes[run_id] = scope
+        set_run_scope(scope)
+
+    def on_chain_end(self, outputs: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._release(run_id)
+
+    def on_chain_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._release(run_id)
+
+    def _release(self, run_id: UUID) -> None:
+        scope = self.scopes.pop(run_id, None)
+        # The root run ends in the caller's context; unbind its scope there so
+        # later unscoped work in the same context does not observe it.
+        if scope is not None and scope.run_id == run_id and current_run_scope() is scope:
+            set_run_scope(None)
@@ -0,0 +1,191 @@
+import asyncio
+import logging
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass, field
+from typing import Any
+
+RuntimeKey = tuple[type, Hashable]
+
+
+@dataclass
+class _SharedRuntime:
+    runtime: dict[str, Any]
+    dispose: Callable[[dict[str, Any]], object] | None
+    adispose: Callable[[dict[str, Any]], Awaitable[object]] | None
+    references: int = 0
+    start: asyncio.Future[Any] | None = None
+
+    @property
+    def started(self) -> bool:
+        return (
+            self.start is not None
+            and self.start.done()
+            and not self.start.cancelled()
+            and self.start.exception() is None
+        )
+
+
+@dataclass(frozen=True)
+class SharedRuntimeInfo:
+    """A runtime held by a `RuntimeRegistry`.
+
+    Attributes:
+        layout: Name of the layout class that built the runtime.
+        key: `GraphLayout.runtime_key()` the runtime was built for.
+        references: Layout instances currently holding the runtime.
+        started: Whether the runtime was started successfully.
+        keys: Runtime keys, as returned by `build_runtime()`.
+    """
+
+    layout: str
+    key: Hashable
+    references: int
+    started: bool
+    keys: tuple[str, ...] = field(default=())
+
+
+class RuntimeRegistry:
+    """Reference-counted store of the runtimes built by shared layouts.
+
+    A `GraphLayout` declaring `share_runtime = True` asks the registry for its
+    runtime instead of calling `build_runtime()` itself. The first instance for
+    a given layout class and `runtime_key()` builds it; later instances, such
+    as the layout of another `WorkflowBuilder` compiling a different graph
+    variant, receive the same builders, retrievers and clients. Each holder
+    calls `release()` once, usually through `WorkflowBuilder.close()`, and the
+    runtime is dropped and disposed when the last holder releases it.
+
+    Building happens under the registry lock, so concurrent acquisitions of
+    the same key never build twice. Likewise `astart()` runs the start
+    coroutine of a runtime once, however many holders start it.
+    """
+
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    def __init__(self):
+        self._entries: dict[RuntimeKey, _SharedRuntime] = {}
+        self._lock = threading.RLock()
+
+    def acquire(
+        self,
+        layout: type,
+        key: Hashable,
+        factory: Callable[[], dict[str, Any]],
+        dispose: Callable[[dict[str, Any]], object] | None = None,
+        adispose: Callable[[dict[str, Any]], Awaitable[object]] | None = None,
+    ) -> dict[str, Any]:
+        """Return the runtime of `layout` for `key`, building it with `factory` if needed.
+
+        `dispose` and `adispose` are kept from the acquisition that built the
+        runtime; once the last holder releases it, `release()` calls
+        `dispose` and `arelease()` awaits `adispose`, or calls `dispose`
+        when it is not given.
+        """
+        with self._lock:
+            entry = self._entries.get((layout, key))
+            if entry is None:
+                entry = _SharedRuntime(runtime=factory(), dispose=dispose, adispose=adispose)
+                self._entries[(layout, key)] = entry
+                self.logger.info("Built shared runtime for %s", layout.__name__)
+            entry.references += 1
+            return entry.runtime
+
+    async def astart(
+        self,
+        layout: type,
+        key: Hashable,
+        start: Callable[[dict[str, Any]], Awaitable[object]],
+    ) -> None:
+        """Run `start` on the runtime of `layout` for `key` unless it already ran.
+
+        Concurrent callers wait for the same start. A failed start is raised
+        to every waiting caller and retried by the next call.
+
+        Raises:
+            RuntimeError: If no runtime is held for `layout` and `key`.
+        """
+        with self._lock:
+            entry = self._get(layout, key)
+            if entry.start is None:
+                entry.start = asyncio.ensure_future(start(entry.runtime))
+            pending = entry.start
+
+        try:
+            await asyncio.shield(pending)
+        except BaseException:
+            with self._lock:
+                if entry.start is pending and pending.done():
+                    entry.start = None
+            raise
+
+    def release(self, layout: type, key: Hashable) -> bool:
+        """Drop one reference to a runtime and return whether it was disposed.
+
+        Raises:
+            RuntimeError: If no runtime is held for `layout` and `key`.
+        """
+        entry = self._release(layout, key)
+        if entry is None:
+            return False
+        if entry.dispose is not None:
+            entry.dispose(entry.runtime)
+        return True
+
+    async def arelease(self, layout: type, key: Hashable) -> bool:
+        """Drop one reference to a runtime, awaiting its disposal when it is the last one.
+
+        Raises:
+            RuntimeError: If no runtime is held for `layout` and `key`.
+        """
+        entry = self._release(layout, key)
+        if entry is None:
+            return False
+        if entry.adispose is not None:
+            await entry.adispose(entry.runtime)
+        elif entry.dispose is not None:
+            entry.dispose(entry.runtime)
+        return True
+
+    def references(self, layout: type, key: Hashable) -> int:
+        """Return how many layout instances hold the runtime of `layout` for `key`."""
+        with self._lock:
+            entry = self._entries.get((layout, key))
+            return entry.references if entry is not None else 0
+
+    def entries(self) -> list[SharedRuntimeInfo]:
+        """Return the runtimes currently held, in build order."""
+        with self._lock:
+            return [
+                SharedRuntimeInfo(
+                    layout=layout.__name__,
+                    key=key,
+                    references=entry.references,
+                    started=entry.started,
+                    keys=tuple(entry.runtime),
+                )
+                for (layout, key), entry in self._entries.items()
+            ]
+
+    def _get(self, layout: type, key: Hashable) -> _SharedRuntime:
+        """Return the entry of `layout` for `key`; call with the lock held."""
+        entry = self._entries.get((layout, key))
+        if entry is None:
+            raise RuntimeError(f"No shared runtime is held for {layout.__name__} with key {key!r}")
+        return entry
+
+    def _release(self, layout: type, key: Hashable) -> _SharedRuntime | None:
+        """Drop one reference and return the entry once nobody holds it anymore."""
+        with self._lock:
+            entry = self._get(layout, key)
+            entry.references -= 1
+            if entry.references > 0:
+                return None
+            del self._entries[(layout, key)]
+
+        self.logger.info("Released shared runtime for %s", layout.__name__)
+        return entry
+
+
+# Registry used by `GraphLayout` unless a layout sets `runtime_registry`.
+shared_runtimes = RuntimeRegistry()
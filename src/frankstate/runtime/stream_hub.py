@@ -0,0 +1,302 @@
+import asyncio
+import logging
+from collections import deque
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass, replace
+from typing import Any, Literal
+
+from langchain_core.messages import BaseMessageChunk
+from langchain_core.runnables import RunnableConfig
+
+OverflowPolicy = Literal["block", "drop_oldest", "drop_newest", "coalesce"]
+OVERFLOW_POLICIES = ("block", "drop_oldest", "drop_newest", "coalesce")
+
+
+@dataclass(frozen=True)
+class StreamEvent:
+    """One chunk of a graph stream, as delivered to subscribers.
+
+    Attributes:
+        mode: LangGraph stream mode that produced the chunk, such as
+            `"updates"`, `"messages"` or `"custom"`.
+        data: The chunk, exactly as `astream()` yields it for that mode.
+        namespace: Subgraph path of the chunk, empty for the root graph.
+        seq: Position of the chunk in the run, starting at 0. A coalesced
+            event keeps the position of its latest chunk.
+    """
+
+    mode: str
+    data: Any
+    namespace: tuple[str, ...] = ()
+    seq: int = 0
+
+
+def coalesce_events(buffered: StreamEvent, event: StreamEvent) -> StreamEvent | None:
+    """Merge `event` into `buffered` when both carry the same kind of partial output.
+
+    - `"updates"` of the same node are merged key by key, concatenating list
+      values as the `add_messages` reducer does and keeping the latest value
+      otherwise.
+    - `"messages"` chunks of the same message are added together.
+
+    Returns `None` when the events cannot be merged.
+    """
+    if buffered.mode != event.mode or buffered.namespace != event.namespace:
+        return None
+
+    if event.mode == "updates" and isinstance(buffered.data, dict) and isinstance(event.data, dict):
+        if buffered.data.keys() != event.data.keys() or len(event.data) != 1:
+            return None
+        node = next(iter(event.data))
+        previous, latest = buffered.data[node], event.data[node]
+        if not isinstance(previous, dict) or not isinstance(latest, dict):
+            return None
+        merged = dict(previous)
+        for key, value in latest.items():
+            old = merged.get(key)
+            merged[key] = old + value if isinstance(old, list) and isinstance(value, list) else value
+        return replace(event, data={node: merged})
+
+    if event.mode == "messages":
+        (previous_chunk, _), (chunk, metadata) = buffered.data, event.data
+        if (
+            isinstance(previous_chunk, BaseMessageChunk)
+            and isinstance(chunk, BaseMessageChunk)
+            and previous_chunk.id is not None
+            and previous_chunk.id == chunk.id
+        ):
+            return replace(event, data=(previous_chunk + chunk, metadata))
+    return None
+
+
+class StreamSubscription:
+    """Bounded queue of the events of one `StreamHub` consumer.
+
+    Iterate it with `async for`; iteration ends when the run ends, and
+    re-raises the run's exception if it failed. A consumer leaving early must
+    call `close()`, so a `"block"` subscription stops holding the run back.
+
+    Attributes:
+        name: Consumer name, used in logs.
+        modes: Stream modes delivered to this consumer, or `None` for all.
+        maxsize: Maximum number of buffered events.
+        policy: What happens to a new event when the buffer is full.
+        delivered: Events handed to the consumer.
+        dropped: Events discarded by the overflow policy.
+        coalesced: Events merged into a buffered one.
+    """
+
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        name: str,
+        modes: frozenset[str] | None,
+        maxsize: int,
+        policy: OverflowPolicy,
+        coalesce: Callable[[StreamEvent, StreamEvent], StreamEvent | None],
+    ):
+        self.name = name
+        self.modes = modes
+        self.maxsize = maxsize
+        self.policy = policy
+        self.delivered = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self._coalesce = coalesce
+        self._buffer: deque[StreamEvent] = deque()
+        self._changed = asyncio.Event()
+        self._finished = False
+        self._closed = False
+        self._error: BaseException | None = None
+
+    @property
+    def closed(self) -> bool:
+        """Return whether the consumer stopped listening."""
+        return self._closed
+
+    def close(self) -> None:
+        """Stop receiving events and discard the buffered ones."""
+        self._closed = True
+        self._buffer.clear()
+        self._changed.set()
+
+    def __aiter__(self) -> "StreamSubscription":
+        return self
+
+    async def __anext__(self) -> StreamEvent:
+        while not self._buffer:
+            if self._closed or self._finished:
+                if self._error is not None and not self._closed:
+                    error, self._error = self._error, None
+                    raise error
+                raise StopAsyncIteration
+            self._changed.clear()
+            await self._changed.wait()
+
+        event = self._buffer.popleft()
+        self.delivered += 1
+        self._changed.set()
+        return event
+
+    def wants(self, mode: str) -> bool:
+        return not self._closed and (self.modes is None or mode in self.modes)
+
+    async def put(self, event: StreamEvent) -> None:
+        """Buffer `event`, applying the overflow policy when the buffer is full."""
+        while len(self._buffer) >= self.maxsize and not self._closed:
+            if self.policy == "block":
+                self._changed.clear()
+                await self._changed.wait()
+                continue
+            if self.policy == "coalesce":
+                merged = self._coalesce(self._buffer[-1], event)
+                if merged is not None:
+                    self._buffer[-1] = merged
+                    self.coalesced += 1
+                    return
+            if self.policy == "drop_newest":
+                self._drop()
+                return
+            self._buffer.popleft()
+            self._drop()
+            break
+
+        if self._closed:
+            return
+        self._buffer.append(event)
+        self._changed.set()
+
+    def finish(self, error: BaseException | None = None) -> None:
+        """Mark the end of the run; buffered events are still delivered."""
+        self._finished = True
+        self._error = error
+        self._changed.set()
+
+    def _drop(self) -> None:
+        self.dropped += 1
+        if self.dropped == 1:
+            self.logger.warning(
+                "Stream consumer '%s' is too slow; dropping events (policy %s)", self.name, self.policy
+            )
+
+
+class StreamHub:
+    """Fan the stream of one graph run out to several consumers through bounded queues.
+
+    The hub runs `astream()` once with every requested stream mode and hands
+    each chunk to the subscriptions interested in its mode. Memory stays
+    bounded by the subscriptions' `maxsize`, whatever the length of the run:
+
+        hub = StreamHub(graph, stream_mode=("updates", "messages", "custom"))
+        ui = hub.subscribe("ui", modes=["messages"], maxsize=256, policy="coalesce")
+        trace = hub.subscribe("trace", policy="block")
+        await asyncio.gather(hub.run(inputs, config), send_to_ui(ui), record(trace))
+
+    When a consumer falls `maxsize` events behind, its `policy` decides:
+
+    - `"block"`: the run waits for the consumer (backpressure).
+    - `"drop_oldest"` / `"drop_newest"`: the oldest buffered event, or the new
+      one, is discarded.
+    - `"coalesce"`: the new event is merged into the last buffered one with
+      `coalesce` (by default `coalesce_events`: node updates and message
+      chunks), or the oldest event is dropped when they cannot be merged.
+
+    A hub serves a single run; create one per run.
+    """
+
+    logger: logging.Logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        graph: Any,
+        stream_mode: str | Sequence[str] = ("updates", "messages", "custom"),
+        subgraphs: bool = False,
+    ):
+        self.graph = graph
+        self.stream_mode = stream_mode
+        self.subgraphs = subgraphs
+        self.modes: tuple[str, ...] = (stream_mode,) if isinstance(stream_mode, str) else tuple(stream_mode)
+        if not self.modes:
+            raise ValueError("`stream_mode` must name at least one stream mode")
+        self.subscriptions: list[StreamSubscription] = []
+        self.events = 0
+        self._started = False
+
+    def subscribe(
+        self,
+        name: str,
+        modes: Iterable[str] | None = None,
+        maxsize: int = 100,
+        policy: OverflowPolicy = "block",
+        coalesce: Callable[[StreamEvent, StreamEvent], StreamEvent | None] = coalesce_events,
+    ) -> StreamSubscription:
+        """Register a consumer before `run()` and return its subscription.
+
+        Raises:
+            ValueError: If `modes` are not streamed by the hub, or `maxsize`
+                or `policy` are invalid.
+            RuntimeError: If the run already started.
+        """
+        if self._started:
+            raise RuntimeError("Subscribe before StreamHub.run() starts")
+        if maxsize < 1:
+            raise ValueError("`maxsize` must be at least 1")
+        if policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"`policy` must be one of {OVERFLOW_POLICIES}, got {policy!r}")
+        selected = frozenset(modes) if modes is not None else None
+        if selected is not None and not selected <= set(self.modes):
+            raise ValueError(f"Subscription '{name}' asks for modes {sorted(selected - set(self.modes))} not streamed by the hub")
+
+        subscription = StreamSubscription(name, selected, maxsize, policy, coalesce)
+        self.subscriptions.append(subscription)
+        return subscription
+
+    async def run(self, input: Any, config: RunnableConfig | None = None, **kwargs: Any) -> int:
+        """Stream one run to the subscribers and return the number of chunks streamed.
+
+        Extra keyword arguments are forwarded to `astream()`. Subscriptions
+        are finished when the run ends, with the run's exception if it failed.
+
+        Raises:
+            RuntimeError: If the hub already ran.
+        """
+        if self._started:
+            raise RuntimeError("A StreamHub serves a single run; create one per run")
+        self._started = True
+
+        if self.subgraphs:
+            kwargs["subgraphs"] = True
+        error: BaseException | None = None
+        try:
+            # LangGraph only treats a list, not any sequence, as several stream modes.
+            stream_mode = self.stream_mode if isinstance(self.stream_mode, str) else list(self.modes)
+            async for chunk in self.graph.astream(input, config, stream_mode=stream_mode, **kwargs):
+                await self.publish(*self._split(chunk))
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            for subscription in self.subscriptions:
+                subscription.finish(error if isinstance(error, Exception) else None)
+        return self.events
+
+    async def publish(self, mode: str, data: Any, namespace: tuple[str, ...] = ()) -> None:
+        """Hand one chunk to the interested subscriptions."""
+        event = StreamEvent(mode=mode, data=data, namespace=namespace, seq=self.events)
+        self.events += 1
+        for subscription in self.subscriptions:
+            if subscription.wants(mode):
+                await subscription.put(event)
+
+    def _split(self, chunk: Any) -> tuple[str, Any, tuple[str, ...]]:
+        """Return `(mode, data, namespace)` for any shape `astream()` yields."""
+        namespace: tuple[str, ...] = ()
+        if self.subgraphs:
+            namespace, chunk = tuple(chunk[0]), chunk[1:]
+            if isinstance(self.stream_mode, str):
+                (chunk,) = chunk
+        if isinstance(self.stream_mode, str):
+            return self.stream_mode, chunk, namespace
+        mode, data = chunk
+        return mode, data, namespace
@@ -1,13 +1,35 @@
+import asyncio
 import logging
-from typing import Any
+from collections.abc import Iterable
+from contextlib import nullcontext
+from typing import Any, Literal
 
 from langgraph.checkpoint.base import BaseCheckpointSaver
-from langgraph.graph import StateGraph
-from langgraph.graph.state import CompiledStateGraph
+from langgraph.graph import END, StateGraph
+from typing_extensions import is_typeddict
 
 from frankstate.entity.graph_layout import GraphLayout
+from frankstate.entity.node import SimpleNode
+from frankstate.entity.runnable_builder import instrument_builders
+from frankstate.instrumentation.hooks import (
+    ExecutionHook,
+    ExecutionHookHandler,
+    validate_hooks,
+)
 from frankstate.managers.edge_manager import EdgeManager
 from frankstate.managers.node_manager import NodeManager
+from frankstate.optimizers.chain_fusion import ChainFusion, ChainFusionReport
+from frankstate.optimizers.parallel_scheduler import (
+    EdgeConfig,
+    ParallelizationReport,
+    ParallelScheduler,
+)
+from frankstate.runtime.compiled_graph import CompiledLayoutGraph
+from frankstate.runtime.dag_engine import DagEngine
+from frankstate.runtime.offload import ProcessPoolOffload
+from frankstate.runtime.run_scope import RunScopeHandler
+
+ENGINES = ("langgraph", "dag")
 
 
 class WorkflowBuilder:
@@ -20,6 +42,14 @@ class WorkflowBuilder:
     1. Instantiate the builder with a layout and a state schema.
     2. Call `compile()`.
     3. Invoke the returned compiled graph from notebooks, services or apps.
+
+    Long-running services can use the builder as an async context manager so
+    the layout's pooled resources are started, health-checked and closed
+    with the service:
+
+        async with WorkflowBuilder(config=MyLayout, state_schema=State) as builder:
+            graph = builder.compile()
+            ...
     """
 
     logger: logging.Logger = logging.getLogger(__name__)
@@ -31,6 +61,12 @@ class WorkflowBuilder:
         checkpointer: BaseCheckpointSaver | None = None,
         input_schema: type[Any] | None = None,
         output_schema: type[Any] | None = None,
+        parallelize: bool = False,
+        fuse_chains: bool = False,
+        preserve_node_events: bool = False,
+        fusion_exclude: Iterable[str] | None = None,
+        engine: Literal["langgraph", "dag"] = "langgraph",
+        hooks: Iterable[ExecutionHook] | None = None,
     ):
         """Create a workflow builder for a graph layout.
 
@@ -40,7 +76,34 @@ class WorkflowBuilder:
             checkpointer: Optional LangGraph checkpoint saver.
             input_schema: Optional input schema forwarded to `StateGraph`.
             output_schema: Optional output schema forwarded to `StateGraph`.
+            parallelize: When `True`, run the `ParallelScheduler` pass so
+                chained nodes with non-conflicting `reads`/`writes` share a
+                superstep. The plan is exposed as `parallelization_report`.
+            fuse_chains: When `True`, run the `ChainFusion` pass so linear
+                chains of `SimpleNode`s execute as one node and one superstep.
+                Requires a `TypedDict` state schema. The result is exposed as
+                `fusion_report`.
+            preserve_node_events: With `fuse_chains`, also emit each inner
+                node update as a custom stream event keyed by node name.
+            fusion_exclude: Node names that must never be fused, such as
+                nodes calling `interrupt()`.
+            engine: `"langgraph"` compiles a regular `CompiledStateGraph`.
+                `"dag"` returns a `DagEngine` that runs acyclic layouts in
+                process, falling back to LangGraph when the layout needs
+                Pregel features. The fallback reason is exposed as
+                `engine_fallback_reason`.
+            hooks: `ExecutionHook` instruments observing every run of the
+                compiled graph, such as `LoopLagMonitor`, or steering it, such
+                as `DegradationPolicy`. Hooks rely on LangGraph callbacks, so
+                `engine="dag"` falls back to LangGraph when hooks are given.
         """
+        if engine not in ENGINES:
+            raise ValueError(f"`engine` must be one of {ENGINES}, got {engine!r}")
+        if parallelize and fuse_chains:
+            raise ValueError("`parallelize` and `fuse_chains` rewrite the same chains; enable only one of them")
+        if fuse_chains and not is_typeddict(state_schema):
+            raise ValueError("`fuse_chains` requires a TypedDict state schema")
+
         self.workflow: StateGraph = StateGraph(
             state_schema=state_schema,
             input_schema=input_schema,
@@ -56,6 +119,16 @@ class WorkflowBuilder:
         self.config: GraphLayout = config()
         self.edge_manager: EdgeManager = EdgeManager()
         self.node_manager: NodeManager = NodeManager()
+        self.parallelize: bool = parallelize
+        self.parallelization_report: ParallelizationReport | None = None
+        self.fuse_chains: bool = fuse_chains
+        self.preserve_node_events: bool = preserve_node_events
+        self.fusion_exclude: tuple[str, ...] = tuple(fusion_exclude or ())
+        self.fusion_report: ChainFusionReport | None = None
+        self.engine: str = engine
+        self.engine_fallback_reason: str | None = None
+        self.hooks: tuple[ExecutionHook, ...] = validate_hooks(hooks)
+        self._static_edges: tuple[EdgeConfig, ...] = ()
         self._workflow_configured: bool = False
 
         self.logger.info(
@@ -63,11 +136,89 @@ class WorkflowBuilder:
             config.__name__,
         )
 
-    def compile(self) -> CompiledStateGraph:
-        """Configure nodes and edges declared in the layout, then compile the graph."""
+    def compile(self) -> CompiledLayoutGraph | DagEngine:
+        """Configure nodes and edges declared in the layout, then compile the graph.
+
+        The result is a `CompiledLayoutGraph`, a `CompiledStateGraph` that keeps
+        `frankstate` runtime handlers active when callers pass their own
+        callbacks. With `engine="dag"`, the compiled graph is wrapped in a
+        `DagEngine` unless the layout needs LangGraph's runtime.
+        """
         self._ensure_workflow_configured()
-        return self.workflow.compile(checkpointer=self.memory)
-    
+        graph = CompiledLayoutGraph.from_compiled(self.workflow.compile(checkpointer=self.memory))
+        callbacks: list[Any] = []
+        if self.edge_manager.get_budgeted_edges() or self.hooks:
+            # Loop budgets and hooks guarding routers keep per-run state in the run scope.
+            callbacks.append(RunScopeHandler())
+        if self.hooks:
+            callbacks.append(ExecutionHookHandler(self.hooks))
+        if callbacks:
+            graph = graph.with_config(callbacks=callbacks)
+        if self.engine != "dag":
+            return graph
+
+        reason = "execution hooks need LangGraph callbacks" if self.hooks else DagEngine.find_unsupported_feature(
+            self.node_manager,
+            self.edge_manager,
+            self._static_edges,
+            state_schema=self.workflow.state_schema,
+            checkpointer=self.memory,
+        )
+        if reason is not None:
+            self.engine_fallback_reason = reason
+            self.logger.warning("DagEngine unavailable, falling back to LangGraph: %s", reason)
+            return graph
+
+        return DagEngine(self.workflow, graph, self.node_manager, self.edge_manager, self._static_edges)
+
+    def close(self) -> None:
+        """Release the layout runtime, closing it once no other layout shares it.
+
+        See `GraphLayout.release_runtime()`. The process pools of offloaded
+        nodes are shut down too. Graphs compiled by this builder keep working,
+        restarting the pools if called again; call it when the builder's
+        graphs are retired.
+        """
+        self._shutdown_offloads()
+        self.config.release_runtime()
+
+    async def astart(self) -> None:
+        """Start and health-check the layout runtime; see `GraphLayout.astart()`."""
+        await self.config.astart()
+
+    async def acheck(self) -> None:
+        """Health-check the layout runtime; see `GraphLayout.acheck()`."""
+        await self.config.acheck()
+
+    async def aclose(self) -> None:
+        """Asynchronous `close()`, closing the runtime with `GraphLayout.aclose_runtime()`."""
+        await asyncio.to_thread(self._shutdown_offloads)
+        await self.config.aclose()
+
+    def _shutdown_offloads(self) -> None:
+        if not self._workflow_configured:
+            return
+        offloads = {
+            id(node.offload): node.offload
+            for node in self.node_manager.get_nodes()
+            if isinstance(node, SimpleNode) and isinstance(node.offload, ProcessPoolOffload)
+        }
+        for offload in offloads.values():
+            offload.shutdown()
+
+    def __enter__(self) -> "WorkflowBuilder":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "WorkflowBuilder":
+        await self.astart()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
     def display_graph(self, save: bool = False, filepath: str = "graph.png") -> None:
         """Render the compiled graph as a Mermaid PNG for notebook workflows.
 
@@ -110,14 +261,27 @@ class WorkflowBuilder:
         
     def _configure_workflow(self) -> None:
         """Assemble the workflow from the nodes and edges discovered in the layout."""
-        self._configure_nodes()
+        # Hooks attribute runs to builders by the name bound while the layout is declared.
+        with instrument_builders() if self.hooks else nullcontext():
+            self._configure_nodes()
+            self._configure_edges()
+        self._validate_loop_budgets()
+        if self.fuse_chains:
+            self._apply_chain_fusion()
+
         for node_args, node_kwargs in self.node_manager.configs_nodes():
             self.workflow.add_node(*node_args, **node_kwargs)
-
-        self._configure_edges()
-        for config in self.edge_manager.configs_edges():
-            self.workflow.add_edge(*config)
+        self._static_edges = self._resolve_static_edges()
+        for node_source, node_path in self._static_edges:
+            self.workflow.add_edge(
+                list(node_source) if isinstance(node_source, tuple) else node_source,
+                node_path,
+            )
+        for hook in self.hooks:
+            hook.bind(type(self.config).__name__, self.node_manager, self.edge_manager)
         for node_source, router, path_map in self.edge_manager.configs_conditional_edges():
+            for hook in self.hooks:
+                router, path_map = hook.wrap_router(node_source, router, path_map)
             self.workflow.add_conditional_edges(
                 node_source,
                 router,
@@ -126,6 +290,52 @@ class WorkflowBuilder:
 
         self._workflow_configured = True
     
+    def _validate_loop_budgets(self) -> None:
+        """Reject unknown budget exits and degraded routes, and warn about cycles without a loop budget."""
+        for edge in self.edge_manager.get_budgeted_edges():
+            if edge.exit_to != END and edge.exit_to not in self.node_manager.nodes:
+                raise ValueError(
+                    f"Loop budget on the edge from '{edge.node_source}' exits to unknown node '{edge.exit_to}'"
+                )
+        for edge in self.edge_manager.get_degradable_edges():
+            if edge.degrade_to != END and edge.degrade_to not in self.node_manager.nodes:
+                raise ValueError(
+                    f"The edge from '{edge.node_source}' degrades to unknown node '{edge.degrade_to}'"
+                )
+
+        for cycle in self.edge_manager.find_unbounded_cycles():
+            self.logger.warning(
+                "Cycle %s has no loop budget; it is bounded only by evaluator logic and the recursion limit",
+                list(cycle),
+            )
+
+    def _resolve_static_edges(self) -> tuple[EdgeConfig, ...]:
+        """Return static edges, rewired by the parallel scheduler when enabled."""
+        if not self.parallelize:
+            return self.edge_manager.configs_edges()
+
+        report = ParallelScheduler(self.node_manager, self.edge_manager).plan()
+        self.parallelization_report = report
+        self.logger.info("Parallelization plan:\n%s", report.summary())
+        return report.edges
+
+    def _apply_chain_fusion(self) -> None:
+        """Replace the managers' content with the fused nodes and rewired edges."""
+        report = ChainFusion(
+            self.node_manager,
+            self.edge_manager,
+            channels=self.workflow.channels,
+            preserve_node_events=self.preserve_node_events,
+            exclude=self.fusion_exclude,
+        ).plan()
+        self.fusion_report = report
+        self.logger.info("Chain fusion plan:\n%s", report.summary())
+
+        self.node_manager = NodeManager()
+        self.node_manager.add_nodes(report.nodes)
+        self.edge_manager = EdgeManager()
+        self.edge_manager.add_edges(report.edges)
+
     def _configure_nodes(self) -> None:
         """Load node definitions from the layout into the node manager."""
         self.node_manager.add_nodes(nodes=self.config.get_nodes())
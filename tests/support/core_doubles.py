@@ -1,4 +1,7 @@
+from langchain_core.embeddings import Embeddings
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
 from langchain_core.messages import AIMessage
+from langchain_core.output_parsers import PydanticOutputParser
 from langchain_core.runnables import RunnableLambda
 
 
@@ -6,7 +9,45 @@ class ToolBindingFakeModel:
     def __init__(self, response_content: str = "oak-response"):
         self.response_content = response_content
         self.bound_tools = None
+        self.bind_calls = []
 
     def bind_tools(self, tools):
         self.bound_tools = list(tools)
-        return RunnableLambda(lambda _: AIMessage(content=self.response_content))
\ No newline at end of file
+        self.bind_calls.append([tool.name for tool in tools])
+        return RunnableLambda(lambda _: AIMessage(content=self.response_content))
+
+class KeywordEmbeddings(Embeddings):
+    """Embeds texts as counts of a fixed keyword vocabulary, counting calls."""
+
+    def __init__(self, vocabulary: list[str]):
+        self.vocabulary = vocabulary
+        self.documents_embedded = 0
+
+    def _embed(self, text: str) -> list[float]:
+        words = text.lower()
+        return [float(words.count(keyword)) for keyword in self.vocabulary]
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.documents_embedded += len(texts)
+        return [self._embed(text) for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        return self._embed(text)
+
+
+class StreamingJsonFakeModel(GenericFakeChatModel):
+    """Fake chat model streaming its answers word by word, counting the chunks produced.
+
+    Its `json_schema` structured output is the bound model followed by a
+    `PydanticOutputParser`, the shape real chat models use.
+    """
+
+    streamed_chunks: int = 0
+
+    def _stream(self, *args, **kwargs):
+        for chunk in super()._stream(*args, **kwargs):
+            self.streamed_chunks += 1
+            yield chunk
+
+    def with_structured_output(self, schema, **kwargs):
+        return self.bind() | PydanticOutputParser(pydantic_object=schema)
@@ -1,6 +1,15 @@
 from typing import Any
 
-from frankstate.entity.runnable_builder import RetrieverMixin, RunnableBuilder
+from langchain_core.language_models.fake_chat_models import FakeMessagesListChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+from langchain_core.runnables import Runnable
+
+from frankstate.entity.runnable_builder import (
+    BatchingMixin,
+    RetrieverMixin,
+    RunnableBuilder,
+)
 
 
 class SpyRunnable:
@@ -50,4 +59,43 @@ class FakeRunnableBuilder(RetrieverMixin, RunnableBuilder):
 
     def _configure_runnable(self) -> SpyRunnable:
         self.configure_calls += 1
-        return SpyRunnable(sync_result=self.sync_result, async_result=self.async_result)
\ No newline at end of file
+        return SpyRunnable(sync_result=self.sync_result, async_result=self.async_result)
+
+class RecordingBatchRunnable(Runnable[Any, Any]):
+    """Uppercase inputs, recording every `abatch()` call and its configs."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[Any]] = []
+        self.configs: list[Any] = []
+
+    def invoke(self, input: Any, config: Any = None, **kwargs: Any) -> Any:
+        return str(input).upper()
+
+    async def abatch(self, inputs: list[Any], config: Any = None, **kwargs: Any) -> list[Any]:
+        self.batches.append(list(inputs))
+        self.configs.append(config)
+        return [
+            ValueError(f"bad input {value!r}") if value == "boom" else str(value).upper()
+            for value in inputs
+        ]
+
+
+class BatchingRunnableBuilder(BatchingMixin, RunnableBuilder):
+    def __init__(self, **kwargs: Any):
+        super().__init__(model=object(), **kwargs)
+
+    def _configure_runnable(self) -> RecordingBatchRunnable:
+        return RecordingBatchRunnable()
+
+
+class FakeChatBuilder(RunnableBuilder):
+    """Prompt and fake chat model answering with fixed token usage per call."""
+
+    def __init__(self, answer: str = "answer", input_tokens: int = 10, output_tokens: int = 5, cached_input_tokens: int = 0):
+        usage: dict[str, Any] = {"input_tokens": input_tokens, "output_tokens": output_tokens, "total_tokens": input_tokens + output_tokens}
+        if cached_input_tokens:
+            usage["input_token_details"] = {"cache_read": cached_input_tokens}
+        super().__init__(model=FakeMessagesListChatModel(responses=[AIMessage(content=answer, usage_metadata=usage)]))
+
+    def _configure_runnable(self) -> Runnable:
+        return ChatPromptTemplate.from_messages([MessagesPlaceholder("messages")]) | self.model
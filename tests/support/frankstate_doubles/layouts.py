@@ -1,4 +1,5 @@
-from typing import Any
+import os
+from typing import Any, ClassVar
 
 from langgraph.graph import END, START, MessagesState
 from langgraph.prebuilt import ToolNode
@@ -6,17 +7,34 @@ from langgraph.prebuilt import ToolNode
 from frankstate.entity.edge import ConditionalEdge, SimpleEdge
 from frankstate.entity.graph_layout import GraphLayout
 from frankstate.entity.node import CommandNode, SimpleNode
-from tests.support.frankstate_doubles.builders import FakeRunnableBuilder
+from frankstate.runtime.offload import ProcessPoolOffload
+from frankstate.runtime.remote import RemoteOffload
+from frankstate.runtime.retry import NodeRetry
+from tests.support.frankstate_doubles.builders import (
+    BatchingRunnableBuilder,
+    FakeChatBuilder,
+    FakeRunnableBuilder,
+)
 from tests.support.frankstate_doubles.stub import (
+    AsyncConstantRouteEvaluator,
     AsyncFieldRouteEvaluator,
+    BlockingSleepEnhancer,
+    ChatMessageEnhancer,
+    ConstantRouteEvaluator,
+    FailingEnhancer,
     FieldRouteEvaluator,
+    FlakyEnhancer,
     RoutingCommander,
     RunnableMessageEnhancer,
     StaticMessageEnhancer,
+    StepRecordingEnhancer,
     SyncRunnableMessageEnhancer,
+    SyncStaticMessageEnhancer,
     ToolCallEvaluator,
     ToolCallingEnhancer,
     ToolSummaryEnhancer,
+    WorkerInfoEnhancer,
+    mark_worker,
     uppercase_text,
 )
 
@@ -235,4 +253,314 @@ class ToolLoopLayout(GraphLayout):
             evaluator=ToolCallEvaluator(),
         )
         self.TOOL_EDGE = SimpleEdge(node_source=self.TOOL_NODE.name, node_path=self.SUMMARY_NODE.name)
-        self.END_EDGE = SimpleEdge(node_source=self.SUMMARY_NODE.name, node_path=END)
\ No newline at end of file
+        self.END_EDGE = SimpleEdge(node_source=self.SUMMARY_NODE.name, node_path=END)
+
+class ChainTestState(MessagesState):
+    question: str
+    rewritten: str
+    context: str
+    answer: str
+
+
+class IndependentChainLayout(GraphLayout):
+    """Sequential chain whose first two nodes do not depend on each other."""
+
+    def __init__(self):
+        super().__init__()
+        self.steps: dict[str, int] = {}
+
+    def build_runtime(self) -> dict[str, Any]:
+        return {}
+
+    def layout(self) -> None:
+        self.REWRITE_NODE = SimpleNode(
+            enhancer=StepRecordingEnhancer("rewritten", lambda state: state["question"].upper(), self.steps),
+            name="rewrite_node",
+            reads=["question"],
+            writes=["rewritten"],
+        )
+        self.RETRIEVE_NODE = SimpleNode(
+            enhancer=StepRecordingEnhancer("context", lambda state: f"docs:{state['question']}", self.steps),
+            name="retrieve_node",
+            reads=["question"],
+            writes=["context"],
+        )
+        self.ANSWER_NODE = SimpleNode(
+            enhancer=StepRecordingEnhancer(
+                "answer",
+                lambda state: f"{state['rewritten']}|{state['context']}",
+                self.steps,
+            ),
+            name="answer_node",
+            reads=["rewritten", "context"],
+            writes=["answer"],
+        )
+
+        self.START_EDGE = SimpleEdge(node_source=START, node_path=self.REWRITE_NODE.name)
+        self.REWRITE_EDGE = SimpleEdge(node_source=self.REWRITE_NODE.name, node_path=self.RETRIEVE_NODE.name)
+        self.RETRIEVE_EDGE = SimpleEdge(node_source=self.RETRIEVE_NODE.name, node_path=self.ANSWER_NODE.name)
+        self.END_EDGE = SimpleEdge(node_source=self.ANSWER_NODE.name, node_path=END)
+
+
+class MixedMessageChainLayout(GraphLayout):
+    """Async and sync message nodes chained before a conditional exit."""
+
+    RUNNABLE_BUILDER: FakeRunnableBuilder
+
+    def build_runtime(self) -> dict[str, Any]:
+        return {
+            "RUNNABLE_BUILDER": FakeRunnableBuilder(
+                sync_result=lambda state: {"content": f"echo:{state['messages'][-1].content}"}
+            )
+        }
+
+    def layout(self) -> None:
+        self.GREET_NODE = SimpleNode(
+            enhancer=StaticMessageEnhancer("hello"),
+            name="greet_node",
+            tags=["greet"],
+        )
+        self.ECHO_NODE = SimpleNode(
+            enhancer=SyncRunnableMessageEnhancer(runnable_builder=self.RUNNABLE_BUILDER),
+            name="echo_node",
+            tags=["echo"],
+        )
+
+        self.START_EDGE = SimpleEdge(node_source=START, node_path=self.GREET_NODE.name)
+        self.GREET_EDGE = SimpleEdge(node_source=self.GREET_NODE.name, node_path=self.ECHO_NODE.name)
+        self.ROUTE_EDGE = ConditionalEdge(
+            node_source=self.ECHO_NODE.name,
+            map_dict={
+                "done": END,
+                "retry": self.GREET_NODE.name,
+            },
+            evaluator=FieldRouteEvaluator(),
+        )
+
+
+class BatchedLinearLayout(GraphLayout):
+    """Single runnable-backed node whose runnable micro-batches concurrent runs."""
+
+    RUNNABLE_BUILDER: BatchingRunnableBuilder
+
+    def build_runtime(self) -> dict[str, Any]:
+        return {"RUNNABLE_BUILDER": BatchingRunnableBuilder(batch_max_size=8, batch_max_latency=0.05)}
+
+    def layout(self) -> None:
+        self.BATCHED_NODE = SimpleNode(
+            enhancer=RunnableMessageEnhancer(runnable_builder=self.RUNNABLE_BUILDER),
+            name="batched_node",
+        )
+        self.START_EDGE = SimpleEdge(node_source=START, node_path=self.BATCHED_NODE.name)
+        self.END_EDGE = SimpleEdge(node_source=self.BATCHED_NODE.name, node_path=END)
+
+
+class BudgetedRetryLayout(GraphLayout):
+    """Retry loop whose evaluator never stops, bounded only by a loop budget."""
+
+    def build_runtime(self) -> dict[str, Any]:
+        return {}
+
+    def layout(self) -> None:
+        self.WORK_NODE = SimpleNode(enhancer=StaticMessageEnhancer("work"), name="work_node")
+        self.GIVE_UP_NODE = SimpleNode(enhancer=StaticMessageEnhancer("give-up"), name="give_up_node")
+
+        self.START_EDGE = SimpleEdge(node_source=START, node_path=self.WORK_NODE.name)
+        self.RETRY_EDGE = ConditionalEdge(
+            node_source=self.WORK_NODE.name,
+            map_dict={"again": self.WORK_NODE.name, "done": END},
+            evaluator=ConstantRouteEvaluator("again"),
+            max_traversals=2,
+            exit_to=self.GIVE_UP_NODE.name,
+        )
+        self.GIVE_UP_EDGE = SimpleEdge(node_source=self.GIVE_UP_NODE.name, node_path=END)
+
+
+class AsyncBudgetedRetryLayout(BudgetedRetryLayout):
+    def layout(self) -> None:
+        super().layout()
+        self.RETRY_EDGE.evaluator = AsyncConstantRouteEvaluator("again")
+
+
+class BudgetedSimpleLoopLayout(GraphLayout):
+    """Two nodes wired in a static cycle whose back edge carries the budget."""
+
+    def build_runtime(self) -> dict[str, Any]:
+        return {}
+
+    def layout(self) -> None:
+        self.PING_NODE = SimpleNode(enhancer=SyncStaticMessageEnhancer("ping"), name="ping_node")
+        self.PONG_NODE = SimpleNode(enhancer=SyncStaticMessageEnhancer("pong"), name="pong_node")
+
+        self.START_EDGE = SimpleEdge(node_source=START, node_path=self.PING_NODE.name)
+        self.PING_EDGE = SimpleEdge(node_source=self.PING_NODE.name, node_path=self.PONG_NODE.name)
+        self.BACK_EDGE = SimpleEdge(
+            node_source=self.PONG_NODE.name,
+            node_path=self.PING_NODE.name,
+            max_traversals=1,
+            exit_to=END,
+        )
+
+
+class OffloadedNodeLayout(GraphLayout):
+    """Single CPU-bound node offloaded to a process pool owned by the layout."""
+
+    def build_runtime(self) -> dict[str, Any]:
+        return {}
+
+    def layout(self) -> None:
+        self.offload = ProcessPoolOffload(max_workers=1, initializer=mark_worker, initargs=("warm",))
+        self.WORKER_NODE = SimpleNode(
+            enhancer=WorkerInfoEnhancer(),
+            name="worker_node",
+            reads=["tool_text"],
+            writes=["decision", "route"],
+            offload=self.offload,
+        )
+
+        self.START_EDGE = SimpleEdge(node_source=START, node_path=self.WORKER_NODE.name)
+        self.END_EDGE = SimpleEdge(node_source=self.WORKER_NODE.name, node_path=END)
+
+
+class BlockingNodeLayout(GraphLayout):
+    """Fast node followed by an async node that blocks the event loop."""
+
+    def build_runtime(self) -> dict[str, Any]:
+        return {}
+
+    def layout(self) -> None:
+        self.FAST_NODE = SimpleNode(enhancer=StaticMessageEnhancer("fast"), name="fast_node")
+        self.BLOCKING_NODE = SimpleNode(enhancer=BlockingSleepEnhancer("slow", seconds=0.3), name="blocking_node")
+
+        self.START_EDGE = SimpleEdge(node_source=START, node_path=self.FAST_NODE.name)
+        self.FAST_EDGE = SimpleEdge(node_source=self.FAST_NODE.name, node_path=self.BLOCKING_NODE.name)
+        self.END_EDGE = SimpleEdge(node_source=self.BLOCKING_NODE.name, node_path=END)
+
+
+class ChatLoopLayout(GraphLayout):
+    """Chat node answering twice through a budgeted retry edge, 15 tokens per answer."""
+
+    CHAT_BUILDER: FakeChatBuilder
+
+    def build_runtime(self) -> dict[str, Any]:
+        return {"CHAT_BUILDER": FakeChatBuilder()}
+
+    def layout(self) -> None:
+        self.ANSWER_NODE = SimpleNode(
+            enhancer=ChatMessageEnhancer(runnable_builder=self.CHAT_BUILDER),
+            name="answer_node",
+            tags=["answer", "llm"],
+        )
+
+        self.START_EDGE = SimpleEdge(node_source=START, node_path=self.ANSWER_NODE.name)
+        self.RETRY_EDGE = ConditionalEdge(
+            node_source=self.ANSWER_NODE.name,
+            map_dict={"again": self.ANSWER_NODE.name, "done": END},
+            evaluator=ConstantRouteEvaluator("again"),
+            max_traversals=1,
+            exit_to=END,
+        )
+
+
+class FailingNodeLayout(GraphLayout):
+    """Single node whose enhancer always raises."""
+
+    def build_runtime(self) -> dict[str, Any]:
+        return {}
+
+    def layout(self) -> None:
+        self.FAILING_NODE = SimpleNode(enhancer=FailingEnhancer(), name="failing_node")
+
+        self.START_EDGE = SimpleEdge(node_source=START, node_path=self.FAILING_NODE.name)
+        self.END_EDGE = SimpleEdge(node_source=self.FAILING_NODE.name, node_path=END)
+
+
+class FlakyNodeLayout(GraphLayout):
+    """Single node failing `failures` times before answering, retried by `retry`."""
+
+    failures: ClassVar[int] = 2
+    retry: ClassVar[NodeRetry | None] = None
+
+    def build_runtime(self) -> dict[str, Any]:
+        return {}
+
+    def layout(self) -> None:
+        self.FLAKY_NODE = SimpleNode(
+            enhancer=FlakyEnhancer(failures=self.failures),
+            name="flaky_node",
+            retry=self.retry,
+        )
+
+        self.START_EDGE = SimpleEdge(node_source=START, node_path=self.FLAKY_NODE.name)
+        self.END_EDGE = SimpleEdge(node_source=self.FLAKY_NODE.name, node_path=END)
+
+
+class LargeOutputLayout(GraphLayout):
+    """Small answer followed by a node appending a 50 kB message."""
+
+    def build_runtime(self) -> dict[str, Any]:
+        return {}
+
+    def layout(self) -> None:
+        self.SMALL_NODE = SimpleNode(enhancer=StaticMessageEnhancer("small"), name="small_node")
+        self.LARGE_NODE = SimpleNode(enhancer=StaticMessageEnhancer("x" * 50_000), name="large_node")
+
+        self.START_EDGE = SimpleEdge(node_source=START, node_path=self.SMALL_NODE.name)
+        self.SMALL_EDGE = SimpleEdge(node_source=self.SMALL_NODE.name, node_path=self.LARGE_NODE.name)
+        self.END_EDGE = SimpleEdge(node_source=self.LARGE_NODE.name, node_path=END)
+
+
+class DegradableRagLayout(GraphLayout):
+    """Retrieve, grade, answer and review, where grading and review are optional under load."""
+
+    def build_runtime(self) -> dict[str, Any]:
+        return {}
+
+    def layout(self) -> None:
+        self.RETRIEVE_NODE = SimpleNode(enhancer=StaticMessageEnhancer("retrieved"), name="retrieve_node")
+        self.GRADE_NODE = SimpleNode(enhancer=StaticMessageEnhancer("graded"), name="grade_node")
+        self.ANSWER_NODE = SimpleNode(enhancer=StaticMessageEnhancer("answered"), name="answer_node")
+        self.REVIEW_NODE = SimpleNode(enhancer=StaticMessageEnhancer("reviewed"), name="review_node")
+
+        self.START_EDGE = SimpleEdge(node_source=START, node_path=self.RETRIEVE_NODE.name)
+        self.GRADE_EDGE = ConditionalEdge(
+            node_source=self.RETRIEVE_NODE.name,
+            map_dict={"grade": self.GRADE_NODE.name},
+            evaluator=AsyncConstantRouteEvaluator("grade"),
+            degrade_to=self.ANSWER_NODE.name,
+        )
+        self.GRADED_EDGE = SimpleEdge(node_source=self.GRADE_NODE.name, node_path=self.ANSWER_NODE.name)
+        self.REVIEW_EDGE = SimpleEdge(
+            node_source=self.ANSWER_NODE.name,
+            node_path=self.REVIEW_NODE.name,
+            degrade_to=END,
+        )
+        self.END_EDGE = SimpleEdge(node_source=self.REVIEW_NODE.name, node_path=END)
+
+
+class RemoteNodeLayout(GraphLayout):
+    """Local node followed by two nodes served by the workers in `FRANKSTATE_TEST_WORKERS`."""
+
+    def build_runtime(self) -> dict[str, Any]:
+        return {}
+
+    def layout(self) -> None:
+        self.remote = RemoteOffload(os.environ["FRANKSTATE_TEST_WORKERS"].split(","), backoff=0.0)
+        self.LOCAL_NODE = SimpleNode(enhancer=StaticMessageEnhancer("local"), name="local_node")
+        self.INFO_NODE = SimpleNode(
+            enhancer=WorkerInfoEnhancer(),
+            name="info_node",
+            reads=["tool_text"],
+            writes=["decision", "route"],
+            offload=self.remote,
+        )
+        self.ANSWER_NODE = SimpleNode(
+            enhancer=SyncStaticMessageEnhancer("remote-answer"),
+            name="answer_node",
+            offload=self.remote,
+        )
+
+        self.START_EDGE = SimpleEdge(node_source=START, node_path=self.LOCAL_NODE.name)
+        self.INFO_EDGE = SimpleEdge(node_source=self.LOCAL_NODE.name, node_path=self.INFO_NODE.name)
+        self.ANSWER_EDGE = SimpleEdge(node_source=self.INFO_NODE.name, node_path=self.ANSWER_NODE.name)
+        self.END_EDGE = SimpleEdge(node_source=self.ANSWER_NODE.name, node_path=END)
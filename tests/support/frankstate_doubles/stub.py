@@ -1,7 +1,10 @@
+import os
+import time
 from typing import Any
 
 from langchain_core.messages import AIMessage
 from langchain_core.tools import tool
+from langgraph.config import get_config
 from langgraph.types import Command
 
 from frankstate.entity.statehandler import StateCommander, StateEnhancer, StateEvaluator
@@ -16,6 +19,11 @@ class StaticMessageEnhancer(StateEnhancer):
         return {"messages": [AIMessage(content=self.message)]}
 
 
+class SyncStaticMessageEnhancer(StaticMessageEnhancer):
+    def enhance(self, state: Any) -> dict[str, list[AIMessage]]:  # type: ignore[override]
+        return {"messages": [AIMessage(content=self.message)]}
+
+
 class RunnableMessageEnhancer(StateEnhancer):
     async def enhance(self, state: Any) -> dict[str, list[AIMessage]]:
         result = await self.runnable.ainvoke(state)
@@ -26,6 +34,11 @@ class RunnableMessageEnhancer(StateEnhancer):
         return {"messages": [AIMessage(content=content)]}
 
 
+class ChatMessageEnhancer(StateEnhancer):
+    async def enhance(self, state: Any) -> dict[str, list[Any]]:
+        return {"messages": [await self.runnable.ainvoke(state)]}
+
+
 class SyncRunnableMessageEnhancer(StateEnhancer):
     def enhance(self, state: Any) -> dict[str, list[AIMessage]]:
         result = self.runnable.invoke(state)
@@ -115,3 +128,92 @@ class ToolSummaryEnhancer(StateEnhancer):
     async def enhance(self, state: Any) -> dict[str, list[AIMessage]]:
         last_message = state["messages"][-1]
         return {"messages": [AIMessage(content=f"tool:{last_message.content}")]}
+
+
+class StepRecordingEnhancer(StateEnhancer):
+    """Write a fixed value to one key and record the superstep it ran in."""
+
+    def __init__(self, key: str, value: Any, steps: dict[str, int], **kwargs: Any):
+        super().__init__(**kwargs)
+        self.key = key
+        self.value = value
+        self.steps = steps
+
+    async def enhance(self, state: Any) -> dict[str, Any]:
+        self.steps[self.key] = get_config()["metadata"]["langgraph_step"]
+        return {self.key: self.value(state) if callable(self.value) else self.value}
+
+
+class ConstantRouteEvaluator(StateEvaluator):
+    """Always return the same route, counting evaluations (a runaway loop)."""
+
+    def __init__(self, route: str, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.route = route
+        self.calls = 0
+
+    def evaluate(self, state: Any) -> str:
+        self.calls += 1
+        return self.route
+
+
+class AsyncConstantRouteEvaluator(ConstantRouteEvaluator):
+    async def evaluate(self, state: Any) -> str:
+        self.calls += 1
+        return self.route
+
+
+def mark_worker(mark: str) -> None:
+    """Process pool initializer recording that it ran in the worker."""
+    os.environ["FRANKSTATE_TEST_WORKER_MARK"] = mark
+
+
+class WorkerInfoEnhancer(StateEnhancer):
+    """Report the process it ran in, the keys it received and the initializer mark."""
+
+    def enhance(self, state: Any) -> dict[str, str]:
+        return {
+            "decision": f"{os.getpid()}:{','.join(sorted(state))}",
+            "route": os.environ.get("FRANKSTATE_TEST_WORKER_MARK", ""),
+        }
+
+
+class BlockingSleepEnhancer(StateEnhancer):
+    """Async enhancer hiding a blocking call, as sync SDK clients do."""
+
+    def __init__(self, message: str, seconds: float, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.message = message
+        self.seconds = seconds
+
+    async def enhance(self, state: Any) -> dict[str, list[AIMessage]]:
+        time.sleep(self.seconds)
+        return {"messages": [AIMessage(content=self.message)]}
+
+
+class FlakyEnhancer(StateEnhancer):
+    """Async enhancer raising `ConnectionError` on its first `failures` calls."""
+
+    def __init__(self, failures: int, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.failures = failures
+        self.calls = 0
+
+    async def enhance(self, state: Any) -> dict[str, Any]:
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise ConnectionError(f"backend unavailable (call {self.calls})")
+        return {"messages": [AIMessage(content=f"answered after {self.calls} calls")]}
+
+
+class FailingEnhancer(StateEnhancer):
+    """Async enhancer that always raises, counting its calls."""
+
+    def __init__(self, message: str = "enhancer failed", **kwargs: Any):
+        super().__init__(**kwargs)
+        self.message = message
+        self.calls = 0
+
+    async def enhance(self, state: Any) -> dict[str, Any]:
+        self.calls += 1
+        raise RuntimeError(self.message)
@@ -0,0 +1,140 @@
+import asyncio
+
+import pytest
+
+from frankstate import WorkflowBuilder
+from frankstate.runtime.batching import MicroBatcher, MicroBatchRunnable
+from tests.support.frankstate_doubles.builders import (
+    BatchingRunnableBuilder,
+    RecordingBatchRunnable,
+)
+from tests.support.frankstate_doubles.layouts import BatchedLinearLayout, FrankTestState
+
+
+@pytest.mark.unit
+def test_micro_batcher_groups_concurrent_calls_and_scatters_results_in_order() -> None:
+    batches: list[list[int]] = []
+
+    async def double(items: list[int]) -> list[int]:
+        batches.append(items)
+        return [item * 2 for item in items]
+
+    batcher = MicroBatcher(double, max_batch_size=4, max_latency=0.01)
+
+    async def _run() -> list[int]:
+        return list(await asyncio.gather(*(batcher.submit(item) for item in range(10))))
+
+    assert asyncio.run(_run()) == [item * 2 for item in range(10)]
+    assert batches == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+    assert (batcher.batches_dispatched, batcher.items_dispatched) == (3, 10)
+
+    # State is per event loop, so the batcher keeps working under a new loop.
+    assert asyncio.run(_run()) == [item * 2 for item in range(10)]
+
+
+@pytest.mark.unit
+def test_micro_batcher_fails_single_callers_or_whole_batch() -> None:
+    async def partial(items: list[int]) -> list[int | Exception]:
+        return [ValueError("odd") if item % 2 else item for item in items]
+
+    async def broken(items: list[int]) -> list[int]:
+        raise RuntimeError("backend down")
+
+    async def _run(batch_fn) -> list[object]:
+        batcher = MicroBatcher(batch_fn, max_batch_size=8, max_latency=0.001)
+        return list(await asyncio.gather(*(batcher.submit(item) for item in range(3)), return_exceptions=True))
+
+    first, second, third = asyncio.run(_run(partial))
+    assert (first, third) == (0, 2)
+    assert isinstance(second, ValueError)
+    assert all(isinstance(result, RuntimeError) for result in asyncio.run(_run(broken)))
+
+    with pytest.raises(ValueError, match="max_batch_size"):
+        MicroBatcher(partial, max_batch_size=0)
+
+
+@pytest.mark.unit
+def test_micro_batcher_skips_cancelled_callers_and_cancels_callers_of_a_cancelled_batch() -> None:
+    batches: list[list[int]] = []
+    started = asyncio.Event()
+
+    async def hang(items: list[int]) -> list[int]:
+        batches.append(items)
+        started.set()
+        await asyncio.Event().wait()
+        return items
+
+    batcher = MicroBatcher(hang, max_batch_size=8, max_latency=0.01)
+
+    async def _run() -> list[object]:
+        callers = [asyncio.create_task(batcher.submit(item)) for item in range(3)]
+        await asyncio.sleep(0)
+        callers[1].cancel()
+        await started.wait()
+        (dispatch,) = batcher._states[asyncio.get_running_loop()].tasks
+        dispatch.cancel()
+        return list(await asyncio.gather(*callers, return_exceptions=True))
+
+    results = asyncio.run(asyncio.wait_for(_run(), timeout=2))
+    assert batches == [[0, 2]]
+    assert all(isinstance(result, asyncio.CancelledError) for result in results)
+    assert batcher.items_dispatched == 2
+
+
+@pytest.mark.unit
+def test_micro_batch_runnable_uses_abatch_with_each_caller_config() -> None:
+    inner = RecordingBatchRunnable()
+    runnable = MicroBatchRunnable(inner, max_batch_size=8, max_latency=0.01)
+
+    async def _run() -> list[object]:
+        return list(
+            await asyncio.gather(
+                runnable.ainvoke("pika", {"metadata": {"run": 1}}),
+                runnable.ainvoke("boom", {"metadata": {"run": 2}}),
+                runnable.ainvoke("chu", {"metadata": {"run": 3}}),
+                return_exceptions=True,
+            )
+        )
+
+    first, second, third = asyncio.run(_run())
+
+    assert (first, third) == ("PIKA", "CHU")
+    assert isinstance(second, ValueError)
+    assert inner.batches == [["pika", "boom", "chu"]]
+    assert [config["metadata"]["run"] for config in inner.configs[0]] == [1, 2, 3]
+    assert runnable.invoke("sync") == "SYNC"
+
+
+@pytest.mark.unit
+def test_batching_mixin_wraps_builder_runnable_once() -> None:
+    builder = BatchingRunnableBuilder(batch_max_size=2, batch_max_latency=0.01)
+
+    runnable = builder.get()
+
+    assert isinstance(runnable, MicroBatchRunnable)
+    assert builder.get() is runnable
+    assert runnable.batcher.max_batch_size == 2
+
+    async def _run() -> list[str]:
+        return list(await asyncio.gather(*(builder.ainvoke(text) for text in ["a", "b", "c"])))
+
+    assert asyncio.run(_run()) == ["A", "B", "C"]
+    assert runnable.runnable.batches == [["a", "b"], ["c"]]
+
+
+@pytest.mark.unit
+def test_concurrent_graph_runs_share_one_batch() -> None:
+    builder = WorkflowBuilder(config=BatchedLinearLayout, state_schema=FrankTestState)
+    graph = builder.compile()
+
+    async def _run() -> list[dict]:
+        return list(
+            await asyncio.gather(*(graph.ainvoke({"messages": [], "route": route}) for route in ["x", "y", "z"]))
+        )
+
+    results = asyncio.run(_run())
+
+    batches = builder.config.RUNNABLE_BUILDER.get().runnable.batches
+    assert len(batches) == 1
+    assert sorted(batch_input["route"] for batch_input in batches[0]) == ["x", "y", "z"]
+    assert all("'ROUTE'" in result["messages"][-1].content for result in results)
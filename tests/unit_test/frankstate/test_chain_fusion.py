@@ -0,0 +1,175 @@
+import asyncio
+
+import pytest
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.graph import END, START
+from pydantic import BaseModel
+
+from frankstate import WorkflowBuilder
+from frankstate.entity.edge import ConditionalEdge, SimpleEdge
+from frankstate.entity.node import CommandNode, SimpleNode
+from frankstate.managers.edge_manager import EdgeManager
+from frankstate.managers.node_manager import NodeManager
+from frankstate.optimizers.chain_fusion import ChainFusion
+from tests.support.frankstate_doubles.layouts import (
+    ChainTestState,
+    FrankTestState,
+    IndependentChainLayout,
+    MixedMessageChainLayout,
+)
+from tests.support.frankstate_doubles.stub import (
+    FieldRouteEvaluator,
+    RoutingCommander,
+    StaticMessageEnhancer,
+)
+
+
+def _managers(
+    nodes: list[SimpleNode | CommandNode],
+    edges: list[SimpleEdge | ConditionalEdge],
+) -> tuple[NodeManager, EdgeManager]:
+    node_manager = NodeManager()
+    node_manager.add_nodes(nodes)
+    edge_manager = EdgeManager()
+    edge_manager.add_edges(edges)
+    return node_manager, edge_manager
+
+
+def _node(name: str, **kwargs) -> SimpleNode:
+    return SimpleNode(StaticMessageEnhancer(name), name=name, **kwargs)
+
+
+@pytest.mark.unit
+def test_plan_fuses_chain_and_rewires_head_and_tail_edges() -> None:
+    node_manager, edge_manager = _managers(
+        [
+            _node("first", tags=["a"], reads=["question"], writes=["rewritten"]),
+            _node("second", tags=["b"], reads=["rewritten", "context"], writes=["answer"]),
+        ],
+        [
+            SimpleEdge(node_source=START, node_path="first"),
+            SimpleEdge(node_source="first", node_path="second"),
+            ConditionalEdge(
+                node_source="second",
+                map_dict={"again": "first", "done": END},
+                evaluator=FieldRouteEvaluator(),
+            ),
+        ],
+    )
+
+    report = ChainFusion(node_manager, edge_manager, channels={}).plan()
+
+    assert report.fused_nodes == ("first", "second")
+    assert [node.name for node in report.nodes] == ["first+second"]
+    fused = report.nodes[0]
+    assert fused.tags == ["a", "b"]
+    assert fused.kwargs == {"metadata": {"fused_nodes": ["first", "second"]}}
+    assert fused.reads == ["question", "context"]
+    assert fused.writes == ["rewritten", "answer"]
+
+    simple, conditional = report.edges
+    assert (simple.node_source, simple.node_path) == (START, "first+second")
+    assert conditional.node_source == "first+second"
+    assert conditional.map_dict == {"again": "first+second", "done": END}
+    assert "first -> second" in report.summary()
+
+
+@pytest.mark.unit
+def test_plan_skips_excluded_nodes_command_targets_and_policy_kwargs() -> None:
+    node_manager, edge_manager = _managers(
+        [
+            CommandNode(RoutingCommander({"accept": "target"}), name="commander"),
+            _node("target"),
+            _node("after_target"),
+            _node("paused"),
+            _node("retried", kwargs={"retry_policy": object()}),
+        ],
+        [
+            SimpleEdge(node_source=START, node_path="commander"),
+            SimpleEdge(node_source="target", node_path="after_target"),
+            SimpleEdge(node_source="after_target", node_path="paused"),
+            SimpleEdge(node_source="paused", node_path="retried"),
+            SimpleEdge(node_source="retried", node_path=END),
+        ],
+    )
+
+    report = ChainFusion(node_manager, edge_manager, channels={}, exclude=["paused"]).plan()
+
+    assert report.chains == ()
+    assert report.edges == edge_manager.get_edges()
+    assert "nothing to fuse" in report.summary()
+
+
+@pytest.mark.unit
+def test_workflow_builder_fused_chain_keeps_final_state_with_fewer_checkpoints() -> None:
+    sequential_saver, fused_saver = InMemorySaver(), InMemorySaver()
+    sequential = WorkflowBuilder(
+        config=IndependentChainLayout,
+        state_schema=ChainTestState,
+        checkpointer=sequential_saver,
+    )
+    fused = WorkflowBuilder(
+        config=IndependentChainLayout,
+        state_schema=ChainTestState,
+        checkpointer=fused_saver,
+        fuse_chains=True,
+    )
+
+    payload = {"messages": [], "question": "pikachu"}
+    run_config = {"configurable": {"thread_id": "fusion"}}
+    sequential_result = asyncio.run(sequential.compile().ainvoke(payload, run_config))
+    fused_result = asyncio.run(fused.compile().ainvoke(payload, run_config))
+
+    assert fused_result == sequential_result
+    assert fused_result["answer"] == "PIKACHU|docs:pikachu"
+    assert fused.fusion_report is not None
+    assert fused.fusion_report.chains[0].name == "rewrite_node+retrieve_node+answer_node"
+    assert "rewrite_node+retrieve_node+answer_node" in fused.compile().get_graph().nodes
+    assert len(list(fused_saver.list(run_config))) < len(list(sequential_saver.list(run_config)))
+
+
+@pytest.mark.unit
+def test_workflow_builder_fuses_mixed_sync_async_chain_and_preserves_node_events() -> None:
+    sequential = WorkflowBuilder(config=MixedMessageChainLayout, state_schema=FrankTestState)
+    fused = WorkflowBuilder(
+        config=MixedMessageChainLayout,
+        state_schema=FrankTestState,
+        fuse_chains=True,
+        preserve_node_events=True,
+    )
+    payload = {"messages": [], "route": "done"}
+
+    async def _collect() -> list[tuple[str, object]]:
+        return [
+            chunk
+            async for chunk in fused.compile().astream(payload, stream_mode=["updates", "custom"])
+        ]
+
+    sequential_result = asyncio.run(sequential.compile().ainvoke(payload))
+    chunks = asyncio.run(_collect())
+
+    assert [message.content for message in sequential_result["messages"]] == ["hello", "echo:hello"]
+    custom_events = [event for mode, event in chunks if mode == "custom"]
+    assert [next(iter(event)) for event in custom_events] == ["greet_node", "echo_node"]
+    assert custom_events[1]["echo_node"]["messages"][0].content == "echo:hello"
+    updates = [event for mode, event in chunks if mode == "updates"]
+    assert [next(iter(event)) for event in updates] == ["greet_node+echo_node"]
+
+    fused_result = asyncio.run(fused.compile().ainvoke(payload))
+    assert [message.content for message in fused_result["messages"]] == ["hello", "echo:hello"]
+
+
+@pytest.mark.unit
+def test_workflow_builder_rejects_invalid_fusion_options() -> None:
+    class PydanticState(BaseModel):
+        question: str = ""
+
+    with pytest.raises(ValueError, match="enable only one"):
+        WorkflowBuilder(
+            config=IndependentChainLayout,
+            state_schema=ChainTestState,
+            parallelize=True,
+            fuse_chains=True,
+        )
+    with pytest.raises(ValueError, match="TypedDict"):
+        WorkflowBuilder(config=IndependentChainLayout, state_schema=PydanticState, fuse_chains=True)
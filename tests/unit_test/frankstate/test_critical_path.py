@@ -0,0 +1,96 @@
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from frankstate import WorkflowBuilder
+from frankstate.analysis.critical_path import CriticalPathAnalyzer, main
+from frankstate.instrumentation.recorder import RunRecorder
+from tests.support.frankstate_doubles.layouts import (
+    AsyncBudgetedRetryLayout,
+    FrankTestState,
+    LinearAsyncLayout,
+)
+
+
+def _fan_out_run(run_id: str, duration: float, slow: float) -> list[dict]:
+    """One run where `fetch` and `search` share superstep 1 before `answer`."""
+    return [
+        {"type": "run", "run_id": run_id, "layout": "FanOutLayout", "duration": duration, "status": "ok"},
+        {"type": "node", "run_id": run_id, "node": "fetch", "step": 1, "start": 0.0, "end": 0.1},
+        {"type": "node", "run_id": run_id, "node": "search", "step": 1, "start": 0.0, "end": slow},
+        {"type": "node", "run_id": run_id, "node": "answer", "step": 2, "start": slow + 0.05, "end": slow + 0.25},
+        {"type": "step", "run_id": run_id, "step": 1, "start": 0.0, "end": max(slow, 0.1), "nodes": ["fetch", "search"]},
+        {"type": "step", "run_id": run_id, "step": 2, "start": slow + 0.05, "end": slow + 0.25, "nodes": ["answer"]},
+    ]
+
+
+@pytest.mark.unit
+def test_recorder_writes_nodes_steps_and_branch_decisions(tmp_path: Path) -> None:
+    path = tmp_path / "runs.jsonl"
+    recorder = RunRecorder(path)
+    graph = WorkflowBuilder(
+        config=AsyncBudgetedRetryLayout,
+        state_schema=FrankTestState,
+        hooks=[recorder],
+    ).compile()
+
+    async def run_twice() -> None:
+        await asyncio.gather(graph.ainvoke({"messages": []}), graph.ainvoke({"messages": []}))
+
+    asyncio.run(run_twice())
+    recorder.flush()
+
+    records = [json.loads(line) for line in path.read_text().splitlines()]
+    runs = [record for record in records if record["type"] == "run"]
+    assert len(runs) == 2 and {run["layout"] for run in runs} == {"AsyncBudgetedRetryLayout"}
+    first = [record for record in records if record["run_id"] == runs[0]["run_id"]]
+    assert [r["node"] for r in first if r["type"] == "node"] == ["work_node"] * 3 + ["give_up_node"]
+    assert [r["decision"] for r in first if r["type"] == "route"] == ["again", "again", "__budget_exit__"]
+    assert [r["step"] for r in first if r["type"] == "step"] == [1, 2, 3, 4]
+    assert all(0 <= r["start"] <= r["end"] <= runs[0]["duration"] for r in first if r["type"] != "run")
+
+    report = CriticalPathAnalyzer.from_jsonl(path).report(layout="AsyncBudgetedRetryLayout")
+    assert report.runs == 2
+    assert report.paths == ((("work_node",) * 3 + ("give_up_node",), 2),)
+    assert report.decisions == {"work_node": {"again": 4, "__budget_exit__": 2}}
+    assert report.mean_working + report.mean_waiting == pytest.approx(report.mean_latency)
+
+
+@pytest.mark.unit
+def test_analyzer_follows_the_slowest_node_of_each_superstep() -> None:
+    analyzer = CriticalPathAnalyzer([*_fan_out_run("a", 0.75, slow=0.5), *_fan_out_run("b", 0.35, slow=0.08)])
+
+    report = analyzer.report()
+
+    assert analyzer.run_path("a").path == ("search", "answer")
+    assert analyzer.run_path("b").path == ("fetch", "answer")
+    assert analyzer.run_path("a").waiting == pytest.approx(0.05)
+    contributors = {item.node: item for item in report.contributors}
+    assert report.contributors[0].node == "search"
+    assert contributors["search"].critical_executions == 1
+    assert contributors["fetch"].mean_barrier_wait == pytest.approx(0.2)
+    assert contributors["answer"].share == pytest.approx(0.4 / 1.1)
+    with pytest.raises(ValueError, match="not recorded"):
+        analyzer.run_path("missing")
+
+
+@pytest.mark.unit
+def test_cli_prints_a_summary_for_one_layout(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    path = tmp_path / "runs.jsonl"
+    recorder = RunRecorder(path)
+    graph = WorkflowBuilder(config=LinearAsyncLayout, state_schema=FrankTestState, hooks=[recorder]).compile()
+    asyncio.run(graph.ainvoke({"messages": []}))
+    recorder.close()
+    with path.open("a") as file:
+        file.writelines(json.dumps(record) + "\n" for record in _fan_out_run("c", 0.75, slow=0.5))
+
+    assert main([str(path), "--layout", "FanOutLayout", "--top", "1"]) == 0
+    output = capsys.readouterr().out
+    assert "1 recorded run(s) of FanOutLayout analysed." in output
+    assert "search: 67% of latency" in output and "answer:" not in output
+
+    assert main([str(path), "--json"]) == 0
+    assert json.loads(capsys.readouterr().out)["runs"] == 2
+    assert main([str(path), "--layout", "Unknown"]) == 1
@@ -0,0 +1,134 @@
+import asyncio
+
+import pytest
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.graph.state import CompiledStateGraph
+
+from frankstate import WorkflowBuilder
+from frankstate.runtime.dag_engine import DagEngine
+from tests.support.frankstate_doubles.layouts import (
+    ChainTestState,
+    CommandAsyncLayout,
+    ConditionalAsyncEvaluatorLayout,
+    ConditionalAsyncLayout,
+    FrankTestState,
+    IndependentChainLayout,
+    LinearAsyncLayout,
+    LinearSyncLayout,
+    MixedMessageChainLayout,
+    ToolLoopLayout,
+)
+
+
+def _contents(result: dict) -> list[str]:
+    return [message.content for message in result["messages"]]
+
+
+@pytest.mark.unit
+def test_dag_engine_matches_langgraph_for_linear_sync_and_async_layouts() -> None:
+    async_engine = WorkflowBuilder(config=LinearAsyncLayout, state_schema=FrankTestState, engine="dag").compile()
+    sync_engine = WorkflowBuilder(config=LinearSyncLayout, state_schema=FrankTestState, engine="dag").compile()
+    async_graph = WorkflowBuilder(config=LinearAsyncLayout, state_schema=FrankTestState).compile()
+    sync_graph = WorkflowBuilder(config=LinearSyncLayout, state_schema=FrankTestState).compile()
+
+    payload = {"messages": [("user", "hi")]}
+
+    assert isinstance(async_engine, DagEngine)
+    assert _contents(asyncio.run(async_engine.ainvoke(payload))) == _contents(asyncio.run(async_graph.ainvoke(payload)))
+    assert _contents(sync_engine.invoke(payload)) == _contents(sync_graph.invoke(payload))
+    assert sync_engine.get_graph().nodes.keys() == sync_graph.get_graph().nodes.keys()
+
+    with pytest.raises(TypeError, match="use ainvoke"):
+        async_engine.invoke(payload)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("layout", [ConditionalAsyncLayout, ConditionalAsyncEvaluatorLayout])
+@pytest.mark.parametrize("route", ["accept", "reject"])
+def test_dag_engine_routes_conditional_edges_like_langgraph(layout: type, route: str) -> None:
+    engine = WorkflowBuilder(config=layout, state_schema=FrankTestState, engine="dag").compile()
+    graph = WorkflowBuilder(config=layout, state_schema=FrankTestState).compile()
+    payload = {"messages": [], "route": route}
+
+    result = asyncio.run(engine.ainvoke(payload))
+
+    assert _contents(result) == _contents(asyncio.run(graph.ainvoke(payload)))
+    assert _contents(result) == ["router", f"{route}ed"]
+
+
+@pytest.mark.unit
+def test_dag_engine_runs_waiting_edges_in_langgraph_supersteps() -> None:
+    engine_builder = WorkflowBuilder(
+        config=IndependentChainLayout,
+        state_schema=ChainTestState,
+        parallelize=True,
+        engine="dag",
+    )
+    graph_builder = WorkflowBuilder(config=IndependentChainLayout, state_schema=ChainTestState, parallelize=True)
+    payload = {"messages": [], "question": "pikachu"}
+
+    engine_result = asyncio.run(engine_builder.compile().ainvoke(payload))
+    graph_result = asyncio.run(graph_builder.compile().ainvoke(payload))
+
+    assert engine_result == graph_result
+    assert engine_builder.config.steps == graph_builder.config.steps
+
+
+@pytest.mark.unit
+def test_dag_engine_streams_values_and_updates_like_langgraph() -> None:
+    engine = WorkflowBuilder(config=IndependentChainLayout, state_schema=ChainTestState, engine="dag").compile()
+    graph = WorkflowBuilder(config=IndependentChainLayout, state_schema=ChainTestState).compile()
+    payload = {"messages": [], "question": "pikachu"}
+
+    async def _collect(compiled) -> list:
+        return [chunk async for chunk in compiled.astream(payload, stream_mode=["values", "updates"])]
+
+    assert asyncio.run(_collect(engine)) == asyncio.run(_collect(graph))
+
+    with pytest.raises(ValueError, match="stream modes"):
+        asyncio.run(_collect_custom(engine, payload))
+
+
+async def _collect_custom(engine: DagEngine, payload: dict) -> list:
+    return [chunk async for chunk in engine.astream(payload, stream_mode="custom")]
+
+
+@pytest.mark.unit
+def test_dag_engine_applies_fused_chain_commands() -> None:
+    engine = WorkflowBuilder(
+        config=IndependentChainLayout,
+        state_schema=ChainTestState,
+        fuse_chains=True,
+        engine="dag",
+    ).compile()
+
+    result = asyncio.run(engine.ainvoke({"messages": [], "question": "pikachu"}))
+
+    assert isinstance(engine, DagEngine)
+    assert result["answer"] == "PIKACHU|docs:pikachu"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("layout", "state_schema", "checkpointer", "reason"),
+    [
+        (CommandAsyncLayout, FrankTestState, None, "'command_node' is a CommandNode"),
+        (ToolLoopLayout, FrankTestState, None, "'tool_node' is a ToolNode"),
+        (MixedMessageChainLayout, FrankTestState, None, "cycle through"),
+        (LinearAsyncLayout, FrankTestState, InMemorySaver(), "checkpointer"),
+    ],
+)
+def test_dag_engine_falls_back_to_langgraph_with_reason(layout, state_schema, checkpointer, reason) -> None:
+    builder = WorkflowBuilder(config=layout, state_schema=state_schema, checkpointer=checkpointer, engine="dag")
+
+    compiled = builder.compile()
+
+    assert isinstance(compiled, CompiledStateGraph)
+    assert builder.engine_fallback_reason is not None
+    assert reason in builder.engine_fallback_reason
+
+
+@pytest.mark.unit
+def test_workflow_builder_rejects_unknown_engine() -> None:
+    with pytest.raises(ValueError, match="engine"):
+        WorkflowBuilder(config=LinearAsyncLayout, state_schema=FrankTestState, engine="pregel")
@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+from langgraph.graph import END, START
+
+from frankstate import WorkflowBuilder
+from frankstate.entity.edge import ConditionalEdge, SimpleEdge
+from frankstate.managers.edge_manager import EdgeManager
+from frankstate.runtime.degradation import DegradationEvent, DegradationPolicy
+from tests.support.frankstate_doubles.layouts import DegradableRagLayout, FrankTestState
+from tests.support.frankstate_doubles.stub import ConstantRouteEvaluator
+
+FULL = ["retrieved", "graded", "answered", "reviewed"]
+DEGRADED = ["retrieved", "answered"]
+
+
+def _contents(result: dict) -> list[str]:
+    return [message.content for message in result["messages"]]
+
+
+@pytest.mark.unit
+def test_degradable_edges_route_normally_without_a_policy() -> None:
+    manager = EdgeManager()
+    manager.add_edges(
+        [
+            SimpleEdge(node_source=START, node_path="a"),
+            SimpleEdge(node_source="a", node_path="b", degrade_to=END),
+            ConditionalEdge(node_source="b", map_dict={"c": "c"}, evaluator=ConstantRouteEvaluator("c"), degrade_to=END),
+        ]
+    )
+
+    assert manager.configs_edges() == ((START, "a"),)
+    assert [(source, path_map) for source, _, path_map in manager.configs_conditional_edges()] == [
+        ("a", {"b": "b"}),
+        ("b", {"c": "c"}),
+    ]
+    assert [edge.node_source for edge in manager.get_degradable_edges()] == ["a", "b"]
+
+    graph = WorkflowBuilder(config=DegradableRagLayout, state_schema=FrankTestState).compile()
+    assert _contents(asyncio.run(graph.ainvoke({"messages": []}))) == FULL
+
+
+@pytest.mark.unit
+def test_policy_degrades_runs_while_overloaded_and_recovers() -> None:
+    events: list[DegradationEvent] = []
+    policy = DegradationPolicy(max_in_flight=1, min_duration=0.0, on_event=events.append)
+    graph = WorkflowBuilder(config=DegradableRagLayout, state_schema=FrankTestState, hooks=[policy]).compile()
+
+    async def burst() -> list[dict]:
+        return await asyncio.gather(*(graph.ainvoke({"messages": []}) for _ in range(3)))
+
+    results = asyncio.run(burst())
+
+    assert [_contents(result) for result in results] == [DEGRADED] * 3
+    assert [event.kind for event in events][0] == "enter" and events[0].reasons == ("in_flight",)
+    routes = [event for event in events if event.kind == "route"]
+    assert {(event.edge, event.target) for event in routes} == {("retrieve_node", "answer_node"), ("answer_node", END)}
+    assert len({event.run_id for event in routes}) == 3
+    assert events[-1].kind == "exit" and not policy.degraded
+
+    assert _contents(asyncio.run(graph.ainvoke({"messages": []}))) == FULL
+
+
+@pytest.mark.unit
+def test_policy_uses_reported_latency_and_validates() -> None:
+    policy = DegradationPolicy(max_backend_latency=1.0, max_queue_wait=0.5, min_duration=60.0)
+    graph = WorkflowBuilder(config=DegradableRagLayout, state_schema=FrankTestState, hooks=[policy]).compile()
+
+    policy.record_backend_latency(3.0)
+    policy.record_queue_wait(0.1)
+
+    assert policy.degraded and policy.signals().backend_latency == 3.0
+    assert _contents(asyncio.run(graph.ainvoke({"messages": []}))) == DEGRADED
+    with pytest.raises(ValueError, match="at least one"):
+        DegradationPolicy()
+    with pytest.raises(ValueError, match="unknown node 'missing'"):
+        WorkflowBuilder(config=_layout_degrading_to("missing"), state_schema=FrankTestState).compile()
+
+
+def _layout_degrading_to(target: str) -> type[DegradableRagLayout]:
+    class BrokenLayout(DegradableRagLayout):
+        def layout(self) -> None:
+            super().layout()
+            self.REVIEW_EDGE = SimpleEdge(node_source="answer_node", node_path="review_node", degrade_to=target)
+
+    return BrokenLayout
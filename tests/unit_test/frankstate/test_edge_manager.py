@@ -67,3 +67,22 @@ def test_configs_edges_and_conditional_edges_match_langgraph_shape() -> None:
     assert conditional_configs[0][0] == "b"
     assert conditional_configs[0][2] == {"accept": "c", "reject": "d"}
     assert conditional_configs[0][1]({"route": "accept"}) == "accept"
+
+
+@pytest.mark.unit
+def test_incoming_and_outgoing_edges_include_conditional_routes() -> None:
+    manager = EdgeManager()
+    entry = SimpleEdge(node_source="a", node_path="b")
+    route = ConditionalEdge(
+        node_source="b",
+        map_dict={"accept": "c", "reject": "d"},
+        evaluator=FieldRouteEvaluator(),
+    )
+    loop = SimpleEdge(node_source="d", node_path="b")
+
+    manager.add_edges([entry, route, loop])
+
+    assert manager.get_outgoing_edges("b") == (route,)
+    assert manager.get_incoming_edges("b") == (entry, loop)
+    assert manager.get_incoming_edges("c") == (route,)
+    assert manager.get_incoming_edges("a") == ()
@@ -0,0 +1,74 @@
+import asyncio
+from typing import Any
+
+import pytest
+from langchain_core.callbacks import BaseCallbackHandler
+
+from frankstate import WorkflowBuilder
+from frankstate.instrumentation.hooks import ExecutionEvent, ExecutionHook
+from tests.support.frankstate_doubles.layouts import (
+    AsyncBudgetedRetryLayout,
+    FrankTestState,
+    LinearAsyncLayout,
+)
+
+
+class RecordingHook(ExecutionHook):
+    def __init__(self) -> None:
+        super().__init__()
+        self.started: list[ExecutionEvent] = []
+        self.ended: list[tuple[ExecutionEvent, Any]] = []
+
+    def on_start(self, event: ExecutionEvent) -> None:
+        self.started.append(event)
+
+    def on_end(self, event: ExecutionEvent, output: Any) -> None:
+        self.ended.append((event, output))
+
+
+class FailingHook(ExecutionHook):
+    def on_start(self, event: ExecutionEvent) -> None:
+        raise RuntimeError("broken instrument")
+
+
+@pytest.mark.unit
+def test_hooks_receive_graph_node_and_router_events() -> None:
+    hook = RecordingHook()
+    graph = WorkflowBuilder(config=AsyncBudgetedRetryLayout, state_schema=FrankTestState, hooks=[hook]).compile()
+
+    asyncio.run(graph.ainvoke({"messages": []}, config={"callbacks": [BaseCallbackHandler()]}))
+
+    assert hook.layout_name == "AsyncBudgetedRetryLayout"
+    graph_event = hook.started[0]
+    assert graph_event.kind == "graph" and graph_event.parent_run_id is None
+    nodes = [(event.node, event.step) for event in hook.started if event.kind == "node"]
+    assert nodes == [("work_node", 1), ("work_node", 2), ("work_node", 3), ("give_up_node", 4)]
+    routes = [output for event, output in hook.ended if event.kind == "router"]
+    assert routes == ["again", "again", "__budget_exit__"]
+    assert all(event.root_run_id == graph_event.run_id for event in hook.started)
+    assert all(event.duration is not None and event.duration >= 0 for event, _ in hook.ended)
+
+
+@pytest.mark.unit
+def test_failing_hooks_do_not_fail_the_run() -> None:
+    graph = WorkflowBuilder(config=LinearAsyncLayout, state_schema=FrankTestState, hooks=[FailingHook()]).compile()
+
+    result = asyncio.run(graph.ainvoke({"messages": []}))
+
+    assert result["messages"]
+
+
+@pytest.mark.unit
+def test_hooks_force_the_langgraph_engine_and_reject_other_objects() -> None:
+    builder = WorkflowBuilder(
+        config=LinearAsyncLayout,
+        state_schema=FrankTestState,
+        engine="dag",
+        hooks=[RecordingHook()],
+    )
+
+    builder.compile()
+
+    assert builder.engine_fallback_reason == "execution hooks need LangGraph callbacks"
+    with pytest.raises(TypeError, match="ExecutionHook"):
+        WorkflowBuilder(config=LinearAsyncLayout, state_schema=FrankTestState, hooks=[BaseCallbackHandler()])
@@ -1,8 +1,12 @@
+import asyncio
+from typing import Any, ClassVar
+
 import pytest
 
 from frankstate.entity.edge import SimpleEdge
 from frankstate.entity.graph_layout import GraphLayout
 from frankstate.entity.node import SimpleNode
+from frankstate.runtime.shared_runtime import RuntimeRegistry
 from tests.support.frankstate_doubles.builders import FakeRunnableBuilder
 from tests.support.frankstate_doubles.stub import StaticMessageEnhancer
 
@@ -138,3 +142,141 @@ def test_get_runnable_builder_rejects_unknown_name() -> None:
 
     with pytest.raises(KeyError, match="does not expose a RunnableBuilder"):
         layout.get_runnable_builder("MISSING_BUILDER")
+
+
+class SharedLayout(GraphLayout):
+    BUILDER: FakeRunnableBuilder
+
+    share_runtime = True
+    runtime_registry = RuntimeRegistry()
+    builds: ClassVar[list[str]] = []
+    closed: ClassVar[list[dict[str, Any]]] = []
+
+    def __init__(self, variant: str = "default"):
+        super().__init__()
+        self.variant = variant
+
+    def runtime_key(self) -> str:
+        return self.variant
+
+    def build_runtime(self) -> dict[str, FakeRunnableBuilder]:
+        self.builds.append(self.variant)
+        return {"BUILDER": FakeRunnableBuilder(async_result={"content": self.variant})}
+
+    def close_runtime(self, runtime: dict[str, Any]) -> None:
+        self.closed.append(runtime)
+
+    def layout(self) -> None:
+        self.NODE = SimpleNode(enhancer=StaticMessageEnhancer(self.variant), name="node")
+        self.EDGE = SimpleEdge(node_source="node", node_path="END")
+
+
+@pytest.mark.unit
+def test_shared_runtime_is_built_once_per_key_and_closed_by_last_holder() -> None:
+    SharedLayout.builds.clear()
+    SharedLayout.closed.clear()
+    first, second, other = SharedLayout(), SharedLayout(), SharedLayout("other")
+
+    first.get_nodes()
+    second.get_nodes()
+    other.get_nodes()
+
+    assert SharedLayout.builds == ["default", "other"]
+    assert first.BUILDER is second.BUILDER
+    assert other.BUILDER is not first.BUILDER
+    assert first.NODE is not second.NODE
+    assert SharedLayout.runtime_registry.references(SharedLayout, "default") == 2
+
+    first.release_runtime()
+    first.release_runtime()
+    assert SharedLayout.closed == []
+    assert SharedLayout.runtime_registry.references(SharedLayout, "default") == 1
+
+    second.release_runtime()
+    assert [runtime["BUILDER"] for runtime in SharedLayout.closed] == [second.BUILDER]
+    assert [entry.key for entry in SharedLayout.runtime_registry.entries()] == ["other"]
+
+    other.release_runtime()
+    assert SharedLayout.runtime_registry.entries() == []
+
+
+@pytest.mark.unit
+def test_unshared_runtime_is_closed_on_release() -> None:
+    closed: list[dict[str, Any]] = []
+    layout = OrderedLayout()
+    layout.close_runtime = closed.append  # type: ignore[method-assign]
+    layout.get_nodes()
+    runtime = layout.runtime
+    layout.release_runtime()
+
+    assert closed == [runtime]
+    assert layout.runtime is None
+    assert layout.get_nodes()[0].name == "first_node"
+    assert layout.runtime_calls == 1
+
+
+@pytest.mark.unit
+def test_registry_rejects_release_without_acquire() -> None:
+    with pytest.raises(RuntimeError, match="No shared runtime"):
+        RuntimeRegistry().release(SharedLayout, "missing")
+
+
+class PooledLayout(SharedLayout):
+    BUILDER: FakeRunnableBuilder
+
+    runtime_registry = RuntimeRegistry()
+    events: ClassVar[list[str]] = []
+    healthy = True
+
+    async def astart_runtime(self, runtime: dict[str, Any]) -> None:
+        self.events.append("start")
+        await asyncio.sleep(0.01)
+
+    async def acheck_runtime(self, runtime: dict[str, Any]) -> None:
+        self.events.append("check")
+        if not self.healthy:
+            raise ConnectionError("pool unreachable")
+
+    async def aclose_runtime(self, runtime: dict[str, Any]) -> None:
+        self.events.append("aclose")
+
+
+@pytest.mark.unit
+def test_shared_runtime_starts_once_and_closes_after_last_holder() -> None:
+    PooledLayout.events.clear()
+
+    async def scenario() -> None:
+        first, second = PooledLayout(), PooledLayout()
+        await asyncio.gather(first.astart(), second.astart())
+        assert PooledLayout.events == ["start", "check"]
+        assert PooledLayout.runtime_registry.entries()[0].started
+
+        await first.acheck()
+        async with PooledLayout() as third:
+            assert third.BUILDER is first.BUILDER
+        await first.aclose()
+        assert PooledLayout.events == ["start", "check", "check"]
+
+        await second.aclose()
+        assert PooledLayout.events[-1] == "aclose"
+        assert PooledLayout.runtime_registry.entries() == []
+        with pytest.raises(RuntimeError, match="was released"):
+            await second.acheck()
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.unit
+def test_failed_health_check_is_retried_on_next_start() -> None:
+    PooledLayout.events.clear()
+    layout = PooledLayout("flaky")
+    layout.healthy = False
+
+    with pytest.raises(ConnectionError, match="pool unreachable"):
+        asyncio.run(layout.astart())
+    assert not PooledLayout.runtime_registry.entries()[0].started
+
+    layout.healthy = True
+    asyncio.run(layout.astart())
+    assert PooledLayout.events == ["start", "check", "start", "check"]
+    layout.release_runtime()
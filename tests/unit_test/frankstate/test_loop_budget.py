@@ -0,0 +1,144 @@
+import asyncio
+from typing import Any
+
+import pytest
+from langchain_core.callbacks import BaseCallbackHandler
+from langgraph.graph import END, START
+
+from frankstate import WorkflowBuilder
+from frankstate.entity.edge import ConditionalEdge, SimpleEdge
+from frankstate.managers.edge_manager import EdgeManager
+from frankstate.runtime.dag_engine import DagEngine
+from frankstate.runtime.loop_budget import BUDGET_EXIT_ROUTE
+from tests.support.frankstate_doubles.layouts import (
+    AsyncBudgetedRetryLayout,
+    BudgetedRetryLayout,
+    BudgetedSimpleLoopLayout,
+    FrankTestState,
+)
+from tests.support.frankstate_doubles.stub import ConstantRouteEvaluator
+
+
+def _contents(result: dict) -> list[str]:
+    return [message.content for message in result["messages"]]
+
+
+@pytest.mark.unit
+def test_edges_validate_loop_budget_declarations() -> None:
+    with pytest.raises(ValueError, match="declared together"):
+        SimpleEdge(node_source="a", node_path="b", max_traversals=1)
+    with pytest.raises(ValueError, match="non-negative"):
+        ConditionalEdge(
+            node_source="a",
+            map_dict={"go": "b"},
+            evaluator=ConstantRouteEvaluator("go"),
+            max_traversals=-1,
+            exit_to=END,
+        )
+
+    assert SimpleEdge(node_source="a", node_path="b", max_traversals=0, exit_to=END).has_budget is True
+    assert SimpleEdge(node_source="a", node_path="b").has_budget is False
+
+
+@pytest.mark.unit
+def test_edge_manager_routes_budgeted_edges_and_finds_unbounded_cycles() -> None:
+    manager = EdgeManager()
+    manager.add_edges(
+        [
+            SimpleEdge(node_source=START, node_path="a"),
+            SimpleEdge(node_source="a", node_path="b"),
+            SimpleEdge(node_source="b", node_path="a", max_traversals=3, exit_to="c"),
+            SimpleEdge(node_source="c", node_path="d"),
+            ConditionalEdge(node_source="d", map_dict={"loop": "c", "end": END}, evaluator=ConstantRouteEvaluator("end")),
+        ]
+    )
+
+    assert manager.configs_edges() == ((START, "a"), ("a", "b"), ("c", "d"))
+    ((source, _, path_map), _) = manager.configs_conditional_edges()
+    assert (source, path_map) == ("b", {"a": "a", BUDGET_EXIT_ROUTE: "c"})
+    assert manager.find_unbounded_cycles() == [("c", "d")]
+    assert {edge.node_source for edge in manager.get_incoming_edges("c")} == {"b", "d"}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("layout", [BudgetedRetryLayout, AsyncBudgetedRetryLayout])
+def test_conditional_loop_budget_exits_per_run_and_skips_the_evaluator(layout: type) -> None:
+    builder = WorkflowBuilder(config=layout, state_schema=FrankTestState)
+    graph = builder.compile()
+
+    async def _run() -> list[dict]:
+        return list(await asyncio.gather(*(graph.ainvoke({"messages": []}) for _ in range(3))))
+
+    results = asyncio.run(_run())
+
+    assert all(_contents(result) == ["work", "work", "work", "give-up"] for result in results)
+    assert builder.config.RETRY_EDGE.evaluator.calls == 6
+
+
+@pytest.mark.unit
+def test_static_loop_budget_exits_to_end_in_sync_runs() -> None:
+    graph = WorkflowBuilder(config=BudgetedSimpleLoopLayout, state_schema=FrankTestState).compile()
+
+    first = graph.invoke({"messages": []})
+    second = graph.invoke({"messages": []})
+
+    assert _contents(first) == ["ping", "pong", "ping", "pong"]
+    assert _contents(second) == _contents(first)
+
+
+@pytest.mark.unit
+def test_loop_budgets_survive_callbacks_passed_per_call() -> None:
+    class RecordingHandler(BaseCallbackHandler):
+        def __init__(self) -> None:
+            self.nodes: list[str] = []
+
+        def on_chain_start(self, serialized: Any, inputs: Any, **kwargs: Any) -> None:
+            if kwargs.get("metadata", {}).get("langgraph_node") == kwargs.get("name"):
+                self.nodes.append(kwargs["name"])
+
+    handler = RecordingHandler()
+    graph = WorkflowBuilder(config=BudgetedSimpleLoopLayout, state_schema=FrankTestState).compile()
+
+    result = graph.invoke({"messages": []}, {"callbacks": [handler]})
+
+    assert _contents(result) == ["ping", "pong", "ping", "pong"]
+    assert handler.nodes == ["ping_node", "pong_node", "ping_node", "pong_node"]
+
+
+@pytest.mark.unit
+def test_loop_budgets_require_the_builder_compiled_graph() -> None:
+    builder = WorkflowBuilder(config=BudgetedSimpleLoopLayout, state_schema=FrankTestState)
+    builder.compile()
+
+    with pytest.raises(RuntimeError, match="run scope"):
+        builder.workflow.compile().invoke({"messages": []})
+
+
+@pytest.mark.unit
+def test_dag_engine_enforces_budgets_on_acyclic_edges() -> None:
+    class ZeroBudgetLayout(BudgetedSimpleLoopLayout):
+        def layout(self) -> None:
+            super().layout()
+            self.PING_EDGE = SimpleEdge(
+                node_source=self.PING_NODE.name,
+                node_path=self.PONG_NODE.name,
+                max_traversals=0,
+                exit_to=END,
+            )
+            self.BACK_EDGE = SimpleEdge(node_source=self.PONG_NODE.name, node_path=END)
+
+    engine = WorkflowBuilder(config=ZeroBudgetLayout, state_schema=FrankTestState, engine="dag").compile()
+
+    assert isinstance(engine, DagEngine)
+    assert _contents(engine.invoke({"messages": []})) == ["ping"]
+
+
+@pytest.mark.unit
+def test_workflow_builder_rejects_unknown_budget_exit() -> None:
+    class UnknownExitLayout(BudgetedSimpleLoopLayout):
+        def layout(self) -> None:
+            super().layout()
+            self.BACK_EDGE.exit_to = "missing_node"
+
+    with pytest.raises(ValueError, match="unknown node 'missing_node'"):
+        WorkflowBuilder(config=UnknownExitLayout, state_schema=FrankTestState).compile()
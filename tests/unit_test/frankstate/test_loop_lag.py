@@ -0,0 +1,73 @@
+import asyncio
+import logging
+
+import pytest
+
+from frankstate import WorkflowBuilder
+from frankstate.instrumentation.loop_lag import LoopLagMonitor
+from tests.support.frankstate_doubles.layouts import (
+    AsyncBudgetedRetryLayout,
+    BlockingNodeLayout,
+    FrankTestState,
+)
+
+
+@pytest.fixture
+def monitor():
+    monitor = LoopLagMonitor(threshold=0.1, interval=0.02)
+    yield monitor
+    monitor.close()
+
+
+@pytest.mark.unit
+def test_monitor_attributes_blocking_calls_to_their_node(
+    monitor: LoopLagMonitor, caplog: pytest.LogCaptureFixture
+) -> None:
+    graph = WorkflowBuilder(config=BlockingNodeLayout, state_schema=FrankTestState, hooks=[monitor]).compile()
+
+    with caplog.at_level(logging.WARNING, logger="frankstate.instrumentation.loop_lag"):
+        asyncio.run(graph.ainvoke({"messages": []}))
+
+    stall = monitor.stalls[0]
+    assert (stall.kind, stall.component, stall.node, stall.inferred) == ("node", "blocking_node", "blocking_node", False)
+    assert stall.lag >= 0.2
+    assert "in enhance" in (stall.call_site or "")
+    assert stall.active_nodes == ("blocking_node",)
+
+    metrics = monitor.metrics()
+    assert metrics.stalls == 1 and metrics.max_lag >= 0.2
+    assert metrics.stalls_by_component == {"node:blocking_node": 1}
+    records = [record for record in caplog.records if hasattr(record, "loop_stall")]
+    assert records and records[0].loop_stall["node"] == "blocking_node"
+
+
+@pytest.mark.unit
+def test_monitor_stays_quiet_on_cooperative_graphs(monitor: LoopLagMonitor) -> None:
+    graph = WorkflowBuilder(config=AsyncBudgetedRetryLayout, state_schema=FrankTestState, hooks=[monitor]).compile()
+
+    async def run_slowly() -> None:
+        await asyncio.gather(*(graph.ainvoke({"messages": []}) for _ in range(3)))
+        await asyncio.sleep(0.1)
+
+    asyncio.run(run_slowly())
+
+    assert not monitor.stalls
+    assert monitor.metrics().stalls == 0
+
+
+@pytest.mark.unit
+def test_monitor_keeps_reporting_after_close(monitor: LoopLagMonitor) -> None:
+    graph = WorkflowBuilder(config=BlockingNodeLayout, state_schema=FrankTestState, hooks=[monitor]).compile()
+
+    asyncio.run(graph.ainvoke({"messages": []}))
+    monitor.close()
+    asyncio.run(graph.ainvoke({"messages": []}))
+
+    assert monitor.metrics().stalls == 2
+    assert [stall.node for stall in monitor.stalls] == ["blocking_node", "blocking_node"]
+
+
+@pytest.mark.unit
+def test_monitor_rejects_non_positive_settings() -> None:
+    with pytest.raises(ValueError, match="positive"):
+        LoopLagMonitor(threshold=0)
@@ -0,0 +1,105 @@
+import asyncio
+import contextvars
+import importlib.util
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from frankstate import WorkflowBuilder
+from frankstate.runtime.loop_runner import BackgroundLoopRunner
+from tests.support.frankstate_doubles.layouts import (
+    AsyncBudgetedRetryLayout,
+    FrankTestState,
+)
+
+request_id: contextvars.ContextVar[str | None] = contextvars.ContextVar("request_id", default=None)
+
+
+@pytest.fixture
+def runner():
+    runner = BackgroundLoopRunner(use_uvloop=False)
+    yield runner
+    runner.close()
+
+
+@pytest.mark.unit
+def test_runner_reuses_one_loop_across_sync_calls(runner: BackgroundLoopRunner) -> None:
+    async def current_loop() -> asyncio.AbstractEventLoop:
+        return asyncio.get_running_loop()
+
+    graph = WorkflowBuilder(config=AsyncBudgetedRetryLayout, state_schema=FrankTestState).compile()
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda _: runner.run(graph, {"messages": []}), range(4)))
+    loops = {runner.run_coroutine(current_loop()) for _ in range(3)}
+
+    assert loops == {runner.loop}
+    assert all([m.content for m in result["messages"]][-1] == "give-up" for result in results)
+
+
+@pytest.mark.unit
+def test_runner_cancels_the_task_when_the_caller_times_out(runner: BackgroundLoopRunner) -> None:
+    cancelled = threading.Event()
+
+    async def slow() -> None:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(TimeoutError):
+        runner.run_coroutine(slow(), timeout=0.05)
+
+    assert cancelled.wait(1.0)
+
+
+@pytest.mark.unit
+def test_runner_streams_chunks_and_propagates_context(runner: BackgroundLoopRunner) -> None:
+    graph = WorkflowBuilder(config=AsyncBudgetedRetryLayout, state_schema=FrankTestState).compile()
+
+    async def read_request_id() -> str | None:
+        return request_id.get()
+
+    token = request_id.set("req-1")
+    try:
+        seen = runner.run_coroutine(read_request_id())
+    finally:
+        request_id.reset(token)
+    chunks = list(runner.stream(graph, {"messages": []}, stream_mode="updates"))
+
+    assert seen == "req-1"
+    assert [next(iter(chunk)) for chunk in chunks] == ["work_node", "work_node", "work_node", "give_up_node"]
+
+
+@pytest.mark.unit
+def test_runner_refuses_to_block_its_own_loop(runner: BackgroundLoopRunner) -> None:
+    async def nested() -> None:
+        async def noop() -> None:
+            return None
+
+        runner.run_coroutine(noop())
+
+    with pytest.raises(RuntimeError, match="own event loop"):
+        runner.run_coroutine(nested())
+
+
+@pytest.mark.unit
+def test_runner_closes_and_restarts_lazily() -> None:
+    runner = BackgroundLoopRunner(use_uvloop=False)
+    first = runner.loop
+
+    runner.close()
+
+    assert first.is_closed() and not runner.running
+    with runner:
+        assert runner.loop is not first
+    assert not runner.running
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(importlib.util.find_spec("uvloop") is None, reason="uvloop is not installed")
+def test_runner_uses_uvloop_when_available() -> None:
+    with BackgroundLoopRunner() as runner:
+        assert type(runner.loop).__module__.startswith("uvloop")
@@ -0,0 +1,44 @@
+import asyncio
+import logging
+import tracemalloc
+
+import pytest
+
+from frankstate import WorkflowBuilder
+from frankstate.instrumentation.memory import MemoryTracker
+from tests.support.frankstate_doubles.layouts import FrankTestState, LargeOutputLayout
+
+
+@pytest.mark.unit
+def test_tracker_flags_the_node_growing_the_state(caplog: pytest.LogCaptureFixture) -> None:
+    tracker = MemoryTracker(max_output_bytes=10_000, max_state_bytes=None)
+    graph = WorkflowBuilder(config=LargeOutputLayout, state_schema=FrankTestState, hooks=[tracker]).compile()
+
+    with caplog.at_level(logging.WARNING, logger="frankstate.instrumentation.memory"):
+        asyncio.run(graph.ainvoke({"messages": []}))
+
+    small, large = tracker.records
+    assert (small.node, small.flags) == ("small_node", ())
+    assert (large.node, large.flags, large.largest_key) == ("large_node", ("output",), "messages")
+    assert large.output_bytes > 50_000 > large.input_bytes > small.input_bytes
+    assert large.step == 2 and large.allocated is None
+
+    (record,) = caplog.records
+    assert record.node_memory["node"] == "large_node"
+    stats = tracker.stats()
+    assert [item.node for item in stats] == ["large_node", "small_node"]
+    assert stats[0].flagged == 1 and stats[0].output_bytes_by_key.keys() == {"messages"}
+
+
+@pytest.mark.unit
+def test_tracker_traces_allocations_and_state_threshold() -> None:
+    tracker = MemoryTracker(max_output_bytes=None, max_state_bytes=1_000, trace_allocations=True)
+    graph = WorkflowBuilder(config=LargeOutputLayout, state_schema=FrankTestState, hooks=[tracker]).compile()
+
+    was_tracing = tracemalloc.is_tracing()
+    asyncio.run(graph.ainvoke({"messages": []}))
+    tracker.close()
+
+    assert all(isinstance(record.allocated, int) for record in tracker.records)
+    assert [record.flags for record in tracker.records] == [(), ("state",)]
+    assert tracemalloc.is_tracing() == was_tracing
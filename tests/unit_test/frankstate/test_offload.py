@@ -0,0 +1,71 @@
+import asyncio
+import gc
+import os
+
+import pytest
+
+from frankstate import WorkflowBuilder
+from frankstate.entity.node import SimpleNode
+from frankstate.runtime.offload import ProcessPoolOffload, default_max_workers
+from tests.support.frankstate_doubles.layouts import FrankTestState, OffloadedNodeLayout
+from tests.support.frankstate_doubles.stub import (
+    StaticMessageEnhancer,
+    WorkerInfoEnhancer,
+)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("engine", ["langgraph", "dag"])
+def test_offloaded_node_runs_in_an_initialized_worker_with_a_projected_state(engine: str) -> None:
+    builder = WorkflowBuilder(config=OffloadedNodeLayout, state_schema=FrankTestState, engine=engine)
+    graph = builder.compile()
+
+    async def _run() -> list[dict]:
+        return list(
+            await asyncio.gather(
+                *(graph.ainvoke({"messages": [], "tool_text": "pikachu", "route": "cold"}) for _ in range(2))
+            )
+        )
+
+    with builder:
+        results = asyncio.run(_run())
+    assert builder.config.offload._pool is None
+
+    pids, keys = zip(*(result["decision"].split(":") for result in results), strict=True)
+    assert len(set(pids)) == 1 and pids[0] != str(os.getpid())
+    assert set(keys) == {"tool_text"}
+    assert [result["route"] for result in results] == ["warm", "warm"]
+    assert builder.engine_fallback_reason is None
+
+
+@pytest.mark.unit
+def test_offload_rejects_unpicklable_enhancers_and_reuses_wrappers() -> None:
+    offload = ProcessPoolOffload(max_workers=1)
+    node = SimpleNode(enhancer=WorkerInfoEnhancer(), name="worker_node", offload=offload)
+    broken = SimpleNode(enhancer=StaticMessageEnhancer("x", callback=lambda: None), name="broken", offload=offload)
+
+    assert offload.wrap(node) is offload.wrap(node)
+    with pytest.raises(TypeError, match="Node 'broken' cannot be offloaded"):
+        offload.wrap(broken)
+    with pytest.raises(ValueError, match="at least 1"):
+        ProcessPoolOffload(max_workers=0)
+    assert default_max_workers() >= 1
+
+
+@pytest.mark.unit
+def test_offload_shares_equal_enhancers_and_forgets_collected_nodes() -> None:
+    offload = ProcessPoolOffload(max_workers=1)
+    first = SimpleNode(enhancer=WorkerInfoEnhancer(), name="worker_node", offload=offload)
+    rebuilt = SimpleNode(enhancer=WorkerInfoEnhancer(), name="worker_node", offload=offload)
+    other = SimpleNode(enhancer=StaticMessageEnhancer("other"), name="other_node", offload=offload)
+
+    wrappers = [offload.wrap(first), offload.wrap(rebuilt), offload.wrap(other)]
+    assert len(offload._enhancers) == 2
+
+    del first, rebuilt, wrappers[:2]
+    gc.collect()
+    assert [key.split("#")[0] for key in offload._enhancers] == ["StaticMessageEnhancer"]
+
+    del other, wrappers
+    gc.collect()
+    assert offload._enhancers == {}
@@ -0,0 +1,100 @@
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("opentelemetry.sdk")
+
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.trace import StatusCode
+
+from frankstate import WorkflowBuilder
+from frankstate.instrumentation.otel import OpenTelemetryHook, create_tracer_provider
+from tests.support.frankstate_doubles.layouts import (
+    ChatLoopLayout,
+    FailingNodeLayout,
+    FrankTestState,
+)
+
+
+@pytest.fixture
+def exporter() -> InMemorySpanExporter:
+    return InMemorySpanExporter()
+
+
+def _hook(exporter: InMemorySpanExporter) -> OpenTelemetryHook:
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    return OpenTelemetryHook(tracer_provider=provider)
+
+
+@pytest.mark.unit
+def test_spans_cover_runs_nodes_edges_and_builders(exporter: InMemorySpanExporter) -> None:
+    graph = WorkflowBuilder(config=ChatLoopLayout, state_schema=FrankTestState, hooks=[_hook(exporter)]).compile()
+
+    asyncio.run(graph.ainvoke({"messages": []}))
+
+    spans = {}
+    for span in exporter.get_finished_spans():
+        spans.setdefault(span.name, []).append(span)
+    assert set(spans) == {"run ChatLoopLayout", "node answer_node", "edge answer_node", "runnable FakeChatBuilder"}
+
+    (run,) = spans["run ChatLoopLayout"]
+    assert run.parent is None
+    assert run.attributes["gen_ai.usage.input_tokens"] == 20
+    assert run.attributes["frankstate.usage.total_tokens"] == 30
+
+    nodes = sorted(spans["node answer_node"], key=lambda span: span.attributes["frankstate.iteration"])
+    assert [node.attributes["frankstate.step"] for node in nodes] == [1, 2]
+    assert all(node.parent.span_id == run.context.span_id for node in nodes)
+    assert nodes[0].attributes["frankstate.node.tags"] == ("answer", "llm")
+    assert nodes[0].attributes["frankstate.layout"] == "ChatLoopLayout"
+    assert nodes[0].attributes["gen_ai.usage.output_tokens"] == 5
+
+    edges = sorted(spans["edge answer_node"], key=lambda span: span.attributes["frankstate.iteration"])
+    assert [edge.attributes["frankstate.edge.decision"] for edge in edges] == ["again", "__budget_exit__"]
+    builders = spans["runnable FakeChatBuilder"]
+    assert {builder.parent.span_id for builder in builders} == {node.context.span_id for node in nodes}
+    assert all(builder.attributes["frankstate.usage.total_tokens"] == 15 for builder in builders)
+
+
+@pytest.mark.unit
+def test_failed_nodes_mark_their_spans_as_errors(exporter: InMemorySpanExporter) -> None:
+    graph = WorkflowBuilder(
+        config=FailingNodeLayout,
+        state_schema=FrankTestState,
+        hooks=[_hook(exporter)],
+    ).compile()
+
+    with pytest.raises(RuntimeError, match="enhancer failed"):
+        asyncio.run(graph.ainvoke({"messages": []}))
+
+    failed = {span.name: span for span in exporter.get_finished_spans() if span.status.status_code == StatusCode.ERROR}
+    assert set(failed) == {"run FailingNodeLayout", "node failing_node"}
+    assert failed["node failing_node"].events[0].name == "exception"
+
+
+@pytest.mark.unit
+def test_file_exporter_writes_one_json_span_per_line(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = tmp_path / "spans.jsonl"
+    opened: list = []
+    open_path = Path.open
+    monkeypatch.setattr(Path, "open", lambda self, *args, **kwargs: opened.append(open_path(self, *args, **kwargs)) or opened[-1])
+    provider = create_tracer_provider(exporter="file", path=path)
+    graph = WorkflowBuilder(
+        config=ChatLoopLayout,
+        state_schema=FrankTestState,
+        hooks=[OpenTelemetryHook(tracer_provider=provider)],
+    ).compile()
+
+    asyncio.run(graph.ainvoke({"messages": []}))
+    provider.shutdown()
+    assert [stream.closed for stream in opened] == [True]
+
+    names = [json.loads(line)["name"] for line in path.read_text().splitlines()]
+    assert names.count("node answer_node") == 2 and names[-1] == "run ChatLoopLayout"
+    with pytest.raises(ValueError, match="path"):
+        create_tracer_provider(exporter="file")
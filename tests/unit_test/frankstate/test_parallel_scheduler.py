@@ -0,0 +1,133 @@
+import asyncio
+
+import pytest
+from langgraph.graph import END, START
+
+from frankstate import WorkflowBuilder
+from frankstate.entity.edge import ConditionalEdge, SimpleEdge
+from frankstate.entity.node import SimpleNode
+from frankstate.managers.edge_manager import EdgeManager
+from frankstate.managers.node_manager import NodeManager
+from frankstate.optimizers.parallel_scheduler import ParallelScheduler
+from tests.support.frankstate_doubles.layouts import (
+    ChainTestState,
+    IndependentChainLayout,
+)
+from tests.support.frankstate_doubles.stub import (
+    FieldRouteEvaluator,
+    StaticMessageEnhancer,
+)
+
+
+def _managers(nodes: list[SimpleNode], edges: list[SimpleEdge | ConditionalEdge]) -> tuple[NodeManager, EdgeManager]:
+    node_manager = NodeManager()
+    node_manager.add_nodes(nodes)
+    edge_manager = EdgeManager()
+    edge_manager.add_edges(edges)
+    return node_manager, edge_manager
+
+
+def _node(name: str, reads: list[str] | None = None, writes: list[str] | None = None) -> SimpleNode:
+    return SimpleNode(StaticMessageEnhancer(name), name=name, reads=reads, writes=writes)
+
+
+@pytest.mark.unit
+def test_plan_groups_independent_nodes_and_explains_conflicts() -> None:
+    node_manager, edge_manager = _managers(
+        [
+            _node("rewrite", reads=["question"], writes=["rewritten"]),
+            _node("retrieve", reads=["question"], writes=["context"]),
+            _node("answer", reads=["rewritten", "context"], writes=["answer"]),
+        ],
+        [
+            SimpleEdge(node_source=START, node_path="rewrite"),
+            SimpleEdge(node_source="rewrite", node_path="retrieve"),
+            SimpleEdge(node_source="retrieve", node_path="answer"),
+            SimpleEdge(node_source="answer", node_path=END),
+        ],
+    )
+
+    report = ParallelScheduler(node_manager, edge_manager).plan()
+
+    assert report.stages == (("rewrite", "retrieve"),)
+    assert report.parallelized_nodes == ("rewrite", "retrieve")
+    assert set(report.edges) == {
+        (START, "rewrite"),
+        (START, "retrieve"),
+        (("rewrite", "retrieve"), "answer"),
+        ("answer", END),
+    }
+    decisions = {decision.node: decision for decision in report.decisions}
+    assert decisions["retrieve"].parallelized is True
+    assert decisions["answer"].parallelized is False
+    assert "reads ['rewritten'] written by 'rewrite'" in decisions["answer"].reason
+    assert "||" in report.summary()
+
+
+@pytest.mark.unit
+def test_plan_keeps_undeclared_and_write_conflicting_nodes_sequential() -> None:
+    node_manager, edge_manager = _managers(
+        [
+            _node("first", reads=[], writes=["messages"]),
+            _node("second", reads=[], writes=["messages"]),
+            _node("third"),
+        ],
+        [
+            SimpleEdge(node_source=START, node_path="first"),
+            SimpleEdge(node_source="first", node_path="second"),
+            SimpleEdge(node_source="second", node_path="third"),
+            SimpleEdge(node_source="third", node_path=END),
+        ],
+    )
+
+    report = ParallelScheduler(node_manager, edge_manager).plan()
+
+    assert report.stages == ()
+    assert report.edges == edge_manager.configs_edges()
+    reasons = {decision.node: decision.reason for decision in report.decisions}
+    assert reasons["second"] == "writes ['messages'] also written by 'first'"
+    assert reasons["third"] == "does not declare reads/writes"
+
+
+@pytest.mark.unit
+def test_plan_does_not_fan_out_heads_reached_through_conditional_edges() -> None:
+    node_manager, edge_manager = _managers(
+        [
+            _node("router", reads=[], writes=[]),
+            _node("left", reads=["question"], writes=["a"]),
+            _node("right", reads=["question"], writes=["b"]),
+        ],
+        [
+            SimpleEdge(node_source=START, node_path="router"),
+            ConditionalEdge(node_source="router", map_dict={"go": "left"}, evaluator=FieldRouteEvaluator()),
+            SimpleEdge(node_source="left", node_path="right"),
+            SimpleEdge(node_source="right", node_path=END),
+        ],
+    )
+
+    report = ParallelScheduler(node_manager, edge_manager).plan()
+
+    assert report.stages == ()
+    reasons = {decision.node: decision.reason for decision in report.decisions}
+    assert "reached through a conditional edge" in reasons["right"]
+
+
+@pytest.mark.unit
+def test_workflow_builder_runs_parallel_stage_in_one_superstep_with_same_result() -> None:
+    sequential = WorkflowBuilder(config=IndependentChainLayout, state_schema=ChainTestState)
+    parallel = WorkflowBuilder(config=IndependentChainLayout, state_schema=ChainTestState, parallelize=True)
+
+    payload = {"messages": [], "question": "pikachu"}
+    sequential_result = asyncio.run(sequential.compile().ainvoke(payload))
+    parallel_result = asyncio.run(parallel.compile().ainvoke(payload))
+
+    assert parallel_result == sequential_result
+    assert parallel_result["answer"] == "PIKACHU|docs:pikachu"
+    assert sequential.parallelization_report is None
+    assert parallel.parallelization_report is not None
+    assert parallel.parallelization_report.stages == (("rewrite_node", "retrieve_node"),)
+
+    steps = parallel.config.steps
+    assert steps["rewritten"] == steps["context"]
+    assert steps["answer"] == steps["context"] + 1
+    assert sequential.config.steps["context"] == sequential.config.steps["rewritten"] + 1
@@ -0,0 +1,57 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from frankstate import WorkflowBuilder
+from frankstate.instrumentation.profiler import RunProfiler
+from tests.support.frankstate_doubles.layouts import BlockingNodeLayout, FrankTestState
+
+
+@pytest.mark.unit
+def test_only_runs_asking_for_a_profile_are_profiled(tmp_path: Path) -> None:
+    profiler = RunProfiler(output_dir=tmp_path, interval=0.002, top=5)
+    graph = WorkflowBuilder(config=BlockingNodeLayout, state_schema=FrankTestState, hooks=[profiler]).compile()
+
+    async def run_concurrently() -> None:
+        await asyncio.gather(
+            graph.ainvoke({"messages": []}),
+            graph.ainvoke({"messages": []}, config={"metadata": {"profile": True}}),
+        )
+
+    asyncio.run(run_concurrently())
+    profiler.flush()
+
+    (profile,) = profiler.profiles
+    assert profile.layout == "BlockingNodeLayout"
+    assert max(profile.samples_by_node, key=profile.samples_by_node.get) == "blocking_node"
+    top = [stat.function for stat in profile.top_by_node["blocking_node"]]
+    assert any(function.startswith("BlockingSleepEnhancer.enhance (") for function in top)
+
+    assert profile.path == tmp_path / f"BlockingNodeLayout-{profile.run_id}.folded"
+    lines = profile.path.read_text().splitlines()
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+    assert any(line.startswith("blocking_node;") and "BlockingSleepEnhancer.enhance" in line for line in lines)
+    assert "blocking_node:" in profile.path.with_suffix(".txt").read_text()
+
+
+@pytest.mark.unit
+def test_profiler_counts_samples_of_the_run_blocked_by_another_as_awaiting() -> None:
+    profiler = RunProfiler(output_dir=None, interval=0.002)
+    graph = WorkflowBuilder(config=BlockingNodeLayout, state_schema=FrankTestState, hooks=[profiler]).compile()
+    other = WorkflowBuilder(config=BlockingNodeLayout, state_schema=FrankTestState).compile()
+
+    async def run_concurrently() -> None:
+        await asyncio.gather(
+            other.ainvoke({"messages": []}),
+            graph.ainvoke({"messages": []}, config={"metadata": {"profile": True}}),
+        )
+
+    asyncio.run(run_concurrently())
+
+    (profile,) = profiler.profiles
+    assert profile.path is None
+    assert sum(profile.samples_by_node.values()) == profile.samples
+    assert profile.awaiting_by_node.get("blocking_node", 0) + profile.awaiting_by_node.get("fast_node", 0) > 0
+    with pytest.raises(ValueError, match="interval"):
+        RunProfiler(interval=0)
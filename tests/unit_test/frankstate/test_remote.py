@@ -0,0 +1,133 @@
+import asyncio
+import os
+
+import pytest
+from langchain_core.messages import AIMessage
+from pydantic import BaseModel
+
+from frankstate import WorkflowBuilder
+from frankstate.runtime.remote import (
+    NodeWorker,
+    RemoteNodeError,
+    RemoteOffload,
+    WorkerAddress,
+)
+from tests.support.frankstate_doubles.layouts import FrankTestState, RemoteNodeLayout
+from tests.support.frankstate_doubles.stub import FailingEnhancer, StaticMessageEnhancer
+
+
+@pytest.mark.unit
+def test_remote_nodes_run_on_workers_balanced_and_retried_past_dead_ones(
+    monkeypatch: pytest.MonkeyPatch, tmp_path
+) -> None:
+    async def scenario() -> None:
+        # Port 1 refuses connections: calls routed there are retried on a live worker.
+        monkeypatch.setenv("FRANKSTATE_TEST_WORKERS", "127.0.0.1:1")
+        async with (
+            NodeWorker.from_layout(RemoteNodeLayout, address=f"unix:{tmp_path / 'worker.sock'}") as unix_worker,
+            NodeWorker.from_layout(RemoteNodeLayout) as tcp_worker,
+        ):
+            for name, worker in (("unix", unix_worker), ("tcp", tcp_worker)):
+                worker.enhancers = {key: _Counting(enhancer, calls, name) for key, enhancer in worker.enhancers.items()}
+            monkeypatch.setenv(
+                "FRANKSTATE_TEST_WORKERS", ",".join([unix_worker.address, tcp_worker.address, "127.0.0.1:1"])
+            )
+
+            builder = WorkflowBuilder(config=RemoteNodeLayout, state_schema=FrankTestState)
+            graph = builder.compile()
+            results.extend(
+                await asyncio.gather(
+                    *(graph.ainvoke({"messages": [], "tool_text": "pikachu", "route": "cold"}) for _ in range(6))
+                )
+            )
+            await builder.config.remote.aclose()
+            remotes.append(builder.config.remote)
+
+    calls = {"unix": 0, "tcp": 0}
+    results: list[dict] = []
+    remotes: list[RemoteOffload] = []
+    asyncio.run(scenario())
+
+    for result in results:
+        assert [message.content for message in result["messages"]] == ["local", "remote-answer"]
+        assert result["decision"] == f"{os.getpid()}:tool_text"
+    assert calls["unix"] > 0 and calls["tcp"] > 0
+    assert calls["unix"] + calls["tcp"] == 12
+    assert remotes[0].workers[2].failures >= 1
+
+
+class _Counting:
+    def __init__(self, enhancer, calls: dict[str, int], name: str):
+        self.enhancer, self.calls, self.name = enhancer, calls, name
+
+    async def enhance(self, state):
+        self.calls[self.name] += 1
+        result = self.enhancer.enhance(state)
+        return await result if asyncio.iscoroutine(result) else result
+
+
+@pytest.mark.unit
+def test_remote_errors_surface_without_retry_and_unreachable_workers_fail_checks() -> None:
+    failing = FailingEnhancer("model overloaded")
+
+    async def scenario() -> None:
+        async with NodeWorker({"fail_node": failing}) as worker:
+            remote = RemoteOffload([worker.address], retries=3, backoff=0.0)
+            with pytest.raises(RemoteNodeError, match="RuntimeError: model overloaded") as error:
+                await remote.call("fail_node", {})
+            assert error.value.error_type == "RuntimeError"
+            with pytest.raises(RemoteNodeError, match="does not serve node 'missing'"):
+                await remote.call("missing", {})
+            await remote.aclose()
+
+        unreachable = RemoteOffload(["127.0.0.1:1"], retries=1, backoff=0.0)
+        with pytest.raises(RemoteNodeError, match="failed on 2 attempt"):
+            await unreachable.call("fail_node", {})
+        with pytest.raises(RemoteNodeError, match="unreachable"):
+            await unreachable.acheck()
+
+    asyncio.run(scenario())
+
+    assert failing.calls == 1
+    assert str(WorkerAddress.parse("[::1]:80")) == "[::1]:80"
+    with pytest.raises(ValueError, match="host:port"):
+        WorkerAddress.parse("localhost")
+    with pytest.raises(ValueError, match="non-empty"):
+        RemoteOffload("127.0.0.1:80")
+
+
+class _Payload(BaseModel):
+    command: str
+
+
+@pytest.mark.unit
+def test_remote_frames_with_unlisted_types_are_rejected_and_callers_must_share_the_secret() -> None:
+    failing = FailingEnhancer("should not run")
+
+    async def scenario() -> None:
+        async with NodeWorker({"fail_node": failing, "answer_node": StaticMessageEnhancer("ok")}, secret="s3cret") as worker:
+            remote = RemoteOffload([worker.address], retries=0, secret="s3cret")
+            with pytest.raises(RemoteNodeError, match="FrameRejectedError: .*_Payload") as error:
+                await remote.call("fail_node", {"payload": _Payload(command="rm -rf /")})
+            assert error.value.error_type == "FrameRejectedError"
+            update = await remote.call("answer_node", {"messages": [AIMessage(content="hi")]})
+            assert update["messages"][0].content == "ok"
+            await remote.acheck()
+            await remote.aclose()
+
+            with pytest.raises(RemoteNodeError, match="requires a shared secret"):
+                await RemoteOffload([worker.address], retries=0).call("answer_node", {})
+            with pytest.raises(RemoteNodeError, match="failed on 1 attempt"):
+                await RemoteOffload([worker.address], retries=0, secret="wrong").call("answer_node", {})
+
+        async with NodeWorker({"fail_node": failing}, allowed_types=[_Payload]) as worker:
+            remote = RemoteOffload([worker.address], retries=0)
+            with pytest.raises(RemoteNodeError, match="RuntimeError: should not run"):
+                await remote.call("fail_node", {"payload": _Payload(command="echo")})
+            await remote.aclose()
+
+    asyncio.run(scenario())
+
+    assert failing.calls == 1
+    with pytest.raises(ValueError, match="requires a `secret`"):
+        NodeWorker({"fail_node": failing}, address="0.0.0.0:8765")
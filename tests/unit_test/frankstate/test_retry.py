@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+
+from frankstate import WorkflowBuilder
+from frankstate.entity.node import SimpleNode
+from frankstate.managers.node_manager import NodeManager
+from frankstate.runtime.retry import NodeRetry, RetryBudget
+from tests.support.frankstate_doubles.layouts import FlakyNodeLayout, FrankTestState
+from tests.support.frankstate_doubles.stub import StaticMessageEnhancer
+
+
+def _run(layout: type[FlakyNodeLayout]) -> tuple[dict, WorkflowBuilder]:
+    builder = WorkflowBuilder(config=layout, state_schema=FrankTestState)
+    graph = builder.compile()
+    return asyncio.run(graph.ainvoke({"messages": []})), builder
+
+
+@pytest.mark.unit
+def test_node_retry_recovers_flaky_backend_and_draws_on_budget() -> None:
+    budget = RetryBudget("backend", rate=0.0, capacity=5)
+
+    class RetriedLayout(FlakyNodeLayout):
+        failures = 2
+        retry = NodeRetry(retry_on=(ConnectionError,), max_attempts=3, initial_interval=0.0, jitter=False, budget=budget)
+
+    result, builder = _run(RetriedLayout)
+
+    assert result["messages"][-1].content == "answered after 3 calls"
+    assert builder.config.FLAKY_NODE.enhancer.calls == 3
+    assert (budget.granted, budget.denied) == (2, 0)
+
+    class NotRetriedLayout(FlakyNodeLayout):
+        failures = 1
+        retry = NodeRetry(retry_on=(TimeoutError,), initial_interval=0.0, budget=budget)
+
+    with pytest.raises(ConnectionError):
+        _run(NotRetriedLayout)
+    assert budget.granted == 2
+
+
+@pytest.mark.unit
+def test_empty_budget_stops_retries_and_conflicting_policies_are_rejected() -> None:
+    budget = RetryBudget("degraded", rate=0.0, capacity=1)
+    retry = NodeRetry(retry_on=(ConnectionError,), max_attempts=5, initial_interval=0.0, jitter=False, budget=budget)
+
+    class StormLayout(FlakyNodeLayout):
+        failures = 10
+
+    StormLayout.retry = retry
+    with pytest.raises(ConnectionError, match="call 2"):
+        _run(StormLayout)
+    assert (budget.granted, budget.denied) == (1, 1)
+
+    manager = NodeManager()
+    node = SimpleNode(enhancer=StaticMessageEnhancer("x"), name="node", kwargs={"retry_policy": None}, retry=retry)
+    with pytest.raises(ValueError, match="retry policy both"):
+        manager._get_node_kwargs(node)
+    with pytest.raises(ValueError, match="max_attempts"):
+        NodeRetry(max_attempts=0)
+    with pytest.raises(ValueError, match="capacity"):
+        RetryBudget("none", rate=1.0, capacity=0)
+
+
+@pytest.mark.unit
+def test_budget_is_only_charged_when_another_attempt_runs() -> None:
+    budget = RetryBudget("backend", rate=0.0, capacity=10)
+
+    class SingleAttemptLayout(FlakyNodeLayout):
+        failures = 10
+        retry = NodeRetry(retry_on=(ConnectionError,), max_attempts=1, budget=budget)
+
+    for _ in range(3):
+        with pytest.raises(ConnectionError, match="call 1"):
+            _run(SingleAttemptLayout)
+    assert (budget.granted, budget.denied, budget.tokens) == (0, 0, 10.0)
+
+    class ExhaustedLayout(FlakyNodeLayout):
+        failures = 10
+        retry = NodeRetry(retry_on=(ConnectionError,), max_attempts=3, initial_interval=0.0, jitter=False, budget=budget)
+
+    with pytest.raises(ConnectionError, match="call 3"):
+        _run(ExhaustedLayout)
+    assert (budget.granted, budget.tokens) == (2, 8.0)
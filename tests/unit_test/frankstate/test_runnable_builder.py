@@ -1,8 +1,11 @@
 import asyncio
 
 import pytest
+from langchain_core.runnables import RunnableBinding, RunnableSequence
 
+from frankstate.entity.runnable_builder import BUILDER_METADATA_KEY, instrument_builders
 from tests.support.frankstate_doubles.builders import (
+    FakeChatBuilder,
     FakeRunnableBuilder,
 )
 
@@ -25,4 +28,19 @@ def test_runnable_builder_invoke_and_ainvoke_delegate_to_configured_runnable() -
     assert builder.invoke("payload") == "sync-result"
     assert asyncio.run(builder.ainvoke("payload")) == "async-result"
     assert builder.configure_calls == 1
-    assert builder.get().calls == [("invoke", "payload"), ("ainvoke", "payload")]
\ No newline at end of file
+    assert builder.get().calls == [("invoke", "payload"), ("ainvoke", "payload")]
+
+@pytest.mark.unit
+def test_runnable_builder_names_its_runnable_only_for_instrumentation() -> None:
+    builder = FakeChatBuilder()
+
+    plain = builder.get()
+    with instrument_builders():
+        named = builder.get()
+        assert builder.get() is named
+
+    assert isinstance(plain, RunnableSequence)
+    assert builder.get() is plain
+    assert isinstance(named, RunnableBinding) and named.bound is plain
+    assert named.config["run_name"] == "FakeChatBuilder"
+    assert named.config["metadata"] == {BUILDER_METADATA_KEY: "FakeChatBuilder"}
@@ -0,0 +1,134 @@
+import pytest
+from langgraph.graph import END, START
+
+from frankstate.analysis.simulator import (
+    Empirical,
+    Fixed,
+    LayoutSimulator,
+    LogNormal,
+    NodeProfile,
+    RouteProfile,
+)
+from frankstate.entity.edge import ConditionalEdge, SimpleEdge
+from frankstate.entity.node import SimpleNode
+from frankstate.managers.edge_manager import EdgeManager
+from frankstate.managers.node_manager import NodeManager
+from tests.support.frankstate_doubles.layouts import BudgetedRetryLayout
+from tests.support.frankstate_doubles.stub import (
+    ConstantRouteEvaluator,
+    StaticMessageEnhancer,
+)
+
+
+def _managers(names: list[str], edges: list[SimpleEdge | ConditionalEdge]) -> tuple[NodeManager, EdgeManager]:
+    node_manager = NodeManager()
+    node_manager.add_nodes([SimpleNode(enhancer=StaticMessageEnhancer(name), name=name) for name in names])
+    edge_manager = EdgeManager()
+    edge_manager.add_edges(edges)
+    return node_manager, edge_manager
+
+
+def _fan_out() -> tuple[NodeManager, EdgeManager]:
+    return _managers(
+        ["a", "b", "c"],
+        [
+            SimpleEdge(node_source=START, node_path="a"),
+            SimpleEdge(node_source=START, node_path="b"),
+            SimpleEdge(node_source="a", node_path="c"),
+            SimpleEdge(node_source="b", node_path="c"),
+            SimpleEdge(node_source="c", node_path=END),
+        ],
+    )
+
+
+@pytest.mark.unit
+def test_simulator_models_supersteps_concurrency_and_llm_calls() -> None:
+    profiles = {
+        "a": NodeProfile(Fixed(0.2), llm_calls=1),
+        "b": NodeProfile(Fixed(0.5), llm_calls=1),
+        "c": NodeProfile(Fixed(0.1)),
+    }
+
+    report = LayoutSimulator(*_fan_out(), nodes=profiles).run(runs=50, seed=1)
+    serialized = LayoutSimulator(*_fan_out(), nodes=profiles, max_concurrency=1).run(runs=50, seed=1)
+
+    assert report.latency[50.0] == pytest.approx(0.6)
+    assert serialized.latency[99.0] == pytest.approx(0.8)
+    assert report.mean_llm_calls == 2
+    assert report.node_visits == {"a": 1.0, "b": 1.0, "c": 1.0}
+    assert report.failed_runs == 0
+
+
+@pytest.mark.unit
+def test_simulator_honours_route_probabilities_and_loop_budgets(monkeypatch: pytest.MonkeyPatch) -> None:
+    closed: list[object] = []
+    monkeypatch.setattr(BudgetedRetryLayout, "close_runtime", lambda self, runtime: closed.append(runtime))
+    simulator = LayoutSimulator.from_layout(
+        BudgetedRetryLayout,
+        nodes={"work_node": NodeProfile(Fixed(1.0), llm_calls=1)},
+        routes={"work_node": RouteProfile({"again": 0.5, "done": 0.5}, latency=Fixed(0.5), llm_calls=1)},
+        default_node=NodeProfile(Fixed(0.0)),
+    )
+    # The layout class was instantiated for its topology only.
+    assert len(closed) == 1
+
+    report = simulator.run(runs=4000, seed=7)
+
+    # Two graded traversals at most; the third attempt gives up without grading.
+    assert report.latency[99.0] == pytest.approx(4.0)
+    assert report.llm_calls[99.0] == 5
+    assert report.node_visits["work_node"] == pytest.approx(1.75, abs=0.05)
+    assert report.node_visits["give_up_node"] == pytest.approx(0.25, abs=0.03)
+
+
+@pytest.mark.unit
+def test_simulator_reports_the_throughput_bottleneck() -> None:
+    simulator = LayoutSimulator(*_fan_out(), nodes={}, default_node=NodeProfile(Fixed(0.5), llm_calls=1))
+
+    unbounded = simulator.run(runs=10, concurrent_runs=20, seed=3)
+    bounded = simulator.run(runs=10, concurrent_runs=20, llm_capacity=30.0, seed=3)
+
+    assert (unbounded.throughput, unbounded.bottleneck) == (pytest.approx(20.0), "concurrency")
+    assert (bounded.throughput, bounded.bottleneck) == (pytest.approx(10.0), "backend")
+    assert "bound by backend" in bounded.summary()
+
+
+@pytest.mark.unit
+def test_simulator_counts_runs_stopped_by_the_recursion_limit() -> None:
+    node_manager, edge_manager = _managers(
+        ["loop"],
+        [
+            SimpleEdge(node_source=START, node_path="loop"),
+            ConditionalEdge(
+                node_source="loop",
+                map_dict={"again": "loop", "done": END},
+                evaluator=ConstantRouteEvaluator("again"),
+            ),
+        ],
+    )
+    simulator = LayoutSimulator(
+        node_manager,
+        edge_manager,
+        nodes={"loop": NodeProfile(LogNormal(median=0.1, p95=0.4))},
+        routes={"loop": RouteProfile({"again": 1.0})},
+    )
+
+    report = simulator.run(runs=5, seed=0)
+
+    assert report.failed_runs == 5
+    assert report.throughput == 0.0
+    assert "5 run(s) hit the recursion limit" in report.summary()
+
+
+@pytest.mark.unit
+def test_simulator_rejects_profiles_that_do_not_match_the_topology() -> None:
+    profiles = {name: NodeProfile(Empirical([0.1, 0.2])) for name in ("a", "b", "c")}
+
+    with pytest.raises(ValueError, match="Missing node profiles"):
+        LayoutSimulator(*_fan_out(), nodes={"a": profiles["a"]})
+    with pytest.raises(ValueError, match="unknown nodes"):
+        LayoutSimulator(*_fan_out(), nodes={**profiles, "missing": profiles["a"]})
+    with pytest.raises(ValueError, match="does not match any conditional routing"):
+        LayoutSimulator(*_fan_out(), nodes=profiles, routes={"a": RouteProfile({"x": 1.0})})
+    with pytest.raises(ValueError, match="`Empirical` requires"):
+        Empirical([])
@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+from langchain_core.messages import AIMessageChunk
+
+from frankstate import WorkflowBuilder
+from frankstate.runtime.stream_hub import StreamEvent, StreamHub
+from tests.support.frankstate_doubles.layouts import (
+    DegradableRagLayout,
+    FailingNodeLayout,
+    FrankTestState,
+)
+
+
+@pytest.mark.unit
+def test_hub_fans_out_one_run_with_backpressure_and_drop_policies() -> None:
+    graph = WorkflowBuilder(config=DegradableRagLayout, state_schema=FrankTestState).compile()
+    hub = StreamHub(graph, stream_mode=("updates", "values"))
+    trace = hub.subscribe("trace", maxsize=1, policy="block")
+    ui = hub.subscribe("ui", modes=["updates"], maxsize=1, policy="drop_newest")
+    seen: dict[str, list[StreamEvent]] = {"trace": [], "ui": []}
+
+    async def consume(name: str, subscription, delay: float) -> None:
+        async for event in subscription:
+            seen[name].append(event)
+            await asyncio.sleep(delay)
+
+    async def scenario() -> int:
+        streamed, *_ = await asyncio.gather(
+            hub.run({"messages": [], "route": "", "decision": "", "tool_text": ""}),
+            consume("trace", trace, 0.0),
+            consume("ui", ui, 0.05),
+        )
+        return streamed
+
+    streamed = asyncio.run(scenario())
+
+    assert [event.seq for event in seen["trace"]] == list(range(streamed))
+    assert [next(iter(event.data)) for event in seen["trace"] if event.mode == "updates"] == [
+        "retrieve_node",
+        "grade_node",
+        "answer_node",
+        "review_node",
+    ]
+    assert seen["trace"][-1].mode == "values"
+    assert all(event.mode == "updates" for event in seen["ui"])
+    assert ui.dropped > 0 and ui.delivered + ui.dropped == 4
+    with pytest.raises(RuntimeError, match="single run"):
+        asyncio.run(hub.run({}))
+
+
+@pytest.mark.unit
+def test_coalescing_merges_chunks_and_run_errors_reach_consumers() -> None:
+    hub = StreamHub(graph=None, stream_mode=("updates", "messages"))
+    tokens = hub.subscribe("tokens", maxsize=1, policy="coalesce")
+
+    async def publish() -> list[StreamEvent]:
+        for text in ("Pika", "chu", "!"):
+            await hub.publish("messages", (AIMessageChunk(content=text, id="m1"), {"langgraph_node": "answer"}))
+        await hub.publish("updates", {"answer": {"messages": ["a"], "route": "x"}})
+        await hub.publish("updates", {"answer": {"messages": ["b"], "route": "y"}})
+        tokens.finish()
+        return [event async for event in tokens]
+
+    events = asyncio.run(publish())
+
+    assert [event.mode for event in events] == ["updates"]
+    assert events[0].data == {"answer": {"messages": ["a", "b"], "route": "y"}}
+    assert tokens.coalesced == 3 and tokens.dropped == 1
+
+    failing = StreamHub(WorkflowBuilder(config=FailingNodeLayout, state_schema=FrankTestState).compile(), "updates")
+    listener = failing.subscribe("listener")
+
+    async def fail() -> list[BaseException | None]:
+        return await asyncio.gather(
+            failing.run({"messages": []}),
+            _drain(listener),
+            return_exceptions=True,
+        )
+
+    run_error, consumer_error = asyncio.run(fail())
+    assert isinstance(run_error, RuntimeError) and consumer_error is run_error
+    with pytest.raises(RuntimeError, match="Subscribe before"):
+        failing.subscribe("late")
+    with pytest.raises(ValueError, match="not streamed by the hub"):
+        StreamHub(graph=None, stream_mode="updates").subscribe("values", modes=["values"])
+
+
+async def _drain(subscription) -> None:
+    async for _ in subscription:
+        pass
@@ -0,0 +1,90 @@
+import asyncio
+from typing import Any
+
+import pytest
+from langgraph.graph import END
+
+from frankstate import WorkflowBuilder
+from frankstate.instrumentation.usage import (
+    RunUsage,
+    TokenBudget,
+    TokenBudgetExceeded,
+    TokenUsage,
+    TokenUsageTracker,
+)
+from tests.support.frankstate_doubles.builders import FakeChatBuilder
+from tests.support.frankstate_doubles.layouts import ChatLoopLayout, FrankTestState
+
+
+@pytest.mark.unit
+def test_tracker_aggregates_usage_per_node_builder_and_run() -> None:
+    finished: list[RunUsage] = []
+    tracker = TokenUsageTracker(on_run_end=finished.append)
+    graph = WorkflowBuilder(config=ChatLoopLayout, state_schema=FrankTestState, hooks=[tracker]).compile()
+
+    asyncio.run(graph.ainvoke({"messages": []}))
+
+    (run,) = finished
+    assert tracker.last_run is run and tracker.usage(run.run_id) is run
+    assert run.layout == "ChatLoopLayout"
+    assert run.model_calls == 2
+    assert run.total == TokenUsage(input_tokens=20, output_tokens=10, total_tokens=30)
+    assert run.by_node == {"answer_node": run.total}
+    assert run.by_builder == {"FakeChatBuilder": run.total}
+    assert run.by_edge == {} and not run.budget_exceeded
+
+
+@pytest.mark.unit
+def test_budget_sends_the_run_to_its_fallback_and_reports_it() -> None:
+    exceeded: list[RunUsage] = []
+    tracker = TokenUsageTracker(budget=TokenBudget(10, fallback=END, on_exceeded=exceeded.append))
+    graph = WorkflowBuilder(config=ChatLoopLayout, state_schema=FrankTestState, hooks=[tracker]).compile()
+
+    result = asyncio.run(graph.ainvoke({"messages": []}))
+
+    assert len(result["messages"]) == 1
+    assert exceeded == [tracker.last_run]
+    assert tracker.last_run.budget_exceeded and tracker.last_run.total.total_tokens == 15
+
+
+@pytest.mark.unit
+def test_budget_ends_the_run_at_the_decision_after_a_fallback_node() -> None:
+    # The fallback node is followed by a conditional edge, whose decision must end the run.
+    tracker = TokenUsageTracker(budget=TokenBudget(10, fallback="answer_node"))
+    graph = WorkflowBuilder(config=ChatLoopLayout, state_schema=FrankTestState, hooks=[tracker]).compile()
+
+    asyncio.run(graph.ainvoke({"messages": []}))
+
+    # Answered once, over budget, then once more at the fallback before ending.
+    assert tracker.last_run.budget_exceeded and tracker.last_run.model_calls == 2
+
+
+@pytest.mark.unit
+def test_budget_without_fallback_raises_and_validates() -> None:
+    tracker = TokenUsageTracker(budget=TokenBudget(4, fallback=None, metric="output_tokens"))
+    graph = WorkflowBuilder(config=ChatLoopLayout, state_schema=FrankTestState, hooks=[tracker]).compile()
+
+    with pytest.raises(TokenBudgetExceeded, match="5 output_tokens, over its budget of 4") as info:
+        asyncio.run(graph.ainvoke({"messages": []}))
+
+    assert info.value.usage.by_node == {"answer_node": TokenUsage(10, 5, 15)}
+    with pytest.raises(ValueError, match="max_tokens"):
+        TokenBudget(0)
+
+
+@pytest.mark.unit
+def test_tracker_reports_prompt_cache_hits() -> None:
+    class CachedChatLayout(ChatLoopLayout):
+        CHAT_BUILDER: FakeChatBuilder
+
+        def build_runtime(self) -> dict[str, Any]:
+            return {"CHAT_BUILDER": FakeChatBuilder(cached_input_tokens=6)}
+
+    tracker = TokenUsageTracker()
+    graph = WorkflowBuilder(config=CachedChatLayout, state_schema=FrankTestState, hooks=[tracker]).compile()
+
+    asyncio.run(graph.ainvoke({"messages": []}))
+
+    assert tracker.last_run.total == TokenUsage(input_tokens=20, output_tokens=10, total_tokens=30, cached_input_tokens=12)
+    assert tracker.last_run.by_node["answer_node"].cache_hit_ratio == 0.6
+    assert TokenUsage().cache_hit_ratio == 0.0
@@ -2,6 +2,7 @@ import asyncio
 import sys
 import types
 from pathlib import Path
+from typing import Any
 
 import pytest
 from langchain_core.messages import HumanMessage
@@ -16,6 +17,7 @@ from frankstate.entity.runnable_builder import RunnableBuilder
 from frankstate.entity.statehandler import StateCommander, StateEnhancer, StateEvaluator
 from frankstate.managers.edge_manager import EdgeManager
 from frankstate.managers.node_manager import NodeManager
+from tests.support.frankstate_doubles.builders import FakeRunnableBuilder
 from tests.support.frankstate_doubles.layouts import (
     CommandAsyncLayout,
     ConditionalAsyncEvaluatorLayout,
@@ -112,6 +114,33 @@ def test_workflow_builder_compiles_linear_layout_once_and_runs_async_enhancer()
     assert first_compiled.get_graph().nodes["linear_node"].metadata == {"tags": ["linear"]}
 
 
+@pytest.mark.unit
+def test_workflow_builder_context_manager_starts_and_closes_layout_runtime() -> None:
+    class PooledLinearLayout(LinearAsyncLayout):
+        RUNNABLE_BUILDER: FakeRunnableBuilder
+
+        def __init__(self):
+            super().__init__()
+            self.lifecycle: list[str] = []
+
+        async def astart_runtime(self, runtime: dict[str, Any]) -> None:
+            self.lifecycle.append("start")
+
+        async def aclose_runtime(self, runtime: dict[str, Any]) -> None:
+            self.lifecycle.append("close")
+
+    async def serve() -> tuple[WorkflowBuilder, dict[str, Any]]:
+        async with WorkflowBuilder(config=PooledLinearLayout, state_schema=FrankTestState) as builder:
+            result = await builder.compile().ainvoke({"messages": [HumanMessage(content="hi")]})
+        return builder, result
+
+    builder, result = asyncio.run(serve())
+
+    assert result["messages"][-1].content == "linear-response"
+    assert builder.config.lifecycle == ["start", "close"]
+    assert builder.config.runtime is None
+
+
 @pytest.mark.unit
 def test_workflow_builder_passes_node_kwargs_through_add_node() -> None:
     class NodeKwargsLayout(GraphLayout):
@@ -0,0 +1,70 @@
+import asyncio
+import logging
+
+import pytest
+from langchain_chroma.vectorstores import Chroma
+from langchain_core.stores import InMemoryStore
+from langgraph.graph import END
+
+from core_examples.components.retrievers.langchain_chroma_multivector_retriever import (
+    langchain_chroma_multivector_retriever as chroma_retriever_module,
+)
+from core_examples.config.layouts import (
+    ai_search_adaptive_rag_config_graph as ai_search_module,
+)
+from core_examples.config.layouts import (
+    local_vectorstore_adaptive_rag_config_graph as local_module,
+)
+from core_examples.models.stategraph.ragstategraph import RAGState
+from frankstate import WorkflowBuilder
+from tests.support.core_doubles import KeywordEmbeddings, StreamingJsonFakeModel
+
+LAYOUTS = [
+    ai_search_module.AISearchAdaptiveRAGConfigGraph,
+    local_module.LocalVectorStoreAdaptiveRAGConfigGraph,
+]
+
+
+@pytest.fixture(autouse=True)
+def fake_backends(monkeypatch) -> None:
+    embeddings = KeywordEmbeddings(["pikachu", "electric"])
+
+    def fake_launch() -> None:
+        local_module.LLMServices.model = StreamingJsonFakeModel(messages=iter([]))
+        local_module.LLMServices.embeddings = embeddings
+
+    def in_memory_storage(embeddings, collection_name, **_):
+        return Chroma(collection_name=collection_name, embedding_function=embeddings), InMemoryStore()
+
+    monkeypatch.setattr(local_module.LLMServices, "launch", fake_launch)
+    monkeypatch.setattr(ai_search_module, "get_secret", lambda name: "https://example.search.windows.net" if name.endswith("ENDPOINT") else "key")
+    monkeypatch.setattr(chroma_retriever_module, "get_local_retriever_storage", in_memory_storage)
+
+
+@pytest.mark.parametrize("layout_class", LAYOUTS)
+def test_adaptive_rag_layouts_bound_the_rewrite_loop(layout_class, caplog) -> None:
+    with layout_class() as layout:
+        budgeted = [edge for edge in layout.get_edges() if edge.has_budget]
+        assert len(budgeted) == 1
+        rewrite_edge = budgeted[0]
+        assert (rewrite_edge.node_source, rewrite_edge.node_path) == (layout.REWRITE_NODE.name, layout.RETRIEVER_NODE.name)
+        assert rewrite_edge.max_traversals == layout_class.MAX_REWRITES
+        assert rewrite_edge.exit_to == layout.GENERATION_NODE.name != END
+
+    builder = WorkflowBuilder(config=layout_class, state_schema=RAGState)
+    with caplog.at_level(logging.WARNING):
+        builder.compile()
+    builder.close()
+    assert "has no loop budget" not in caplog.text
+
+
+def test_local_layout_checks_and_closes_its_chroma_client() -> None:
+    layout = local_module.LocalVectorStoreAdaptiveRAGConfigGraph()
+
+    async def _run() -> None:
+        async with layout:
+            await layout.acheck()
+            assert layout.RAW_RETRIEVER.count() == 0
+
+    asyncio.run(_run())
+    assert layout.RAW_RETRIEVER.vectordb._client._closed
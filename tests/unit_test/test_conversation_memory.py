@@ -0,0 +1,68 @@
+import asyncio
+
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
+from langchain_core.runnables import RunnableLambda
+
+from core_examples.components.memory.conversation_memory import ConversationMemory
+
+
+def _count_messages(messages) -> int:
+    return 10 * len(messages)
+
+
+def _turn(index: int, tool_output: str = "Pikachu evolves into Raichu") -> list:
+    call = {"name": "GetEvolutionTool", "args": {"pokemon": "pikachu"}, "id": f"call-{index}"}
+    return [
+        HumanMessage(content=f"question {index}", id=f"h{index}"),
+        AIMessage(content="", tool_calls=[call], id=f"a{index}"),
+        ToolMessage(content=tool_output, tool_call_id=f"call-{index}", id=f"t{index}"),
+        AIMessage(content=f"answer {index}", id=f"r{index}"),
+    ]
+
+
+def test_memory_trims_whole_turns_and_compacts_consumed_tool_results() -> None:
+    memory = ConversationMemory(max_tokens=100, keep_tokens=50, max_tool_result_chars=10, token_counter=_count_messages)
+    system = SystemMessage(content="You are Professor Oak.", id="s")
+    history = [system, *_turn(1), *_turn(2), *_turn(3)]
+
+    view = memory.prepare(history)
+
+    assert view[0] is system
+    assert [message.id for message in view[1:]] == ["h3", "a3", "t3", "r3"]
+    assert view[3].content == "[27 characters of tool output omitted after use]"
+    assert history[11].content == "Pikachu evolves into Raichu"
+
+    # The next turns reuse the same cut until the view exceeds the budget again.
+    history += [*_turn(4)]
+    assert [message.id for message in memory.prepare(history)[1:]][:2] == ["h3", "a3"]
+    history += [*_turn(5)]
+    assert [message.id for message in memory.prepare(history)[1:]] == ["h5", "a5", "t5", "r5"]
+
+    # A pending tool call is never separated from its result.
+    pending = [*_turn(6)[:2], HumanMessage(content="hurry", id="h-interrupt"), _turn(6)[2]]
+    assert memory._find_cut(pending, [10] * 4, 0, 10) is None
+
+
+def test_memory_folds_cut_turns_into_a_rolling_summary() -> None:
+    requests: list[str] = []
+
+    def summarize(messages) -> AIMessage:
+        requests.append(messages[-1].content)
+        return AIMessage(content=f"summary {len(requests)}")
+
+    memory = ConversationMemory(max_tokens=70, keep_tokens=40, summarizer=RunnableLambda(summarize), token_counter=_count_messages)
+    history = [*_turn(1), *_turn(2)]
+
+    view = asyncio.run(memory.aprepare(history))
+    assert isinstance(view[0], SystemMessage) and view[0].content.endswith("summary 1")
+    assert [message.id for message in view[1:]] == ["h2", "a2", "t2", "r2"]
+    assert "question 1" in requests[0] and "Current summary:\n(empty)" in requests[0]
+
+    history += [*_turn(3)]
+    view = asyncio.run(memory.aprepare(history))
+    assert view[0].content.endswith("summary 2")
+    assert "summary 1" in requests[1] and "question 2" in requests[1]
+    assert "question 1" not in requests[1]
+
+    failing = ConversationMemory(max_tokens=70, keep_tokens=40, summarizer=RunnableLambda(lambda _: 1 / 0), token_counter=_count_messages)
+    assert [message.id for message in failing.prepare(history)] == ["h3", "a3", "t3", "r3"]
@@ -0,0 +1,81 @@
+import asyncio
+
+import pytest
+from langchain_core.exceptions import OutputParserException
+from langchain_core.messages import AIMessage
+
+from core_examples.components.edges.evaluators.grade_rewrite_generate import (
+    GradeRewriteGenerate,
+)
+from core_examples.components.runnables.structured_grade_document.structured_grade_document import (
+    GradeStreamCappedError,
+    StructuredGradeDocument,
+)
+from core_examples.models.structured_output.grade_documents import GradeDocuments
+from core_examples.utils.streaming_json import JsonFieldScanner
+from tests.support.core_doubles import StreamingJsonFakeModel
+
+GRADE_INPUT = {"context": {"texts": "Pikachu is an Electric-type Pokémon.", "images": []}, "question": "What type is Pikachu?"}
+VERBOSE_ANSWER = '{"binary_score": "yes", "reasoning": "' + " ".join(["the document mentions Pikachu"] * 20) + '"}'
+
+
+def _scan(text: str, field: str = "binary_score") -> JsonFieldScanner:
+    scanner = JsonFieldScanner(field)
+    for start in range(0, len(text), 3):
+        if scanner.feed(text[start:start + 3]):
+            break
+    return scanner
+
+
+def test_scanner_reports_top_level_fields_as_soon_as_they_are_complete() -> None:
+    scanner = _scan('```json\n{"note": "say \\"binary_score\\": \\"no\\"", "nested": {"binary_score": "no"}, "binary_score": "yes", "tail": "')
+
+    assert scanner.done and scanner.value == "yes"
+    assert _scan('{"binary_score" : true, "tail": 1}').value is True
+    assert _scan('{"score": 0.75}', field="score").value == 0.75
+    assert not _scan('{"binary_score": {"value": "yes"}}').done
+    assert not _scan('{"binary_score": "ye').done
+
+
+def test_grader_stops_streaming_once_the_score_is_known() -> None:
+    model = StreamingJsonFakeModel(messages=iter([AIMessage(content=VERBOSE_ANSWER)]))
+    grader = StructuredGradeDocument(model=model, structured_output_schema=GradeDocuments, early_exit_field="binary_score")
+
+    result = asyncio.run(grader.ainvoke(GRADE_INPUT))
+
+    assert result.binary_score == "yes"
+    assert model.streamed_chunks < len(VERBOSE_ANSWER.split(" ")) // 4
+
+    full = StreamingJsonFakeModel(messages=iter([AIMessage(content='{"binary_score": "no"}')]))
+    assert StructuredGradeDocument(model=full, structured_output_schema=GradeDocuments).invoke(GRADE_INPUT).binary_score == "no"
+    with pytest.raises(ValueError, match="not a field"):
+        StructuredGradeDocument(model=full, structured_output_schema=GradeDocuments, early_exit_field="score")
+
+
+def test_capped_grading_raises_a_typed_error_routed_to_generation() -> None:
+    fenced_preamble = "Sure! Here is my assessment:\n```json\n" + '{"reasoning": "' + "long " * 50 + '", "binary_score": "no"}'
+
+    def capped_grader(content: str) -> tuple[StructuredGradeDocument, StreamingJsonFakeModel]:
+        model = StreamingJsonFakeModel(messages=iter([AIMessage(content=content)]))
+        grader = StructuredGradeDocument(
+            model=model,
+            structured_output_schema=GradeDocuments,
+            early_exit_field="binary_score",
+            max_stream_chunks=10,
+        )
+        return grader, model
+
+    grader, model = capped_grader(fenced_preamble)
+    with pytest.raises(GradeStreamCappedError, match="after 10 chunk") as error:
+        grader.invoke(GRADE_INPUT)
+    assert error.value.field == "binary_score"
+    assert model.streamed_chunks <= 11
+
+    grader, _ = capped_grader(fenced_preamble)
+    state = {**GRADE_INPUT, "iterations": 0}
+    assert asyncio.run(GradeRewriteGenerate(grader).evaluate(state)) == "generate"
+
+    # A stream ending within the cap without the field is still a parsing failure.
+    grader, _ = capped_grader('{"reasoning": "short"}')
+    with pytest.raises(OutputParserException):
+        grader.invoke(GRADE_INPUT)
@@ -1,17 +1,23 @@
+import asyncio
+
 from langchain_core.messages import AIMessage, HumanMessage
 
 from core_examples.components.runnables.oaklang_agent.oaklang_agent import OakLangAgent
+from core_examples.components.tools.dominate_pokemon.dominate_pokemon_tool import (
+    DominatePokemonTool,
+)
 from core_examples.components.tools.get_evolution.get_evolution_tool import (
     GetEvolutionTool,
 )
 from core_examples.components.tools.random_movements.random_movements_tool import (
     RandomMovementsTool,
 )
+from core_examples.components.tools.tool_selector import ToolSelector
 from core_examples.utils.common import (
     load_and_clean_text_file,
     resolve_package_resource,
 )
-from tests.support.core_doubles import ToolBindingFakeModel
+from tests.support.core_doubles import KeywordEmbeddings, ToolBindingFakeModel
 
 
 def test_oaklang_agent_build_prompt_loads_runtime_prompt_assets() -> None:
@@ -71,3 +77,19 @@ def test_oaklang_agent_binds_tools_and_returns_model_response() -> None:
         "GetEvolutionTool",
         "RandomMovementsTool",
     ]
+
+
+def test_oaklang_agent_binds_only_selected_tools_and_reuses_bound_variants() -> None:
+    fake_model = ToolBindingFakeModel(response_content="oak-selected-response")
+    tools = [GetEvolutionTool(), RandomMovementsTool(), DominatePokemonTool()]
+    embeddings = KeywordEmbeddings(["evolution", "movements", "capture"])
+    agent = OakLangAgent(model=fake_model, tools=tools, tool_selector=ToolSelector(tools, embeddings, top_k=1))
+
+    first = agent.invoke({"messages": [HumanMessage(content="What is the evolution of Eevee?")]})
+    asyncio.run(agent.ainvoke([HumanMessage(content="Which evolution comes after Pichu?")]))
+    called = AIMessage(content="", tool_calls=[{"name": "GetEvolutionTool", "args": {}, "id": "call-1"}])
+    agent.invoke([HumanMessage(content="Show me random movements of Mew"), called])
+
+    assert first.content == "oak-selected-response"
+    assert fake_model.bind_calls == [["GetEvolutionTool"], ["GetEvolutionTool", "RandomMovementsTool"]]
+    assert embeddings.documents_embedded == 3
@@ -0,0 +1,52 @@
+import os
+
+import pytest
+
+from core_examples.utils.prompt_registry import PromptRegistry, compile_template
+
+
+def _write_package(root, name: str, files: dict[str, str]) -> str:
+    package_dir = root / name
+    (package_dir / "prompt").mkdir(parents=True)
+    (package_dir / "__init__.py").write_text("")
+    for file_name, content in files.items():
+        (package_dir / "prompt" / file_name).write_text(content)
+    return name
+
+
+def test_compile_template_substitutes_parts_once_and_keeps_call_variables() -> None:
+    template = compile_template(
+        "# Instructions\n{instructions}\n\n# Question\n{question}",
+        {"instructions": "Answer in {language}."},
+    )
+
+    assert template == "# Instructions\nAnswer in {{language}}.\n\n# Question\n{question}"
+    assert template.format(question="Who is Pikachu?").endswith("Answer in {language}.\n\n# Question\nWho is Pikachu?")
+
+
+def test_registry_loads_prompt_packages_once_and_reloads_changed_files(monkeypatch, tmp_path) -> None:
+    monkeypatch.syspath_prepend(str(tmp_path))
+    package = _write_package(
+        tmp_path,
+        "prompt_registry_pkg",
+        {
+            "format_template.md": "{context}\n---\n{question}\n",
+            "context.md": "  You are Professor Oak.  \n",
+        },
+    )
+    registry = PromptRegistry(reload=True, check_interval=0.0)
+
+    prompt = registry.get(package)
+    assert registry.get(package) is prompt
+    assert prompt.variables == frozenset({"question"})
+    assert prompt.render(question="Hi") == "You are Professor Oak.\n---\nHi"
+    with pytest.raises(ValueError, match="missing variables"):
+        prompt.render()
+
+    context_file = tmp_path / package / "prompt" / "context.md"
+    context_file.write_text("You are Professor Elm.")
+    stat = context_file.stat()
+    os.utime(context_file, (stat.st_atime, stat.st_mtime + 10))
+
+    assert registry.get(package).render(question="Hi") == "You are Professor Elm.\n---\nHi"
+    assert PromptRegistry().get(package).parts["context"] == "You are Professor Elm."
@@ -0,0 +1,30 @@
+from pydantic import BaseModel
+
+from core_examples.components.runnables.multimodal_generation.multimodal_generation import (
+    MultimodalGeneration,
+)
+from core_examples.components.runnables.structured_grade_document.structured_grade_document import (
+    StructuredGradeDocument,
+)
+from tests.support.core_doubles import ToolBindingFakeModel
+
+
+class BinaryScore(BaseModel):
+    binary_score: str
+
+
+def test_grader_and_generator_prompts_share_the_retrieved_context_prefix() -> None:
+    image = {"type": "image_url", "image_url": {"url": "data:image/jpeg;base64,cGlrYQ=="}}
+    context = {"texts": "Pikachu is an Electric-type Pokémon.", "images": [image]}
+    question = "What type is Pikachu?"
+
+    grader = StructuredGradeDocument(model=ToolBindingFakeModel(), structured_output_schema=BinaryScore)
+    generator = MultimodalGeneration(model=ToolBindingFakeModel())
+    grade_content = grader._build_prompt(context=context, question=question).invoke({}).messages[0].content
+    generate_content = generator._build_prompt(context=context, question=question).invoke({}).messages[0].content
+
+    assert grade_content[:-1] == generate_content[:-1]
+    assert "Pikachu is an Electric-type" in grade_content[0]["text"] and question in grade_content[0]["text"]
+    assert grade_content[1] == image
+    assert "grader assessing relevance" in grade_content[-1]["text"]
+    assert grade_content[-1] != generate_content[-1]
@@ -34,7 +34,7 @@ def test_simple_oak_config_graph_build_runtime_resolves_all_runtime_dependencies
 
     runtime = layout.build_runtime()
 
-    assert set(runtime) == {"CONFIG_NODES", "OAKLANG_AGENT"}
+    assert set(runtime) == {"CONFIG_NODES", "OAKLANG_AGENT", "MEMORY"}
     assert runtime["CONFIG_NODES"]["OAKLANG_NODE"]["name"] == "OakLangAgent"
     assert runtime["CONFIG_NODES"]["OAKTOOLS_NODE"]["name"] == "OakTools"
     assert isinstance(runtime["OAKLANG_AGENT"], OakLangAgent)